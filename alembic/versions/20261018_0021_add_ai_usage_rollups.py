@@ -0,0 +1,53 @@
+"""Add AI usage rollup table.
+
+Revision ID: 20261018_0021
+Revises: 20260118_0020
+Create Date: 2026-10-18
+
+Tables created:
+- ai_usage_rollups: Hourly/daily usage counters per provider, model, user and app.
+  Populate historical data with ``atlas db rebuild-usage-rollups``.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_0021"
+down_revision: str | None = "20260118_0020"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ai_usage_rollups",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("granularity", sa.String(8), nullable=False, comment="hour or day"),
+        sa.Column("bucket", sa.DateTime(timezone=True), nullable=False, index=True),
+        sa.Column("provider", sa.String(32), nullable=False),
+        sa.Column("model", sa.String(128), nullable=False),
+        sa.Column("user_id", sa.String(36), nullable=False, server_default=""),
+        sa.Column("app_name", sa.String(64), nullable=False, server_default=""),
+        # Counters
+        sa.Column("request_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("tokens_prompt", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("tokens_completion", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("tokens_reasoning", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("tokens_total", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("cost_usd", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("tps_sum", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("tps_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.UniqueConstraint(
+            "granularity", "bucket", "provider", "model", "user_id", "app_name", name="uq_ai_usage_rollup_key"
+        ),
+    )
+    op.create_index("ix_ai_usage_rollups_granularity_bucket", "ai_usage_rollups", ["granularity", "bucket"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ai_usage_rollups_granularity_bucket", table_name="ai_usage_rollups")
+    op.drop_table("ai_usage_rollups")
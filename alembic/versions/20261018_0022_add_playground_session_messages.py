@@ -0,0 +1,99 @@
+"""Store playground conversation turns as append-only rows.
+
+Revision ID: 20261018_0022
+Revises: 20261018_0021
+Create Date: 2026-10-18
+
+Tables created:
+- playground_session_messages: One row per message, keyed by (session_id, seq).
+
+Columns added:
+- playground_sessions.message_count
+
+Existing inline ``playground_sessions.messages`` arrays are copied into the new
+table and emptied, so later turns never rewrite the whole history.
+"""
+
+import json
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_0022"
+down_revision: str | None = "20261018_0021"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _as_list(value) -> list:
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return []
+    return value if isinstance(value, list) else []
+
+
+def upgrade() -> None:
+    messages_table = op.create_table(
+        "playground_session_messages",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column(
+            "session_id",
+            sa.String(36),
+            sa.ForeignKey("playground_sessions.id", ondelete="CASCADE"),
+            nullable=False,
+            index=True,
+        ),
+        sa.Column("seq", sa.Integer(), nullable=False),
+        sa.Column("message", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.UniqueConstraint("session_id", "seq", name="uq_playground_session_message_seq"),
+    )
+
+    with op.batch_alter_table("playground_sessions", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("message_count", sa.Integer(), nullable=False, server_default="0"))
+
+    # Move inline histories into the new table
+    bind = op.get_bind()
+    sessions = sa.table(
+        "playground_sessions",
+        sa.column("id", sa.String),
+        sa.column("messages", sa.JSON),
+        sa.column("message_count", sa.Integer),
+    )
+    for session_id, messages in bind.execute(sa.select(sessions.c.id, sessions.c.messages)).all():
+        items = _as_list(messages)
+        if items:
+            op.bulk_insert(
+                messages_table,
+                [{"session_id": session_id, "seq": seq, "message": item} for seq, item in enumerate(items)],
+            )
+        bind.execute(
+            sessions.update().where(sessions.c.id == session_id).values(messages=[], message_count=len(items))
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    sessions = sa.table("playground_sessions", sa.column("id", sa.String), sa.column("messages", sa.JSON))
+    rows = sa.table(
+        "playground_session_messages",
+        sa.column("session_id", sa.String),
+        sa.column("seq", sa.Integer),
+        sa.column("message", sa.JSON),
+    )
+    history: dict[str, list] = {}
+    for session_id, message in bind.execute(
+        sa.select(rows.c.session_id, rows.c.message).order_by(rows.c.session_id, rows.c.seq)
+    ).all():
+        history.setdefault(session_id, []).append(message)
+    for session_id, messages in history.items():
+        bind.execute(sessions.update().where(sessions.c.id == session_id).values(messages=messages))
+
+    with op.batch_alter_table("playground_sessions", schema=None) as batch_op:
+        batch_op.drop_column("message_count")
+    op.drop_table("playground_session_messages")
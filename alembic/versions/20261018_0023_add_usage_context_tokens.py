@@ -0,0 +1,34 @@
+"""Add context compaction token counts to playground_usage.
+
+Revision ID: 20261018_0023
+Revises: 20261018_0022
+Create Date: 2026-10-18
+
+Columns added:
+- playground_usage.context_tokens_before: Estimated prompt tokens before compaction
+- playground_usage.context_tokens_after: Estimated prompt tokens actually sent
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_0023"
+down_revision: str | None = "20261018_0022"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("playground_usage", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("context_tokens_before", sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column("context_tokens_after", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("playground_usage", schema=None) as batch_op:
+        batch_op.drop_column("context_tokens_after")
+        batch_op.drop_column("context_tokens_before")
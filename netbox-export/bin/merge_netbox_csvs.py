@@ -25,18 +25,13 @@ from infrastructure_atlas.env import load_env, project_root
 
 # Try to import Excel-related libraries
 EXCEL_AVAILABLE = False
-pd = None
-Workbook = None
-dataframe_to_rows = None
-Table = None
-TableStyleInfo = None
+load_workbook = None
+write_xlsx = None
 
 try:
-    import pandas as pd
-    from openpyxl import Workbook, load_workbook
-    from openpyxl.utils import get_column_letter
-    from openpyxl.utils.dataframe import dataframe_to_rows
-    from openpyxl.worksheet.table import Table, TableStyleInfo
+    from openpyxl import load_workbook
+
+    from infrastructure_atlas.infrastructure.tabular_export import write_xlsx
     EXCEL_AVAILABLE = True
 except ImportError:
     pass  # Will show warning in main function if needed
@@ -60,6 +55,14 @@ def _load_column_order_from_xlsx(order_file):
     except Exception:
         return []
 
+def _excel_value(value):
+    """Convert a CSV cell to an Excel value, keeping integers numeric."""
+    if value is None or value == "":
+        return None
+    if value.isdigit() and (value == "0" or not value.startswith("0")):
+        return int(value)
+    return value
+
 def merge_netbox_csvs():
     """Merge NetBox devices and VMs CSV files with netbox_type column."""
     # File paths
@@ -115,7 +118,10 @@ def merge_netbox_csvs():
 
         print(f"Final merged headers: {len(merged_headers)} columns")
 
-        # Create column mapping for both file types (not needed for current logic)
+        # Column positions in the merged layout, resolved once per input file
+        merged_index = {header: idx for idx, header in enumerate(merged_headers)}
+        devices_positions = [merged_index[header] for header in devices_headers]
+        vms_positions = [merged_index[header] for header in vms_headers]
 
         # Initialize counters
         devices_count = 0
@@ -139,10 +145,8 @@ def merge_netbox_csvs():
                     merged_row = [""] * (len(merged_headers) - 1)  # -1 for netbox_type
 
                     # Map device data to correct columns
-                    for header, value in zip(devices_headers, row, strict=False):
-                        if header in merged_headers:
-                            merged_idx = merged_headers.index(header)
-                            merged_row[merged_idx] = value
+                    for merged_idx, value in zip(devices_positions, row, strict=False):
+                        merged_row[merged_idx] = value
 
                     # Add netbox_type
                     merged_row.append("devices")
@@ -163,10 +167,8 @@ def merge_netbox_csvs():
                     merged_row = [""] * (len(merged_headers) - 1)  # -1 for netbox_type
 
                     # Map VM data to correct columns
-                    for header, value in zip(vms_headers, row, strict=False):
-                        if header in merged_headers:
-                            merged_idx = merged_headers.index(header)
-                            merged_row[merged_idx] = value
+                    for merged_idx, value in zip(vms_positions, row, strict=False):
+                        merged_row[merged_idx] = value
 
                     # Add netbox_type
                     merged_row.append("vms")
@@ -209,87 +211,55 @@ def create_excel_export(csv_file, excel_file):
     try:
         print(f"\nCreating Excel export: {excel_file}")
 
-        df = pd.read_csv(csv_file)
-
-        # Optional: reorder columns based on a reference XLSX's header row
-        # Candidate paths (first found wins):
-        # Resolve etc and data paths
-        root = project_root()
-        data_dir_env = os.getenv("NETBOX_DATA_DIR", "data")
-        data_dir_path = Path(data_dir_env) if os.path.isabs(data_dir_env) else (root / data_dir_env)
-        order_candidates = [
-            os.getenv("NETBOX_XLSX_ORDER_FILE"),
-            str(root / "netbox-export" / "etc" / "column_order.xlsx"),
-            str(data_dir_path / "netbox_merged_export.xlsx"),  # allow using a prior export as the template
-        ]
-        order_file = next((p for p in order_candidates if p and os.path.exists(p)), None)
-        if order_file:
-            print(f"Applying column order from: {order_file}")
-            desired_order = _load_column_order_from_xlsx(order_file)
-            if desired_order:
-                # Keep only columns that exist in df, in the desired order
-                ordered_cols = [c for c in desired_order if c in df.columns]
-                # Append any columns from df that were not in the template, to avoid data loss
-                tail_cols = [c for c in df.columns if c not in ordered_cols]
-                df = df[ordered_cols + tail_cols]
+        with open(csv_file, encoding="utf-8", newline="") as handle:
+            reader = csv.DictReader(handle)
+            columns = list(reader.fieldnames or [])
+
+            # Optional: reorder columns based on a reference XLSX's header row
+            # Candidate paths (first found wins):
+            # Resolve etc and data paths
+            root = project_root()
+            data_dir_env = os.getenv("NETBOX_DATA_DIR", "data")
+            data_dir_path = Path(data_dir_env) if os.path.isabs(data_dir_env) else (root / data_dir_env)
+            order_candidates = [
+                os.getenv("NETBOX_XLSX_ORDER_FILE"),
+                str(root / "netbox-export" / "etc" / "column_order.xlsx"),
+                str(data_dir_path / "netbox_merged_export.xlsx"),  # allow using a prior export as the template
+            ]
+            order_file = next((p for p in order_candidates if p and os.path.exists(p)), None)
+            if order_file:
+                print(f"Applying column order from: {order_file}")
+                desired_order = _load_column_order_from_xlsx(order_file)
+                if desired_order:
+                    # Keep only columns that exist in the CSV, in the desired order
+                    present = set(columns)
+                    ordered_cols = [c for c in dict.fromkeys(desired_order) if c in present]
+                    # Append any CSV columns that were not in the template, to avoid data loss
+                    ordered = set(ordered_cols)
+                    tail_cols = [c for c in columns if c not in ordered]
+                    columns = ordered_cols + tail_cols
+                else:
+                    print("Warning: could not read headers from order file; keeping CSV order.")
             else:
-                print("Warning: could not read headers from order file; keeping CSV order.")
-        else:
-            print("No column order template found; keeping CSV order.")
-
-        # Preserve CSV row order in Excel (no additional sorting here)
-
-        # Create Excel workbook
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "NetBox Inventory"
-
-        # Write data to worksheet
-        for r in dataframe_to_rows(df, index=False, header=True):
-            ws.append(r)
-
-        # Create table with filters (only if we have data rows)
-        num_cols = len(df.columns)
-        end_col = get_column_letter(num_cols)
-        has_rows = len(df) > 0
-        if has_rows:
-            table_range = f"A1:{end_col}{len(df) + 1}"
-            print(f"Creating table with range: {table_range}")
-            table = Table(displayName="NetBoxInventory", ref=table_range)
-
-            # Add table style
-            style = TableStyleInfo(
-                name="TableStyleMedium9",
-                showFirstColumn=False,
-                showLastColumn=False,
-                showRowStripes=True,
-                showColumnStripes=True,
+                print("No column order template found; keeping CSV order.")
+
+            # Preserve CSV row order in Excel (no additional sorting here). Rows are
+            # streamed into a write-only workbook as an Excel table (enables filters);
+            # top row and first column stay frozen.
+            result = write_xlsx(
+                excel_file,
+                reader,
+                columns,
+                sheet_name="NetBox Inventory",
+                value_formatter=_excel_value,
+                styled=False,
+                freeze_panes="B2",
+                table_name="NetBoxInventory",
             )
-            table.tableStyleInfo = style
 
-            # Add table to worksheet (this enables filters)
-            ws.add_table(table)
-        else:
+        if not result.row_count:
             print("No data rows; skipping table creation to avoid Excel warnings.")
 
-        # Freeze top row and first column (keep headers and column A visible)
-        ws.freeze_panes = "B2"
-
-        # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    max_length = max(max_length, len(str(cell.value)))
-                except Exception:
-                    pass
-            adjusted_width = min(max_length + 2, 50)  # Cap at 50 characters
-            ws.column_dimensions[column_letter].width = adjusted_width
-
-        # Save Excel file
-        wb.save(excel_file)
-
         # File size info
         if os.path.exists(excel_file):
             file_size = os.path.getsize(excel_file)
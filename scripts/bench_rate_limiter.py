@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Benchmark rate limiter check throughput for each counter store.
+
+Pre-fills the windows with ``--fill`` recorded requests, then times
+``can_make_request`` calls. Check cost should not depend on the fill level.
+
+Usage:
+    python scripts/bench_rate_limiter.py --checks 20000 --fill 0 10000
+    python scripts/bench_rate_limiter.py --stores memory sqlite mongodb
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+
+def _make_store(kind: str, tmpdir: str):
+    from infrastructure_atlas.infrastructure.rate_limit_store import (
+        InMemoryRateLimitStore,
+        SQLiteRateLimitStore,
+        create_rate_limit_store,
+    )
+
+    if kind == "memory":
+        return InMemoryRateLimitStore()
+    if kind == "sqlite":
+        return SQLiteRateLimitStore(Path(tmpdir) / "rate_limits.sqlite3")
+    return create_rate_limit_store(kind)
+
+
+async def _bench(kind: str, fill: int, checks: int, tmpdir: str) -> None:
+    from infrastructure_atlas.infrastructure.rate_limiting import RateLimitConfig, RateLimiter
+
+    config = RateLimitConfig(requests_per_minute=10**9, requests_per_hour=10**9)
+    limiter = RateLimiter(config, store=_make_store(kind, tmpdir))
+    limiter.state.namespace = f"bench-{kind}-{fill}"
+    await limiter.reset()
+    for _ in range(fill):
+        limiter.state.add_request(100)
+
+    start = time.perf_counter()
+    for _ in range(checks):
+        await limiter.can_make_request(estimated_tokens=100)
+    elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(checks):
+        await limiter.record_request(100)
+    record_elapsed = time.perf_counter() - start
+
+    print(
+        f"{kind:<8} fill={fill:<7} check {checks / elapsed:>10,.0f}/s ({elapsed / checks * 1e6:7.1f}us)  "
+        f"record {checks / record_elapsed:>10,.0f}/s ({record_elapsed / checks * 1e6:7.1f}us)"
+    )
+    await limiter.reset()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stores", nargs="+", default=["memory", "sqlite"], choices=["memory", "sqlite", "mongodb"])
+    parser.add_argument("--fill", nargs="+", type=int, default=[0, 10_000], help="Requests recorded before timing")
+    parser.add_argument("--checks", type=int, default=5_000, help="Timed checks per run")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for kind in args.stores:
+            for fill in args.fill:
+                asyncio.run(_bench(kind, fill, args.checks, tmpdir))
+
+
+if __name__ == "__main__":
+    main()
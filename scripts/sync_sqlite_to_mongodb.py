@@ -166,6 +166,31 @@ def main():
 
             verify_table.add_row(coll_name, str(sqlite_count), str(mongo_count), status)
 
+        # Playground history lives in its own SQLite table but is embedded in MongoDB
+        try:
+            result = session.execute(text("SELECT COUNT(*) FROM playground_session_messages"))
+            sqlite_count = result.scalar() or 0
+        except Exception:
+            sqlite_count = "N/A"
+        try:
+            totals = list(
+                app_db["playground_sessions"].aggregate(
+                    [{"$group": {"_id": None, "count": {"$sum": {"$size": {"$ifNull": ["$messages", []]}}}}}]
+                )
+            )
+            mongo_count = totals[0]["count"] if totals else 0
+        except Exception:
+            mongo_count = "N/A"
+
+        if sqlite_count == mongo_count:
+            status = "[green]✓ Match[/green]"
+        elif sqlite_count == "N/A":
+            status = "[yellow]Table not in SQLite[/yellow]"
+        else:
+            status = "[red]✗ Mismatch[/red]"
+
+        verify_table.add_row("playground_sessions.messages", str(sqlite_count), str(mongo_count), status)
+
     console.print(verify_table)
     console.print("\n[bold green]Migration complete![/bold green]\n")
 
@@ -0,0 +1,275 @@
+"""Backup sync against a local in-process SFTP server.
+
+The server is a paramiko ``ServerInterface`` with an ``SFTPServerInterface``
+rooted in a temporary directory. It counts SSH connections and files opened
+for writing, so the tests can check that unchanged files are not uploaded
+again and that repeated syncs reuse one pooled SSH session.
+
+Usage:
+    pytest scripts/test_backup_sync.py
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+paramiko = pytest.importorskip("paramiko")
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from infrastructure_atlas import backup_sync
+from infrastructure_atlas.backup_sync import BackupConfig
+
+USERNAME = "atlas"
+PASSWORD = "secret"
+FILE_COUNT = 40
+
+
+class _Server(paramiko.ServerInterface):
+    def check_auth_password(self, username: str, password: str) -> int:
+        if (username, password) == (USERNAME, PASSWORD):
+            return paramiko.AUTH_SUCCESSFUL
+        return paramiko.AUTH_FAILED
+
+    def get_allowed_auths(self, username: str) -> str:
+        return "password"
+
+    def check_channel_request(self, kind: str, chanid: int) -> int:
+        if kind == "session":
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+
+class _Handle(paramiko.SFTPHandle):
+    def stat(self):
+        return paramiko.SFTPAttributes.from_stat(os.fstat(self.writefile.fileno()))
+
+
+class _SFTP(paramiko.SFTPServerInterface):
+    root: Path
+    writes: list[str] = []
+    lock = threading.Lock()
+
+    def _local(self, path: str) -> Path:
+        return self.root / path.lstrip("/")
+
+    def open(self, path: str, flags: int, attr):
+        local = self._local(path)
+        try:
+            handle = _Handle(flags)
+            handle.writefile = handle.readfile = local.open("wb")
+        except OSError as exc:
+            return paramiko.SFTPServer.convert_errno(exc.errno)
+        with self.lock:
+            type(self).writes.append(path)
+        return handle
+
+    def stat(self, path: str):
+        try:
+            return paramiko.SFTPAttributes.from_stat(os.stat(self._local(path)))
+        except OSError as exc:
+            return paramiko.SFTPServer.convert_errno(exc.errno)
+
+    lstat = stat
+
+    def mkdir(self, path: str, attr) -> int:
+        try:
+            self._local(path).mkdir()
+        except OSError as exc:
+            return paramiko.SFTPServer.convert_errno(exc.errno)
+        return paramiko.SFTP_OK
+
+
+class _SFTPServer:
+    def __init__(self, root: Path):
+        self.root = root
+        self.connections = 0
+        self.host_key = paramiko.RSAKey.generate(2048)
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.listen(8)
+        self.port = self.sock.getsockname()[1]
+        self.transports: list[paramiko.Transport] = []
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self) -> None:
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            self.connections += 1
+            transport = paramiko.Transport(conn)
+            transport.add_server_key(self.host_key)
+            transport.set_subsystem_handler("sftp", paramiko.SFTPServer, _SFTP)
+            transport.start_server(server=_Server())
+            self.transports.append(transport)
+
+    def close(self) -> None:
+        self.sock.close()
+        for transport in self.transports:
+            transport.close()
+
+
+@pytest.fixture
+def sftp_server(tmp_path: Path) -> Iterator[_SFTPServer]:
+    root = tmp_path / "remote"
+    root.mkdir()
+    _SFTP.root = root
+    _SFTP.writes = []
+    server = _SFTPServer(root)
+    try:
+        yield server
+    finally:
+        backup_sync.close_sessions()
+        server.close()
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path) -> Path:
+    data = tmp_path / "data"
+    for index in range(FILE_COUNT):
+        path = data / f"group{index % 4}" / f"file{index:03d}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f'{{"index": {index}}}\n' * (index + 1))
+    return data
+
+
+def _config(server: _SFTPServer, data: Path) -> BackupConfig:
+    return BackupConfig(
+        backup_type="sftp",
+        data_dir=data,
+        enable=True,
+        host="127.0.0.1",
+        port=server.port,
+        username=USERNAME,
+        password=PASSWORD,
+        remote_path="/backups/atlas",
+        sftp_concurrency=4,
+    )
+
+
+def _sync(monkeypatch: pytest.MonkeyPatch, config: BackupConfig, **kwargs) -> dict:
+    monkeypatch.setattr(backup_sync, "_load_config", lambda: config)
+    result = backup_sync.sync_data_dir(**kwargs)
+    assert result["status"] == "ok", result
+    return result
+
+
+def test_first_sync_uploads_everything(monkeypatch, sftp_server, data_dir) -> None:
+    result = _sync(monkeypatch, _config(sftp_server, data_dir))
+
+    assert result["count"] == FILE_COUNT
+    assert len(_SFTP.writes) == FILE_COUNT
+    for path in data_dir.rglob("file*.json"):
+        remote = sftp_server.root / "backups/atlas" / path.relative_to(data_dir)
+        assert remote.read_bytes() == path.read_bytes()
+    assert not (sftp_server.root / "backups/atlas" / backup_sync.MANIFEST_NAME).exists()
+
+
+def test_unchanged_files_are_skipped_on_one_connection(monkeypatch, sftp_server, data_dir) -> None:
+    config = _config(sftp_server, data_dir)
+    _sync(monkeypatch, config)
+    _SFTP.writes = []
+
+    result = _sync(monkeypatch, config)
+
+    assert result["count"] == 0
+    assert result["unchanged"] == FILE_COUNT
+    assert _SFTP.writes == []
+    assert sftp_server.connections == 1
+
+
+def test_only_changed_files_are_uploaded(monkeypatch, sftp_server, data_dir) -> None:
+    config = _config(sftp_server, data_dir)
+    _sync(monkeypatch, config)
+    _SFTP.writes = []
+
+    changed = data_dir / "group1" / "file005.json"
+    changed.write_text('{"index": "changed"}\n')
+    touched = data_dir / "group2" / "file006.json"
+    later = time.time() + 60
+    os.utime(touched, (later, later))
+    added = data_dir / "group3" / "nested" / "new.json"
+    added.parent.mkdir()
+    added.write_text("{}\n")
+
+    result = _sync(monkeypatch, config)
+
+    assert sorted(_SFTP.writes) == ["/backups/atlas/group1/file005.json", "/backups/atlas/group3/nested/new.json"]
+    assert result["unchanged"] == FILE_COUNT - 1
+    assert (sftp_server.root / "backups/atlas/group1/file005.json").read_bytes() == changed.read_bytes()
+    assert sftp_server.connections == 1
+
+    _SFTP.writes = []
+    assert _sync(monkeypatch, config)["count"] == 0
+
+
+def test_force_uploads_everything(monkeypatch, sftp_server, data_dir) -> None:
+    config = _config(sftp_server, data_dir)
+    _sync(monkeypatch, config)
+    _SFTP.writes = []
+
+    result = _sync(monkeypatch, config, force=True)
+
+    assert result["count"] == FILE_COUNT
+    assert len(_SFTP.writes) == FILE_COUNT
+
+
+def test_dropped_session_reconnects(monkeypatch, sftp_server, data_dir) -> None:
+    config = _config(sftp_server, data_dir)
+    _sync(monkeypatch, config)
+    for transport in sftp_server.transports:
+        transport.close()
+    time.sleep(0.1)
+
+    (data_dir / "group0" / "file000.json").write_text("[]\n")
+    result = _sync(monkeypatch, config)
+
+    assert result["count"] == 1
+    assert sftp_server.connections == 2
+
+
+def test_session_in_use_is_not_closed_when_idle(monkeypatch, sftp_server, data_dir) -> None:
+    config = _config(sftp_server, data_dir)
+    monkeypatch.setattr(backup_sync, "SESSION_IDLE_SECONDS", 0.0)
+    pool = backup_sync.SSHSessionPool()
+    try:
+        with pool.session(config) as held:
+            time.sleep(0.05)
+            with pool.session(config) as again:
+                assert again is held
+            assert held.client.get_transport().is_active()
+
+        with pool.session(config) as fresh:
+            assert fresh is not held
+        assert held.client.get_transport() is None
+        assert sftp_server.connections == 2
+    finally:
+        pool.close_all()
+
+
+def test_failed_session_is_closed_after_its_last_user(monkeypatch, sftp_server, data_dir) -> None:
+    config = _config(sftp_server, data_dir)
+    pool = backup_sync.SSHSessionPool()
+    try:
+        with pool.session(config) as outer:
+            with pytest.raises(RuntimeError), pool.session(config):
+                raise RuntimeError("upload failed")
+            assert outer.client.get_transport().is_active()
+        assert outer.client.get_transport() is None
+
+        with pool.session(config) as fresh:
+            assert fresh is not outer
+    finally:
+        pool.close_all()
@@ -0,0 +1,86 @@
+"""Import-time regression test for the atlas CLI.
+
+The CLI is started many times per hour by cron jobs and the task runner, so
+commands must not import the subcommand stacks they do not use. Each case runs
+the CLI under ``python -X importtime`` and checks the heavy packages stay out
+and the total import time stays within a budget.
+
+Usage:
+    pytest scripts/test_cli_import_time.py -m perf
+    ATLAS_CLI_IMPORT_BUDGET_MS=800 pytest scripts/test_cli_import_time.py
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_PATH = Path(__file__).parent.parent / "src"
+
+# Generous default so slow CI machines pass; before lazy loading `atlas --help`
+# took over 5 s of imports, afterwards well under 1 s.
+IMPORT_BUDGET_MS = float(os.getenv("ATLAS_CLI_IMPORT_BUDGET_MS", "2000"))
+
+HEAVY_MODULES = (
+    "fastapi",
+    "infrastructure_atlas.api.app",
+    "langchain_core",
+    "pandas",
+    "pyVmomi",
+    "docling",
+)
+
+_IMPORT_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( +)(\S+)$")
+
+COMMANDS = [
+    ["--help"],
+    ["cache-stats", "--help"],
+    ["tasks", "--help"],
+    ["zabbix", "--help"],
+    ["zabbix", "problems", "--help"],
+]
+
+
+def _run_importtime(args: list[str]) -> tuple[float, set[str]]:
+    """Run the CLI with ``-X importtime``; return total import ms and imported modules."""
+    env = dict(os.environ, PYTHONPATH=str(SRC_PATH), NO_COLOR="1")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "infrastructure_atlas.cli", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=120,
+        check=False,
+    )
+    assert proc.returncode == 0, proc.stdout + proc.stderr
+    total_us = 0
+    modules: set[str] = set()
+    for line in proc.stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if not match:
+            continue
+        modules.add(match.group(4))
+        if len(match.group(3)) == 1:  # Top-level import: cumulative time includes its children
+            total_us += int(match.group(2))
+    return total_us / 1000, modules
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("args", COMMANDS, ids=lambda args: " ".join(args))
+def test_cli_command_import_time(args: list[str]) -> None:
+    total_ms, modules = _run_importtime(args)
+
+    heavy = sorted(name for name in modules if name.split(".")[0] in HEAVY_MODULES or name in HEAVY_MODULES)
+    assert not heavy, f"`atlas {' '.join(args)}` imported heavy modules: {heavy}"
+    assert total_ms < IMPORT_BUDGET_MS, f"`atlas {' '.join(args)}` spent {total_ms:.0f} ms importing"
+
+
+if __name__ == "__main__":
+    for command in COMMANDS:
+        elapsed, _ = _run_importtime(command)
+        print(f"atlas {' '.join(command):<24} {elapsed:8.0f} ms")
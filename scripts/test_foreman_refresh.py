@@ -0,0 +1,227 @@
+"""Foreman inventory refresh against a local stub Foreman server.
+
+The stub serves ``/api/v2/hosts``, ``/api/v2/fact_values`` and
+``/api/v2/puppetclasses`` with a fixed per-request latency and records how
+many requests are in flight, so the tests can check that parallel paging
+returns the same hosts as sequential paging, stays within
+``max_concurrency``, that bulk enrichment attaches facts (and classes when
+enabled) and that a page without data fails the listing.
+
+Usage:
+    pytest scripts/test_foreman_refresh.py
+    pytest scripts/test_foreman_refresh.py -m perf
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from infrastructure_atlas.infrastructure.external.foreman_client import (
+    ForemanClient,
+    ForemanClientConfig,
+    ForemanClientError,
+)
+
+HOST_COUNT = 950
+PER_PAGE = 100  # Small pages so the stub inventory spans ten pages
+LATENCY_SECONDS = 0.05
+CLASSES = {"ntp": lambda i: True, "nginx": lambda i: i % 3 == 0, "profile::db": lambda i: i % 10 == 0}
+
+
+def _host(index: int) -> dict[str, object]:
+    return {"id": index + 1, "name": f"host{index:04d}.example.com", "ip": f"10.0.{index // 250}.{index % 250}"}
+
+
+def _facts(index: int) -> dict[str, str]:
+    return {"os::name": "Debian" if index % 2 else "Ubuntu", "serialnumber": f"SN{index:05d}", "virtual": "kvm"}
+
+
+class _StubForeman(BaseHTTPRequestHandler):
+    in_flight = 0
+    max_in_flight = 0
+    missing_page: int | None = None
+    requests: list[str] = []
+    lock = threading.Lock()
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002 - BaseHTTPRequestHandler API
+        pass
+
+    def do_GET(self) -> None:  # noqa: N802 - BaseHTTPRequestHandler API
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+            cls.requests.append(self.path)
+        try:
+            time.sleep(LATENCY_SECONDS)
+            url = urlparse(self.path)
+            query = {key: values[0] for key, values in parse_qs(url.query).items()}
+            page = int(query.get("page", 1))
+            per_page = int(query.get("per_page", 20))
+            if url.path == "/api/v2/hosts" and page == cls.missing_page:
+                body = None
+            elif url.path == "/api/v2/hosts":
+                body = self._hosts(query.get("search"), page, per_page)
+            elif url.path == "/api/v2/fact_values":
+                body = self._fact_values(query.get("search", ""), page, per_page)
+            elif url.path == "/api/v2/puppetclasses":
+                groups: dict[str, list[dict[str, object]]] = {}
+                for number, name in enumerate(CLASSES, start=1):
+                    groups.setdefault(name.split("::")[0], []).append({"id": number, "name": name})
+                body = {"total": len(CLASSES), "subtotal": len(CLASSES), "page": page, "results": groups}
+            else:
+                self.send_error(404)
+                return
+            payload = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    @staticmethod
+    def _hosts(search: str | None, page: int, per_page: int) -> dict[str, object]:
+        indexes = list(range(HOST_COUNT))
+        if search:
+            match = re.fullmatch(r'class = "(.+)"', search)
+            indexes = [i for i in indexes if match and CLASSES[match.group(1)](i)]
+        window = indexes[(page - 1) * per_page : page * per_page]
+        return {
+            "total": HOST_COUNT,
+            "subtotal": len(indexes),
+            "page": page,
+            "per_page": per_page,
+            "results": [_host(i) for i in window],
+        }
+
+    @staticmethod
+    def _fact_values(search: str, page: int, per_page: int) -> dict[str, object]:
+        match = re.search(r"name \^ \((.+)\)", search)
+        names = [name.strip() for name in match.group(1).split(",")] if match else []
+        values = [
+            (_host(i)["name"], name, value) for i in range(HOST_COUNT) for name, value in _facts(i).items() if name in names
+        ]
+        results: dict[str, dict[str, str]] = {}
+        for host_name, name, value in values[(page - 1) * per_page : page * per_page]:
+            results.setdefault(str(host_name), {})[name] = value
+        return {"total": HOST_COUNT * 20, "subtotal": len(values), "page": page, "results": results}
+
+
+class _SmallPageClient(ForemanClient):
+    _PER_PAGE = PER_PAGE
+
+
+@pytest.fixture
+def foreman_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubForeman)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    _StubForeman.in_flight = 0
+    _StubForeman.max_in_flight = 0
+    _StubForeman.missing_page = None
+    _StubForeman.requests = []
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _client(url: str, max_concurrency: int) -> ForemanClient:
+    config = ForemanClientConfig(base_url=url, username="atlas", token="token", max_concurrency=max_concurrency)
+    return _SmallPageClient(config, cache_namespace=f"stub-{max_concurrency}")
+
+
+def test_parallel_paging_matches_sequential(foreman_url: str) -> None:
+    with _client(foreman_url, 4) as client:
+        sequential = client.list_hosts(force_refresh=True)
+        parallel = client.list_hosts(force_refresh=True, parallel=True)
+
+    assert len(sequential) == HOST_COUNT
+    assert [host["id"] for host in parallel] == [host["id"] for host in sequential]
+
+
+def test_parallel_paging_is_bounded(foreman_url: str) -> None:
+    with _client(foreman_url, 3) as client:
+        hosts = client.list_hosts(force_refresh=True, parallel=True)
+
+    assert len(hosts) == HOST_COUNT
+    assert _StubForeman.max_in_flight <= 3
+    assert len(_StubForeman.requests) == 10
+
+
+def test_bulk_enrichment(foreman_url: str) -> None:
+    with _client(foreman_url, 4) as client:
+        facts = client.fetch_fact_values(["os::name", "serialnumber"])
+        classes = client.fetch_host_puppet_classes()
+
+    assert len(facts) == HOST_COUNT
+    assert facts["host0003.example.com"] == {"os::name": "Debian", "serialnumber": "SN00003"}
+    assert classes["host0030.example.com"] == ["nginx", "ntp", "profile::db"]
+    assert classes["host0001.example.com"] == ["ntp"]
+    # 19 fact pages, the class list, then the class searches (ntp 10 pages, nginx 4, profile::db 1)
+    assert len(_StubForeman.requests) == 19 + 1 + 10 + 4 + 1
+    assert _StubForeman.max_in_flight <= 4
+
+
+def test_refresh_inventory_attaches_enrichment(foreman_url: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    from infrastructure_atlas.application.services import foreman as foreman_service
+
+    monkeypatch.setenv(foreman_service.REFRESH_FACTS_ENV, "os::name,virtual")
+    monkeypatch.setenv(foreman_service.REFRESH_PUPPET_CLASSES_ENV, "true")
+    with _client(foreman_url, 4) as client:
+        hosts, enrichment = foreman_service._fetch_inventory(client)
+
+    assert enrichment == {"facts": ["os::name", "virtual"], "puppetclasses": True, "errors": []}
+    host = next(host for host in hosts if host["name"] == "host0010.example.com")
+    assert host["facts"] == {"os::name": "Ubuntu", "virtual": "kvm"}
+    assert host["puppetclasses"] == ["ntp", "profile::db"]
+
+
+def test_refresh_skips_puppet_classes_by_default(foreman_url: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    from infrastructure_atlas.application.services import foreman as foreman_service
+
+    monkeypatch.delenv(foreman_service.REFRESH_PUPPET_CLASSES_ENV, raising=False)
+    with _client(foreman_url, 4) as client:
+        hosts, enrichment = foreman_service._fetch_inventory(client)
+
+    assert enrichment is not None
+    assert enrichment["puppetclasses"] is False
+    assert all("puppetclasses" not in host for host in hosts)
+    assert not any("puppetclasses" in path or "class" in path for path in _StubForeman.requests)
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_missing_page_fails_the_listing(foreman_url: str, parallel: bool) -> None:
+    _StubForeman.missing_page = 4
+    with _client(foreman_url, 4) as client, pytest.raises(ForemanClientError, match="page 4"):
+        client.list_hosts(force_refresh=True, parallel=parallel)
+
+
+@pytest.mark.perf
+def test_parallel_paging_is_faster(foreman_url: str) -> None:
+    with _client(foreman_url, 4) as client:
+        start = time.perf_counter()
+        client.list_hosts(force_refresh=True)
+        sequential = time.perf_counter() - start
+        start = time.perf_counter()
+        client.list_hosts(force_refresh=True, parallel=True)
+        parallel = time.perf_counter() - start
+
+    # Ten pages: 1 + 9 sequential round trips versus 1 + ceil(9 / 4)
+    assert parallel < sequential * 0.6, f"parallel {parallel:.2f}s vs sequential {sequential:.2f}s"
@@ -0,0 +1,317 @@
+"""NetBox snapshot sync against a local stub NetBox API.
+
+The stub serves devices, VMs and the sites, tenants and clusters they
+reference, with brief nested objects like NetBox does. The tests check that
+records built from a snapshot (full sync, warm start and delta refresh) equal
+the records of the plain pynetbox export, including fields pynetbox used to
+fetch lazily (region, site group, tenant group, cluster site), and that the
+id listing never pulls full objects.
+
+Usage:
+    pytest scripts/test_netbox_snapshot.py
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+from collections.abc import Iterator
+from dataclasses import fields
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+pytest.importorskip("pynetbox")
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from infrastructure_atlas.infrastructure.external import NetboxClient, NetboxClientConfig
+
+PAGE_SIZE = 25
+DEVICE_COUNT = 60
+VM_COUNT = 30
+
+ENDPOINTS = {
+    "dcim/devices": "devices",
+    "virtualization/virtual-machines": "vms",
+    "dcim/sites": "sites",
+    "tenancy/tenants": "tenants",
+    "virtualization/clusters": "clusters",
+    "dcim/regions": "regions",
+    "dcim/site-groups": "site_groups",
+    "tenancy/tenant-groups": "tenant_groups",
+}
+
+
+class _StubNetbox(BaseHTTPRequestHandler):
+    version = "4.1"
+    objects: dict[str, dict[int, dict[str, Any]]] = {}
+    requests: list[tuple[str, dict[str, list[str]]]] = []
+    lock = threading.Lock()
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002 - BaseHTTPRequestHandler API
+        pass
+
+    def do_GET(self) -> None:  # noqa: N802 - BaseHTTPRequestHandler API
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        cls = type(self)
+        with cls.lock:
+            cls.requests.append((url.path, query))
+        path = url.path.strip("/").removeprefix("api").strip("/")
+        if not path:
+            self._send({}, headers={"API-Version": cls.version} if cls.version else {})
+            return
+        if path == "status":
+            self._send({"netbox-version": f"{cls.version}.0"})
+            return
+        for prefix, kind in ENDPOINTS.items():
+            if path == prefix:
+                self._send(self._list(kind, query))
+                return
+            if path.startswith(prefix + "/"):
+                item = cls.objects[kind].get(int(path.rsplit("/", 1)[-1]))
+                if item is None:
+                    self.send_error(404)
+                    return
+                self._send(item)
+                return
+        self.send_error(404)
+
+    def _list(self, kind: str, query: dict[str, list[str]]) -> dict[str, Any]:
+        items = sorted(type(self).objects[kind].values(), key=lambda item: item["id"])
+        if "id" in query:
+            wanted = {int(value) for value in query["id"]}
+            items = [item for item in items if item["id"] in wanted]
+        if "last_updated__gte" in query:
+            items = [item for item in items if item["last_updated"] >= query["last_updated__gte"][0]]
+        if query.get("brief"):
+            items = [_brief(item) for item in items]
+        elif "fields" in query:
+            names = query["fields"][0].split(",")
+            items = [{name: item[name] for name in names} for item in items]
+        limit = int(query.get("limit", [PAGE_SIZE])[0]) or PAGE_SIZE
+        offset = int(query.get("offset", [0])[0])
+        page = items[offset : offset + limit]
+        base = f"http://{self.headers['Host']}{urlparse(self.path).path}"
+        params = "&".join(f"{key}={value}" for key, values in query.items() if key not in {"limit", "offset"} for value in values)
+        next_url = f"{base}?{params}&limit={limit}&offset={offset + limit}" if offset + limit < len(items) else None
+        return {"count": len(items), "next": next_url, "previous": None, "results": page}
+
+    def _send(self, body: dict[str, Any], headers: dict[str, str] | None = None) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def _brief(item: dict[str, Any]) -> dict[str, Any]:
+    return {key: item[key] for key in ("id", "url", "display", "name", "slug", "address") if key in item}
+
+
+def _inventory(base: str) -> dict[str, dict[int, dict[str, Any]]]:
+    def obj(kind_path: str, identifier: int, name: str, **extra: Any) -> dict[str, Any]:
+        return {
+            "id": identifier,
+            "url": f"{base}/api/{kind_path}/{identifier}/",
+            "display": name,
+            "name": name,
+            "slug": name.lower(),
+            "last_updated": "2026-10-01T10:00:00Z",
+            **extra,
+        }
+
+    regions = {i: obj("dcim/regions", i, f"Region{i}") for i in (1, 2)}
+    site_groups = {i: obj("dcim/site-groups", i, f"SiteGroup{i}") for i in (1, 2)}
+    tenant_groups = {i: obj("tenancy/tenant-groups", i, f"TenantGroup{i}") for i in (1, 2)}
+    sites = {
+        i: obj("dcim/sites", i, f"Site{i}", region=_brief(regions[1 + i % 2]), group=_brief(site_groups[1 + i % 2]))
+        for i in range(1, 5)
+    }
+    tenants = {i: obj("tenancy/tenants", i, f"Tenant{i}", group=_brief(tenant_groups[1 + i % 2])) for i in range(1, 4)}
+    clusters = {i: obj("virtualization/clusters", i, f"Cluster{i}", site=_brief(sites[i])) for i in range(1, 3)}
+    manufacturer = obj("dcim/manufacturers", 1, "Dell")
+    device_type = {**_brief(obj("dcim/device-types", 1, "R650")), "model": "R650", "manufacturer": _brief(manufacturer)}
+    role = _brief(obj("dcim/device-roles", 1, "Server"))
+
+    devices = {}
+    for i in range(1, DEVICE_COUNT + 1):
+        devices[i] = {
+            **obj("dcim/devices", i, f"dev{i:03d}"),
+            "status": {"value": "active", "label": "Active"},
+            "site": _brief(sites[1 + i % 4]),
+            "tenant": _brief(tenants[1 + i % 3]) if i % 5 else None,
+            "role": role,
+            "device_type": device_type,
+            "location": None,
+            "cluster": None,
+            "rack": None,
+            "position": None,
+            "face": None,
+            "serial": f"SN{i:04d}",
+            "asset_tag": None,
+            "primary_ip4": {"id": i, "url": f"{base}/api/ipam/ip-addresses/{i}/", "display": f"10.0.0.{i}/24", "address": f"10.0.0.{i}/24", "family": 4},
+            "primary_ip6": None,
+            "primary_ip": None,
+            "oob_ip": None,
+            "tags": [{"id": 1, "url": f"{base}/api/extras/tags/1/", "display": "prod", "name": "prod", "slug": "prod"}],
+            "custom_fields": {"oob_ip": f"192.168.0.{i}"},
+            "description": f"device {i}",
+            "last_updated": f"2026-10-0{1 + i % 5}T10:00:00Z",
+        }
+    vms = {}
+    for i in range(1, VM_COUNT + 1):
+        vms[i] = {
+            **obj("virtualization/virtual-machines", i, f"vm{i:03d}"),
+            "status": {"value": "active", "label": "Active"},
+            "site": _brief(sites[1 + i % 2]),
+            "cluster": _brief(clusters[1 + i % 2]),
+            "tenant": _brief(tenants[1 + i % 3]),
+            "role": role,
+            "platform": _brief(obj("dcim/platforms", 1, "Ubuntu")),
+            "primary_ip4": None,
+            "primary_ip6": None,
+            "primary_ip": None,
+            "oob_ip": None,
+            "tags": [],
+            "custom_fields": {},
+            "comments": "",
+            "description": "",
+            "last_updated": f"2026-10-0{1 + i % 5}T11:00:00Z",
+        }
+    return {
+        "devices": devices,
+        "vms": vms,
+        "sites": sites,
+        "tenants": tenants,
+        "clusters": clusters,
+        "regions": regions,
+        "site_groups": site_groups,
+        "tenant_groups": tenant_groups,
+    }
+
+
+@pytest.fixture
+def netbox_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubNetbox)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    _StubNetbox.version = "4.1"
+    _StubNetbox.objects = _inventory(url)
+    _StubNetbox.requests = []
+    try:
+        yield url
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _client(url: str, snapshot_dir: Path | None) -> NetboxClient:
+    config = NetboxClientConfig(
+        url=url,
+        token="token",
+        cache_ttl_seconds=3600,
+        snapshot_dir=snapshot_dir,
+        snapshot_enabled=snapshot_dir is not None,
+    )
+    return NetboxClient(config)
+
+
+def _export(records) -> list[dict[str, Any]]:
+    rows = [{f.name: getattr(record, f.name) for f in fields(record) if f.name != "source"} for record in records]
+    return sorted(rows, key=lambda row: row["id"])
+
+
+def _live_export(url: str) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    client = _client(url, None)
+    return _export(client.list_devices(force_refresh=True)), _export(client.list_vms(force_refresh=True))
+
+
+def _list_requests(path: str) -> list[dict[str, list[str]]]:
+    return [query for request_path, query in _StubNetbox.requests if request_path == path]
+
+
+def test_snapshot_matches_live_export(netbox_url: str, tmp_path: Path) -> None:
+    live_devices, live_vms = _live_export(netbox_url)
+    _StubNetbox.requests = []
+
+    client = _client(netbox_url, tmp_path)
+    devices = client.list_devices(force_refresh=True)
+    vms = client.list_vms(force_refresh=True)
+
+    # Related fields come from batched list queries, not one lazy fetch per record
+    assert all(path.count("/") == 4 for path, _ in _StubNetbox.requests if path != "/api/")
+    assert _export(devices) == live_devices
+    assert _export(vms) == live_vms
+    device = next(row for row in live_devices if row["id"] == 1)
+    assert (device["region"], device["site_group"], device["tenant_group"]) == ("Region1", "SiteGroup1", "TenantGroup1")
+    assert next(row for row in live_vms if row["id"] == 1)["location"] == "Site2"
+    assert type(devices[0].source) is type(_client(netbox_url, None).get_device(1).source)
+
+
+def test_warm_start_serves_snapshot(netbox_url: str, tmp_path: Path) -> None:
+    live_devices, _ = _live_export(netbox_url)
+    _client(netbox_url, tmp_path).list_devices(force_refresh=True)
+    _StubNetbox.requests = []
+
+    devices = _client(netbox_url, tmp_path).list_devices()
+
+    assert _export(devices) == live_devices
+    assert _StubNetbox.requests == []
+
+
+def test_delta_refresh_matches_live_export(netbox_url: str, tmp_path: Path) -> None:
+    client = _client(netbox_url, tmp_path)
+    client.list_devices(force_refresh=True)
+
+    devices = _StubNetbox.objects["devices"]
+    devices[7] = {**devices[7], "name": "renamed", "display": "renamed", "last_updated": "2026-10-10T09:00:00Z"}
+    del devices[8]
+    devices[DEVICE_COUNT + 1] = {**devices[9], "id": DEVICE_COUNT + 1, "name": "new", "last_updated": "2026-09-01T00:00:00Z"}
+    _StubNetbox.objects["sites"][3]["region"] = _brief(_StubNetbox.objects["regions"][1])
+    _StubNetbox.requests = []
+
+    refreshed = client.list_devices(force_refresh=True)
+
+    listing = _list_requests("/api/dcim/devices/")
+    assert {"fields": ["id,last_updated"]} in [{k: v for k, v in q.items() if k == "fields"} for q in listing]
+    assert all("fields" in q or "last_updated__gte" in q or "id" in q for q in listing)
+    live_devices, _ = _live_export(netbox_url)
+    assert _export(refreshed) == live_devices
+    assert {row["region"] for row in live_devices if row["site"] == "Site3"} == {"Region1"}
+
+
+def test_netbox_3_lists_ids_with_brief(netbox_url: str, tmp_path: Path) -> None:
+    _StubNetbox.version = "3.7"
+    client = _client(netbox_url, tmp_path)
+    client.list_devices(force_refresh=True)
+    _StubNetbox.requests = []
+
+    client.list_devices(force_refresh=True)
+
+    listing = _list_requests("/api/dcim/devices/")
+    assert any(q.get("brief") == ["1"] for q in listing)
+    assert not any("fields" in q for q in listing)
+
+
+def test_unknown_version_falls_back_to_full_sync(netbox_url: str, tmp_path: Path) -> None:
+    _StubNetbox.version = ""
+    client = _client(netbox_url, tmp_path)
+    client.list_devices(force_refresh=True)
+    del _StubNetbox.objects["devices"][3]
+    _StubNetbox.requests = []
+
+    refreshed = client.list_devices(force_refresh=True)
+
+    listing = _list_requests("/api/dcim/devices/")
+    assert not any("brief" in q or "fields" in q or "last_updated__gte" in q for q in listing)
+    assert len(refreshed) == DEVICE_COUNT - 1
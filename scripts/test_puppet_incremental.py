@@ -0,0 +1,146 @@
+"""Incremental Puppet inventory parsing against a temporary git repository.
+
+The tests commit a small user-management tree, parse it with the refresh
+helper of the Puppet service and then change it commit by commit, checking
+that an unchanged commit is skipped, that only the files listed by
+``git diff`` are parsed again, that deleted manifests drop out of the
+inventory and that a parser version bump forces a full parse.
+
+Usage:
+    pytest scripts/test_puppet_incremental.py
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from infrastructure_atlas.application.services import puppet as puppet_service
+from infrastructure_atlas.infrastructure.external import GitClient, GitClientConfig, puppet_parser
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+USERS = ("alice", "bob", "carol")
+
+
+def _user_manifest(username: str, uid: int) -> str:
+    return f"@user::vwuser {{ '{username}':\n  uid => {uid},\n}}\n"
+
+
+def _git(repo: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", "-c", "user.name=Atlas", "-c", "user.email=atlas@example.com", *args],
+        cwd=repo,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+def _commit(repo: Path, message: str) -> str:
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "--allow-empty", "-m", message)
+    return _git(repo, "rev-parse", "HEAD")
+
+
+class _Refresher:
+    """Runs ``_parse_repository`` the way ``refresh_inventory`` does, keeping the inventory cache in memory."""
+
+    def __init__(self, repo: Path, cache_dir: Path) -> None:
+        self.repo = repo
+        self.client = GitClient(GitClientConfig(remote_url=str(repo), local_path=repo))
+        self.files_path = puppet_service._file_cache_path(cache_dir, "test")
+        self.cached: dict[str, Any] | None = None
+
+    def refresh(self) -> tuple[puppet_parser.PuppetInventory, dict[str, Any]]:
+        commit_hash = _git(self.repo, "rev-parse", "HEAD")
+        inventory, stats = puppet_service._parse_repository(
+            self.client, self.repo, self.files_path, commit_hash, lambda: self.cached
+        )
+        self.cached = {"inventory": inventory, "meta": {"commit_hash": commit_hash}}
+        return inventory, stats
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    path = tmp_path / "repo"
+    users_dir = path / puppet_parser._USERS_DIR
+    users_dir.mkdir(parents=True)
+    for uid, username in enumerate(USERS, start=1001):
+        (users_dir / f"{username}.pp").write_text(_user_manifest(username, uid), encoding="utf-8")
+    (path / puppet_parser._VIRTUAL_PP).write_text(
+        "".join(f"class {{ 'user::virtual_users::{username}': }}\n" for username in USERS), encoding="utf-8"
+    )
+    _git(path, "init", "-q")
+    _commit(path, "initial")
+    return path
+
+
+@pytest.fixture
+def refresher(repo: Path, tmp_path: Path) -> _Refresher:
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    return _Refresher(repo, cache_dir)
+
+
+def test_first_parse_reads_every_file(refresher: _Refresher) -> None:
+    inventory, stats = refresher.refresh()
+
+    assert stats == {"mode": "full", "parsed_files": len(USERS) + 1, "changed_files": None}
+    assert sorted(inventory.users) == sorted(USERS)
+    assert all(user.enabled for user in inventory.users.values())
+
+
+def test_unchanged_commit_is_skipped(refresher: _Refresher) -> None:
+    first, _ = refresher.refresh()
+
+    inventory, stats = refresher.refresh()
+
+    assert stats == {"mode": "skipped", "parsed_files": 0, "changed_files": 0}
+    assert inventory is first
+
+
+def test_only_changed_files_are_parsed(repo: Path, refresher: _Refresher) -> None:
+    refresher.refresh()
+    users_dir = repo / puppet_parser._USERS_DIR
+    (users_dir / "alice.pp").write_text(_user_manifest("alice", 2001), encoding="utf-8")
+    (users_dir / "bob.pp").unlink()
+    (users_dir / "README.md").write_text("Not a manifest\n", encoding="utf-8")
+    _commit(repo, "change alice, drop bob")
+
+    inventory, stats = refresher.refresh()
+
+    assert stats == {"mode": "incremental", "parsed_files": 1, "changed_files": 3}
+    assert sorted(inventory.users) == ["alice", "carol"]
+    assert inventory.users["alice"].uid == 2001
+    assert inventory.users["carol"].uid == 1003
+
+
+def test_commit_without_manifest_changes_parses_nothing(repo: Path, refresher: _Refresher) -> None:
+    refresher.refresh()
+    (repo / "README.md").write_text("Puppet tree\n", encoding="utf-8")
+    _commit(repo, "docs only")
+
+    inventory, stats = refresher.refresh()
+
+    assert stats == {"mode": "incremental", "parsed_files": 0, "changed_files": 1}
+    assert sorted(inventory.users) == sorted(USERS)
+
+
+def test_parser_version_bump_forces_full_parse(refresher: _Refresher, monkeypatch: pytest.MonkeyPatch) -> None:
+    refresher.refresh()
+    monkeypatch.setattr(puppet_parser, "PARSER_VERSION", puppet_parser.PARSER_VERSION + 1)
+    monkeypatch.setattr(puppet_service, "PUPPET_PARSER_VERSION", puppet_parser.PARSER_VERSION)
+
+    inventory, stats = refresher.refresh()
+
+    assert stats == {"mode": "full", "parsed_files": len(USERS) + 1, "changed_files": None}
+    assert sorted(inventory.users) == sorted(USERS)
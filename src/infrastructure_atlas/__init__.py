@@ -1,10 +1,17 @@
 """Infrastructure Atlas tools package."""
 
-from . import application, domain, infrastructure, interfaces
-from .cli import app as cli_app
-from .cli import main
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
 from .env import load_env, project_root, require_env
 
+# Subpackages and the CLI are imported on first attribute access, so importing
+# one submodule (e.g. by the ``atlas`` entry point) does not load them all.
+_LAZY_SUBMODULES = {"application", "domain", "infrastructure", "interfaces"}
+_LAZY_CLI_ATTRIBUTES = {"cli_app": "app", "main": "main"}
+
 __all__ = [
     "application",
     "cli_app",
@@ -16,3 +23,12 @@ __all__ = [
     "project_root",
     "require_env",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _LAZY_CLI_ATTRIBUTES:
+        cli = importlib.import_module(".cli", __name__)
+        return getattr(cli, _LAZY_CLI_ATTRIBUTES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,176 @@
+"""Process-wide pool of prepared playground agents and tool-bound LLM clients.
+
+Building an agent re-reads its prompt markdown, converts every skill action to a
+LangChain tool and instantiates an LLM client (with its own HTTP connection
+pool). The playground used to repeat all of that for every chat message; the
+pool keeps one prepared entry per (agent, provider, model, temperature,
+max_tokens, skill set, registry) combination and hands it to every runtime.
+
+Entries are rebuilt automatically when the agent's prompt file changes on disk
+or when the skills registry version moves (skills registered, initialised or
+cleaned up). :func:`invalidate_agent_pool` drops entries explicitly.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from infrastructure_atlas.infrastructure.caching import TTLCache
+from infrastructure_atlas.infrastructure.logging import get_logger
+from infrastructure_atlas.infrastructure.metrics import increment_counter
+
+if TYPE_CHECKING:
+    from infrastructure_atlas.agents.workflow_agent import BaseAgent
+    from infrastructure_atlas.skills import SkillsRegistry
+
+logger = get_logger(__name__)
+
+AGENT_POOL_TTL_SECONDS = 1800.0
+PROMPTS_DIR = Path(__file__).parent / "prompts"
+
+
+@dataclass(frozen=True, slots=True)
+class AgentPoolKey:
+    """Identity of a prepared agent; equal keys share one pooled entry."""
+
+    agent_id: str
+    provider: str
+    model: str
+    temperature: float
+    max_tokens: int
+    skills: tuple[str, ...]
+    registry_id: int
+
+    @classmethod
+    def build(
+        cls,
+        agent_id: str,
+        *,
+        provider: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        skills: list[str] | tuple[str, ...],
+        registry: SkillsRegistry | None,
+    ) -> AgentPoolKey:
+        return cls(
+            agent_id=agent_id,
+            provider=provider,
+            model=model,
+            temperature=float(temperature),
+            max_tokens=int(max_tokens),
+            skills=tuple(sorted(skills)),
+            registry_id=id(registry),
+        )
+
+
+@dataclass(slots=True)
+class PooledAgent:
+    """A prepared agent together with its tool-bound chat LLM."""
+
+    agent: BaseAgent
+    llm: Any
+    provider: str
+    model: str
+    # JSON tool definitions sent with every request, used for token budgeting
+    tool_schema: str = ""
+    signature: tuple[int, int] = (0, 0)
+
+
+def _prompt_signature(agent_id: str) -> int:
+    try:
+        return (PROMPTS_DIR / f"{agent_id}.md").stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _registry_version(registry: SkillsRegistry | None) -> int:
+    return getattr(registry, "version", 0) if registry is not None else 0
+
+
+class AgentPool:
+    """Keyed cache of :class:`PooledAgent` entries with staleness checks."""
+
+    def __init__(self, ttl_seconds: float = AGENT_POOL_TTL_SECONDS, name: str | None = "agents.playground_pool"):
+        self._cache: TTLCache[AgentPoolKey, PooledAgent] = TTLCache(ttl_seconds=ttl_seconds, name=name)
+
+    def acquire(
+        self,
+        key: AgentPoolKey,
+        registry: SkillsRegistry | None,
+        factory: Callable[[], PooledAgent],
+    ) -> PooledAgent:
+        """Return the pooled entry for ``key``, building it with ``factory`` on a miss.
+
+        A cached entry whose prompt file or skills registry changed since it was
+        built is discarded and rebuilt.
+        """
+        signature = (_prompt_signature(key.agent_id), _registry_version(registry))
+
+        def load() -> PooledAgent:
+            entry = factory()
+            entry.signature = signature
+            increment_counter("agent_pool_builds_total", labels={"agent": key.agent_id})
+            logger.info(
+                f"Prepared pooled agent {key.agent_id} ({key.provider}/{key.model}, "
+                f"{len(key.skills)} skill(s))"
+            )
+            return entry
+
+        entry = self._cache.get(key, load)
+        if entry.signature != signature:
+            logger.info(f"Agent {key.agent_id} prompt or skills changed; rebuilding pooled entry")
+            self._cache.invalidate(key)
+            entry = self._cache.get(key, load)
+        return entry
+
+    def invalidate(self, agent_id: str | None = None) -> int:
+        """Drop pooled entries, optionally only those for ``agent_id``.
+
+        Returns:
+            Number of entries removed
+        """
+        if agent_id is None:
+            removed = self._cache.size()
+            self._cache.invalidate()
+            return removed
+        keys = [key for key in list(self._cache.store) if key.agent_id == agent_id]
+        for key in keys:
+            self._cache.invalidate(key)
+        return len(keys)
+
+    def stats(self) -> dict[str, Any]:
+        metrics = self._cache.snapshot_metrics()
+        return {
+            "size": self._cache.size(),
+            "hits": metrics.hits,
+            "misses": metrics.misses,
+            "builds": metrics.loads,
+            "evictions": metrics.evictions,
+        }
+
+
+_AGENT_POOL = AgentPool()
+
+
+def get_agent_pool() -> AgentPool:
+    """Return the process-wide agent pool shared by all playground runtimes."""
+    return _AGENT_POOL
+
+
+def invalidate_agent_pool(agent_id: str | None = None) -> int:
+    """Drop pooled agents, e.g. after editing prompts or reconfiguring skills."""
+    return _AGENT_POOL.invalidate(agent_id)
+
+
+__all__ = [
+    "AGENT_POOL_TTL_SECONDS",
+    "AgentPool",
+    "AgentPoolKey",
+    "PooledAgent",
+    "get_agent_pool",
+    "invalidate_agent_pool",
+]
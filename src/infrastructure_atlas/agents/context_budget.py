@@ -0,0 +1,404 @@
+"""Token-budgeted context assembly for playground conversations.
+
+Every LLM call in a playground chat used to carry the whole session history, so
+long bot threads grew input tokens, latency and cost without bound. The
+:class:`ContextBuilder` fits a conversation into a per-model token budget:
+
+- the most recent turns are always sent verbatim;
+- older turns are represented by a rolling summary stored on the session and
+  regenerated in the background whenever enough history has accumulated;
+- large tool outputs are truncated before they enter the context.
+
+Token counts use tiktoken (the OpenAI tokenizer, and a close proxy for other
+providers). Anthropic and Gemini do not ship local tokenizers, so their counts
+are scaled by a per-model ratio learned from the ``input_tokens`` the provider
+reports after each call.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+
+from infrastructure_atlas.infrastructure.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from langchain_core.language_models import BaseChatModel
+
+logger = get_logger(__name__)
+
+# Upper bound for the prompt we send, regardless of the model's context window
+DEFAULT_CONTEXT_BUDGET = int(os.getenv("ATLAS_PLAYGROUND_CONTEXT_BUDGET", "48000"))
+# Most recent messages that are never folded into the summary
+KEEP_RECENT_MESSAGES = 6
+# Share of the budget verbatim history may use before older turns are folded
+SUMMARY_TRIGGER_RATIO = 0.75
+# Share of the budget kept verbatim after folding
+SUMMARY_TARGET_RATIO = 0.4
+SUMMARY_MAX_TOKENS = 800
+MAX_TOOL_OUTPUT_TOKENS = int(os.getenv("ATLAS_PLAYGROUND_MAX_TOOL_OUTPUT_TOKENS", "6000"))
+# Per-message framing overhead (role markers, separators)
+MESSAGE_OVERHEAD_TOKENS = 4
+CHARS_PER_TOKEN = 4.0
+
+# Context window by model-name prefix; first match wins
+CONTEXT_WINDOWS: tuple[tuple[str, int], ...] = (
+    ("claude", 200_000),
+    ("gpt-5", 400_000),
+    ("gpt-4.1", 1_000_000),
+    ("gpt-4o", 128_000),
+    ("o3", 200_000),
+    ("o4", 200_000),
+    ("gemini", 1_000_000),
+)
+DEFAULT_CONTEXT_WINDOW = 128_000
+
+SUMMARY_PROMPT = (
+    "You maintain a running summary of a conversation between a user and an infrastructure "
+    "operations assistant. Merge the existing summary with the new messages into one concise "
+    "summary. Keep hostnames, IPs, ticket keys, decisions, findings and open questions; drop "
+    "pleasantries and raw tool output. Reply with the summary only."
+)
+
+
+@dataclass(slots=True)
+class RollingSummary:
+    """Summary of the conversation up to (excluding) message index ``upto``."""
+
+    text: str
+    upto: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"text": self.text, "upto": self.upto}
+
+    @classmethod
+    def from_dict(cls, data: Any) -> RollingSummary | None:
+        if not isinstance(data, dict) or not data.get("text"):
+            return None
+        try:
+            return cls(text=str(data["text"]), upto=int(data.get("upto", 0)))
+        except (TypeError, ValueError):
+            return None
+
+
+@dataclass(slots=True)
+class FoldRequest:
+    """Messages that should be merged into the rolling summary."""
+
+    previous: RollingSummary | None
+    messages: list[dict[str, Any]]
+    upto: int
+
+
+@dataclass(slots=True)
+class ContextWindow:
+    """Result of :meth:`ContextBuilder.build`."""
+
+    messages: list[BaseMessage]
+    tokens_before: int
+    tokens_after: int
+    budget: int
+    dropped_messages: int = 0
+    fold: FoldRequest | None = None
+
+    @property
+    def compacted(self) -> bool:
+        return self.tokens_after < self.tokens_before
+
+
+@lru_cache(maxsize=8)
+def _encoding(name: str) -> Any | None:
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding(name)
+    except Exception as exc:  # pragma: no cover - tokenizer optional at runtime
+        logger.debug(f"tiktoken encoding {name} unavailable, estimating tokens from length: {exc}")
+        return None
+
+
+def _encoding_name(provider: str, model: str) -> str:
+    if provider in ("openai", "azure_openai") and model.startswith(("gpt-4o", "gpt-4.1", "gpt-5", "o")):
+        return "o200k_base"
+    return "cl100k_base"
+
+
+@lru_cache(maxsize=4096)
+def _count_text(encoding_name: str, text: str) -> int:
+    encoding = _encoding(encoding_name)
+    if encoding is None:
+        return math.ceil(len(text) / CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+_calibration: dict[tuple[str, str], float] = {}
+_calibration_lock = threading.Lock()
+
+
+def context_window_for(model: str) -> int:
+    for prefix, window in CONTEXT_WINDOWS:
+        if model.startswith(prefix):
+            return window
+    return DEFAULT_CONTEXT_WINDOW
+
+
+def _message_text(message: BaseMessage) -> str:
+    content = message.content
+    if isinstance(content, str):
+        return content
+    parts = []
+    for block in content:
+        if isinstance(block, str):
+            parts.append(block)
+        elif isinstance(block, dict):
+            parts.append(str(block.get("text") or block.get("input") or ""))
+    return "\n".join(parts)
+
+
+def _to_langchain(message: dict[str, Any]) -> BaseMessage:
+    if message.get("role") == "user":
+        return HumanMessage(content=message.get("content", ""))
+    return AIMessage(content=message.get("content", ""))
+
+
+class ContextBuilder:
+    """Assemble LLM messages for one chat turn within a token budget."""
+
+    def __init__(
+        self,
+        provider: str,
+        model: str,
+        max_output_tokens: int,
+        *,
+        budget: int | None = None,
+        tool_schema: str = "",
+        keep_recent: int = KEEP_RECENT_MESSAGES,
+        max_tool_output_tokens: int = MAX_TOOL_OUTPUT_TOKENS,
+    ):
+        """Create a builder for one model.
+
+        Args:
+            provider: LLM provider name
+            model: Model identifier, used to look up the context window
+            max_output_tokens: Tokens reserved for the completion
+            budget: Prompt budget; defaults to ``ATLAS_PLAYGROUND_CONTEXT_BUDGET``
+            tool_schema: Serialized tool definitions sent with every request
+            keep_recent: Most recent messages that are always sent verbatim
+            max_tool_output_tokens: Cap for a single tool result
+        """
+        self.provider = provider
+        self.model = model
+        self.keep_recent = keep_recent
+        self.max_tool_output_tokens = max_tool_output_tokens
+        self._encoding_name = _encoding_name(provider, model)
+        self.tool_tokens = self.count_text(tool_schema) if tool_schema else 0
+        window_budget = context_window_for(model) - max_output_tokens
+        self.budget = max(1_000, min(budget or DEFAULT_CONTEXT_BUDGET, window_budget) - self.tool_tokens)
+
+    # ------------------------------------------------------------------
+    # Token counting
+    # ------------------------------------------------------------------
+    def _raw_count(self, text: str) -> int:
+        return _count_text(self._encoding_name, text)
+
+    def _scale(self) -> float:
+        with _calibration_lock:
+            return _calibration.get((self.provider, self.model), 1.0)
+
+    def count_text(self, text: str) -> int:
+        return math.ceil(self._raw_count(text) * self._scale())
+
+    def count_messages(self, messages: Sequence[BaseMessage]) -> int:
+        raw = sum(self._raw_count(_message_text(message)) + MESSAGE_OVERHEAD_TOKENS for message in messages)
+        return math.ceil(raw * self._scale())
+
+    def calibrate(self, estimated_tokens: int, reported_tokens: int) -> None:
+        """Blend the provider-reported prompt size into the per-model scale factor.
+
+        Args:
+            estimated_tokens: Our estimate for the messages sent (tool definitions excluded)
+            reported_tokens: ``input_tokens`` reported by the provider for that request
+        """
+        estimated_tokens += self.tool_tokens
+        if estimated_tokens <= 0 or reported_tokens <= 0:
+            return
+        key = (self.provider, self.model)
+        with _calibration_lock:
+            current = _calibration.get(key, 1.0)
+            raw_estimate = estimated_tokens / current
+            observed = min(max(reported_tokens / raw_estimate, 0.5), 2.0)
+            _calibration[key] = round(current * 0.8 + observed * 0.2, 4)
+
+    # ------------------------------------------------------------------
+    # Assembly
+    # ------------------------------------------------------------------
+    def truncate_tool_output(self, text: str) -> str:
+        """Cut a tool result down to ``max_tool_output_tokens`` (head and tail kept)."""
+        tokens = self.count_text(text)
+        if tokens <= self.max_tool_output_tokens:
+            return text
+        keep_chars = int(len(text) * self.max_tool_output_tokens / tokens)
+        head = text[: int(keep_chars * 0.8)]
+        tail = text[len(text) - int(keep_chars * 0.2) :] if keep_chars >= 10 else ""
+        omitted = len(text) - len(head) - len(tail)
+        return f"{head}\n\n[... {omitted} characters of tool output omitted ...]\n\n{tail}"
+
+    def _truncate_message(self, message: BaseMessage, max_tokens: int) -> BaseMessage:
+        text = _message_text(message)
+        tokens = self.count_text(text)
+        if tokens <= max_tokens:
+            return message
+        keep_chars = max(int(len(text) * max_tokens / tokens), 0)
+        return message.__class__(content=f"{text[:keep_chars]}\n[... truncated ...]")
+
+    def build(
+        self,
+        system_prompt: str,
+        history: Sequence[dict[str, Any]],
+        current_message: str,
+        *,
+        history_offset: int = 0,
+        summary: RollingSummary | None = None,
+    ) -> ContextWindow:
+        """Fit ``system_prompt`` + history + current message into the budget.
+
+        Args:
+            system_prompt: Agent system prompt
+            history: Prior messages (dicts with ``role``/``content``), oldest first
+            current_message: The user message for this turn
+            history_offset: Absolute index of ``history[0]`` in the conversation
+            summary: Rolling summary of earlier messages, if any
+
+        Returns:
+            ContextWindow with the messages to send and compaction details
+        """
+        system = SystemMessage(content=system_prompt)
+        current = HumanMessage(content=current_message)
+        converted = [_to_langchain(message) for message in history]
+        costs = [self.count_messages([message]) for message in converted]
+        fixed = self.count_messages([system, current])
+        tokens_before = fixed + sum(costs)
+
+        # Messages already represented by the summary are not sent verbatim
+        start = 0
+        if summary is not None:
+            start = min(max(summary.upto - history_offset, 0), len(converted))
+
+        summary_message = None
+        if summary is not None:
+            summary_message = SystemMessage(content=f"## Conversation so far (summary)\n{summary.text}")
+            fixed += self.count_messages([summary_message])
+
+        # Newest-first: keep what fits, but always keep the most recent turns
+        available = self.budget - fixed
+        cut = len(converted)
+        used = 0
+        while cut > start:
+            cost = costs[cut - 1]
+            if used + cost > available and len(converted) - cut >= self.keep_recent:
+                break
+            used += cost
+            cut -= 1
+        verbatim = converted[cut:]
+
+        if used > available and verbatim:
+            # Even the protected recent turns overflow; shrink each one evenly
+            share = max(available // len(verbatim), 64)
+            verbatim = [self._truncate_message(message, share) for message in verbatim]
+
+        messages: list[BaseMessage] = [system]
+        if summary_message is not None:
+            messages.append(summary_message)
+        messages.extend(verbatim)
+        messages.append(current)
+        tokens_after = self.count_messages(messages)
+
+        return ContextWindow(
+            messages=messages,
+            tokens_before=tokens_before,
+            tokens_after=tokens_after,
+            budget=self.budget,
+            dropped_messages=cut - start,
+            fold=self._fold_request(history, costs, start, history_offset, summary),
+        )
+
+    def _fold_request(
+        self,
+        history: Sequence[dict[str, Any]],
+        costs: list[int],
+        start: int,
+        history_offset: int,
+        summary: RollingSummary | None,
+    ) -> FoldRequest | None:
+        """Decide whether older verbatim turns should be folded into the summary."""
+        if sum(costs[start:]) <= self.budget * SUMMARY_TRIGGER_RATIO:
+            return None
+        target = self.budget * SUMMARY_TARGET_RATIO
+        fold_end = len(history)
+        kept = 0
+        while fold_end > start:
+            cost = costs[fold_end - 1]
+            if kept + cost > target and len(history) - fold_end >= self.keep_recent:
+                break
+            kept += cost
+            fold_end -= 1
+        if fold_end <= start:
+            return None
+        return FoldRequest(
+            previous=summary,
+            messages=list(history[start:fold_end]),
+            upto=history_offset + fold_end,
+        )
+
+
+async def summarize(llm: BaseChatModel, request: FoldRequest, count_text: Callable[[str], int]) -> RollingSummary:
+    """Merge ``request.messages`` into the previous summary with one LLM call.
+
+    Only the messages that fit ``DEFAULT_CONTEXT_BUDGET`` are sent; the returned
+    summary's ``upto`` stops after the last one, so the rest stay verbatim and
+    are folded by a later summary.
+    """
+    lines: list[str] = []
+    budget = DEFAULT_CONTEXT_BUDGET
+    for message in request.messages:
+        line = f"{message.get('role', 'assistant')}: {message.get('content', '')}"
+        cost = count_text(line)
+        if cost > budget:
+            if lines:
+                break
+            # A single oversized message is cut so the fold still makes progress
+            line = f"{line[: int(len(line) * budget / cost)]}\n[... truncated ...]"
+            cost = budget
+        budget -= cost
+        lines.append(line)
+    previous = request.previous.text if request.previous else "(none)"
+    response = await llm.ainvoke(
+        [
+            SystemMessage(content=SUMMARY_PROMPT),
+            HumanMessage(content=f"Existing summary:\n{previous}\n\nNew messages:\n" + "\n\n".join(lines)),
+        ]
+    )
+    text = response.content if isinstance(response.content, str) else _message_text(response)
+    return RollingSummary(text=text.strip(), upto=request.upto - (len(request.messages) - len(lines)))
+
+
+__all__ = [
+    "DEFAULT_CONTEXT_BUDGET",
+    "KEEP_RECENT_MESSAGES",
+    "MAX_TOOL_OUTPUT_TOKENS",
+    "SUMMARY_MAX_TOKENS",
+    "ContextBuilder",
+    "ContextWindow",
+    "FoldRequest",
+    "RollingSummary",
+    "context_window_for",
+    "summarize",
+]
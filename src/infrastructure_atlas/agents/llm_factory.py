@@ -133,6 +133,8 @@ def create_llm(
         )
 
     elif provider == "openai":
+        # Report token usage on streamed responses as well
+        kwargs.setdefault("stream_usage", True)
         return llm_class(
             model=model,
             temperature=temperature,
@@ -153,6 +155,7 @@ def create_llm(
         azure_endpoint = kwargs.pop("azure_endpoint", None) or os.getenv("AZURE_OPENAI_ENDPOINT")
         api_version = kwargs.pop("api_version", None) or os.getenv("AZURE_OPENAI_API_VERSION", "2024-08-01-preview")
         deployment = kwargs.pop("azure_deployment", None) or os.getenv("AZURE_OPENAI_DEPLOYMENT", model)
+        kwargs.setdefault("stream_usage", True)
 
         return llm_class(
             azure_deployment=deployment,
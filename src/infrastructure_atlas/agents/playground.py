@@ -7,6 +7,7 @@ agents and skills without the full orchestration pipeline.
 from __future__ import annotations
 
 import asyncio
+import json
 import os
 import time
 import uuid
@@ -16,14 +17,21 @@ from datetime import UTC, datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
-# Default LLM provider - can be overridden via ATLAS_DEFAULT_LLM_PROVIDER env var
-DEFAULT_LLM_PROVIDER = os.getenv("ATLAS_DEFAULT_LLM_PROVIDER", "anthropic")
-
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
-
+from langchain_core.messages import ToolMessage
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from infrastructure_atlas.agents.agent_pool import AgentPoolKey, PooledAgent, get_agent_pool
+from infrastructure_atlas.agents.context_budget import (
+    SUMMARY_MAX_TOKENS,
+    ContextBuilder,
+    FoldRequest,
+    RollingSummary,
+    summarize,
+)
 from infrastructure_atlas.agents.llm_factory import create_llm, get_default_model, get_supported_providers
 from infrastructure_atlas.agents.usage import UsageRecord, calculate_cost, create_usage_service
 from infrastructure_atlas.infrastructure.logging import get_logger
+from infrastructure_atlas.infrastructure.session_registry import BoundedSessionRegistry
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
@@ -31,6 +39,26 @@ if TYPE_CHECKING:
     from infrastructure_atlas.agents.workflow_agent import BaseAgent
     from infrastructure_atlas.skills import SkillsRegistry
 
+# Default LLM provider - can be overridden via ATLAS_DEFAULT_LLM_PROVIDER env var
+DEFAULT_LLM_PROVIDER = os.getenv("ATLAS_DEFAULT_LLM_PROVIDER", "anthropic")
+
+# Number of most recent messages loaded when a persisted session is resumed
+SESSION_HISTORY_TAIL = int(os.getenv("ATLAS_PLAYGROUND_HISTORY_TAIL", "50"))
+
+# Bounds for sessions cached in memory by a runtime; evicted sessions are
+# flushed to the database and reloaded on their next message
+MAX_CACHED_SESSIONS = int(os.getenv("ATLAS_PLAYGROUND_MAX_SESSIONS", "500"))
+SESSION_IDLE_SECONDS = float(os.getenv("ATLAS_PLAYGROUND_SESSION_IDLE_SECONDS", "7200"))
+
+# Session state key holding the rolling conversation summary
+CONTEXT_SUMMARY_STATE_KEY = "_context_summary"
+
+# Upper bound for one LLM call (a whole streamed response when streaming)
+LLM_TIMEOUT_SECONDS = 120.0
+
+# Background summarization tasks by session ID (at most one per session)
+_SUMMARY_TASKS: dict[str, asyncio.Task[None]] = {}
+
 logger = get_logger(__name__)
 
 
@@ -39,6 +67,7 @@ class ChatEventType(str, Enum):
 
     MESSAGE_START = "message_start"
     MESSAGE_DELTA = "message_delta"
+    TEXT_DELTA = "text_delta"  # Partial model output while streaming
     MESSAGE_END = "message_end"
     TOOL_START = "tool_start"
     TOOL_END = "tool_end"
@@ -64,6 +93,24 @@ class ChatEvent:
         }
 
 
+def _message_text(message: Any) -> str:
+    """Return the text parts of a (possibly partial) LLM message.
+
+    Providers return either a string or a list of content blocks; tool-use
+    blocks are skipped.
+    """
+    content = getattr(message, "content", "")
+    if isinstance(content, str):
+        return content
+    parts: list[str] = []
+    for block in content or []:
+        if isinstance(block, str):
+            parts.append(block)
+        elif isinstance(block, dict) and block.get("type") == "text":
+            parts.append(block.get("text", ""))
+    return "".join(parts)
+
+
 @dataclass
 class SkillResult:
     """Result from executing a skill action."""
@@ -205,6 +252,50 @@ class PlaygroundSession:
         self.total_cost_usd = 0.0
         self.created_at = datetime.now(UTC)
         self.updated_at = datetime.now(UTC)
+        # Persistence bookkeeping: ``history_offset`` older messages were not
+        # loaded (tail-only resume); the ``_persisted_*`` values mirror storage
+        # so saves only append new messages and increment counters.
+        self.history_offset = 0
+        self._persisted_messages = 0
+        self._persisted_tokens = 0
+        self._persisted_cost_usd = 0.0
+        self._reset_pending = False
+        self._persisted_updated_at: datetime | None = None
+
+    @property
+    def has_unsaved_changes(self) -> bool:
+        """True when the session changed since it was last persisted."""
+        return self.updated_at != self._persisted_updated_at
+
+    @property
+    def message_count(self) -> int:
+        """Total conversation length, including messages not loaded into memory."""
+        return self.history_offset + len(self.messages)
+
+    @property
+    def context_summary(self) -> RollingSummary | None:
+        """Rolling summary of older turns, persisted with the session state."""
+        return RollingSummary.from_dict(self.state.get(CONTEXT_SUMMARY_STATE_KEY))
+
+    @context_summary.setter
+    def context_summary(self, summary: RollingSummary | None) -> None:
+        if summary is None:
+            self.state.pop(CONTEXT_SUMMARY_STATE_KEY, None)
+        else:
+            self.state[CONTEXT_SUMMARY_STATE_KEY] = summary.to_dict()
+        self.updated_at = datetime.now(UTC)
+
+    def unsaved_messages(self) -> list[dict[str, Any]]:
+        """Messages appended since the session was last persisted."""
+        return self.messages[self._persisted_messages :]
+
+    def mark_persisted(self) -> None:
+        """Record that storage now matches the in-memory session."""
+        self._persisted_messages = len(self.messages)
+        self._persisted_tokens = self.total_tokens
+        self._persisted_cost_usd = self.total_cost_usd
+        self._persisted_updated_at = self.updated_at
+        self._reset_pending = False
 
     def add_message(self, role: str, content: str, **kwargs: Any) -> None:
         """Add a message to the conversation history."""
@@ -237,6 +328,7 @@ class PlaygroundSession:
             "user_id": self.user_id,
             "username": self.username,
             "messages": self.messages,
+            "message_count": self.message_count,
             "state": self.state,
             "config_override": self.config_override,
             "total_tokens": self.total_tokens,
@@ -251,6 +343,10 @@ class PlaygroundSession:
         self.state = {}
         self.total_tokens = 0
         self.total_cost_usd = 0.0
+        self.history_offset = 0
+        # The next save replaces the stored conversation, so every message is unsaved
+        self._persisted_messages = 0
+        self._reset_pending = True
         self.updated_at = datetime.now(UTC)
 
 
@@ -275,17 +371,27 @@ class PlaygroundRuntime:
         self,
         skills_registry: SkillsRegistry,
         db_session: Session | None = None,
+        *,
+        session_registry_name: str | None = None,
     ):
         """Initialize the playground runtime.
 
         Args:
             skills_registry: Registry of available skills
             db_session: Optional database session for persistence
+            session_registry_name: Name under which the in-memory session cache
+                reports metrics; set for long-lived runtimes such as bots
         """
         self.skills = skills_registry
         self.db_session = db_session
-        self._sessions: dict[str, PlaygroundSession] = {}
-        self._agent_cache: dict[str, BaseAgent] = {}
+        self._sessions: BoundedSessionRegistry[str, PlaygroundSession] = BoundedSessionRegistry(
+            session_registry_name or "playground.sessions",
+            max_entries=MAX_CACHED_SESSIONS,
+            idle_seconds=SESSION_IDLE_SECONDS,
+            on_evict=self._flush_evicted_session,
+            register=session_registry_name is not None,
+        )
+        self._agent_pool = get_agent_pool()
 
         logger.info("PlaygroundRuntime initialized")
 
@@ -347,8 +453,8 @@ class PlaygroundRuntime:
         Returns:
             PlaygroundSession instance
         """
-        if session_id and session_id in self._sessions:
-            session = self._sessions[session_id]
+        session = self._sessions.get(session_id) if session_id else None
+        if session is not None:
             # Update session with latest user info and client if provided
             if user_id and not session.user_id:
                 session.user_id = user_id
@@ -411,8 +517,9 @@ class PlaygroundRuntime:
         Returns:
             PlaygroundSession or None if not found
         """
-        if session_id in self._sessions:
-            return self._sessions[session_id]
+        session = self._sessions.get(session_id)
+        if session is not None:
+            return session
 
         if self.db_session:
             return self._load_session_from_db(session_id)
@@ -428,14 +535,43 @@ class PlaygroundRuntime:
         Returns:
             True if deleted, False if not found
         """
-        if session_id in self._sessions:
-            del self._sessions[session_id]
+        self._sessions.pop(session_id)
 
         if self.db_session:
             self._delete_session_from_db(session_id)
 
         return True
 
+    @staticmethod
+    async def _stream_llm(llm: Any, messages: list[Any]) -> AsyncIterator[Any]:
+        """Yield message chunks from ``llm.astream`` within ``LLM_TIMEOUT_SECONDS``."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + LLM_TIMEOUT_SECONDS
+        iterator = llm.astream(messages).__aiter__()
+        try:
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError
+                try:
+                    chunk = await asyncio.wait_for(iterator.__anext__(), timeout=remaining)
+                except StopAsyncIteration:
+                    return
+                yield chunk
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    def _flush_evicted_session(self, session_id: str, session: PlaygroundSession) -> None:
+        """Persist unsaved session changes before the session leaves memory."""
+        if not session.has_unsaved_changes:
+            return
+        backend = os.getenv("ATLAS_STORAGE_BACKEND", "sqlite").lower()
+        if self.db_session or backend == "mongodb":
+            logger.debug(f"Flushing session {session_id} before eviction")
+            self._save_session_to_db(session)
+
     def _get_agent_instance(
         self,
         agent_id: str,
@@ -499,6 +635,68 @@ class PlaygroundRuntime:
 
         return agent_class(config=config, skills_registry=self.skills)
 
+    def _get_pooled_agent(
+        self,
+        agent_id: str,
+        config_override: dict[str, Any] | None = None,
+    ) -> PooledAgent | None:
+        """Get a prepared agent and its tool-bound LLM from the shared pool.
+
+        Agents are pooled per agent, provider, model, temperature, max_tokens and
+        enabled skill set, so repeated messages reuse the loaded prompt, the
+        LangChain tools and the LLM client's HTTP connections.
+
+        Args:
+            agent_id: Agent identifier
+            config_override: Optional configuration overrides
+
+        Returns:
+            Pooled agent entry or None if the agent is unknown
+        """
+        agent_info = AVAILABLE_AGENTS.get(agent_id)
+        if not agent_info:
+            logger.warning(f"Unknown agent: {agent_id}")
+            return None
+
+        override = config_override or {}
+        default_max_tokens = AGENT_DEFAULTS.get(agent_id, {}).get("max_tokens", 4096)
+        skills = agent_info.skills
+        if "skills" in override:
+            enabled_skills = set(override["skills"])
+            skills = [s for s in skills if s in enabled_skills]
+        provider, model = self._resolve_provider_model(
+            override.get("provider", DEFAULT_LLM_PROVIDER),
+            override.get("model", agent_info.default_model),
+        )
+        temperature = override.get("temperature", agent_info.default_temperature)
+        max_tokens = override.get("max_tokens", default_max_tokens)
+
+        key = AgentPoolKey.build(
+            agent_id,
+            provider=provider,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            skills=skills,
+            registry=self.skills,
+        )
+
+        def build() -> PooledAgent:
+            agent = self._get_agent_instance(agent_id, config_override)
+            if agent is None:
+                raise LookupError(agent_id)
+            llm = create_llm(provider=provider, model=model, temperature=temperature, max_tokens=max_tokens)
+            tool_schema = ""
+            if agent._tools:
+                llm = llm.bind_tools(agent._tools)
+                tool_schema = json.dumps([convert_to_openai_tool(tool) for tool in agent._tools], default=str)
+            return PooledAgent(agent=agent, llm=llm, provider=provider, model=model, tool_schema=tool_schema)
+
+        try:
+            return self._agent_pool.acquire(key, self.skills, build)
+        except LookupError:
+            return None
+
     async def chat(  # noqa: PLR0913
         self,
         agent_id: str,
@@ -520,7 +718,9 @@ class PlaygroundRuntime:
             session_id: Optional session ID for context
             state: Optional state to inject
             config_override: Optional configuration overrides
-            stream: Whether to stream the response
+            stream: Stream model output as TEXT_DELTA events while it is
+                generated; the final MESSAGE_DELTA carries the full response
+                either way
             user_id: User ID for usage tracking
             username: Username for usage tracking
             client: Client identifier (web, telegram, slack, teams)
@@ -557,21 +757,17 @@ class PlaygroundRuntime:
         )
 
         try:
-            # Get agent instance
-            agent = self._get_agent_instance(agent_id, session.config_override)
-            if not agent:
+            # Get the prepared agent and its tool-bound LLM from the pool
+            pooled = self._get_pooled_agent(agent_id, session.config_override)
+            if not pooled:
                 yield ChatEvent(
                     type=ChatEventType.ERROR,
                     data={"error": f"Agent '{agent_id}' not found"},
                 )
                 return
 
-            # Use the agent's LLM directly for chat
-            llm = self._create_llm_with_overrides(agent, session.config_override)
-            tools = agent._tools if hasattr(agent, "_tools") else []
-
-            if tools:
-                llm = llm.bind_tools(tools)
+            agent = pooled.agent
+            llm = pooled.llm
 
             # Build system prompt with user context
             system_prompt = agent._system_prompt
@@ -586,15 +782,26 @@ class PlaygroundRuntime:
                     system_prompt = f"{system_prompt}\n\n## Current User\nYou are chatting with:\n{user_context}\n\nWhen searching for tickets assigned to \"me\" or \"my tickets\", use this user's email address."
                     logger.info(f"Added user context to system prompt: {user_context}")
 
-            # Build messages for LLM
-            langchain_messages = [
-                SystemMessage(content=system_prompt),
-                *[
-                    HumanMessage(content=m["content"]) if m["role"] == "user" else AIMessage(content=m["content"])
-                    for m in session.messages[:-1]  # Exclude last message, we'll add it fresh
-                ],
-                HumanMessage(content=message),
-            ]
+            # Build messages for LLM within the model's token budget
+            context = ContextBuilder(
+                pooled.provider, pooled.model, agent.config.max_tokens, tool_schema=pooled.tool_schema
+            )
+            window = context.build(
+                system_prompt,
+                session.messages[:-1],  # Exclude last message, we'll add it fresh
+                message,
+                history_offset=session.history_offset,
+                summary=session.context_summary,
+            )
+            langchain_messages = window.messages
+            if window.compacted:
+                logger.info(
+                    f"Compacted context for session {session.session_id}: "
+                    f"{window.tokens_before} -> {window.tokens_after} tokens "
+                    f"(budget {window.budget}, {window.dropped_messages} message(s) dropped)"
+                )
+            if window.fold is not None:
+                self._schedule_summary(session, window.fold, pooled, context)
 
             # Execute with tool loop
             response_content = ""
@@ -602,20 +809,37 @@ class PlaygroundRuntime:
             output_tokens = 0
             tool_calls_log: list[dict[str, Any]] = []
             max_iterations = 10
-            model = session.config_override.get("model", agent.config.model) if session.config_override else agent.config.model
+            model = pooled.model
 
             for iteration in range(max_iterations):
                 logger.debug(f"LLM iteration {iteration + 1}/{max_iterations}")
-                # Use async LLM call to avoid blocking the event loop
-                response = await asyncio.wait_for(
-                    llm.ainvoke(langchain_messages),
-                    timeout=120.0,  # 2 minute timeout for LLM calls
-                )
+                if stream:
+                    response = None
+                    streamed_text = ""
+                    async for chunk in self._stream_llm(llm, langchain_messages):
+                        response = chunk if response is None else response + chunk
+                        delta = _message_text(chunk)
+                        if delta:
+                            streamed_text += delta
+                            yield ChatEvent(
+                                type=ChatEventType.TEXT_DELTA,
+                                data={"delta": delta, "content": streamed_text, "iteration": iteration},
+                            )
+                    if response is None:
+                        raise RuntimeError("LLM returned an empty stream")
+                else:
+                    # Use async LLM call to avoid blocking the event loop
+                    response = await asyncio.wait_for(
+                        llm.ainvoke(langchain_messages),
+                        timeout=LLM_TIMEOUT_SECONDS,
+                    )
 
                 # Track tokens separately
                 if hasattr(response, "usage_metadata") and response.usage_metadata:
                     input_tokens += response.usage_metadata.get("input_tokens", 0)
                     output_tokens += response.usage_metadata.get("output_tokens", 0)
+                    if iteration == 0:
+                        context.calibrate(window.tokens_after, response.usage_metadata.get("input_tokens", 0))
 
                 # Check for tool calls
                 if hasattr(response, "tool_calls") and response.tool_calls:
@@ -673,13 +897,18 @@ class PlaygroundRuntime:
 
                         langchain_messages.append(
                             ToolMessage(
-                                content=str(tool_result),
+                                content=context.truncate_tool_output(str(tool_result)),
                                 tool_call_id=tool_call["id"],
                             )
                         )
                 else:
                     # No tool calls, we have the final response
-                    response_content = response.content if isinstance(response.content, str) else str(response.content)
+                    if stream:
+                        response_content = _message_text(response)
+                    else:
+                        response_content = (
+                            response.content if isinstance(response.content, str) else str(response.content)
+                        )
                     break
 
             # Calculate accurate cost using pricing table
@@ -712,6 +941,8 @@ class PlaygroundRuntime:
                     "output_tokens": output_tokens,
                     "cost_usd": cost_usd,
                     "duration_ms": duration_ms,
+                    "context_tokens_before": window.tokens_before,
+                    "context_tokens_after": window.tokens_after,
                 },
             )
 
@@ -726,6 +957,8 @@ class PlaygroundRuntime:
                     output_tokens=output_tokens,
                     tool_calls=tool_calls_log if tool_calls_log else None,
                     duration_ms=duration_ms,
+                    context_tokens_before=window.tokens_before,
+                    context_tokens_after=window.tokens_after,
                 )
 
             logger.info(
@@ -735,6 +968,8 @@ class PlaygroundRuntime:
                     "session_id": session.session_id,
                     "input_tokens": input_tokens,
                     "output_tokens": output_tokens,
+                    "context_tokens_before": window.tokens_before,
+                    "context_tokens_after": window.tokens_after,
                     "cost_usd": cost_usd,
                     "duration_ms": duration_ms,
                 },
@@ -766,6 +1001,48 @@ class PlaygroundRuntime:
                 data={"error": error_msg},
             )
 
+    def _schedule_summary(
+        self,
+        session: PlaygroundSession,
+        fold: FoldRequest,
+        pooled: PooledAgent,
+        context: ContextBuilder,
+    ) -> None:
+        """Fold older turns into the session's rolling summary in the background.
+
+        The current turn is answered with the existing summary; the refreshed
+        one is used from the next turn on.
+        """
+        if session.session_id in _SUMMARY_TASKS:
+            return
+
+        async def run() -> None:
+            try:
+                llm = create_llm(
+                    provider=pooled.provider,
+                    model=pooled.model,
+                    temperature=0.0,
+                    max_tokens=SUMMARY_MAX_TOKENS,
+                )
+                summary = await asyncio.wait_for(summarize(llm, fold, context.count_text), timeout=120.0)
+                current = session.context_summary
+                if session.message_count < fold.upto or (current and current.upto >= summary.upto):
+                    return  # Session was cleared or a newer summary landed meanwhile
+                session.context_summary = summary
+                backend = os.getenv("ATLAS_STORAGE_BACKEND", "sqlite").lower()
+                if self.db_session or backend == "mongodb":
+                    self._save_session_to_db(session)
+                logger.info(
+                    f"Updated rolling summary for session {session.session_id}: "
+                    f"{len(fold.messages)} message(s) folded, covers {summary.upto} message(s)"
+                )
+            except Exception as e:
+                logger.warning(f"Failed to summarize session {session.session_id}: {e!s}")
+            finally:
+                _SUMMARY_TASKS.pop(session.session_id, None)
+
+        _SUMMARY_TASKS[session.session_id] = asyncio.get_running_loop().create_task(run())
+
     async def execute_skill(
         self,
         skill_name: str,
@@ -831,42 +1108,15 @@ class PlaygroundRuntime:
 
         return "\n\n".join(parts) if parts else "No context"
 
-    def _create_llm_with_overrides(
-        self,
-        agent: BaseAgent,
-        config_override: dict[str, Any] | None,
-    ):
-        """Create LLM instance with config overrides.
-
-        Supports multiple providers: anthropic, openai, gemini, azure_openai.
-        Provider can be specified in config_override['provider'].
-        """
-        # Default to agent's model config
-        model = agent.config.model
-        temperature = agent.config.temperature
-        max_tokens = agent.config.max_tokens
-        provider = DEFAULT_LLM_PROVIDER  # Default provider (set via ATLAS_DEFAULT_LLM_PROVIDER env var)
-
-        if config_override:
-            provider = config_override.get("provider", provider)
-            model = config_override.get("model", model)
-            temperature = config_override.get("temperature", temperature)
-            max_tokens = config_override.get("max_tokens", max_tokens)
-
+    @staticmethod
+    def _resolve_provider_model(provider: str, model: str) -> tuple[str, str]:
+        """Return the provider and a model that provider can serve."""
         # If model doesn't match provider, use provider's default
         # This handles cases like selecting "openai" but having a Claude model in config
         if provider != "anthropic" and model.startswith("claude"):
             model = get_default_model(provider)
             logger.info(f"Switched to provider default model: {model} for provider {provider}")
-
-        logger.debug(f"Creating LLM: provider={provider}, model={model}, temp={temperature}")
-
-        return create_llm(
-            provider=provider,
-            model=model,
-            temperature=temperature,
-            max_tokens=max_tokens,
-        )
+        return provider, model
 
     def _execute_agent_tool(
         self,
@@ -891,6 +1141,8 @@ class PlaygroundRuntime:
         tool_calls: list[dict[str, Any]] | None,
         duration_ms: int,
         error: str | None = None,
+        context_tokens_before: int | None = None,
+        context_tokens_after: int | None = None,
     ) -> None:
         """Record usage to the database.
 
@@ -904,6 +1156,8 @@ class PlaygroundRuntime:
             tool_calls: List of tool calls made
             duration_ms: Duration in milliseconds
             error: Error message if any
+            context_tokens_before: Estimated prompt tokens before context compaction
+            context_tokens_after: Estimated prompt tokens actually sent
         """
         # Record to Playground usage (for Playground dashboard)
         try:
@@ -919,6 +1173,8 @@ class PlaygroundRuntime:
                 tool_calls=tool_calls,
                 duration_ms=duration_ms,
                 error=error,
+                context_tokens_before=context_tokens_before,
+                context_tokens_after=context_tokens_after,
                 user_id=session.user_id,
                 username=session.username,
                 client=session.client,
@@ -954,7 +1210,11 @@ class PlaygroundRuntime:
             logger.error(f"Failed to record AI activity: {e!s}", exc_info=True)
 
     def _load_session_from_db(self, session_id: str) -> PlaygroundSession | None:
-        """Load a session from the database (MongoDB or SQLite)."""
+        """Load a session from the database (MongoDB or SQLite).
+
+        Only the last ``SESSION_HISTORY_TAIL`` messages are loaded; use
+        :meth:`load_full_history` when the complete conversation is needed.
+        """
         import os
 
         backend = os.getenv("ATLAS_STORAGE_BACKEND", "sqlite").lower()
@@ -966,9 +1226,31 @@ class PlaygroundRuntime:
                 db = get_mongodb_client().atlas
                 collection = db["playground_sessions"]
 
-                doc = collection.find_one({"_id": session_id})
-                if not doc:
+                docs = list(
+                    collection.aggregate(
+                        [
+                            {"$match": {"_id": session_id}},
+                            {
+                                "$project": {
+                                    "agent_id": 1,
+                                    "user_id": 1,
+                                    "client": 1,
+                                    "state": 1,
+                                    "config_override": 1,
+                                    "total_tokens": 1,
+                                    "total_cost_usd": 1,
+                                    "created_at": 1,
+                                    "updated_at": 1,
+                                    "message_count": {"$size": {"$ifNull": ["$messages", []]}},
+                                    "messages": {"$slice": [{"$ifNull": ["$messages", []]}, -SESSION_HISTORY_TAIL]},
+                                }
+                            },
+                        ]
+                    )
+                )
+                if not docs:
                     return None
+                doc = docs[0]
 
                 session = PlaygroundSession(
                     session_id=doc["_id"],
@@ -977,15 +1259,20 @@ class PlaygroundRuntime:
                     client=doc.get("client"),
                 )
                 session.messages = doc.get("messages", [])
+                session.history_offset = doc.get("message_count", 0) - len(session.messages)
                 session.state = doc.get("state", {})
                 session.config_override = doc.get("config_override", {})
                 session.total_tokens = doc.get("total_tokens", 0)
                 session.total_cost_usd = doc.get("total_cost_usd", 0.0)
-                session.created_at = doc.get("created_at")
-                session.updated_at = doc.get("updated_at")
+                session.created_at = doc.get("created_at") or session.created_at
+                session.updated_at = doc.get("updated_at") or session.updated_at
+                session.mark_persisted()
 
                 self._sessions[session_id] = session
-                logger.debug(f"Loaded session {session_id} from MongoDB with {len(session.messages)} messages")
+                logger.debug(
+                    f"Loaded session {session_id} from MongoDB with {len(session.messages)} of "
+                    f"{session.message_count} messages"
+                )
                 return session
 
             except Exception as e:
@@ -997,6 +1284,7 @@ class PlaygroundRuntime:
             return None
 
         from infrastructure_atlas.db.models import PlaygroundSession as DBSession
+        from infrastructure_atlas.db.models import PlaygroundSessionMessage
 
         db_session = self.db_session.query(DBSession).filter_by(id=session_id).first()
         if not db_session:
@@ -1008,23 +1296,87 @@ class PlaygroundRuntime:
             user_id=db_session.user_id,
             client=db_session.client,
         )
-        session.messages = db_session.messages or []
+        tail = (
+            self.db_session.query(PlaygroundSessionMessage.message)
+            .filter_by(session_id=session_id)
+            .order_by(PlaygroundSessionMessage.seq.desc())
+            .limit(SESSION_HISTORY_TAIL)
+            .all()
+        )
+        session.messages = [row.message for row in reversed(tail)]
+        session.history_offset = (db_session.message_count or 0) - len(session.messages)
         session.state = db_session.state or {}
         session.config_override = db_session.config_override or {}
         session.total_tokens = db_session.total_tokens or 0
         session.total_cost_usd = db_session.total_cost_usd or 0.0
         session.created_at = db_session.created_at
         session.updated_at = db_session.updated_at
+        session.mark_persisted()
 
         self._sessions[session_id] = session
         return session
 
+    def load_full_history(self, session: PlaygroundSession) -> list[dict[str, Any]]:
+        """Load messages skipped by the tail-only resume and prepend them to ``session``.
+
+        Returns:
+            The complete message list
+        """
+        if session.history_offset <= 0:
+            return session.messages
+
+        import os
+
+        backend = os.getenv("ATLAS_STORAGE_BACKEND", "sqlite").lower()
+        older: list[dict[str, Any]] | None = None
+
+        if backend == "mongodb":
+            try:
+                from infrastructure_atlas.infrastructure.mongodb.client import get_mongodb_client
+
+                collection = get_mongodb_client().atlas["playground_sessions"]
+                doc = collection.find_one(
+                    {"_id": session.session_id},
+                    {"messages": {"$slice": [0, session.history_offset]}},
+                )
+                older = (doc or {}).get("messages")
+            except Exception as e:
+                logger.error(f"Failed to load session history from MongoDB: {e!s}")
+        elif self.db_session:
+            from infrastructure_atlas.db.models import PlaygroundSessionMessage
+
+            rows = (
+                self.db_session.query(PlaygroundSessionMessage.message)
+                .filter(
+                    PlaygroundSessionMessage.session_id == session.session_id,
+                    PlaygroundSessionMessage.seq < session.history_offset,
+                )
+                .order_by(PlaygroundSessionMessage.seq)
+                .all()
+            )
+            older = [row.message for row in rows]
+
+        if older is not None and len(older) == session.history_offset:
+            session.messages[:0] = older
+            session._persisted_messages += len(older)
+            session.history_offset = 0
+        return session.messages
+
     def _save_session_to_db(self, session: PlaygroundSession) -> None:
-        """Save a session to the database (MongoDB or SQLite)."""
+        """Persist a session to the database (MongoDB or SQLite).
+
+        Saves are append-only: messages added since the last save are pushed
+        (MongoDB) or inserted as rows (SQLite) and token/cost totals are
+        incremented, so a turn never rewrites the existing history. Only a
+        cleared session replaces the stored conversation.
+        """
         import os
         from datetime import UTC, datetime
 
         backend = os.getenv("ATLAS_STORAGE_BACKEND", "sqlite").lower()
+        new_messages = session.unsaved_messages()
+        tokens_delta = session.total_tokens - session._persisted_tokens
+        cost_delta = session.total_cost_usd - session._persisted_cost_usd
 
         if backend == "mongodb":
             try:
@@ -1033,24 +1385,38 @@ class PlaygroundRuntime:
                 db = get_mongodb_client().atlas
                 collection = db["playground_sessions"]
 
-                doc = {
-                    "_id": session.session_id,
+                fields = {
                     "agent_id": session.agent_id,
                     "user_id": session.user_id,
                     "client": session.client,
-                    "messages": session.messages,
                     "state": session.state,
                     "config_override": session.config_override,
-                    "total_tokens": session.total_tokens,
-                    "total_cost_usd": session.total_cost_usd,
                     "updated_at": datetime.now(UTC),
                 }
-
-                result = collection.replace_one({"_id": session.session_id}, doc, upsert=True)
+                if session._reset_pending:
+                    update: dict[str, Any] = {
+                        "$set": {
+                            **fields,
+                            "messages": new_messages,
+                            "total_tokens": session.total_tokens,
+                            "total_cost_usd": session.total_cost_usd,
+                        },
+                    }
+                else:
+                    update = {
+                        "$set": fields,
+                        "$inc": {"total_tokens": tokens_delta, "total_cost_usd": cost_delta},
+                    }
+                    if new_messages:
+                        update["$push"] = {"messages": {"$each": new_messages}}
+                update["$setOnInsert"] = {"created_at": session.created_at}
+
+                result = collection.update_one({"_id": session.session_id}, update, upsert=True)
+                session.mark_persisted()
                 logger.info(
                     f"Saved session {session.session_id} to MongoDB: "
-                    f"messages={len(session.messages)}, matched={result.matched_count}, "
-                    f"modified={result.modified_count}, upserted={result.upserted_id is not None}"
+                    f"appended={len(new_messages)}, total={session.message_count}, "
+                    f"matched={result.matched_count}, upserted={result.upserted_id is not None}"
                 )
             except Exception as e:
                 logger.error(f"Failed to save session to MongoDB: {e!s}", exc_info=True)
@@ -1060,36 +1426,67 @@ class PlaygroundRuntime:
                 return
 
             try:
+                from sqlalchemy import func
+
                 from infrastructure_atlas.db.models import PlaygroundSession as DBSession
+                from infrastructure_atlas.db.models import PlaygroundSessionMessage
 
-                db_session = self.db_session.query(DBSession).filter_by(id=session.session_id).first()
-
-                if db_session:
-                    # Update existing
-                    db_session.agent_id = session.agent_id
-                    db_session.user_id = session.user_id
-                    db_session.client = session.client
-                    db_session.messages = session.messages
-                    db_session.state = session.state
-                    db_session.config_override = session.config_override
-                    db_session.total_tokens = session.total_tokens
-                    db_session.total_cost_usd = session.total_cost_usd
-                else:
-                    # Create new
-                    db_session = DBSession(
-                        id=session.session_id,
-                        agent_id=session.agent_id,
-                        user_id=session.user_id,
-                        client=session.client,
-                        messages=session.messages,
-                        state=session.state,
-                        config_override=session.config_override,
+                values: dict[str, Any] = {
+                    "agent_id": session.agent_id,
+                    "user_id": session.user_id,
+                    "client": session.client,
+                    "state": session.state,
+                    "config_override": session.config_override,
+                    "updated_at": datetime.now(UTC),
+                }
+                if session._reset_pending:
+                    self.db_session.query(PlaygroundSessionMessage).filter_by(
+                        session_id=session.session_id
+                    ).delete(synchronize_session=False)
+                    values.update(
+                        message_count=len(new_messages),
                         total_tokens=session.total_tokens,
                         total_cost_usd=session.total_cost_usd,
+                        messages=[],
+                    )
+                    first_seq = 0
+                else:
+                    values.update(
+                        message_count=DBSession.message_count + len(new_messages),
+                        total_tokens=DBSession.total_tokens + tokens_delta,
+                        total_cost_usd=func.coalesce(DBSession.total_cost_usd, 0.0) + cost_delta,
+                    )
+                    first_seq = session.history_offset + session._persisted_messages
+
+                updated = (
+                    self.db_session.query(DBSession)
+                    .filter_by(id=session.session_id)
+                    .update(values, synchronize_session=False)
+                )
+                if not updated:
+                    self.db_session.add(
+                        DBSession(
+                            id=session.session_id,
+                            agent_id=session.agent_id,
+                            user_id=session.user_id,
+                            client=session.client,
+                            messages=[],
+                            message_count=len(new_messages),
+                            state=session.state,
+                            config_override=session.config_override,
+                            total_tokens=session.total_tokens,
+                            total_cost_usd=session.total_cost_usd,
+                        )
                     )
-                    self.db_session.add(db_session)
+                    self.db_session.flush()
+                    first_seq = 0
 
+                self.db_session.add_all(
+                    PlaygroundSessionMessage(session_id=session.session_id, seq=first_seq + offset, message=message)
+                    for offset, message in enumerate(new_messages)
+                )
                 self.db_session.commit()
+                session.mark_persisted()
             except Exception as e:
                 logger.error(f"Failed to save session to DB: {e!s}")
                 self.db_session.rollback()
@@ -1115,7 +1512,9 @@ class PlaygroundRuntime:
                 return
 
             from infrastructure_atlas.db.models import PlaygroundSession as DBSession
+            from infrastructure_atlas.db.models import PlaygroundSessionMessage
 
+            self.db_session.query(PlaygroundSessionMessage).filter_by(session_id=session_id).delete()
             self.db_session.query(DBSession).filter_by(id=session_id).delete()
             self.db_session.commit()
 
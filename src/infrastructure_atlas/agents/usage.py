@@ -9,15 +9,22 @@ This module provides:
 
 from __future__ import annotations
 
+import uuid
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select
 from sqlalchemy.orm import Session
 
+from infrastructure_atlas.ai.usage_service import usage_write_behind_enabled
 from infrastructure_atlas.db.models import PlaygroundUsage
 from infrastructure_atlas.infrastructure.logging import get_logger
+from infrastructure_atlas.infrastructure.queues.write_behind import (
+    PartialFlushError,
+    WriteBehindBuffer,
+    get_write_behind_buffer,
+)
 
 logger = get_logger(__name__)
 
@@ -83,6 +90,9 @@ class UsageRecord:
     user_id: str | None = None
     username: str | None = None
     client: str | None = None  # web, telegram, slack, teams
+    # Estimated prompt size before/after token-budget compaction
+    context_tokens_before: int | None = None
+    context_tokens_after: int | None = None
 
     @property
     def total_tokens(self) -> int:
@@ -93,6 +103,74 @@ class UsageRecord:
         return calculate_cost(self.model, self.input_tokens, self.output_tokens)
 
 
+def _usage_row(record: UsageRecord) -> dict[str, Any]:
+    """Column values for a usage record, timestamped when it is recorded."""
+    return {
+        "user_id": record.user_id,
+        "username": record.username,
+        "client": record.client or "web",
+        "session_id": record.session_id,
+        "agent_id": record.agent_id,
+        "model": record.model,
+        "user_message": record.user_message,
+        "assistant_message": record.assistant_message,
+        "input_tokens": record.input_tokens,
+        "output_tokens": record.output_tokens,
+        "total_tokens": record.total_tokens,
+        "cost_usd": record.cost_usd,
+        "tool_calls": record.tool_calls,
+        "duration_ms": record.duration_ms,
+        "error": record.error,
+        "context_tokens_before": record.context_tokens_before,
+        "context_tokens_after": record.context_tokens_after,
+        "created_at": datetime.now(UTC),
+    }
+
+
+def _log_usage(usage_id: Any, row: dict[str, Any]) -> None:
+    """Emit the structured usage log for operational monitoring."""
+    logger.info(
+        "Playground usage recorded",
+        extra={
+            "event": "playground_usage",
+            "usage_id": usage_id,
+            "user_id": row["user_id"],
+            "username": row["username"],
+            "client": row["client"],
+            "session_id": row["session_id"],
+            "agent_id": row["agent_id"],
+            "model": row["model"],
+            "input_tokens": row["input_tokens"],
+            "output_tokens": row["output_tokens"],
+            "total_tokens": row["total_tokens"],
+            "cost_usd": row["cost_usd"],
+            "tool_call_count": len(row["tool_calls"]) if row["tool_calls"] else 0,
+            "duration_ms": row["duration_ms"],
+            "context_tokens_before": row["context_tokens_before"],
+            "context_tokens_after": row["context_tokens_after"],
+            "has_error": row["error"] is not None,
+        },
+    )
+
+
+def _flush_sql_usage(rows: list[dict[str, Any]]) -> None:
+    from infrastructure_atlas.db import get_batch_sessionmaker
+
+    with get_batch_sessionmaker()() as session:
+        UsageService(session).write_batch(rows)
+
+
+def _flush_mongodb_usage(docs: list[dict[str, Any]]) -> None:
+    from infrastructure_atlas.infrastructure.mongodb import get_mongodb_client
+
+    MongoDBUsageService(get_mongodb_client().atlas).write_batch(docs)
+
+
+def _usage_buffer(backend: str) -> WriteBehindBuffer[dict[str, Any]]:
+    flush = _flush_mongodb_usage if backend == "mongodb" else _flush_sql_usage
+    return get_write_behind_buffer(f"playground_usage_{backend}", flush)
+
+
 class UsageService:
     """Service for recording and querying playground usage."""
 
@@ -106,60 +184,43 @@ class UsageService:
             record: UsageRecord with all the details
 
         Returns:
-            The created PlaygroundUsage database record
+            The PlaygroundUsage record; with write-behind enabled it is inserted
+            by the next batch flush and has no ``id`` yet
         """
-        # Create database record
-        usage = PlaygroundUsage(
-            user_id=record.user_id,
-            username=record.username,
-            client=record.client or "web",
-            session_id=record.session_id,
-            agent_id=record.agent_id,
-            model=record.model,
-            user_message=record.user_message,
-            assistant_message=record.assistant_message,
-            input_tokens=record.input_tokens,
-            output_tokens=record.output_tokens,
-            total_tokens=record.total_tokens,
-            cost_usd=record.cost_usd,
-            tool_calls=record.tool_calls,
-            duration_ms=record.duration_ms,
-            error=record.error,
-        )
+        from infrastructure_atlas.db import get_batch_sessionmaker
+
+        row = _usage_row(record)
+        usage = PlaygroundUsage(**row)
+
+        # Only buffer when this session targets the database the batch flusher writes to
+        if not (
+            usage_write_behind_enabled()
+            and self.db.get_bind().url == get_batch_sessionmaker().kw["bind"].url
+            and _usage_buffer("sql").submit(row)
+        ):
+            try:
+                self.db.add(usage)
+                self.db.commit()
+                self.db.refresh(usage)
+            except Exception as e:
+                logger.error(f"Failed to record usage to DB: {e!s}")
+                self.db.rollback()
+                raise
+
+        _log_usage(usage.id, row)
+        return usage
 
+    def write_batch(self, rows: list[dict[str, Any]]) -> None:
+        """Insert a batch of usage rows with a single executemany."""
+        if not rows:
+            return
         try:
-            self.db.add(usage)
+            self.db.execute(insert(PlaygroundUsage), rows)
             self.db.commit()
-            self.db.refresh(usage)
-        except Exception as e:
-            logger.error(f"Failed to record usage to DB: {e!s}")
+        except Exception:
             self.db.rollback()
             raise
 
-        # Emit structured log for operational monitoring
-        logger.info(
-            "Playground usage recorded",
-            extra={
-                "event": "playground_usage",
-                "usage_id": usage.id,
-                "user_id": record.user_id,
-                "username": record.username,
-                "client": record.client or "web",
-                "session_id": record.session_id,
-                "agent_id": record.agent_id,
-                "model": record.model,
-                "input_tokens": record.input_tokens,
-                "output_tokens": record.output_tokens,
-                "total_tokens": record.total_tokens,
-                "cost_usd": record.cost_usd,
-                "tool_call_count": len(record.tool_calls) if record.tool_calls else 0,
-                "duration_ms": record.duration_ms,
-                "has_error": record.error is not None,
-            },
-        )
-
-        return usage
-
     def get_user_stats(
         self,
         user_id: str | None = None,
@@ -394,60 +455,35 @@ class MongoDBUsageService:
         self._collection = db["playground_usage"]
 
     def record(self, record: UsageRecord) -> dict[str, Any]:
-        """Record a usage entry to database and emit structured log."""
-        import uuid
-
-        now = datetime.now(UTC)
-        doc = {
-            "_id": str(uuid.uuid4()),
-            "user_id": record.user_id,
-            "username": record.username,
-            "client": record.client or "web",
-            "session_id": record.session_id,
-            "agent_id": record.agent_id,
-            "model": record.model,
-            "user_message": record.user_message,
-            "assistant_message": record.assistant_message,
-            "input_tokens": record.input_tokens,
-            "output_tokens": record.output_tokens,
-            "total_tokens": record.total_tokens,
-            "cost_usd": record.cost_usd,
-            "tool_calls": record.tool_calls,
-            "duration_ms": record.duration_ms,
-            "error": record.error,
-            "created_at": now,
-        }
+        """Record a usage entry to database and emit structured log.
 
-        try:
-            self._collection.insert_one(doc)
-        except Exception as e:
-            logger.error(f"Failed to record usage to MongoDB: {e!s}")
-            raise
+        With write-behind enabled the document is stored with ``insert_many``
+        by the next batch flush.
+        """
+        doc = {"_id": str(uuid.uuid4()), **_usage_row(record)}
 
-        # Emit structured log
-        logger.info(
-            "Playground usage recorded",
-            extra={
-                "event": "playground_usage",
-                "usage_id": doc["_id"],
-                "user_id": record.user_id,
-                "username": record.username,
-                "client": record.client or "web",
-                "session_id": record.session_id,
-                "agent_id": record.agent_id,
-                "model": record.model,
-                "input_tokens": record.input_tokens,
-                "output_tokens": record.output_tokens,
-                "total_tokens": record.total_tokens,
-                "cost_usd": record.cost_usd,
-                "tool_call_count": len(record.tool_calls) if record.tool_calls else 0,
-                "duration_ms": record.duration_ms,
-                "has_error": record.error is not None,
-            },
-        )
+        if not (usage_write_behind_enabled() and _usage_buffer("mongodb").submit(doc)):
+            try:
+                self.write_batch([doc])
+            except Exception as e:
+                logger.error(f"Failed to record usage to MongoDB: {e!s}")
+                raise
 
+        _log_usage(doc["_id"], doc)
         return doc
 
+    def write_batch(self, docs: list[dict[str, Any]]) -> None:
+        """Insert a batch of usage documents, skipping those a re-queued batch already stored.
+
+        Raises:
+            PartialFlushError: With the documents that could not be inserted
+        """
+        from infrastructure_atlas.infrastructure.mongodb.repositories import insert_new_documents
+
+        _, failed = insert_new_documents(self._collection, docs)
+        if failed:
+            raise PartialFlushError(failed, f"Failed to insert {len(failed)} of {len(docs)} usage record(s)")
+
     def get_user_stats(
         self,
         user_id: str | None = None,
@@ -98,7 +98,7 @@ class BaseAgent(ABC):
         self.config = config
         self.skills_registry = skills_registry
         self._system_prompt = self._load_system_prompt()
-        self._llm = self._create_llm()
+        self._llm_instance: ChatAnthropic | None = None
         self._tools: list[BaseTool] = []
 
         # Load tools from skills registry
@@ -115,6 +115,17 @@ class BaseAgent(ABC):
             },
         )
 
+    @property
+    def _llm(self) -> ChatAnthropic:
+        """LLM used by :meth:`think` and :meth:`execute_with_tools`, created on first use.
+
+        Playground chats bring their own provider-specific client, so pooled
+        agents never pay for this one unless a workflow actually calls it.
+        """
+        if self._llm_instance is None:
+            self._llm_instance = self._create_llm()
+        return self._llm_instance
+
     def _load_system_prompt(self) -> str:
         """Load the system prompt from the markdown file."""
         prompt_path = Path(__file__).parent / "prompts" / self.config.prompt_file
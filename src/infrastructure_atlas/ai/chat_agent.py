@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import uuid
 from collections.abc import AsyncGenerator
 from typing import Any
@@ -12,6 +13,7 @@ from infrastructure_atlas.ai.models import (
     AgentConfig,
     ChatMessage,
     ChatResponse,
+    MessageRole,
     ProviderType,
     StreamChunk,
     TokenUsage,
@@ -26,6 +28,9 @@ from infrastructure_atlas.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Upper bound on messages an agent keeps in memory; older turns are dropped
+MAX_HISTORY_MESSAGES = int(os.getenv("ATLAS_CHAT_MAX_HISTORY_MESSAGES", "200"))
+
 
 class ChatAgent:
     """AI chat agent with tool calling capabilities.
@@ -107,6 +112,7 @@ class ChatAgent:
             },
         )
 
+        self._trim_history()
         messages = self._build_messages(message)
         tools = self.tool_registry.get_tools(role=self.config.role) if self.config.tools_enabled else None
 
@@ -220,6 +226,7 @@ class ChatAgent:
             },
         )
 
+        self._trim_history()
         messages = self._build_messages(message)
         tools = self.tool_registry.get_tools(role=self.config.role) if self.config.tools_enabled else None
 
@@ -331,6 +338,22 @@ class ChatAgent:
     def set_history(self, messages: list[ChatMessage]) -> None:
         """Set the conversation history."""
         self._history = list(messages)
+        self._trim_history()
+
+    def _trim_history(self) -> None:
+        """Drop the oldest turns once the history exceeds ``MAX_HISTORY_MESSAGES``.
+
+        Trimming starts at a user message so tool results are never separated
+        from the assistant message that requested them.
+        """
+        overflow = len(self._history) - MAX_HISTORY_MESSAGES
+        if overflow <= 0:
+            return
+        start = next(
+            (i for i in range(overflow, len(self._history)) if self._history[i].role == MessageRole.USER),
+            len(self._history),
+        )
+        del self._history[:start]
 
     def get_usage(self) -> TokenUsage:
         """Get total token usage for this agent."""
@@ -6,18 +6,14 @@ Supports automatic cleanup of old exports.
 
 from __future__ import annotations
 
-import csv
 import tempfile
 import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from openpyxl import Workbook
-from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
-from openpyxl.utils import get_column_letter
-
 from infrastructure_atlas.infrastructure.logging import get_logger
+from infrastructure_atlas.infrastructure.tabular_export import union_headers, write_csv, write_xlsx
 
 logger = get_logger(__name__)
 
@@ -145,87 +141,6 @@ def generate_xlsx(
 
     logger.debug(f"Normalized {len(data)} items to {len(normalized_data)} rows")
 
-    # Create workbook
-    wb = Workbook()
-    ws = wb.active
-    ws.title = sheet_name[:31]  # Excel sheet name limit
-
-    # Styles
-    header_font = Font(bold=True, color="FFFFFF")
-    header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-    header_alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-
-    title_font = Font(bold=True, size=14)
-    title_fill = PatternFill(start_color="D9E2F3", end_color="D9E2F3", fill_type="solid")
-
-    thin_border = Border(
-        left=Side(style="thin"),
-        right=Side(style="thin"),
-        top=Side(style="thin"),
-        bottom=Side(style="thin"),
-    )
-
-    current_row = 1
-
-    # Add title row if provided
-    if title:
-        ws.merge_cells(start_row=1, start_column=1, end_row=1, end_column=len(normalized_data[0]) if normalized_data else 1)
-        title_cell = ws.cell(row=1, column=1, value=title)
-        title_cell.font = title_font
-        title_cell.fill = title_fill
-        title_cell.alignment = Alignment(horizontal="center", vertical="center")
-        current_row = 2
-        # Add empty row after title
-        current_row = 3
-
-    # Get all unique headers from data
-    headers: list[str] = []
-    for row in normalized_data:
-        for key in row.keys():
-            if key not in headers:
-                headers.append(key)
-
-    # Write headers
-    header_row = current_row
-    for col_idx, header in enumerate(headers, 1):
-        cell = ws.cell(row=header_row, column=col_idx, value=_format_header(header))
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = header_alignment
-        cell.border = thin_border
-
-    # Write data rows
-    for row_idx, row_data in enumerate(normalized_data, header_row + 1):
-        for col_idx, header in enumerate(headers, 1):
-            value = row_data.get(header, "")
-            cell = ws.cell(row=row_idx, column=col_idx, value=_format_value(value))
-            cell.border = thin_border
-            cell.alignment = Alignment(vertical="center", wrap_text=True)
-
-            # Apply number formatting for dates
-            if isinstance(value, datetime):
-                cell.number_format = "YYYY-MM-DD HH:MM"
-
-    # Auto-size columns
-    for col_idx, header in enumerate(headers, 1):
-        column_letter = get_column_letter(col_idx)
-
-        # Calculate max width
-        max_length = len(str(header))
-        for row in normalized_data:
-            value = row.get(header, "")
-            cell_length = len(str(value)) if value else 0
-            max_length = max(max_length, min(cell_length, 50))  # Cap at 50 chars
-
-        # Set column width (add padding)
-        ws.column_dimensions[column_letter].width = min(max_length + 2, 50)
-
-    # Freeze header row
-    ws.freeze_panes = ws.cell(row=header_row + 1, column=1)
-
-    # Add auto-filter
-    ws.auto_filter.ref = f"A{header_row}:{get_column_letter(len(headers))}{header_row + len(normalized_data)}"
-
     # Generate filename with timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     safe_filename = "".join(c for c in filename if c.isalnum() or c in "-_").strip()
@@ -235,18 +150,25 @@ def generate_xlsx(
     temp_dir = get_export_dir()
     file_path = temp_dir / full_filename
 
-    wb.save(file_path)
+    result = write_xlsx(
+        file_path,
+        normalized_data,
+        sheet_name=sheet_name,
+        title=title,
+        header_labels=_format_header,
+        value_formatter=_format_value,
+    )
 
-    logger.info(f"Generated xlsx export: {file_path} ({len(normalized_data)} rows)")
+    logger.info(f"Generated xlsx export: {file_path} ({result.row_count} rows)")
 
     return {
         "success": True,
         "file_path": str(file_path),
         "filename": full_filename,
-        "row_count": len(normalized_data),
-        "column_count": len(headers),
+        "row_count": result.row_count,
+        "column_count": result.column_count,
         "file_type": "xlsx",
-        "message": f"Excel file generated with {len(normalized_data)} rows and {len(headers)} columns",
+        "message": f"Excel file generated with {result.row_count} rows and {result.column_count} columns",
     }
 
 
@@ -281,13 +203,6 @@ def generate_csv(
             "success": False,
         }
 
-    # Get all unique headers
-    headers: list[str] = []
-    for row in normalized_data:
-        for key in row.keys():
-            if key not in headers:
-                headers.append(key)
-
     # Generate filename with timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     safe_filename = "".join(c for c in filename if c.isalnum() or c in "-_").strip()
@@ -298,28 +213,19 @@ def generate_csv(
     file_path = temp_dir / full_filename
 
     with open(file_path, "w", newline="", encoding="utf-8") as f:
-        # Add title as comment if provided
-        if title:
-            f.write(f"# {title}\n")
-
-        writer = csv.DictWriter(f, fieldnames=headers, delimiter=delimiter, extrasaction="ignore")
-        writer.writeheader()
+        # Title is added as a comment line; complex values are flattened to strings
+        result = write_csv(f, normalized_data, delimiter=delimiter, title=title, value_formatter=_format_value)
 
-        for row in normalized_data:
-            # Convert complex values to strings
-            clean_row = {k: _format_value(v) for k, v in row.items()}
-            writer.writerow(clean_row)
-
-    logger.info(f"Generated csv export: {file_path} ({len(normalized_data)} rows)")
+    logger.info(f"Generated csv export: {file_path} ({result.row_count} rows)")
 
     return {
         "success": True,
         "file_path": str(file_path),
         "filename": full_filename,
-        "row_count": len(normalized_data),
-        "column_count": len(headers),
+        "row_count": result.row_count,
+        "column_count": result.column_count,
         "file_type": "csv",
-        "message": f"CSV file generated with {len(normalized_data)} rows and {len(headers)} columns",
+        "message": f"CSV file generated with {result.row_count} rows and {result.column_count} columns",
     }
 
 
@@ -353,11 +259,7 @@ def generate_txt(
         }
 
     # Get all unique headers
-    headers: list[str] = []
-    for row in normalized_data:
-        for key in row.keys():
-            if key not in headers:
-                headers.append(key)
+    headers = union_headers(normalized_data)
 
     # Calculate column widths
     col_widths = {h: len(_format_header(h)) for h in headers}
@@ -457,11 +359,7 @@ def generate_docx(
         }
 
     # Get all unique headers
-    headers: list[str] = []
-    for row in normalized_data:
-        for key in row.keys():
-            if key not in headers:
-                headers.append(key)
+    headers = union_headers(normalized_data)
 
     # Create document
     doc = Document()
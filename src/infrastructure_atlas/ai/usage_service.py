@@ -4,15 +4,24 @@ from __future__ import annotations
 
 import csv
 import io
+import os
+import uuid
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from sqlalchemy import desc, func, select
+from sqlalchemy import delete, desc, func, insert, select, update
 from sqlalchemy.orm import Session
 
-from infrastructure_atlas.db.models import AIActivityLog, AIModelConfig
+from infrastructure_atlas.db.models import AIActivityLog, AIModelConfig, AIUsageRollup
+from infrastructure_atlas.infrastructure.caching import TTLCache
 from infrastructure_atlas.infrastructure.logging import get_logger
+from infrastructure_atlas.infrastructure.queues.write_behind import (
+    PartialFlushError,
+    WriteBehindBuffer,
+    get_write_behind_buffer,
+)
 
 from .pricing import PRICING, calculate_cost
 
@@ -76,6 +85,203 @@ class ModelUsageStats:
         }
 
 
+# Rollup buckets maintained at log time; dashboards and trends read these instead of raw logs
+ROLLUP_GRANULARITIES: tuple[str, ...] = ("hour", "day")
+
+_PERIOD_FORMATS = {
+    "hour": "%Y-%m-%d %H:00",
+    "day": "%Y-%m-%d",
+    "month": "%Y-%m",
+}
+
+_ROLLUP_COUNTERS = (
+    "request_count",
+    "tokens_prompt",
+    "tokens_completion",
+    "tokens_reasoning",
+    "tokens_total",
+    "cost_usd",
+    "tps_sum",
+    "tps_count",
+)
+
+
+def _rollup_bucket(ts: datetime, granularity: str) -> datetime:
+    """Truncate a timestamp to the start of its UTC rollup bucket."""
+    ts = ts.astimezone(UTC) if ts.tzinfo else ts.replace(tzinfo=UTC)
+    if granularity == "hour":
+        return ts.replace(minute=0, second=0, microsecond=0)
+    return ts.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _rollup_keys(
+    created_at: datetime,
+    provider: str,
+    model: str,
+    user_id: str | None,
+    app_name: str | None,
+) -> list[dict[str, Any]]:
+    """Build the rollup key for every granularity a log entry contributes to."""
+    return [
+        {
+            "granularity": granularity,
+            "bucket": _rollup_bucket(created_at, granularity),
+            "provider": provider,
+            "model": model,
+            "user_id": user_id or "",
+            "app_name": app_name or "",
+        }
+        for granularity in ROLLUP_GRANULARITIES
+    ]
+
+
+def _rollup_increments(
+    tokens_prompt: int,
+    tokens_completion: int,
+    tokens_reasoning: int,
+    tokens_total: int,
+    cost_usd: float,
+    tokens_per_second: float | None,
+) -> dict[str, int | float]:
+    """Counter deltas contributed by a single activity log entry."""
+    return {
+        "request_count": 1,
+        "tokens_prompt": tokens_prompt or 0,
+        "tokens_completion": tokens_completion or 0,
+        "tokens_reasoning": tokens_reasoning or 0,
+        "tokens_total": tokens_total or 0,
+        "cost_usd": cost_usd or 0.0,
+        "tps_sum": tokens_per_second or 0.0,
+        "tps_count": 1 if tokens_per_second is not None else 0,
+    }
+
+
+def _accumulate_rollup(
+    totals: dict[tuple[Any, ...], dict[str, Any]],
+    key: dict[str, Any],
+    increments: Mapping[str, int | float],
+) -> None:
+    """Fold increments into an in-memory rollup map (used for backfills)."""
+    ident = tuple(key.values())
+    entry = totals.get(ident)
+    if entry is None:
+        totals[ident] = {**key, **increments}
+        return
+    for field, value in increments.items():
+        entry[field] += value
+
+
+def _stats_from_rollup(row: Mapping[str, Any]) -> UsageStats:
+    """Build UsageStats from summed rollup counters."""
+    total_requests = row.get("request_count") or 0
+    total_tokens = row.get("tokens_total") or 0
+    total_cost = row.get("cost_usd") or 0.0
+    tps_count = row.get("tps_count") or 0
+    return UsageStats(
+        total_requests=total_requests,
+        total_tokens=total_tokens,
+        total_prompt_tokens=row.get("tokens_prompt") or 0,
+        total_completion_tokens=row.get("tokens_completion") or 0,
+        total_reasoning_tokens=row.get("tokens_reasoning") or 0,
+        total_cost_usd=total_cost,
+        avg_tokens_per_request=total_tokens / total_requests if total_requests > 0 else 0,
+        avg_cost_per_request=total_cost / total_requests if total_requests > 0 else 0,
+        avg_tokens_per_second=(row.get("tps_sum") or 0.0) / tps_count if tps_count > 0 else 0.0,
+    )
+
+
+def _trend_from_rollups(rows: list[Mapping[str, Any]], granularity: str) -> list[dict[str, Any]]:
+    """Group rollup rows into labelled periods, oldest first."""
+    period_format = _PERIOD_FORMATS.get(granularity, _PERIOD_FORMATS["day"])
+    periods: dict[str, dict[str, Any]] = {}
+    for row in sorted(rows, key=lambda item: item["bucket"]):
+        label = row["bucket"].strftime(period_format)
+        entry = periods.setdefault(label, {"period": label, "request_count": 0, "total_tokens": 0, "total_cost_usd": 0.0})
+        entry["request_count"] += row.get("request_count") or 0
+        entry["total_tokens"] += row.get("tokens_total") or 0
+        entry["total_cost_usd"] += row.get("cost_usd") or 0.0
+    for entry in periods.values():
+        entry["total_cost_usd"] = round(entry["total_cost_usd"], 4)
+    return list(periods.values())
+
+
+def _aggregate_rollups(entries: Iterable[Mapping[str, Any]]) -> list[dict[str, Any]]:
+    """Fold a batch of activity log entries into one rollup row per key."""
+    totals: dict[tuple[Any, ...], dict[str, Any]] = {}
+    for entry in entries:
+        increments = _rollup_increments(
+            entry["tokens_prompt"],
+            entry["tokens_completion"],
+            entry["tokens_reasoning"],
+            entry["tokens_total"],
+            entry["cost_usd"],
+            entry["tokens_per_second"],
+        )
+        keys = _rollup_keys(entry["created_at"], entry["provider"], entry["model"], entry["user_id"], entry["app_name"])
+        for key in keys:
+            _accumulate_rollup(totals, key, increments)
+    return list(totals.values())
+
+
+def _split_rollup(row: Mapping[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Split an aggregated rollup row into its key fields and counter increments."""
+    key = {field: value for field, value in row.items() if field not in _ROLLUP_COUNTERS}
+    return key, {field: row[field] for field in _ROLLUP_COUNTERS}
+
+
+# ============================================================================
+# Write-behind activity logging
+# ============================================================================
+
+USAGE_WRITE_BEHIND_ENV = "ATLAS_USAGE_WRITE_BEHIND"
+PRICING_OVERRIDES_TTL_SECONDS = 60.0
+
+# Custom per-model pricing keyed by (provider, model_id), loaded once per TTL per backend
+_PRICING_OVERRIDES: TTLCache[str, dict[tuple[str, str], tuple[float, float]]] = TTLCache(
+    ttl_seconds=PRICING_OVERRIDES_TTL_SECONDS,
+    name="ai.usage.pricing_overrides",
+)
+
+
+def usage_write_behind_enabled() -> bool:
+    """Whether activity logs are buffered and written in batches (default on)."""
+    value = os.getenv(USAGE_WRITE_BEHIND_ENV, "1")
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _activity_cost(
+    overrides: Mapping[tuple[str, str], tuple[float, float]],
+    provider: str,
+    model: str,
+    tokens_prompt: int,
+    tokens_completion: int,
+) -> float:
+    """Cost of a call, preferring a custom pricing override over the built-in table."""
+    override = overrides.get((provider, model))
+    if override is None:
+        return calculate_cost(model, tokens_prompt, tokens_completion).cost_usd
+    price_input, price_output = override
+    return (tokens_prompt / 1_000_000) * price_input + (tokens_completion / 1_000_000) * price_output
+
+
+def _flush_sql_activity(entries: list[dict[str, Any]]) -> None:
+    from infrastructure_atlas.db import get_batch_sessionmaker
+
+    with get_batch_sessionmaker()() as session:
+        AIUsageService(session).write_activity_batch(entries)
+
+
+def _flush_mongodb_activity(entries: list[dict[str, Any]]) -> None:
+    from infrastructure_atlas.infrastructure.mongodb import get_mongodb_client
+
+    MongoDBIAUsageService(get_mongodb_client().atlas).write_activity_batch(entries)
+
+
+def _activity_buffer(backend: str) -> WriteBehindBuffer[dict[str, Any]]:
+    flush = _flush_mongodb_activity if backend == "mongodb" else _flush_sql_activity
+    return get_write_behind_buffer(f"ai_activity_{backend}", flush)
+
+
 class AIUsageService:
     """Service for tracking AI API usage and managing costs."""
 
@@ -122,51 +328,79 @@ class AIUsageService:
             model_provider: The underlying model provider (for OpenRouter)
 
         Returns:
-            The created AIActivityLog entry
+            The AIActivityLog entry; with write-behind enabled it is persisted
+            asynchronously by the next batch flush
         """
-        # Calculate cost
-        cost_info = calculate_cost(model, tokens_prompt, tokens_completion)
-        cost_usd = cost_info.cost_usd
+        total_tokens = tokens_prompt + tokens_completion + tokens_reasoning
+        cost_usd = _activity_cost(self._pricing_overrides(), provider, model, tokens_prompt, tokens_completion)
 
-        # Check for custom pricing override
-        custom_config = self.get_model_config(provider, model)
-        if custom_config:
-            input_cost = (tokens_prompt / 1_000_000) * custom_config.price_input_per_million
-            output_cost = (tokens_completion / 1_000_000) * custom_config.price_output_per_million
-            cost_usd = input_cost + output_cost
+        values = {
+            "id": str(uuid.uuid4()),
+            "created_at": datetime.now(UTC),
+            "generation_id": generation_id,
+            "provider": provider,
+            "model": model,
+            "model_provider": model_provider,
+            "tokens_prompt": tokens_prompt,
+            "tokens_completion": tokens_completion,
+            "tokens_reasoning": tokens_reasoning,
+            "tokens_total": total_tokens,
+            "cost_usd": cost_usd,
+            "generation_time_ms": generation_time_ms,
+            "time_to_first_token_ms": time_to_first_token_ms,
+            "tokens_per_second": tokens_per_second,
+            "streamed": streamed,
+            "finish_reason": finish_reason,
+            "cancelled": cancelled,
+            "user_id": user_id,
+            "session_id": session_id,
+            "app_name": app_name,
+        }
 
-        total_tokens = tokens_prompt + tokens_completion + tokens_reasoning
+        from infrastructure_atlas.db import get_batch_sessionmaker
 
-        log_entry = AIActivityLog(
-            generation_id=generation_id,
-            provider=provider,
-            model=model,
-            model_provider=model_provider,
-            tokens_prompt=tokens_prompt,
-            tokens_completion=tokens_completion,
-            tokens_reasoning=tokens_reasoning,
-            tokens_total=total_tokens,
-            cost_usd=cost_usd,
-            generation_time_ms=generation_time_ms,
-            time_to_first_token_ms=time_to_first_token_ms,
-            tokens_per_second=tokens_per_second,
-            streamed=streamed,
-            finish_reason=finish_reason,
-            cancelled=cancelled,
-            user_id=user_id,
-            session_id=session_id,
-            app_name=app_name,
+        # Only buffer when this session targets the database the batch flusher writes to
+        buffered = (
+            usage_write_behind_enabled()
+            and self._session.get_bind().url == get_batch_sessionmaker().kw["bind"].url
+            and _activity_buffer("sql").submit(values)
         )
-
-        self._session.add(log_entry)
-        self._session.commit()
+        if not buffered:
+            self.write_activity_batch([values])
 
         logger.debug(
             f"Logged AI activity: {provider}/{model} - "
             f"{total_tokens} tokens, ${cost_usd:.6f}"
         )
 
-        return log_entry
+        return AIActivityLog(**values)
+
+    def write_activity_batch(self, entries: list[dict[str, Any]]) -> None:
+        """Insert activity log rows and their rollup increments in one transaction."""
+        if not entries:
+            return
+        try:
+            self._session.execute(insert(AIActivityLog), entries)
+            self._record_rollups(_aggregate_rollups(entries))
+            self._session.commit()
+        except Exception:
+            self._session.rollback()
+            raise
+
+    def _pricing_overrides(self) -> dict[tuple[str, str], tuple[float, float]]:
+        def _load() -> dict[tuple[str, str], tuple[float, float]]:
+            query = select(
+                AIModelConfig.provider,
+                AIModelConfig.model_id,
+                AIModelConfig.price_input_per_million,
+                AIModelConfig.price_output_per_million,
+            )
+            return {
+                (row.provider, row.model_id): (row.price_input_per_million, row.price_output_per_million)
+                for row in self._session.execute(query)
+            }
+
+        return _PRICING_OVERRIDES.get("sql", _load)
 
     def get_activity_logs(
         self,
@@ -332,48 +566,17 @@ class AIUsageService:
         end_date: datetime | None = None,
         granularity: str = "day",
     ) -> list[dict[str, Any]]:
-        """Get usage statistics over time.
+        """Get usage statistics over time from the pre-aggregated rollups.
+
+        ``start_date`` is widened to the start of its hour/day bucket.
 
         Args:
             start_date: Start date filter
             end_date: End date filter
             granularity: 'hour', 'day', or 'month'
         """
-        # SQLite date function format
-        if granularity == "hour":
-            date_format = "%Y-%m-%d %H:00"
-        elif granularity == "month":
-            date_format = "%Y-%m"
-        else:  # day
-            date_format = "%Y-%m-%d"
-
-        date_func = func.strftime(date_format, AIActivityLog.created_at)
-
-        query = select(
-            date_func.label("period"),
-            func.count(AIActivityLog.id).label("request_count"),
-            func.sum(AIActivityLog.tokens_total).label("total_tokens"),
-            func.sum(AIActivityLog.cost_usd).label("total_cost"),
-        ).group_by(date_func)
-
-        if start_date:
-            query = query.where(AIActivityLog.created_at >= start_date)
-        if end_date:
-            query = query.where(AIActivityLog.created_at <= end_date)
-
-        query = query.order_by(date_func)
-
-        results = self._session.execute(query).all()
-
-        return [
-            {
-                "period": row.period,
-                "request_count": row.request_count or 0,
-                "total_tokens": row.total_tokens or 0,
-                "total_cost_usd": round(row.total_cost or 0.0, 4),
-            }
-            for row in results
-        ]
+        rollup_granularity = "hour" if granularity == "hour" else "day"
+        return _trend_from_rollups(self._rollup_rows(rollup_granularity, start_date, end_date), granularity)
 
     def export_activity_csv(
         self,
@@ -439,6 +642,127 @@ class AIUsageService:
 
         return output.getvalue()
 
+    # Usage Rollup Methods
+
+    def _record_rollups(self, rollups: list[dict[str, Any]]) -> None:
+        """Increment (or create) aggregated rollup rows in the current transaction."""
+        for row in rollups:
+            key, increments = _split_rollup(row)
+            stmt = (
+                update(AIUsageRollup)
+                .where(*(getattr(AIUsageRollup, field) == value for field, value in key.items()))
+                .values({field: getattr(AIUsageRollup, field) + value for field, value in increments.items()})
+                .execution_options(synchronize_session=False)
+            )
+            if self._session.execute(stmt).rowcount == 0:
+                self._session.add(AIUsageRollup(**row))
+
+    def _rollup_rows(
+        self,
+        granularity: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return rollup counters summed per bucket."""
+        query = (
+            select(
+                AIUsageRollup.bucket,
+                *(func.sum(getattr(AIUsageRollup, field)).label(field) for field in _ROLLUP_COUNTERS),
+            )
+            .where(AIUsageRollup.granularity == granularity)
+            .group_by(AIUsageRollup.bucket)
+        )
+        if start_date:
+            query = query.where(AIUsageRollup.bucket >= _rollup_bucket(start_date, granularity))
+        if end_date:
+            query = query.where(AIUsageRollup.bucket <= end_date)
+        return [dict(row._mapping) for row in self._session.execute(query).all()]
+
+    def _rollup_stats(self, start_date: datetime | None = None) -> UsageStats:
+        """Aggregate daily rollups into overall usage statistics."""
+        query = select(
+            *(func.sum(getattr(AIUsageRollup, field)).label(field) for field in _ROLLUP_COUNTERS)
+        ).where(AIUsageRollup.granularity == "day")
+        if start_date:
+            query = query.where(AIUsageRollup.bucket >= start_date)
+        return _stats_from_rollup(self._session.execute(query).one()._mapping)
+
+    def _rollup_usage_by_model(self, start_date: datetime | None = None, limit: int = 20) -> list[ModelUsageStats]:
+        """Per-model usage from daily rollups, most expensive first."""
+        total_cost = func.sum(AIUsageRollup.cost_usd).label("cost_usd")
+        query = (
+            select(
+                AIUsageRollup.provider,
+                AIUsageRollup.model,
+                func.sum(AIUsageRollup.request_count).label("request_count"),
+                func.sum(AIUsageRollup.tokens_total).label("tokens_total"),
+                total_cost,
+                func.sum(AIUsageRollup.tps_sum).label("tps_sum"),
+                func.sum(AIUsageRollup.tps_count).label("tps_count"),
+            )
+            .where(AIUsageRollup.granularity == "day")
+            .group_by(AIUsageRollup.provider, AIUsageRollup.model)
+        )
+        if start_date:
+            query = query.where(AIUsageRollup.bucket >= start_date)
+        query = query.order_by(desc(total_cost)).limit(limit)
+
+        return [
+            ModelUsageStats(
+                provider=row.provider,
+                model=row.model,
+                request_count=row.request_count or 0,
+                total_tokens=row.tokens_total or 0,
+                total_cost_usd=row.cost_usd or 0.0,
+                avg_tokens_per_second=(row.tps_sum or 0.0) / row.tps_count if row.tps_count else 0.0,
+            )
+            for row in self._session.execute(query).all()
+        ]
+
+    def rebuild_usage_rollups(self) -> int:
+        """Recompute all rollups from the raw activity logs.
+
+        Used to backfill history recorded before rollups existed. Run while
+        no AI traffic is being logged, as existing rollups are replaced.
+
+        Returns:
+            Number of activity log entries rolled up
+        """
+        totals: dict[tuple[Any, ...], dict[str, Any]] = {}
+        processed = 0
+        query = select(
+            AIActivityLog.created_at,
+            AIActivityLog.provider,
+            AIActivityLog.model,
+            AIActivityLog.user_id,
+            AIActivityLog.app_name,
+            AIActivityLog.tokens_prompt,
+            AIActivityLog.tokens_completion,
+            AIActivityLog.tokens_reasoning,
+            AIActivityLog.tokens_total,
+            AIActivityLog.cost_usd,
+            AIActivityLog.tokens_per_second,
+        ).execution_options(yield_per=1000)
+        for row in self._session.execute(query):
+            increments = _rollup_increments(
+                row.tokens_prompt,
+                row.tokens_completion,
+                row.tokens_reasoning,
+                row.tokens_total,
+                row.cost_usd,
+                row.tokens_per_second,
+            )
+            for key in _rollup_keys(row.created_at, row.provider, row.model, row.user_id, row.app_name):
+                _accumulate_rollup(totals, key, increments)
+            processed += 1
+
+        self._session.execute(delete(AIUsageRollup))
+        self._session.add_all(AIUsageRollup(**values) for values in totals.values())
+        self._session.commit()
+
+        logger.info(f"Rebuilt {len(totals)} usage rollups from {processed} activity logs")
+        return processed
+
     # Model Configuration Methods
 
     def get_model_config(self, provider: str, model_id: str) -> AIModelConfig | None:
@@ -522,6 +846,7 @@ class AIUsageService:
 
         self._session.add(config)
         self._session.commit()
+        _PRICING_OVERRIDES.invalidate("sql")
 
         logger.info(f"Created model config: {provider}/{model_id}")
         return self._config_to_dict(config)
@@ -555,6 +880,7 @@ class AIUsageService:
                 setattr(config, key, value)
 
         self._session.commit()
+        _PRICING_OVERRIDES.invalidate("sql")
 
         logger.info(f"Updated model config: {config.provider}/{config.model_id}")
         return self._config_to_dict(config)
@@ -569,6 +895,7 @@ class AIUsageService:
 
         self._session.delete(config)
         self._session.commit()
+        _PRICING_OVERRIDES.invalidate("sql")
 
         logger.info(f"Deleted model config: {config.provider}/{config.model_id}")
         return True
@@ -601,20 +928,22 @@ class AIUsageService:
         week_start = today_start - timedelta(days=7)
         month_start = today_start - timedelta(days=30)
 
+        # All figures come from the daily/hourly rollups, never the raw logs
+
         # Overall stats
-        overall = self.get_usage_stats()
+        overall = self._rollup_stats()
 
         # Today's stats
-        today_stats = self.get_usage_stats(start_date=today_start)
+        today_stats = self._rollup_stats(start_date=today_start)
 
         # This week
-        week_stats = self.get_usage_stats(start_date=week_start)
+        week_stats = self._rollup_stats(start_date=week_start)
 
         # This month (30 days)
-        month_stats = self.get_usage_stats(start_date=month_start)
+        month_stats = self._rollup_stats(start_date=month_start)
 
         # Top models
-        top_models = self.get_usage_by_model(start_date=month_start, limit=5)
+        top_models = self._rollup_usage_by_model(start_date=month_start, limit=5)
 
         # Usage trend (last 7 days)
         daily_trend = self.get_usage_over_time(
@@ -640,6 +969,7 @@ class MongoDBIAUsageService:
         self._db: Database = db
         self._activity_collection = db["ai_activity_logs"]
         self._config_collection = db["ai_model_configs"]
+        self._rollup_collection = db["ai_usage_rollups"]
 
     def log_activity(
         self,
@@ -660,22 +990,13 @@ class MongoDBIAUsageService:
         generation_id: str | None = None,
         model_provider: str | None = None,
     ) -> dict[str, Any]:
-        """Log an AI API call to the activity log."""
-        import uuid
-
-        # Calculate cost
-        cost_info = calculate_cost(model, tokens_prompt, tokens_completion)
-        cost_usd = cost_info.cost_usd
-
-        # Check for custom pricing override
-        custom_config = self.get_model_config(provider, model)
-        if custom_config:
-            input_cost = (tokens_prompt / 1_000_000) * custom_config["price_input_per_million"]
-            output_cost = (tokens_completion / 1_000_000) * custom_config["price_output_per_million"]
-            cost_usd = input_cost + output_cost
+        """Log an AI API call to the activity log.
 
+        The document is returned immediately; with write-behind enabled it is
+        stored with ``insert_many`` by the next batch flush.
+        """
         total_tokens = tokens_prompt + tokens_completion + tokens_reasoning
-        now = datetime.now(UTC)
+        cost_usd = _activity_cost(self._pricing_overrides(), provider, model, tokens_prompt, tokens_completion)
 
         doc = {
             "_id": str(uuid.uuid4()),
@@ -697,13 +1018,44 @@ class MongoDBIAUsageService:
             "user_id": user_id,
             "session_id": session_id,
             "app_name": app_name,
-            "created_at": now,
+            "created_at": datetime.now(UTC),
         }
 
-        self._activity_collection.insert_one(doc)
+        if not (usage_write_behind_enabled() and _activity_buffer("mongodb").submit(doc)):
+            self.write_activity_batch([doc])
         logger.debug(f"Logged AI activity: {provider}/{model} - {total_tokens} tokens, ${cost_usd:.6f}")
         return doc
 
+    def write_activity_batch(self, docs: list[dict[str, Any]]) -> None:
+        """Insert activity log documents and upsert their aggregated rollups.
+
+        Documents already stored by an earlier attempt of a re-queued batch are
+        skipped, and rollups only count the documents inserted now.
+
+        Raises:
+            PartialFlushError: With the documents that could not be inserted
+        """
+        from infrastructure_atlas.infrastructure.mongodb.repositories import insert_new_documents
+
+        inserted, failed = insert_new_documents(self._activity_collection, docs)
+        if inserted:
+            self._record_rollups(_aggregate_rollups(inserted))
+        if failed:
+            raise PartialFlushError(failed, f"Failed to insert {len(failed)} of {len(docs)} AI activity log(s)")
+
+    def _pricing_overrides(self) -> dict[tuple[str, str], tuple[float, float]]:
+        def _load() -> dict[tuple[str, str], tuple[float, float]]:
+            projection = {"provider": 1, "model_id": 1, "price_input_per_million": 1, "price_output_per_million": 1}
+            return {
+                (doc["provider"], doc["model_id"]): (
+                    doc.get("price_input_per_million") or 0.0,
+                    doc.get("price_output_per_million") or 0.0,
+                )
+                for doc in self._config_collection.find({}, projection)
+            }
+
+        return _PRICING_OVERRIDES.get("mongodb", _load)
+
     def get_activity_logs(
         self,
         limit: int = 100,
@@ -871,45 +1223,12 @@ class MongoDBIAUsageService:
         end_date: datetime | None = None,
         granularity: str = "day",
     ) -> list[dict[str, Any]]:
-        """Get usage statistics over time."""
-        match_stage: dict[str, Any] = {}
-        if start_date:
-            match_stage.setdefault("created_at", {})["$gte"] = start_date
-        if end_date:
-            match_stage.setdefault("created_at", {})["$lte"] = end_date
-
-        # MongoDB date grouping
-        if granularity == "hour":
-            date_expr = {"$dateToString": {"format": "%Y-%m-%d %H:00", "date": "$created_at"}}
-        elif granularity == "month":
-            date_expr = {"$dateToString": {"format": "%Y-%m", "date": "$created_at"}}
-        else:  # day
-            date_expr = {"$dateToString": {"format": "%Y-%m-%d", "date": "$created_at"}}
-
-        pipeline = [
-            {"$match": match_stage} if match_stage else {"$match": {}},
-            {
-                "$group": {
-                    "_id": date_expr,
-                    "request_count": {"$sum": 1},
-                    "total_tokens": {"$sum": "$tokens_total"},
-                    "total_cost": {"$sum": "$cost_usd"},
-                }
-            },
-            {"$sort": {"_id": 1}},
-        ]
+        """Get usage statistics over time from the pre-aggregated rollups.
 
-        results = list(self._activity_collection.aggregate(pipeline))
-
-        return [
-            {
-                "period": row["_id"],
-                "request_count": row.get("request_count", 0),
-                "total_tokens": row.get("total_tokens", 0),
-                "total_cost_usd": round(row.get("total_cost", 0.0), 4),
-            }
-            for row in results
-        ]
+        ``start_date`` is widened to the start of its hour/day bucket.
+        """
+        rollup_granularity = "hour" if granularity == "hour" else "day"
+        return _trend_from_rollups(self._rollup_rows(rollup_granularity, start_date, end_date), granularity)
 
     def export_activity_csv(
         self,
@@ -960,6 +1279,132 @@ class MongoDBIAUsageService:
 
         return output.getvalue()
 
+    # Usage Rollup Methods
+
+    def _record_rollups(self, rollups: list[dict[str, Any]]) -> None:
+        """Upsert aggregated rollup documents with ``$inc``."""
+        from pymongo import UpdateOne
+
+        operations = []
+        for row in rollups:
+            key, increments = _split_rollup(row)
+            operations.append(UpdateOne(key, {"$inc": increments}, upsert=True))
+        try:
+            self._rollup_collection.bulk_write(operations, ordered=False)
+        except Exception as e:
+            # The raw logs are already stored; `atlas db rebuild-usage-rollups` repairs drift
+            logger.warning(f"Failed to update AI usage rollups: {e}")
+
+    @staticmethod
+    def _rollup_sum_fields() -> dict[str, Any]:
+        return {field: {"$sum": f"${field}"} for field in _ROLLUP_COUNTERS}
+
+    def _rollup_rows(
+        self,
+        granularity: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return rollup counters summed per bucket."""
+        match_stage: dict[str, Any] = {"granularity": granularity}
+        if start_date:
+            match_stage.setdefault("bucket", {})["$gte"] = _rollup_bucket(start_date, granularity)
+        if end_date:
+            match_stage.setdefault("bucket", {})["$lte"] = end_date
+
+        pipeline = [
+            {"$match": match_stage},
+            {"$group": {"_id": "$bucket", **self._rollup_sum_fields()}},
+        ]
+        return [{**row, "bucket": row["_id"]} for row in self._rollup_collection.aggregate(pipeline)]
+
+    def _rollup_stats(self, start_date: datetime | None = None) -> UsageStats:
+        """Aggregate daily rollups into overall usage statistics."""
+        match_stage: dict[str, Any] = {"granularity": "day"}
+        if start_date:
+            match_stage["bucket"] = {"$gte": start_date}
+
+        pipeline = [
+            {"$match": match_stage},
+            {"$group": {"_id": None, **self._rollup_sum_fields()}},
+        ]
+        results = list(self._rollup_collection.aggregate(pipeline))
+        return _stats_from_rollup(results[0] if results else {})
+
+    def _rollup_usage_by_model(self, start_date: datetime | None = None, limit: int = 20) -> list[ModelUsageStats]:
+        """Per-model usage from daily rollups, most expensive first."""
+        match_stage: dict[str, Any] = {"granularity": "day"}
+        if start_date:
+            match_stage["bucket"] = {"$gte": start_date}
+
+        pipeline = [
+            {"$match": match_stage},
+            {"$group": {"_id": {"provider": "$provider", "model": "$model"}, **self._rollup_sum_fields()}},
+            {"$sort": {"cost_usd": -1}},
+            {"$limit": limit},
+        ]
+
+        return [
+            ModelUsageStats(
+                provider=row["_id"]["provider"],
+                model=row["_id"]["model"],
+                request_count=row.get("request_count", 0),
+                total_tokens=row.get("tokens_total", 0),
+                total_cost_usd=row.get("cost_usd", 0.0),
+                avg_tokens_per_second=row.get("tps_sum", 0.0) / row["tps_count"] if row.get("tps_count") else 0.0,
+            )
+            for row in self._rollup_collection.aggregate(pipeline)
+        ]
+
+    def rebuild_usage_rollups(self) -> int:
+        """Recompute all rollups from the raw activity logs.
+
+        Used to backfill history recorded before rollups existed. Run while
+        no AI traffic is being logged, as existing rollups are replaced.
+
+        Returns:
+            Number of activity log entries rolled up
+        """
+        totals: dict[tuple[Any, ...], dict[str, Any]] = {}
+        processed = 0
+        projection = {
+            "_id": 0,
+            "created_at": 1,
+            "provider": 1,
+            "model": 1,
+            "user_id": 1,
+            "app_name": 1,
+            "tokens_prompt": 1,
+            "tokens_completion": 1,
+            "tokens_reasoning": 1,
+            "tokens_total": 1,
+            "cost_usd": 1,
+            "tokens_per_second": 1,
+        }
+        for log in self._activity_collection.find({}, projection, batch_size=1000):
+            created_at = log.get("created_at")
+            if not isinstance(created_at, datetime):
+                continue
+            increments = _rollup_increments(
+                log.get("tokens_prompt", 0),
+                log.get("tokens_completion", 0),
+                log.get("tokens_reasoning", 0),
+                log.get("tokens_total", 0),
+                log.get("cost_usd", 0.0),
+                log.get("tokens_per_second"),
+            )
+            keys = _rollup_keys(created_at, log.get("provider") or "", log.get("model") or "", log.get("user_id"), log.get("app_name"))
+            for key in keys:
+                _accumulate_rollup(totals, key, increments)
+            processed += 1
+
+        self._rollup_collection.delete_many({})
+        if totals:
+            self._rollup_collection.insert_many(list(totals.values()), ordered=False)
+
+        logger.info(f"Rebuilt {len(totals)} usage rollups from {processed} activity logs")
+        return processed
+
     # Model Configuration Methods
 
     def get_model_config(self, provider: str, model_id: str) -> dict[str, Any] | None:
@@ -1016,8 +1461,6 @@ class MongoDBIAUsageService:
         is_preferred: bool = False,
     ) -> dict[str, Any]:
         """Create a new model configuration."""
-        import uuid
-
         existing = self.get_model_config(provider, model_id)
         if existing:
             raise ValueError(f"Model config for {provider}/{model_id} already exists")
@@ -1042,6 +1485,7 @@ class MongoDBIAUsageService:
 
         self._config_collection.insert_one(doc)
         logger.info(f"Created model config: {provider}/{model_id}")
+        _PRICING_OVERRIDES.invalidate("mongodb")
         return self._config_to_dict(doc)
 
     def update_model_config(
@@ -1067,6 +1511,7 @@ class MongoDBIAUsageService:
 
         if result:
             logger.info(f"Updated model config: {result['provider']}/{result['model_id']}")
+            _PRICING_OVERRIDES.invalidate("mongodb")
             return self._config_to_dict(result)
         return None
 
@@ -1075,6 +1520,7 @@ class MongoDBIAUsageService:
         result = self._config_collection.find_one_and_delete({"_id": config_id})
         if result:
             logger.info(f"Deleted model config: {result['provider']}/{result['model_id']}")
+            _PRICING_OVERRIDES.invalidate("mongodb")
             return True
         return False
 
@@ -1106,11 +1552,12 @@ class MongoDBIAUsageService:
         week_start = today_start - timedelta(days=7)
         month_start = today_start - timedelta(days=30)
 
-        overall = self.get_usage_stats()
-        today_stats = self.get_usage_stats(start_date=today_start)
-        week_stats = self.get_usage_stats(start_date=week_start)
-        month_stats = self.get_usage_stats(start_date=month_start)
-        top_models = self.get_usage_by_model(start_date=month_start, limit=5)
+        # All figures come from the daily/hourly rollups, never the raw logs
+        overall = self._rollup_stats()
+        today_stats = self._rollup_stats(start_date=today_start)
+        week_stats = self._rollup_stats(start_date=week_start)
+        month_stats = self._rollup_stats(start_date=month_start)
+        top_models = self._rollup_usage_by_model(start_date=month_start, limit=5)
         daily_trend = self.get_usage_over_time(start_date=week_start, granularity="day")
 
         return {
@@ -1156,5 +1603,7 @@ __all__ = [
     "MongoDBIAUsageService",
     "UsageStats",
     "ModelUsageStats",
+    "ROLLUP_GRANULARITIES",
     "create_usage_service",
+    "usage_write_behind_enabled",
 ]
@@ -7,8 +7,8 @@ import shutil
 import sys
 import time
 import warnings
-from collections.abc import Callable, Collection, Mapping, Sequence
-from contextlib import contextmanager
+from collections.abc import AsyncIterator, Callable, Collection, Mapping, Sequence
+from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
@@ -70,6 +70,7 @@ from infrastructure_atlas.domain.integrations.commvault import (
     CommvaultJobList,
 )
 from infrastructure_atlas.env import load_env, project_root
+from infrastructure_atlas.infrastructure.caching import get_cache_registry
 from infrastructure_atlas.infrastructure.external.commvault_client import (
     CommvaultClient,
     CommvaultClientConfig,
@@ -77,6 +78,7 @@ from infrastructure_atlas.infrastructure.external.commvault_client import (
 )
 from infrastructure_atlas.infrastructure.logging import get_logger, logging_context, setup_logging
 from infrastructure_atlas.infrastructure.metrics import get_metrics_snapshot, snapshot_to_prometheus
+from infrastructure_atlas.infrastructure.queues.write_behind import flush_all_write_behind_buffers
 from infrastructure_atlas.infrastructure.security import sync_secure_settings
 from infrastructure_atlas.infrastructure.tracing import init_tracing, tracing_enabled
 from infrastructure_atlas.interfaces.api import bootstrap_api
@@ -416,8 +418,16 @@ UI_SECRET = os.getenv("ATLAS_UI_SECRET", "").strip() or secrets.token_hex(32)
 SESSION_COOKIE_NAME = "atlas_ui"
 SESSION_USER_KEY = "user_id"
 
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    yield
+    # Persist buffered usage/activity logs before the worker exits
+    flush_all_write_behind_buffers()
+
+
 # Initialize FastAPI application
-app = FastAPI(title="Infrastructure Atlas API", version="0.1.0")
+app = FastAPI(title="Infrastructure Atlas API", version="0.1.0", lifespan=_lifespan)
 app.add_middleware(
     ObservabilityMiddleware,
     metrics_enabled=METRICS_ENABLED,
@@ -446,6 +456,7 @@ if METRICS_ENABLED:
     @app.get("/metrics", response_class=PlainTextResponse)
     def metrics_endpoint(request: Request) -> PlainTextResponse:
         _require_metrics_token(request)
+        get_cache_registry().publish_metrics()
         payload = snapshot_to_prometheus(get_metrics_snapshot())
         return PlainTextResponse(payload, media_type=METRICS_MEDIA_TYPE)
 
@@ -2004,6 +2015,26 @@ def admin_backup_restore(req: BackupRestoreRequest, user: OptionalUserDep = None
         return result
 
 
+@app.post("/admin/backup/prune-chunks")
+def admin_backup_prune_chunks(req: BackupCreateRequest = None, user: OptionalUserDep = None):
+    """Delete stored incremental-backup chunks no backup references anymore."""
+    actor = getattr(user, "username", None)
+    password = req.password if req else None
+
+    with task_logging("admin.backup_prune_chunks", actor=actor, trigger="ui") as task_log:
+        try:
+            result = backup_manager.prune_backup_chunks(password=password)
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+        task_log.add_success(status=result.get("status"), deleted=result.get("deleted"))
+
+        if result.get("status") == "error":
+            raise HTTPException(status_code=500, detail=result.get("reason", "Chunk pruning failed"))
+
+        return result
+
+
 @app.delete("/admin/backup/{filename}")
 def admin_backup_delete(filename: str, user: OptionalUserDep = None):
     """Delete a backup."""
@@ -566,6 +566,7 @@
                 document.getElementById('playground-messages').appendChild(currentMessageEl);
                 break;
 
+              case 'text_delta':  // partial output while streaming
               case 'message_delta':
                 responseContent = event.data.content || '';
                 if (currentMessageEl) {
@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 import os
 import uuid
-from collections.abc import Iterable, Mapping
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
@@ -17,19 +17,43 @@ from sqlalchemy.orm import Session
 
 from infrastructure_atlas.domain.entities import ForemanConfigEntity
 from infrastructure_atlas.env import project_root
+from infrastructure_atlas.infrastructure.cache_metadata import load_cache_status, write_json_cache
 from infrastructure_atlas.infrastructure.db.repositories import SqlAlchemyForemanConfigRepository
 from infrastructure_atlas.infrastructure.external import (
     ForemanAuthError,
     ForemanClient,
     ForemanClientConfig,
     ForemanClientError,
+    get_foreman_client_pool,
 )
+from infrastructure_atlas.infrastructure.host_identity import foreman_host_refs, get_host_identity_index
 from infrastructure_atlas.infrastructure.logging import get_logger
 from infrastructure_atlas.infrastructure.security.secret_store import require_secret_store
 
 logger = get_logger(__name__)
 
 CACHE_DIR_ENV = "FOREMAN_CACHE_DIR"
+REFRESH_ENRICH_ENV = "FOREMAN_REFRESH_ENRICH"
+REFRESH_FACTS_ENV = "FOREMAN_REFRESH_FACTS"
+# Class enrichment costs one host search per Puppet class, so it is opt-in
+REFRESH_PUPPET_CLASSES_ENV = "FOREMAN_REFRESH_PUPPET_CLASSES"
+
+# Facts copied onto each cached host during a refresh (legacy and structured names)
+DEFAULT_REFRESH_FACTS = (
+    "os::name",
+    "os::release::full",
+    "operatingsystem",
+    "operatingsystemrelease",
+    "kernelrelease",
+    "virtual",
+    "is_virtual",
+    "processorcount",
+    "memorysize_mb",
+    "manufacturer",
+    "productname",
+    "serialnumber",
+    "puppetversion",
+)
 _CACHE_LOCK = Lock()
 _CACHE_LOCKS: dict[str, Lock] = {}
 
@@ -101,6 +125,97 @@ def _cache_lock_for(config_id: str) -> Lock:
         return _CACHE_LOCKS.setdefault(config_id, Lock())
 
 
+def _cache_status(path: Path, load_entry: Callable[[], dict[str, Any] | None]) -> dict[str, Any] | None:
+    """Read cache status from the metadata sidecar, loading the cache only to backfill it."""
+
+    def _load_meta() -> dict[str, Any] | None:
+        entry = load_entry()
+        return entry["meta"] if entry else None
+
+    meta = load_cache_status(path, _load_meta)
+    if meta is not None:
+        meta["generated_at"] = _parse_iso_datetime(meta.get("generated_at"))
+    return meta
+
+
+def _env_flag(name: str, default: bool = False) -> bool:
+    """Parse boolean environment variable."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _refresh_fact_names() -> list[str]:
+    raw = os.getenv(REFRESH_FACTS_ENV)
+    if raw is None:
+        return list(DEFAULT_REFRESH_FACTS)
+    return [name.strip() for name in raw.split(",") if name.strip()]
+
+
+def _fetch_inventory(client: ForemanClient) -> tuple[list[dict[str, Any]], dict[str, Any] | None]:
+    """Fetch all hosts for a refresh, enriched with bulk-loaded facts and Puppet classes.
+
+    Host pages after the first are fetched concurrently. Unless
+    ``FOREMAN_REFRESH_ENRICH`` is off, each host gets a ``facts`` mapping (the
+    facts in ``FOREMAN_REFRESH_FACTS``) loaded in bulk instead of per host.
+    With ``FOREMAN_REFRESH_PUPPET_CLASSES`` on, hosts also get a
+    ``puppetclasses`` list. A failed enrichment step is logged and recorded
+    in the returned summary; the hosts are still refreshed.
+
+    Returns:
+        Tuple of (hosts, enrichment summary or None when enrichment is off).
+    """
+    hosts = [dict(host) for host in client.list_hosts(force_refresh=True, parallel=True)]
+    if not _env_flag(REFRESH_ENRICH_ENV, True):
+        return hosts, None
+
+    fact_names = _refresh_fact_names()
+    enrichment: dict[str, Any] = {"facts": fact_names, "puppetclasses": False, "errors": []}
+    facts_by_host: dict[str, dict[str, Any]] | None = None
+    classes_by_host: dict[str, list[str]] | None = None
+    try:
+        facts_by_host = client.fetch_fact_values(fact_names)
+    except ForemanAuthError:
+        raise
+    except ForemanClientError as exc:
+        logger.warning("Bulk fact load failed during Foreman refresh: %s", exc)
+        enrichment["errors"].append(f"facts: {exc}")
+    if _env_flag(REFRESH_PUPPET_CLASSES_ENV):
+        try:
+            classes_by_host = client.fetch_host_puppet_classes()
+            enrichment["puppetclasses"] = True
+        except ForemanAuthError:
+            raise
+        except ForemanClientError as exc:
+            logger.warning("Bulk Puppet class load failed during Foreman refresh: %s", exc)
+            enrichment["errors"].append(f"puppetclasses: {exc}")
+
+    for host in hosts:
+        name = str(host.get("name") or "")
+        if facts_by_host is not None:
+            host["facts"] = facts_by_host.get(name, {})
+        if classes_by_host is not None:
+            host["puppetclasses"] = classes_by_host.get(name, [])
+    return hosts, enrichment
+
+
+def _index_hosts(
+    config: ForemanConfigEntity,
+    hosts: list[dict[str, Any]],
+    meta: Mapping[str, Any],
+    *,
+    from_cache: bool,
+) -> None:
+    """Feed a Foreman inventory into the host identity index."""
+    version = (meta.get("generated_at"), len(hosts)) if from_cache else None
+    get_host_identity_index().update_partition(
+        f"foreman:{config.id}",
+        lambda: foreman_host_refs(config.id, config.name, hosts),
+        version=version,
+    )
+
+
 @dataclass(slots=True)
 class ForemanService:
     """Application service exposing Foreman configuration operations."""
@@ -264,6 +379,7 @@ class ForemanService:
             store.set(entity.token_secret, cleaned)
 
         self.session.commit()
+        get_foreman_client_pool().invalidate(config_id)
         return entity
 
     def delete_config(self, config_id: str) -> bool:
@@ -284,6 +400,8 @@ class ForemanService:
         if removed:
             store.delete(config.token_secret)
             self.session.commit()
+            get_host_identity_index().drop_partition(f"foreman:{config_id}")
+            get_foreman_client_pool().invalidate(config_id)
         return removed
 
     def test_connection(self, config_id: str) -> dict[str, Any]:
@@ -344,7 +462,9 @@ class ForemanService:
             }
 
     def get_client(self, config_id: str) -> ForemanClient:
-        """Get a ForemanClient instance for a configuration.
+        """Get the pooled ForemanClient for a configuration.
+
+        The client is shared across requests and must not be closed by callers.
 
         Args:
             config_id: Configuration ID.
@@ -364,13 +484,14 @@ class ForemanService:
         if not token:
             raise ValueError("Token not found in secret store")
 
-        return ForemanClient(
+        return get_foreman_client_pool().get(
+            config.id,
             ForemanClientConfig(
                 base_url=config.base_url,
                 username=config.username,
                 token=token,
                 verify_ssl=config.verify_ssl,
-            )
+            ),
         )
 
     # ------------------------------------------------------------------
@@ -381,11 +502,14 @@ class ForemanService:
         results: list[tuple[ForemanConfigEntity, dict[str, Any]]] = []
         repo = self._repo_instance()
         for config in repo.list_all():
-            cache = self._load_cache_entry(config.id)
-            meta = cache["meta"] if cache else {}
+            meta = self.get_cache_status(config.id) or {}
             results.append((config, meta))
         return results
 
+    def get_cache_status(self, config_id: str) -> dict[str, Any] | None:
+        """Return cache metadata (generated_at, host_count, size, checksum) without loading hosts."""
+        return _cache_status(self._cache_path(config_id), lambda: self._load_cache_entry(config_id))
+
     def refresh_inventory(
         self,
         config_id: str,
@@ -419,18 +543,21 @@ class ForemanService:
         )
 
         try:
-            client = ForemanClient(client_config)
-            with client:
-                hosts = client.list_hosts(force_refresh=True)
+            # A refresh also drops cached host details, Puppet data and facts
+            client = get_foreman_client_pool().get(config.id, client_config)
+            client.invalidate_cache()
+            hosts, enrichment = _fetch_inventory(client)
 
             generated_at = _now_utc()
             meta = {
                 "generated_at": generated_at,
                 "host_count": len(hosts),
                 "source": "live",
+                "enrichment": enrichment,
             }
 
             self._write_cache(config, hosts, meta)
+            _index_hosts(config, hosts, meta, from_cache=False)
             return config, hosts, meta
         except ForemanAuthError as exc:
             logger.error("Foreman authentication failed for %s: %s", config_id, exc)
@@ -469,6 +596,7 @@ class ForemanService:
         if cache:
             meta = dict(cache["meta"])
             meta["source"] = "cache"
+            _index_hosts(config, cache["hosts"], meta, from_cache=True)
             return config, cache["hosts"], meta
         return self.refresh_inventory(config_id)
 
@@ -510,6 +638,7 @@ class ForemanService:
         meta = {
             "generated_at": generated_at,
             "host_count": host_count,
+            "enrichment": payload.get("enrichment"),
         }
         return {"meta": meta, "hosts": hosts}
 
@@ -530,12 +659,17 @@ class ForemanService:
             "generated_at": _isoformat(meta.get("generated_at")),
             "host_count": len(host_list),
             "hosts": host_list,
+            "enrichment": meta.get("enrichment"),
         }
 
         with lock:
             try:
-                path.parent.mkdir(parents=True, exist_ok=True)
-                path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+                write_json_cache(
+                    path,
+                    payload,
+                    {"generated_at": payload["generated_at"], "host_count": len(host_list)},
+                    sort_keys=True,
+                )
                 logger.debug("Wrote Foreman cache for %s (%d hosts)", config.id, len(host_list))
             except Exception:
                 logger.exception("Failed to write Foreman cache for %s", config.id)
@@ -653,6 +787,7 @@ class MongoDBForemanService:
             store = require_secret_store()
             store.set(entity.token_secret, cleaned)
 
+        get_foreman_client_pool().invalidate(config_id)
         return entity
 
     def delete_config(self, config_id: str) -> bool:
@@ -664,6 +799,8 @@ class MongoDBForemanService:
         removed = self._repo.delete(config_id)
         if removed:
             store.delete(config.token_secret)
+            get_host_identity_index().drop_partition(f"foreman:{config_id}")
+            get_foreman_client_pool().invalidate(config_id)
         return removed
 
     def test_connection(self, config_id: str) -> dict[str, Any]:
@@ -714,7 +851,7 @@ class MongoDBForemanService:
             }
 
     def get_client(self, config_id: str) -> ForemanClient:
-        """Get a ForemanClient instance for a configuration."""
+        """Get the pooled ForemanClient for a configuration (shared, do not close)."""
         config = self.get_config(config_id)
         if config is None:
             raise ValueError("Foreman configuration not found")
@@ -724,13 +861,14 @@ class MongoDBForemanService:
         if not token:
             raise ValueError("Token not found in secret store")
 
-        return ForemanClient(
+        return get_foreman_client_pool().get(
+            config.id,
             ForemanClientConfig(
                 base_url=config.base_url,
                 username=config.username,
                 token=token,
                 verify_ssl=config.verify_ssl,
-            )
+            ),
         )
 
     # ------------------------------------------------------------------
@@ -740,11 +878,14 @@ class MongoDBForemanService:
         """List all configurations with cache status metadata."""
         results: list[tuple[ForemanConfigEntity, dict[str, Any]]] = []
         for config in self._repo.list_all():
-            cache = self._load_cache_entry(config.id)
-            meta = cache["meta"] if cache else {}
+            meta = self.get_cache_status(config.id) or {}
             results.append((config, meta))
         return results
 
+    def get_cache_status(self, config_id: str) -> dict[str, Any] | None:
+        """Return cache metadata (generated_at, host_count, size, checksum) without loading hosts."""
+        return _cache_status(self._cache_path(config_id), lambda: self._load_cache_entry(config_id))
+
     def refresh_inventory(
         self,
         config_id: str,
@@ -767,18 +908,21 @@ class MongoDBForemanService:
         )
 
         try:
-            client = ForemanClient(client_config)
-            with client:
-                hosts = client.list_hosts(force_refresh=True)
+            # A refresh also drops cached host details, Puppet data and facts
+            client = get_foreman_client_pool().get(config.id, client_config)
+            client.invalidate_cache()
+            hosts, enrichment = _fetch_inventory(client)
 
             generated_at = _now_utc()
             meta = {
                 "generated_at": generated_at,
                 "host_count": len(hosts),
                 "source": "live",
+                "enrichment": enrichment,
             }
 
             self._write_cache(config, hosts, meta)
+            _index_hosts(config, hosts, meta, from_cache=False)
             return config, hosts, meta
         except ForemanAuthError as exc:
             logger.error("Foreman authentication failed for %s: %s", config_id, exc)
@@ -805,6 +949,7 @@ class MongoDBForemanService:
         if cache:
             meta = dict(cache["meta"])
             meta["source"] = "cache"
+            _index_hosts(config, cache["hosts"], meta, from_cache=True)
             return config, cache["hosts"], meta
         return self.refresh_inventory(config_id)
 
@@ -846,6 +991,7 @@ class MongoDBForemanService:
         meta = {
             "generated_at": generated_at,
             "host_count": host_count,
+            "enrichment": payload.get("enrichment"),
         }
         return {"meta": meta, "hosts": hosts}
 
@@ -866,12 +1012,17 @@ class MongoDBForemanService:
             "generated_at": _isoformat(meta.get("generated_at")),
             "host_count": len(host_list),
             "hosts": host_list,
+            "enrichment": meta.get("enrichment"),
         }
 
         with lock:
             try:
-                path.parent.mkdir(parents=True, exist_ok=True)
-                path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+                write_json_cache(
+                    path,
+                    payload,
+                    {"generated_at": payload["generated_at"], "host_count": len(host_list)},
+                    sort_keys=True,
+                )
                 logger.debug("Wrote Foreman cache for %s (%d hosts)", config.id, len(host_list))
             except Exception:
                 logger.exception("Failed to write Foreman cache for %s", config.id)
@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 import os
 import uuid
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
@@ -17,9 +17,16 @@ from sqlalchemy.orm import Session
 
 from infrastructure_atlas.domain.entities import PuppetConfigEntity
 from infrastructure_atlas.env import project_root
+from infrastructure_atlas.infrastructure.cache_metadata import (
+    load_cache_status,
+    read_cache_metadata,
+    write_json_cache,
+)
 from infrastructure_atlas.infrastructure.external import (
+    PUPPET_PARSER_VERSION,
     GitClient,
     GitClientConfig,
+    PuppetFileCache,
     PuppetGroup,
     PuppetInventory,
     PuppetParser,
@@ -34,6 +41,10 @@ CACHE_DIR_ENV = "PUPPET_CACHE_DIR"
 _CACHE_LOCK = Lock()
 _CACHE_LOCKS: dict[str, Lock] = {}
 
+# config_id -> (commit hash, inventory) of the last inventory loaded or parsed
+_INVENTORY_MEMO: dict[str, tuple[str, PuppetInventory]] = {}
+_INVENTORY_MEMO_LOCK = Lock()
+
 
 def _normalise_name(name: str) -> str:
     """Normalise configuration name."""
@@ -100,6 +111,130 @@ def _cache_lock_for(config_id: str) -> Lock:
         return _CACHE_LOCKS.setdefault(config_id, Lock())
 
 
+# Cache payload fields mirrored into the metadata sidecar
+_STATUS_FIELDS = ("generated_at", "user_count", "group_count", "commit_hash", "commit_message", "commit_date")
+
+
+def _cache_status(path: Path, load_entry: Callable[[], dict[str, Any] | None]) -> dict[str, Any] | None:
+    """Read cache status from the metadata sidecar, loading the cache only to backfill it."""
+
+    def _load_meta() -> dict[str, Any] | None:
+        entry = load_entry()
+        return entry["meta"] if entry else None
+
+    meta = load_cache_status(path, _load_meta)
+    if meta is not None:
+        meta["generated_at"] = _parse_iso_datetime(meta.get("generated_at"))
+    return meta
+
+
+def _remember_inventory(config_id: str, commit_hash: str | None, inventory: PuppetInventory) -> None:
+    """Memoise an inventory and its access index under its commit hash."""
+    if not commit_hash:
+        return
+    inventory.access_index()
+    with _INVENTORY_MEMO_LOCK:
+        _INVENTORY_MEMO[config_id] = (commit_hash, inventory)
+
+
+def _forget_inventory(config_id: str) -> None:
+    with _INVENTORY_MEMO_LOCK:
+        _INVENTORY_MEMO.pop(config_id, None)
+
+
+def _memoised_inventory(config_id: str, path: Path) -> tuple[PuppetInventory, dict[str, Any]] | None:
+    """Return the memoised inventory if the cache file still describes the same commit.
+
+    Only the small metadata sidecar is read, so other workers' refreshes to a
+    new commit are noticed without loading the cache.
+    """
+    with _INVENTORY_MEMO_LOCK:
+        entry = _INVENTORY_MEMO.get(config_id)
+    if entry is None:
+        return None
+    sidecar = read_cache_metadata(path)
+    if not sidecar or sidecar.get("commit_hash") != entry[0]:
+        return None
+    meta = {key: sidecar.get(key) for key in _STATUS_FIELDS}
+    meta["generated_at"] = _parse_iso_datetime(meta.get("generated_at"))
+    return entry[1], meta
+
+
+def _file_cache_path(cache_dir: Path, config_id: str) -> Path:
+    """Path of the per-file parse cache kept next to the inventory cache."""
+    return cache_dir / f"{config_id}.files.json"
+
+
+def _load_file_cache(path: Path) -> PuppetFileCache:
+    try:
+        return PuppetFileCache.from_dict(json.loads(path.read_text(encoding="utf-8")))
+    except FileNotFoundError:
+        return PuppetFileCache()
+    except Exception:
+        logger.warning("Failed to read Puppet file cache %s", path, exc_info=True)
+        return PuppetFileCache()
+
+
+def _parse_repository(
+    client: GitClient,
+    local_path: Path,
+    files_path: Path,
+    commit_hash: str | None,
+    load_cached: Callable[[], dict[str, Any] | None],
+) -> tuple[PuppetInventory, dict[str, Any]]:
+    """Parse a freshly pulled repository, reusing earlier work where possible.
+
+    - Commit unchanged since the last parse: the cached inventory is returned
+      without reading any manifest.
+    - Otherwise ``git diff --name-only`` lists the changed files and only
+      those are re-read and, if their content hash changed, re-parsed.
+    - Without a usable file cache or diff the whole repository is scanned,
+      still skipping the regexes for files whose content is unchanged.
+
+    Returns:
+        Tuple of (inventory, parse statistics for the refresh metadata).
+    """
+    files_meta = read_cache_metadata(files_path) or {}
+    if (
+        commit_hash
+        and files_meta.get("commit_hash") == commit_hash
+        and files_meta.get("version") == PUPPET_PARSER_VERSION
+    ):
+        cached = load_cached()
+        if cached and cached["meta"].get("commit_hash") == commit_hash:
+            return cached["inventory"], {"mode": "skipped", "parsed_files": 0, "changed_files": 0}
+
+    file_cache = _load_file_cache(files_path)
+    changed: list[str] | None = None
+    if file_cache.entries and file_cache.commit_hash and commit_hash:
+        changed = client.changed_files(file_cache.commit_hash, commit_hash)
+
+    inventory = PuppetParser(local_path).parse_inventory(file_cache, changed_paths=changed)
+    file_cache.commit_hash = commit_hash
+    try:
+        write_json_cache(
+            files_path,
+            file_cache.to_dict(),
+            {
+                "version": PUPPET_PARSER_VERSION,
+                "commit_hash": commit_hash,
+                "file_count": len(file_cache.entries),
+            },
+            indent=None,
+            sort_keys=True,
+        )
+    except Exception:
+        logger.warning("Failed to write Puppet file cache %s", files_path, exc_info=True)
+
+    stats = {
+        "mode": "incremental" if changed is not None else "full",
+        "parsed_files": file_cache.parsed_files,
+        "changed_files": len(changed) if changed is not None else None,
+    }
+    logger.debug("Parsed Puppet repository %s: %s", local_path, stats)
+    return inventory, stats
+
+
 def _model_to_entity(model: Any) -> PuppetConfigEntity:
     """Convert SQLAlchemy model to domain entity."""
     return PuppetConfigEntity(
@@ -313,6 +448,7 @@ class PuppetService:
 
         self.session.delete(config)
         self.session.commit()
+        _forget_inventory(config_id)
         return True
 
     def _resolve_local_path(self, config_id: str, stored_path: str | None) -> Path:
@@ -376,11 +512,14 @@ class PuppetService:
         """List all configurations with cache status metadata."""
         results: list[tuple[PuppetConfigEntity, dict[str, Any]]] = []
         for config in self.list_configs():
-            cache = self._load_cache_entry(config.id)
-            meta = cache.get("meta", {}) if cache else {}
+            meta = self.get_cache_status(config.id) or {}
             results.append((config, meta))
         return results
 
+    def get_cache_status(self, config_id: str) -> dict[str, Any] | None:
+        """Return cache metadata (generated_at, counts, commit, size, checksum) without parsing the inventory."""
+        return _cache_status(self._cache_path(config_id), lambda: self._load_cache_entry(config_id))
+
     def refresh_inventory(
         self,
         config_id: str,
@@ -402,13 +541,16 @@ class PuppetService:
             raise ValueError("Puppet configuration not found")
 
         client = self.get_git_client(config_id)
+        local_path = self._resolve_local_path(config_id, config.local_path)
         with client:
             repo_info = client.ensure_updated()
-
-        # Parse the repository using resolved path
-        local_path = self._resolve_local_path(config_id, config.local_path)
-        parser = PuppetParser(local_path)
-        inventory = parser.parse_inventory()
+            inventory, parse_stats = _parse_repository(
+                client,
+                local_path,
+                _file_cache_path(self._cache_dir_path(), config_id),
+                repo_info.commit_hash,
+                lambda: self._cached_inventory(config_id),
+            )
 
         generated_at = _now_utc()
         meta = {
@@ -419,9 +561,11 @@ class PuppetService:
             "commit_message": repo_info.commit_message,
             "commit_date": repo_info.commit_date,
             "source": "live",
+            "parse": parse_stats,
         }
 
         self._write_cache(config, inventory, meta)
+        _remember_inventory(config_id, repo_info.commit_hash, inventory)
         return config, inventory, meta
 
     def get_inventory(
@@ -449,7 +593,7 @@ class PuppetService:
         if config is None:
             raise ValueError("Puppet configuration not found")
 
-        cache = self._load_cache_entry(config_id)
+        cache = self._cached_inventory(config_id)
         if cache:
             meta = dict(cache["meta"])
             meta["source"] = "cache"
@@ -464,6 +608,17 @@ class PuppetService:
         """Get cache file path for a configuration."""
         return self._cache_dir_path() / f"{config_id}.json"
 
+    def _cached_inventory(self, config_id: str) -> dict[str, Any] | None:
+        """Return the cached inventory, from the in-process memo while the commit is unchanged."""
+        memo = _memoised_inventory(config_id, self._cache_path(config_id))
+        if memo is not None:
+            inventory, meta = memo
+            return {"meta": meta, "inventory": inventory}
+        cache = self._load_cache_entry(config_id)
+        if cache:
+            _remember_inventory(config_id, cache["meta"].get("commit_hash"), cache["inventory"])
+        return cache
+
     def _load_cache_entry(self, config_id: str) -> dict[str, Any] | None:
         """Load cache entry from disk."""
         path = self._cache_path(config_id)
@@ -599,8 +754,12 @@ class PuppetService:
 
         with lock:
             try:
-                path.parent.mkdir(parents=True, exist_ok=True)
-                path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+                write_json_cache(
+                    path,
+                    payload,
+                    {key: payload[key] for key in _STATUS_FIELDS},
+                    sort_keys=True,
+                )
                 logger.debug(
                     "Wrote Puppet cache for %s (%d users, %d groups)",
                     config.id,
@@ -773,6 +932,7 @@ class MongoDBPuppetService:
                 except Exception:
                     logger.warning("Failed to delete local repo for config %s", config_id)
 
+        _forget_inventory(config_id)
         return self._repo.delete(config_id)
 
     def get_git_client(self, config_id: str) -> GitClient:
@@ -809,11 +969,14 @@ class MongoDBPuppetService:
         """List all configurations with cache status metadata."""
         results: list[tuple[PuppetConfigEntity, dict[str, Any]]] = []
         for config in self.list_configs():
-            cache = self._load_cache_entry(config.id)
-            meta = cache.get("meta", {}) if cache else {}
+            meta = self.get_cache_status(config.id) or {}
             results.append((config, meta))
         return results
 
+    def get_cache_status(self, config_id: str) -> dict[str, Any] | None:
+        """Return cache metadata (generated_at, counts, commit, size, checksum) without parsing the inventory."""
+        return _cache_status(self._cache_path(config_id), lambda: self._load_cache_entry(config_id))
+
     def refresh_inventory(
         self,
         config_id: str,
@@ -824,13 +987,16 @@ class MongoDBPuppetService:
             raise ValueError("Puppet configuration not found")
 
         client = self.get_git_client(config_id)
+        local_path = self._resolve_local_path(config_id, config.local_path)
         with client:
             repo_info = client.ensure_updated()
-
-        # Parse the repository using resolved path
-        local_path = self._resolve_local_path(config_id, config.local_path)
-        parser = PuppetParser(local_path)
-        inventory = parser.parse_inventory()
+            inventory, parse_stats = _parse_repository(
+                client,
+                local_path,
+                _file_cache_path(self._cache_dir_path(), config_id),
+                repo_info.commit_hash,
+                lambda: self._cached_inventory(config_id),
+            )
 
         generated_at = _now_utc()
         meta = {
@@ -841,9 +1007,11 @@ class MongoDBPuppetService:
             "commit_message": repo_info.commit_message,
             "commit_date": repo_info.commit_date,
             "source": "live",
+            "parse": parse_stats,
         }
 
         self._write_cache(config, inventory, meta)
+        _remember_inventory(config_id, repo_info.commit_hash, inventory)
         return config, inventory, meta
 
     def get_inventory(
@@ -860,7 +1028,7 @@ class MongoDBPuppetService:
         if config is None:
             raise ValueError("Puppet configuration not found")
 
-        cache = self._load_cache_entry(config_id)
+        cache = self._cached_inventory(config_id)
         if cache:
             meta = dict(cache["meta"])
             meta["source"] = "cache"
@@ -875,6 +1043,17 @@ class MongoDBPuppetService:
         """Get cache file path for a configuration."""
         return self._cache_dir_path() / f"{config_id}.json"
 
+    def _cached_inventory(self, config_id: str) -> dict[str, Any] | None:
+        """Return the cached inventory, from the in-process memo while the commit is unchanged."""
+        memo = _memoised_inventory(config_id, self._cache_path(config_id))
+        if memo is not None:
+            inventory, meta = memo
+            return {"meta": meta, "inventory": inventory}
+        cache = self._load_cache_entry(config_id)
+        if cache:
+            _remember_inventory(config_id, cache["meta"].get("commit_hash"), cache["inventory"])
+        return cache
+
     def _load_cache_entry(self, config_id: str) -> dict[str, Any] | None:
         """Load cache entry from disk."""
         path = self._cache_path(config_id)
@@ -1009,8 +1188,12 @@ class MongoDBPuppetService:
 
         with lock:
             try:
-                path.parent.mkdir(parents=True, exist_ok=True)
-                path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+                write_json_cache(
+                    path,
+                    payload,
+                    {key: payload[key] for key in _STATUS_FIELDS},
+                    sort_keys=True,
+                )
                 logger.debug(
                     "Wrote Puppet cache for %s (%d users, %d groups)",
                     config.id,
@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 import os
 import uuid
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from datetime import UTC, datetime
 from pathlib import Path
 from threading import Lock
@@ -16,9 +16,14 @@ if TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
 from infrastructure_atlas.domain.entities import VCenterConfigEntity
-from infrastructure_atlas.domain.integrations.vcenter import VCenterVM
+from infrastructure_atlas.domain.integrations.vcenter import VCenterVM, VCenterVMSearch
 from infrastructure_atlas.domain.repositories import VCenterConfigRepository
 from infrastructure_atlas.env import project_root
+from infrastructure_atlas.infrastructure.cache_metadata import (
+    load_cache_status,
+    remove_cache_metadata,
+    write_json_cache,
+)
 from infrastructure_atlas.infrastructure.external import (
     ESXiClient,
     VCenterAuthError,
@@ -26,12 +31,15 @@ from infrastructure_atlas.infrastructure.external import (
     VCenterClientConfig,
     VCenterClientError,
 )
+from infrastructure_atlas.infrastructure.host_identity import get_host_identity_index, vcenter_vm_refs
 from infrastructure_atlas.infrastructure.logging import get_logger
 from infrastructure_atlas.infrastructure.security.secret_store import require_secret_store
 
 logger = get_logger(__name__)
 
 CACHE_DIR_ENV = "VCENTER_CACHE_DIR"
+# File caches are re-read into the host identity index at most this often by search_vms
+SEARCH_INDEX_MAX_AGE_SECONDS = 60.0
 _CACHE_LOCK = Lock()
 _CACHE_LOCKS: dict[str, Lock] = {}
 
@@ -671,6 +679,22 @@ def _build_vm(  # noqa: PLR0913
     )
 
 
+def _index_inventory(
+    config: VCenterConfigEntity,
+    vms: list[VCenterVM],
+    meta: Mapping[str, Any],
+    *,
+    from_cache: bool,
+) -> None:
+    """Feed a full inventory into the host identity index."""
+    version = (meta.get("generated_at"), len(vms)) if from_cache else None
+    get_host_identity_index().update_partition(
+        f"vcenter:{config.id}",
+        lambda: vcenter_vm_refs(config.id, config.name, vms),
+        version=version,
+    )
+
+
 def _serialize_vm(vm: VCenterVM) -> dict[str, Any]:
     return {
         "id": vm.vm_id,
@@ -885,11 +909,37 @@ class VCenterService:
         results: list[tuple[VCenterConfigEntity, dict[str, Any]]] = []
         repo = self._repo_instance()
         for config in repo.list_all():
-            cache = self._load_cache_entry(config.id)
-            meta = cache["meta"] if cache else {}
+            meta = self.get_cache_status(config.id) or {}
             results.append((config, meta))
         return results
 
+    def get_cache_status(self, config_id: str) -> dict[str, Any] | None:
+        """Return ``generated_at``, ``vm_count``, size and checksum of a cache.
+
+        Reads the cache metadata written alongside every refresh instead of
+        loading the VMs. Returns None when nothing is cached.
+        """
+        cache_repo = self._get_cache_repo()
+        if cache_repo is not None:
+            try:
+                meta = cache_repo.get_cache_metadata(config_id)
+            except Exception:
+                logger.warning("Failed to read vCenter cache metadata from MongoDB for %s", config_id, exc_info=True)
+                return None
+            if not meta or "vm_count" not in meta:
+                return None  # An empty inventory (vm_count 0) is still a cache
+        else:
+            meta = load_cache_status(self._cache_path(config_id), lambda: self._load_cache_meta_json(config_id))
+            if meta is None:
+                return None
+        generated_at = meta.get("generated_at")
+        return {
+            "generated_at": generated_at if isinstance(generated_at, datetime) else _parse_iso_datetime(generated_at),
+            "vm_count": meta.get("vm_count"),
+            "size_bytes": meta.get("size_bytes"),
+            "sha256": meta.get("sha256"),
+        }
+
     def get_config(self, config_id: str) -> VCenterConfigEntity | None:
         identifier = (config_id or "").strip()
         if not identifier:
@@ -1017,6 +1067,8 @@ class VCenterService:
                     cache_path.unlink()
                 except Exception:
                     logger.warning("Failed to remove vCenter JSON cache for %s", config_id, exc_info=True)
+            remove_cache_metadata(cache_path)
+            get_host_identity_index().drop_partition(f"vcenter:{config_id}")
             return True
         self._rollback()
         return False
@@ -1044,6 +1096,8 @@ class VCenterService:
             # Use partial update when filtering to specific VMs
             is_partial = filters is not None
             self._write_cache(config, vms, meta, partial_update=is_partial)
+        if not is_partial:
+            _index_inventory(config, vms, meta, from_cache=False)
         meta_with_source = dict(meta)
         meta_with_source["source"] = "live"
         return config, vms, meta_with_source
@@ -1066,9 +1120,107 @@ class VCenterService:
         if cache:
             meta = dict(cache["meta"])
             meta["source"] = "cache"
+            _index_inventory(config, cache["vms"], meta, from_cache=True)
             return config, cache["vms"], meta
         return self.refresh_inventory(config_id)
 
+    def search_vms(  # noqa: PLR0913
+        self,
+        *,
+        config_ids: Iterable[str] | None = None,
+        name: str | None = None,
+        name_pattern: str | None = None,
+        ip_address: str | None = None,
+        mac_address: str | None = None,
+        instance_uuid: str | None = None,
+        guest_host_name: str | None = None,
+        power_state: str | None = None,
+        limit: int = 100,
+        fields: Sequence[str] | None = None,
+    ) -> list[tuple[VCenterConfigEntity, VCenterVM]]:
+        """Find cached VMs matching every given filter without loading whole inventories.
+
+        With the MongoDB backend this is one indexed, projected query; ``fields``
+        limits the VM attributes loaded (others keep their empty defaults). File
+        caches resolve exact identifiers through the host identity index and fall
+        back to scanning for ``name_pattern``.
+
+        Args:
+            config_ids: Restrict to these vCenter configurations
+            name: Exact VM name (case-insensitive)
+            name_pattern: Regex matched against the VM name (case-insensitive)
+            ip_address: IP address reported by the guest
+            mac_address: MAC address of any NIC
+            instance_uuid: vCenter instance UUID
+            guest_host_name: Exact guest hostname (case-insensitive)
+            power_state: Power state such as POWERED_ON
+            limit: Maximum number of matches
+            fields: VM attributes to load from MongoDB
+
+        Returns:
+            ``(config, vm)`` pairs
+        """
+        wanted = set(config_ids) if config_ids is not None else None
+        configs = {c.id: c for c in self.list_configs() if wanted is None or c.id in wanted}
+        if not configs:
+            return []
+        search = VCenterVMSearch(
+            config_ids=tuple(configs),
+            name=name,
+            name_pattern=name_pattern,
+            ip_address=ip_address,
+            mac_address=mac_address,
+            instance_uuid=instance_uuid,
+            guest_host_name=guest_host_name,
+            power_state=power_state,
+        )
+        cache_repo = self._get_cache_repo()
+        if cache_repo is not None:
+            matches = cache_repo.search_vms_with_config(search, limit=limit, fields=fields)
+            return [(configs[config_id], vm) for config_id, vm in matches if config_id in configs]
+
+        identifier = search.identifier
+        candidates = self._indexed_candidates(configs, identifier) if identifier else self._scan_candidates(configs)
+        results: list[tuple[VCenterConfigEntity, VCenterVM]] = []
+        for config, vm in candidates:
+            if search.matches(vm):
+                results.append((config, vm))
+                if len(results) >= limit:
+                    break
+        return results
+
+    def _indexed_candidates(
+        self,
+        configs: Mapping[str, VCenterConfigEntity],
+        identifier: str,
+    ) -> list[tuple[VCenterConfigEntity, VCenterVM]]:
+        index = get_host_identity_index()
+        for config in configs.values():
+            if not index.is_stale(f"vcenter:{config.id}", SEARCH_INDEX_MAX_AGE_SECONDS):
+                continue
+            try:
+                self.get_inventory(config.id)
+            except Exception as exc:
+                logger.warning("Error getting inventory from %s: %s", config.name, exc)
+        return [
+            (configs[ref.scope], ref.record)
+            for ref in index.lookup(identifier, source="vcenter")
+            if ref.scope in configs
+        ]
+
+    def _scan_candidates(
+        self,
+        configs: Mapping[str, VCenterConfigEntity],
+    ) -> Iterator[tuple[VCenterConfigEntity, VCenterVM]]:
+        for config in configs.values():
+            try:
+                _, vms, _ = self.get_inventory(config.id)
+            except Exception as exc:
+                logger.warning("Error searching inventory from %s: %s", config.name, exc)
+                continue
+            for vm in vms:
+                yield config, vm
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -1135,6 +1287,10 @@ class VCenterService:
         }
         return {"meta": meta, "vms": vms}
 
+    def _load_cache_meta_json(self, config_id: str) -> dict[str, Any] | None:
+        cache = self._load_cache_entry_json(config_id)
+        return cache["meta"] if cache else None
+
     def _write_cache(
         self,
         config: VCenterConfigEntity,
@@ -1235,7 +1391,12 @@ class VCenterService:
             "vms": [_serialize_vm(vm) for vm in vm_list],
         }
         try:
-            path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+            write_json_cache(
+                path,
+                payload,
+                {"generated_at": generated_at, "vm_count": vm_count},
+                sort_keys=True,
+            )
         except Exception:
             logger.warning("Failed to write vCenter cache for %s", config.id, exc_info=True)
 
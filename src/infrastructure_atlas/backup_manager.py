@@ -3,14 +3,20 @@
 from __future__ import annotations
 
 import hashlib
+import hmac
 import io
 import json
 import os
+import shutil
+import tempfile
+import threading
 import zipfile
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, BinaryIO, Literal
 
 try:
     import pyzipper
@@ -59,6 +65,25 @@ EXCLUDE_PATTERNS = [
 ]
 
 
+# Archives are built in a spooled temp file: kept in memory up to this size, then on disk
+ARCHIVE_SPOOL_MAX_SIZE = 16 * 1024 * 1024
+# Read/write/upload granularity for archive streams
+ARCHIVE_CHUNK_SIZE = 1024 * 1024
+
+# Incremental backups: content-defined chunks stored once under CHUNK_DIR by keyed hash,
+# plus a small "<name>.inc.zip" manifest per backup referencing them
+CHUNK_DIR = "chunks"
+INCREMENTAL_SUFFIX = ".inc.zip"
+CHUNK_MIN_SIZE = 256 * 1024
+CHUNK_MAX_SIZE = 4 * 1024 * 1024
+# A cut is made where the low 20 bits of the rolling hash are zero (~1 MB past the minimum)
+CHUNK_BOUNDARY_MASK = (1 << 20) - 1
+
+# Held while an incremental backup runs and while chunks are pruned: a backup
+# reuses stored chunks its manifest (written last) does not reference yet
+_CHUNK_STORE_LOCK = threading.Lock()
+
+
 class BackupError(Exception):
     """Base exception for backup operations."""
 
@@ -83,6 +108,7 @@ class BackupManifest:
     compressed_size: int = 0
     encrypted: bool = True
     checksum: str = ""
+    incremental: bool = False
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -94,6 +120,7 @@ class BackupManifest:
             "compressed_size": self.compressed_size,
             "encrypted": self.encrypted,
             "checksum": self.checksum,
+            "incremental": self.incremental,
         }
 
     @classmethod
@@ -107,6 +134,7 @@ class BackupManifest:
             compressed_size=data.get("compressed_size", 0),
             encrypted=data.get("encrypted", True),
             checksum=data.get("checksum", ""),
+            incremental=data.get("incremental", False),
         )
 
 
@@ -138,17 +166,50 @@ class BackupConfig:
     # Options
     create_timestamped: bool = True
     keep_local_copy: bool = False
+    incremental: bool = False
+
+
+class _DigestStream:
+    """Pass-through file wrapper that sha256-hashes every chunk read or written."""
+
+    def __init__(self, stream: BinaryIO, length: int = 0):
+        self._stream = stream
+        self._length = length
+        self._digest = hashlib.sha256()
+        self.size = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._stream.read(size)
+        self._digest.update(chunk)
+        self.size += len(chunk)
+        return chunk
 
+    def write(self, chunk: bytes) -> int:
+        self._digest.update(chunk)
+        self.size += len(chunk)
+        return self._stream.write(chunk)
 
-def _create_encrypted_zip(files: list[tuple[Path, str]], manifest: BackupManifest, password: str) -> bytes:
-    """Create a password-protected ZIP archive using AES-256 encryption."""
+    def __len__(self) -> int:
+        # Lets requests send a Content-Length instead of a chunked body
+        return self._length
+
+    def hexdigest(self) -> str:
+        return self._digest.hexdigest()
+
+
+def _spooled_file() -> tempfile.SpooledTemporaryFile:
+    return tempfile.SpooledTemporaryFile(max_size=ARCHIVE_SPOOL_MAX_SIZE, mode="w+b")
+
+
+def _create_encrypted_zip(
+    files: list[tuple[Path, str]], manifest: BackupManifest, password: str, target: BinaryIO
+) -> None:
+    """Write a password-protected ZIP archive using AES-256 encryption to ``target``."""
     if not HAS_PYZIPPER:
         raise BackupError("pyzipper is required for encrypted backups. Install with: pip install pyzipper")
 
-    buffer = io.BytesIO()
-
     with pyzipper.AESZipFile(
-        buffer,
+        target,
         mode="w",
         compression=pyzipper.ZIP_DEFLATED,
         encryption=pyzipper.WZ_AES,  # WinZip AES-256 encryption
@@ -166,18 +227,15 @@ def _create_encrypted_zip(files: list[tuple[Path, str]], manifest: BackupManifes
             except Exception:
                 pass  # Skip files that can't be read
 
-    return buffer.getvalue()
-
 
-def _extract_encrypted_zip(data: bytes, target_dir: Path, password: str) -> BackupManifest:
+def _extract_encrypted_zip(source: BinaryIO, target_dir: Path, password: str) -> BackupManifest:
     """Extract a password-protected ZIP archive."""
     if not HAS_PYZIPPER:
         raise BackupError("pyzipper is required for encrypted backups. Install with: pip install pyzipper")
 
-    buffer = io.BytesIO(data)
     manifest = None
 
-    with pyzipper.AESZipFile(buffer, mode="r") as zf:
+    with pyzipper.AESZipFile(source, mode="r") as zf:
         zf.setpassword(password.encode())
 
         # Extract manifest first
@@ -228,6 +286,7 @@ def _load_config() -> BackupConfig:
         create_timestamped=os.getenv("BACKUP_CREATE_TIMESTAMPED_DIRS", "true").strip().lower()
         in {"1", "true", "yes", "on"},
         keep_local_copy=os.getenv("BACKUP_KEEP_LOCAL_COPY", "false").strip().lower() in {"1", "true", "yes", "on"},
+        incremental=os.getenv("BACKUP_INCREMENTAL", "false").strip().lower() in {"1", "true", "yes", "on"},
     )
 
     if backup_type == "local":
@@ -289,14 +348,19 @@ def _collect_export_files(root: Path) -> list[tuple[Path, str]]:
     return _collect_files(root, include_server_config=False)
 
 
-def _create_archive(files: list[tuple[Path, str]], manifest: BackupManifest, password: str | None = None) -> bytes:
-    """Create a ZIP archive of the files, optionally password-protected."""
+def _create_archive(
+    files: list[tuple[Path, str]],
+    manifest: BackupManifest,
+    target: BinaryIO,
+    password: str | None = None,
+) -> None:
+    """Write a ZIP archive of the files to ``target``, optionally password-protected."""
     if password:
-        return _create_encrypted_zip(files, manifest, password)
+        _create_encrypted_zip(files, manifest, password, target)
+        return
 
     # Unencrypted ZIP
-    buffer = io.BytesIO()
-    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED, compresslevel=6) as zf:
+    with zipfile.ZipFile(target, mode="w", compression=zipfile.ZIP_DEFLATED, compresslevel=6) as zf:
         manifest_data = json.dumps(manifest.to_dict(), indent=2)
         zf.writestr("manifest.json", manifest_data)
         for local_path, rel_path in files:
@@ -304,18 +368,16 @@ def _create_archive(files: list[tuple[Path, str]], manifest: BackupManifest, pas
                 zf.write(str(local_path), arcname=rel_path)
             except Exception:
                 pass
-    return buffer.getvalue()
 
 
-def _extract_archive(data: bytes, target_dir: Path, password: str | None = None) -> BackupManifest:
+def _extract_archive(source: BinaryIO, target_dir: Path, password: str | None = None) -> BackupManifest:
     """Extract ZIP archive to target directory."""
     if password:
-        return _extract_encrypted_zip(data, target_dir, password)
+        return _extract_encrypted_zip(source, target_dir, password)
 
     # Unencrypted ZIP
-    buffer = io.BytesIO(data)
     manifest = None
-    with zipfile.ZipFile(buffer, mode="r") as zf:
+    with zipfile.ZipFile(source, mode="r") as zf:
         try:
             with zf.open("manifest.json") as mf:
                 manifest = BackupManifest.from_dict(json.load(mf))
@@ -333,6 +395,73 @@ def _extract_archive(data: bytes, target_dir: Path, password: str | None = None)
     return manifest or BackupManifest()
 
 
+def _read_archive_manifest(source: BinaryIO, password: str) -> BackupManifest | None:
+    """Read only ``manifest.json`` from an encrypted archive (None when absent)."""
+    with pyzipper.AESZipFile(source, mode="r") as zf:
+        zf.setpassword(password.encode())
+        try:
+            with zf.open("manifest.json") as mf:
+                return BackupManifest.from_dict(json.load(mf))
+        except Exception:
+            return None
+
+
+def _build_manifest(files: list[tuple[Path, str]]) -> BackupManifest:
+    import socket
+
+    entries = [{"path": rel, "size": local.stat().st_size} for local, rel in files]
+    return BackupManifest(
+        created_at=datetime.now(UTC).isoformat(),
+        hostname=socket.gethostname(),
+        files=entries,
+        total_size=sum(entry["size"] for entry in entries),
+        encrypted=True,
+    )
+
+
+def _upload_archive(
+    config: BackupConfig,
+    filename: str,
+    files: list[tuple[Path, str]],
+    manifest: BackupManifest,
+    password: str,
+) -> str:
+    """Build the archive in a spooled temp file and stream it to the storage provider.
+
+    Sets ``manifest.compressed_size`` and ``manifest.checksum``; the checksum is
+    computed from the bytes as they are uploaded.
+
+    Returns:
+        Provider path of the uploaded archive
+    """
+    with _spooled_file() as archive:
+        _create_archive(files, manifest, archive, password=password)
+        manifest.compressed_size = archive.seek(0, io.SEEK_END)
+        archive.seek(0)
+
+        stream = _DigestStream(archive, length=manifest.compressed_size)
+        remote_path = _get_storage_provider(config).upload(filename, stream)
+        manifest.checksum = stream.hexdigest()
+    return remote_path
+
+
+def _download_archive(config: BackupConfig, filename: str) -> tuple[tempfile.SpooledTemporaryFile, str]:
+    """Stream an archive from the storage provider into a spooled temp file.
+
+    Returns:
+        The rewound temp file (caller closes it) and the sha256 of the downloaded bytes
+    """
+    archive = _spooled_file()
+    try:
+        stream = _DigestStream(archive)
+        _get_storage_provider(config).download_to(filename, stream)
+    except Exception:
+        archive.close()
+        raise
+    archive.seek(0)
+    return archive, stream.hexdigest()
+
+
 class LocalStorageProvider:
     """Local filesystem storage provider."""
 
@@ -340,19 +469,30 @@ class LocalStorageProvider:
         self.config = config
         self.backup_dir = config.local_path or project_root() / "backups"
 
-    def upload(self, filename: str, data: bytes) -> str:
+    def upload(self, filename: str, data: bytes | BinaryIO) -> str:
         """Upload backup to local storage."""
-        self.backup_dir.mkdir(parents=True, exist_ok=True)
         path = self.backup_dir / filename
-        path.write_bytes(data)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(data, bytes):
+            path.write_bytes(data)
+        else:
+            with path.open("wb") as f:
+                shutil.copyfileobj(data, f, ARCHIVE_CHUNK_SIZE)
         return str(path)
 
-    def download(self, filename: str) -> bytes:
-        """Download backup from local storage."""
+    def download_to(self, filename: str, target: BinaryIO) -> None:
+        """Copy a backup from local storage into ``target``."""
         path = self.backup_dir / filename
         if not path.exists():
             raise BackupStorageError(f"Backup not found: {filename}")
-        return path.read_bytes()
+        with path.open("rb") as f:
+            shutil.copyfileobj(f, target, ARCHIVE_CHUNK_SIZE)
+
+    def download(self, filename: str) -> bytes:
+        """Download backup from local storage."""
+        buffer = io.BytesIO()
+        self.download_to(filename, buffer)
+        return buffer.getvalue()
 
     def list_backups(self) -> list[dict[str, Any]]:
         """List available backups and exports."""
@@ -386,6 +526,30 @@ class LocalStorageProvider:
             return True
         return False
 
+    def list_chunks(self) -> set[str]:
+        """Return the ids of all stored chunks."""
+        chunk_dir = self.backup_dir / CHUNK_DIR
+        if not chunk_dir.exists():
+            return set()
+        return {path.name for path in chunk_dir.iterdir() if path.is_file()}
+
+    def store_chunks(self, chunks: Iterable[tuple[str, bytes]]) -> None:
+        """Store sealed chunks under their ids."""
+        for chunk_id, blob in chunks:
+            self.upload(f"{CHUNK_DIR}/{chunk_id}", blob)
+
+    def fetch_chunks(self, chunk_ids: Iterable[str]) -> Iterator[bytes]:
+        """Yield sealed chunks in the order requested."""
+        for chunk_id in chunk_ids:
+            path = self.backup_dir / CHUNK_DIR / chunk_id
+            if not path.exists():
+                raise BackupStorageError(f"Backup chunk not found: {chunk_id}")
+            yield path.read_bytes()
+
+    def delete_chunks(self, chunk_ids: Iterable[str]) -> int:
+        """Delete chunks; returns the number removed."""
+        return sum(self.delete(f"{CHUNK_DIR}/{chunk_id}") for chunk_id in chunk_ids)
+
 
 class SFTPStorageProvider:
     """SFTP storage provider."""
@@ -430,7 +594,7 @@ class SFTPStorageProvider:
                 except Exception:
                     pass
 
-    def upload(self, filename: str, data: bytes) -> str:
+    def upload(self, filename: str, data: bytes | BinaryIO) -> str:
         """Upload backup via SFTP."""
         client, sftp = self._connect()
         try:
@@ -438,25 +602,37 @@ class SFTPStorageProvider:
             self._ensure_dir(sftp, remote_dir)
 
             remote_path = f"{remote_dir}/{filename}"
+            if "/" in filename:
+                self._ensure_dir(sftp, remote_path.rsplit("/", 1)[0])
             with sftp.file(remote_path, "wb") as f:
-                f.write(data)
+                # Don't wait for a server ack after every write request
+                f.set_pipelined(True)
+                if isinstance(data, bytes):
+                    f.write(data)
+                else:
+                    shutil.copyfileobj(data, f, ARCHIVE_CHUNK_SIZE)
 
             return remote_path
         finally:
             sftp.close()
             client.close()
 
-    def download(self, filename: str) -> bytes:
-        """Download backup via SFTP."""
+    def download_to(self, filename: str, target: BinaryIO) -> None:
+        """Stream a backup via SFTP into ``target``."""
         client, sftp = self._connect()
         try:
             remote_path = f"{self.config.remote_path.rstrip('/')}/{filename}"
-            with sftp.file(remote_path, "rb") as f:
-                return f.read()
+            sftp.getfo(remote_path, target)
         finally:
             sftp.close()
             client.close()
 
+    def download(self, filename: str) -> bytes:
+        """Download backup via SFTP."""
+        buffer = io.BytesIO()
+        self.download_to(filename, buffer)
+        return buffer.getvalue()
+
     def list_backups(self) -> list[dict[str, Any]]:
         """List available backups and exports."""
         client, sftp = self._connect()
@@ -500,6 +676,64 @@ class SFTPStorageProvider:
             sftp.close()
             client.close()
 
+    def _chunk_dir(self) -> str:
+        return f"{self.config.remote_path.rstrip('/')}/{CHUNK_DIR}"
+
+    def list_chunks(self) -> set[str]:
+        """Return the ids of all stored chunks."""
+        client, sftp = self._connect()
+        try:
+            return set(sftp.listdir(self._chunk_dir()))
+        except FileNotFoundError:
+            return set()
+        finally:
+            sftp.close()
+            client.close()
+
+    def store_chunks(self, chunks: Iterable[tuple[str, bytes]]) -> None:
+        """Store sealed chunks under their ids over a single SFTP session."""
+        client, sftp = self._connect()
+        try:
+            chunk_dir = self._chunk_dir()
+            self._ensure_dir(sftp, chunk_dir)
+            for chunk_id, blob in chunks:
+                with sftp.file(f"{chunk_dir}/{chunk_id}", "wb") as f:
+                    f.set_pipelined(True)
+                    f.write(blob)
+        finally:
+            sftp.close()
+            client.close()
+
+    def fetch_chunks(self, chunk_ids: Iterable[str]) -> Iterator[bytes]:
+        """Yield sealed chunks in the order requested over a single SFTP session."""
+        client, sftp = self._connect()
+        try:
+            chunk_dir = self._chunk_dir()
+            for chunk_id in chunk_ids:
+                with sftp.file(f"{chunk_dir}/{chunk_id}", "rb") as f:
+                    f.prefetch()
+                    yield f.read()
+        finally:
+            sftp.close()
+            client.close()
+
+    def delete_chunks(self, chunk_ids: Iterable[str]) -> int:
+        """Delete chunks; returns the number removed."""
+        client, sftp = self._connect()
+        removed = 0
+        try:
+            chunk_dir = self._chunk_dir()
+            for chunk_id in chunk_ids:
+                try:
+                    sftp.remove(f"{chunk_dir}/{chunk_id}")
+                    removed += 1
+                except OSError:
+                    continue
+            return removed
+        finally:
+            sftp.close()
+            client.close()
+
 
 class WebDAVStorageProvider:
     """WebDAV storage provider (for FileRun, Nextcloud, etc.)."""
@@ -522,20 +756,27 @@ class WebDAVStorageProvider:
             parts.append(filename)
         return "/".join(parts)
 
-    def _ensure_dir(self):
-        """Ensure remote directory exists."""
-        if not self.path:
-            return
+    def _ensure_dir(self, subdir: str = ""):
+        """Ensure remote directory (and optional subdirectory) exists."""
+        collections = [self.path] if self.path else []
+        if subdir:
+            collections.append(subdir)
 
-        # Try to create directory via MKCOL
-        url = f"{self.base_url}/{self.path}"
-        try:
-            requests.request("MKCOL", url, auth=self.auth, timeout=30)
-        except Exception:
-            pass  # Directory might already exist
+        # Try to create each directory level via MKCOL
+        url = self.base_url
+        for collection in collections:
+            url = f"{url}/{collection}"
+            try:
+                requests.request("MKCOL", url, auth=self.auth, timeout=30)
+            except Exception:
+                pass  # Directory might already exist
+
+    def upload(self, filename: str, data: bytes | BinaryIO) -> str:
+        """Upload backup via WebDAV.
 
-    def upload(self, filename: str, data: bytes) -> str:
-        """Upload backup via WebDAV."""
+        File-like ``data`` is streamed in the request body with a Content-Length
+        taken from ``len(data)``.
+        """
         self._ensure_dir()
         url = self._url(filename)
 
@@ -552,16 +793,21 @@ class WebDAVStorageProvider:
 
         return url
 
-    def download(self, filename: str) -> bytes:
-        """Download backup via WebDAV."""
+    def download_to(self, filename: str, target: BinaryIO) -> None:
+        """Stream a backup via WebDAV into ``target``."""
         url = self._url(filename)
 
-        response = requests.get(url, auth=self.auth, timeout=300)
+        with requests.get(url, auth=self.auth, timeout=300, stream=True) as response:
+            if response.status_code != 200:
+                raise BackupStorageError(f"WebDAV download failed: {response.status_code}")
+            for chunk in response.iter_content(chunk_size=ARCHIVE_CHUNK_SIZE):
+                target.write(chunk)
 
-        if response.status_code != 200:
-            raise BackupStorageError(f"WebDAV download failed: {response.status_code}")
-
-        return response.content
+    def download(self, filename: str) -> bytes:
+        """Download backup via WebDAV."""
+        buffer = io.BytesIO()
+        self.download_to(filename, buffer)
+        return buffer.getvalue()
 
     def list_backups(self) -> list[dict[str, Any]]:
         """List available backups via PROPFIND."""
@@ -646,6 +892,58 @@ class WebDAVStorageProvider:
         except Exception:
             return False
 
+    def list_chunks(self) -> set[str]:
+        """Return the ids of all stored chunks via PROPFIND."""
+        import re
+        from urllib.parse import unquote
+
+        response = requests.request(
+            "PROPFIND",
+            f"{self._url(CHUNK_DIR)}/",
+            auth=self.auth,
+            headers={"Depth": "1"},
+            timeout=60,
+        )
+        if response.status_code == 404:
+            return set()
+        if response.status_code not in {200, 207}:
+            raise BackupStorageError(f"WebDAV chunk listing failed: {response.status_code}")
+
+        chunk_ids = set()
+        for href in re.findall(r"<(?:[dD]:)?href>([^<]+)</(?:[dD]:)?href>", response.text):
+            name = unquote(href).rstrip("/").split("/")[-1]
+            if name and name != CHUNK_DIR:
+                chunk_ids.add(name)
+        return chunk_ids
+
+    def store_chunks(self, chunks: Iterable[tuple[str, bytes]]) -> None:
+        """Store sealed chunks under their ids, reusing one HTTP connection."""
+        self._ensure_dir(CHUNK_DIR)
+        with requests.Session() as session:
+            for chunk_id, blob in chunks:
+                response = session.put(
+                    self._url(f"{CHUNK_DIR}/{chunk_id}"),
+                    data=blob,
+                    auth=self.auth,
+                    headers={"Content-Type": "application/octet-stream"},
+                    timeout=300,
+                )
+                if response.status_code not in {200, 201, 204}:
+                    raise BackupStorageError(f"WebDAV chunk upload failed: {response.status_code}")
+
+    def fetch_chunks(self, chunk_ids: Iterable[str]) -> Iterator[bytes]:
+        """Yield sealed chunks in the order requested, reusing one HTTP connection."""
+        with requests.Session() as session:
+            for chunk_id in chunk_ids:
+                response = session.get(self._url(f"{CHUNK_DIR}/{chunk_id}"), auth=self.auth, timeout=300)
+                if response.status_code != 200:
+                    raise BackupStorageError(f"WebDAV chunk download failed: {response.status_code}")
+                yield response.content
+
+    def delete_chunks(self, chunk_ids: Iterable[str]) -> int:
+        """Delete chunks; returns the number removed."""
+        return sum(self.delete(f"{CHUNK_DIR}/{chunk_id}") for chunk_id in chunk_ids)
+
 
 def _get_storage_provider(config: BackupConfig):
     """Get appropriate storage provider based on config."""
@@ -659,11 +957,278 @@ def _get_storage_provider(config: BackupConfig):
         raise BackupStorageError(f"Unknown backup type: {config.backup_type}")
 
 
-def create_backup(password: str | None = None, config: BackupConfig | None = None) -> dict[str, Any]:
-    """Create an encrypted backup of all application data as a password-protected ZIP."""
+# =============================================================================
+# Incremental Backups (content-defined, deduplicated chunks)
+# =============================================================================
+
+# Gear table for the rolling hash; derived from sha256 so chunk boundaries are stable across runs
+_GEAR = tuple(int.from_bytes(hashlib.sha256(bytes([i])).digest()[:8], "big") for i in range(256))
+# The gear hash shifts left once per byte, so only the last this-many bytes reach the masked bits
+_BOUNDARY_WINDOW = CHUNK_BOUNDARY_MASK.bit_length()
+# Bytes hashed per vectorised step; most cuts fall within the first few blocks past the minimum
+_BOUNDARY_SCAN_BLOCK = 256 * 1024
+
+
+@lru_cache(maxsize=1)
+def _gear_table():
+    import numpy as np
+
+    # Low 32 bits suffice: the boundary test only looks at the low 20 bits of the sum
+    return np.array([value & 0xFFFFFFFF for value in _GEAR], dtype=np.uint32)
+
+
+def _chunk_boundary(data: bytes) -> int:
+    """Return the length of the next content-defined chunk at the start of ``data``.
+
+    Equivalent to rolling ``hash = (hash << 1) + GEAR[byte]`` from
+    ``CHUNK_MIN_SIZE`` and cutting where ``hash & CHUNK_BOUNDARY_MASK == 0``.
+    The masked bits only depend on the last ``_BOUNDARY_WINDOW`` bytes, so
+    each block is hashed with numpy as a windowed sum of shifted gear values.
+    """
+    import numpy as np
+
+    limit = min(len(data), CHUNK_MAX_SIZE)
+    if limit <= CHUNK_MIN_SIZE:
+        return limit
+    gear = _gear_table()
+    view = np.frombuffer(data, dtype=np.uint8, count=limit)
+    for start in range(CHUNK_MIN_SIZE, limit, _BOUNDARY_SCAN_BLOCK):
+        end = min(start + _BOUNDARY_SCAN_BLOCK, limit)
+        # Include the preceding window bytes, but nothing before CHUNK_MIN_SIZE where the hash starts
+        lead = min(_BOUNDARY_WINDOW - 1, start - CHUNK_MIN_SIZE)
+        values = gear[view[start - lead : end]]
+        rolling = values.copy()
+        shifted = np.empty_like(values)
+        for shift in range(1, _BOUNDARY_WINDOW):
+            np.left_shift(values[:-shift], shift, out=shifted[:-shift])
+            rolling[shift:] += shifted[:-shift]
+        hits = np.flatnonzero((rolling[lead:] & np.uint32(CHUNK_BOUNDARY_MASK)) == 0)
+        if hits.size:
+            return start + int(hits[0]) + 1
+    return limit
+
+
+def _iter_file_chunks(path: Path) -> Iterator[bytes]:
+    """Split a file into content-defined chunks, reading at most two max-size chunks ahead."""
+    with path.open("rb") as f:
+        buffer = f.read(CHUNK_MAX_SIZE * 2)
+        while buffer:
+            cut = _chunk_boundary(buffer)
+            yield buffer[:cut]
+            buffer = buffer[cut:]
+            if len(buffer) < CHUNK_MAX_SIZE:
+                buffer += f.read(CHUNK_MAX_SIZE)
+
+
+def _chunk_id(data: bytes, password: str) -> str:
+    # Keyed hash so chunk names don't reveal plaintext hashes to the storage host
+    return hmac.new(password.encode(), data, hashlib.sha256).hexdigest()
+
+
+def _seal_chunk(data: bytes, password: str) -> bytes:
+    """Compress and AES-encrypt a chunk as a single-member ZIP."""
+    buffer = io.BytesIO()
+    with pyzipper.AESZipFile(buffer, mode="w", compression=pyzipper.ZIP_DEFLATED, encryption=pyzipper.WZ_AES) as zf:
+        zf.setpassword(password.encode())
+        zf.writestr("chunk", data)
+    return buffer.getvalue()
+
+
+def _open_chunk(blob: bytes, password: str) -> bytes:
+    with pyzipper.AESZipFile(io.BytesIO(blob), mode="r") as zf:
+        zf.setpassword(password.encode())
+        return zf.read("chunk")
+
+
+def _previous_chunk_map(config: BackupConfig, provider: Any, password: str) -> dict[tuple[str, int, float], list[str]]:
+    """Map (path, size, mtime) to chunk ids from the newest incremental manifest.
+
+    Lets unchanged files skip re-chunking; returns an empty map if there is none
+    or it cannot be read.
+    """
+    names = sorted(
+        entry["filename"]
+        for entry in provider.list_backups()
+        if entry["filename"].startswith("atlas_backup_") and entry["filename"].endswith(INCREMENTAL_SUFFIX)
+    )
+    if not names:
+        return {}
+    try:
+        archive, _ = _download_archive(config, names[-1])
+        with archive:
+            manifest = _read_archive_manifest(archive, password)
+    except Exception:
+        return {}
+    if manifest is None:
+        return {}
+    return {
+        (entry["path"], entry["size"], entry.get("mtime", 0.0)): entry["chunks"]
+        for entry in manifest.files
+        if "chunks" in entry
+    }
+
+
+def _create_incremental_backup(
+    config: BackupConfig, files: list[tuple[Path, str]], password: str
+) -> dict[str, Any]:
+    """Upload only chunks the storage provider doesn't have yet, then a manifest referencing them."""
+    import socket
+
+    if not HAS_PYZIPPER:
+        raise BackupError("pyzipper is required for encrypted backups. Install with: pip install pyzipper")
+
+    provider = _get_storage_provider(config)
+    stored = provider.list_chunks()
+    previous = _previous_chunk_map(config, provider, password)
+
+    manifest = BackupManifest(
+        version="3.0",
+        created_at=datetime.now(UTC).isoformat(),
+        hostname=socket.gethostname(),
+        encrypted=True,
+        incremental=True,
+    )
+    stats = {"chunks_total": 0, "chunks_uploaded": 0, "uploaded_size": 0}
+
+    def _new_chunks() -> Iterator[tuple[str, bytes]]:
+        # Generator so chunks are uploaded while files are still being read
+        for local_path, rel_path in files:
+            try:
+                stat = local_path.stat()
+                key = (rel_path, stat.st_size, stat.st_mtime)
+                chunk_ids = previous.get(key)
+                if chunk_ids is None or not stored.issuperset(chunk_ids):
+                    chunk_ids = []
+                    for data in _iter_file_chunks(local_path):
+                        chunk_id = _chunk_id(data, password)
+                        chunk_ids.append(chunk_id)
+                        if chunk_id not in stored:
+                            blob = _seal_chunk(data, password)
+                            stored.add(chunk_id)
+                            stats["chunks_uploaded"] += 1
+                            stats["uploaded_size"] += len(blob)
+                            yield chunk_id, blob
+            except OSError:
+                continue  # Skip files that can't be read
+            stats["chunks_total"] += len(chunk_ids)
+            manifest.files.append({"path": rel_path, "size": stat.st_size, "mtime": stat.st_mtime, "chunks": chunk_ids})
+            manifest.total_size += stat.st_size
+
+    provider.store_chunks(_new_chunks())
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename = f"atlas_backup_{timestamp}{INCREMENTAL_SUFFIX}"
+    remote_path = _upload_archive(config, filename, [], manifest, password)
+
+    return {
+        "status": "ok",
+        "filename": filename,
+        "path": remote_path,
+        "method": config.backup_type,
+        "incremental": True,
+        "files_count": len(manifest.files),
+        "total_size": manifest.total_size,
+        "compressed_size": manifest.compressed_size,
+        **stats,
+        "checksum": manifest.checksum,
+        "timestamp": manifest.created_at,
+    }
+
+
+def _try_incremental_backup(config: BackupConfig, files: list[tuple[Path, str]], password: str) -> dict[str, Any]:
+    """Run :func:`_create_incremental_backup`, reporting failures as an error result."""
+    try:
+        with _CHUNK_STORE_LOCK:
+            return _create_incremental_backup(config, files, password)
+    except Exception as e:
+        return {
+            "status": "error",
+            "reason": str(e),
+            "timestamp": datetime.now(UTC).isoformat(),
+        }
+
+
+def _restore_chunked(archive: BinaryIO, target_dir: Path, config: BackupConfig, password: str) -> BackupManifest:
+    """Reassemble the files of an incremental backup manifest from stored chunks."""
+    manifest = _read_archive_manifest(archive, password)
+    if manifest is None:
+        raise BackupError("Incremental backup manifest is missing")
+
+    root = target_dir.resolve()
+    entries = []
+    for entry in manifest.files:
+        # Security: prevent path traversal
+        target_path = (target_dir / entry["path"]).resolve()
+        if not str(target_path).startswith(str(root)):
+            continue
+        entries.append((target_path, entry["chunks"]))
+
+    # One provider session streams every chunk in file order
+    blobs = _get_storage_provider(config).fetch_chunks(
+        chunk_id for _, chunk_ids in entries for chunk_id in chunk_ids
+    )
+    try:
+        for target_path, chunk_ids in entries:
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            with target_path.open("wb") as f:
+                for _ in chunk_ids:
+                    f.write(_open_chunk(next(blobs), password))
+    finally:
+        blobs.close()
+    return manifest
+
+
+def prune_backup_chunks(password: str | None = None, config: BackupConfig | None = None) -> dict[str, Any]:
+    """Delete stored chunks no longer referenced by any incremental backup manifest.
+
+    Waits for a running incremental backup to write its manifest first.
+    """
     if config is None:
         config = _load_config()
 
+    encryption_password = password or config.encryption_password
+    if not encryption_password:
+        return {"status": "error", "reason": "Decryption password not configured"}
+
+    try:
+        with _CHUNK_STORE_LOCK:
+            provider = _get_storage_provider(config)
+            referenced: set[str] = set()
+            for entry in provider.list_backups():
+                if not entry["filename"].endswith(INCREMENTAL_SUFFIX):
+                    continue
+                archive, _ = _download_archive(config, entry["filename"])
+                with archive:
+                    manifest = _read_archive_manifest(archive, encryption_password)
+                if manifest is None:
+                    # Never prune chunks based on a manifest we could not read
+                    return {"status": "error", "reason": f"Cannot read manifest {entry['filename']} (wrong password?)"}
+                for file_entry in manifest.files:
+                    referenced.update(file_entry.get("chunks", []))
+
+            orphaned = provider.list_chunks() - referenced
+            removed = provider.delete_chunks(sorted(orphaned))
+            return {"status": "ok", "referenced": len(referenced), "deleted": removed}
+
+    except Exception as e:
+        return {"status": "error", "reason": str(e)}
+
+
+def create_backup(
+    password: str | None = None,
+    config: BackupConfig | None = None,
+    incremental: bool | None = None,
+) -> dict[str, Any]:
+    """Create an encrypted backup of all application data as a password-protected ZIP.
+
+    With ``incremental`` (default: ``BACKUP_INCREMENTAL``) files are stored as
+    deduplicated chunks and the backup itself is a small manifest referencing them.
+    """
+    if config is None:
+        config = _load_config()
+    if incremental is None:
+        incremental = config.incremental
+
     if not config.enable:
         return {"status": "skipped", "reason": "Backups are disabled"}
 
@@ -679,30 +1244,18 @@ def create_backup(password: str | None = None, config: BackupConfig | None = Non
     if not files:
         return {"status": "skipped", "reason": "No files to backup"}
 
-    # Build manifest
-    import socket
+    if incremental:
+        return _try_incremental_backup(config, files, encryption_password)
 
-    manifest = BackupManifest(
-        created_at=datetime.now(UTC).isoformat(),
-        hostname=socket.gethostname(),
-        files=[{"path": rel, "size": local.stat().st_size} for local, rel in files],
-        total_size=sum(local.stat().st_size for local, _ in files),
-        encrypted=True,
-    )
-
-    # Create password-protected ZIP archive
-    encrypted_data = _create_archive(files, manifest, password=encryption_password)
-    manifest.compressed_size = len(encrypted_data)
-    manifest.checksum = hashlib.sha256(encrypted_data).hexdigest()
+    manifest = _build_manifest(files)
 
     # Generate filename (.zip extension - standard password-protected ZIP)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"atlas_backup_{timestamp}.zip"
 
-    # Upload to storage
+    # Build the password-protected ZIP archive and stream it to storage
     try:
-        provider = _get_storage_provider(config)
-        remote_path = provider.upload(filename, encrypted_data)
+        remote_path = _upload_archive(config, filename, files, manifest, encryption_password)
 
         return {
             "status": "ok",
@@ -712,7 +1265,7 @@ def create_backup(password: str | None = None, config: BackupConfig | None = Non
             "files_count": len(files),
             "total_size": manifest.total_size,
             "compressed_size": manifest.compressed_size,
-            "encrypted_size": len(encrypted_data),
+            "encrypted_size": manifest.compressed_size,
             "checksum": manifest.checksum,
             "timestamp": manifest.created_at,
         }
@@ -742,57 +1295,51 @@ def restore_backup(
 
     # Download backup
     try:
-        provider = _get_storage_provider(config)
-        zip_data = provider.download(filename)
+        archive, checksum = _download_archive(config, filename)
     except Exception as e:
         return {"status": "error", "reason": f"Failed to download backup: {e}"}
 
-    # Verify checksum of ZIP file
-    checksum = hashlib.sha256(zip_data).hexdigest()
+    with archive:
+        if dry_run:
+            # Just parse and return manifest without extracting
+            if not HAS_PYZIPPER:
+                return {"status": "error", "reason": "pyzipper is required for encrypted backups"}
 
-    if dry_run:
-        # Just parse and return manifest without extracting
-        if not HAS_PYZIPPER:
-            return {"status": "error", "reason": "pyzipper is required for encrypted backups"}
+            try:
+                manifest = _read_archive_manifest(archive, encryption_password)
+            except Exception as e:
+                return {"status": "error", "reason": f"Failed to read backup (wrong password?): {e}"}
+
+            if manifest is None:
+                return {"status": "ok", "dry_run": True, "checksum": checksum}
+            return {
+                "status": "ok",
+                "dry_run": True,
+                "manifest": manifest.to_dict(),
+                "checksum": checksum,
+            }
+
+        # Extract to target
+        if target_dir is None:
+            target_dir = project_root()
 
         try:
-            buffer = io.BytesIO(zip_data)
-            with pyzipper.AESZipFile(buffer, mode="r") as zf:
-                zf.setpassword(encryption_password.encode())
-                try:
-                    with zf.open("manifest.json") as mf:
-                        manifest = BackupManifest.from_dict(json.load(mf))
-                        return {
-                            "status": "ok",
-                            "dry_run": True,
-                            "manifest": manifest.to_dict(),
-                            "checksum": checksum,
-                        }
-                except Exception:
-                    pass
-        except Exception as e:
-            return {"status": "error", "reason": f"Failed to read backup (wrong password?): {e}"}
-
-        return {"status": "ok", "dry_run": True, "checksum": checksum}
-
-    # Extract to target
-    if target_dir is None:
-        target_dir = project_root()
-
-    try:
-        manifest = _extract_archive(zip_data, target_dir, password=encryption_password)
-
-        return {
-            "status": "ok",
-            "restored_to": str(target_dir),
-            "files_count": len(manifest.files),
-            "manifest": manifest.to_dict(),
-            "checksum": checksum,
-            "timestamp": datetime.now(UTC).isoformat(),
-        }
+            if filename.endswith(INCREMENTAL_SUFFIX):
+                manifest = _restore_chunked(archive, target_dir, config, encryption_password)
+            else:
+                manifest = _extract_archive(archive, target_dir, password=encryption_password)
+
+            return {
+                "status": "ok",
+                "restored_to": str(target_dir),
+                "files_count": len(manifest.files),
+                "manifest": manifest.to_dict(),
+                "checksum": checksum,
+                "timestamp": datetime.now(UTC).isoformat(),
+            }
 
-    except Exception as e:
-        return {"status": "error", "reason": f"Failed to extract backup (wrong password?): {e}"}
+        except Exception as e:
+            return {"status": "error", "reason": f"Failed to extract backup (wrong password?): {e}"}
 
 
 def list_backups(config: BackupConfig | None = None) -> dict[str, Any]:
@@ -818,7 +1365,11 @@ def list_backups(config: BackupConfig | None = None) -> dict[str, Any]:
 
 
 def delete_backup(filename: str, config: BackupConfig | None = None) -> dict[str, Any]:
-    """Delete a backup."""
+    """Delete a backup.
+
+    Deleting an incremental backup also prunes the chunks no remaining
+    incremental backup references (when the encryption password is configured).
+    """
     if config is None:
         config = _load_config()
 
@@ -827,7 +1378,10 @@ def delete_backup(filename: str, config: BackupConfig | None = None) -> dict[str
         success = provider.delete(filename)
 
         if success:
-            return {"status": "ok", "deleted": filename}
+            result: dict[str, Any] = {"status": "ok", "deleted": filename}
+            if filename.endswith(INCREMENTAL_SUFFIX) and config.encryption_password:
+                result["chunks"] = prune_backup_chunks(config=config)
+            return result
         else:
             return {"status": "error", "reason": "Backup not found or could not be deleted"}
 
@@ -868,34 +1422,15 @@ def create_export(password: str | None = None, config: BackupConfig | None = Non
     if not files:
         return {"status": "skipped", "reason": "No files to export"}
 
-    # Build manifest with export type marker
-    import socket
-
-    manifest = BackupManifest(
-        created_at=datetime.now(UTC).isoformat(),
-        hostname=socket.gethostname(),
-        files=[{"path": rel, "size": local.stat().st_size} for local, rel in files],
-        total_size=sum(local.stat().st_size for local, _ in files),
-        encrypted=True,
-    )
-    # Mark this as an export (not a full backup)
-    manifest_dict = manifest.to_dict()
-    manifest_dict["type"] = "export"
-    manifest_dict["excludes_server_config"] = True
-
-    # Create password-protected ZIP archive
-    encrypted_data = _create_archive(files, manifest, password=encryption_password)
-    manifest.compressed_size = len(encrypted_data)
-    manifest.checksum = hashlib.sha256(encrypted_data).hexdigest()
+    manifest = _build_manifest(files)
 
     # Generate filename with export prefix
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"atlas_export_{timestamp}.zip"
 
-    # Upload to storage
+    # Build the password-protected ZIP archive and stream it to storage
     try:
-        provider = _get_storage_provider(config)
-        remote_path = provider.upload(filename, encrypted_data)
+        remote_path = _upload_archive(config, filename, files, manifest, encryption_password)
 
         return {
             "status": "ok",
@@ -906,7 +1441,7 @@ def create_export(password: str | None = None, config: BackupConfig | None = Non
             "files_count": len(files),
             "total_size": manifest.total_size,
             "compressed_size": manifest.compressed_size,
-            "encrypted_size": len(encrypted_data),
+            "encrypted_size": manifest.compressed_size,
             "checksum": manifest.checksum,
             "timestamp": manifest.created_at,
             "excludes": ["*.env", "server-specific configs"],
@@ -943,75 +1478,65 @@ def import_export(
 
     # Download export
     try:
-        provider = _get_storage_provider(config)
-        zip_data = provider.download(filename)
+        archive, checksum = _download_archive(config, filename)
     except Exception as e:
         return {"status": "error", "reason": f"Failed to download export: {e}"}
 
-    # Verify checksum
-    checksum = hashlib.sha256(zip_data).hexdigest()
+    with archive:
+        if dry_run:
+            # Just parse and return manifest without extracting
+            if not HAS_PYZIPPER:
+                return {"status": "error", "reason": "pyzipper is required for encrypted exports"}
 
-    if dry_run:
-        # Just parse and return manifest without extracting
-        if not HAS_PYZIPPER:
-            return {"status": "error", "reason": "pyzipper is required for encrypted exports"}
+            try:
+                manifest = _read_archive_manifest(archive, encryption_password)
+            except Exception as e:
+                return {"status": "error", "reason": f"Failed to read export (wrong password?): {e}"}
+
+            if manifest is None:
+                return {"status": "ok", "dry_run": True, "checksum": checksum}
+            return {
+                "status": "ok",
+                "dry_run": True,
+                "type": "export",
+                "manifest": manifest.to_dict(),
+                "checksum": checksum,
+                "safe_import": True,
+                "will_not_overwrite": [".env", "server configs"],
+            }
+
+        # Extract to target (only data directory)
+        if target_dir is None:
+            target_dir = project_root()
 
         try:
-            buffer = io.BytesIO(zip_data)
-            with pyzipper.AESZipFile(buffer, mode="r") as zf:
-                zf.setpassword(encryption_password.encode())
-                try:
-                    with zf.open("manifest.json") as mf:
-                        manifest = BackupManifest.from_dict(json.load(mf))
-                        return {
-                            "status": "ok",
-                            "dry_run": True,
-                            "type": "export",
-                            "manifest": manifest.to_dict(),
-                            "checksum": checksum,
-                            "safe_import": True,
-                            "will_not_overwrite": [".env", "server configs"],
-                        }
-                except Exception:
-                    pass
-        except Exception as e:
-            return {"status": "error", "reason": f"Failed to read export (wrong password?): {e}"}
-
-        return {"status": "ok", "dry_run": True, "checksum": checksum}
-
-    # Extract to target (only data directory)
-    if target_dir is None:
-        target_dir = project_root()
-
-    try:
-        # Use custom extraction that skips server-specific files
-        manifest = _extract_export_archive(zip_data, target_dir, password=encryption_password)
-
-        return {
-            "status": "ok",
-            "type": "export",
-            "imported_to": str(target_dir),
-            "files_count": len(manifest.files),
-            "manifest": manifest.to_dict(),
-            "checksum": checksum,
-            "timestamp": datetime.now(UTC).isoformat(),
-            "server_config_preserved": True,
-        }
+            # Use custom extraction that skips server-specific files
+            manifest = _extract_export_archive(archive, target_dir, password=encryption_password)
+
+            return {
+                "status": "ok",
+                "type": "export",
+                "imported_to": str(target_dir),
+                "files_count": len(manifest.files),
+                "manifest": manifest.to_dict(),
+                "checksum": checksum,
+                "timestamp": datetime.now(UTC).isoformat(),
+                "server_config_preserved": True,
+            }
 
-    except Exception as e:
-        return {"status": "error", "reason": f"Failed to extract export (wrong password?): {e}"}
+        except Exception as e:
+            return {"status": "error", "reason": f"Failed to extract export (wrong password?): {e}"}
 
 
-def _extract_export_archive(data: bytes, target_dir: Path, password: str) -> BackupManifest:
+def _extract_export_archive(source: BinaryIO, target_dir: Path, password: str) -> BackupManifest:
     """Extract export archive, skipping any server-specific files that might have slipped in."""
     if not HAS_PYZIPPER:
         raise BackupError("pyzipper is required for encrypted exports")
 
-    buffer = io.BytesIO(data)
     manifest = None
     extracted_files = []
 
-    with pyzipper.AESZipFile(buffer, mode="r") as zf:
+    with pyzipper.AESZipFile(source, mode="r") as zf:
         zf.setpassword(password.encode())
 
         # Extract manifest first
@@ -1125,6 +1650,7 @@ __all__ = [
     "import_export",
     "list_backups",
     "list_exports",
+    "prune_backup_chunks",
     "restore_backup",
     "sync_data_dir",
     "sync_paths",
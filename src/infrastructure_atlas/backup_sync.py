@@ -1,13 +1,29 @@
+"""Copy files from the data directory to the configured backup target.
+
+Syncs are incremental: a manifest of (size, mtime, sha256) per file and
+target (``<data_dir>/.backup_sync_manifest.json``) records what was last
+transferred, and only new or changed files are sent. SFTP/SCP syncs reuse a
+pooled SSH session across calls, and SFTP uploads run over several channels
+of that session at once (``BACKUP_SFTP_CONCURRENCY``).
+"""
+
 from __future__ import annotations
 
+import atexit
+import hashlib
+import json
 import os
 import shutil
 import subprocess
-from collections.abc import Iterable, Sequence
+import threading
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import UTC, datetime
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 try:
     import paramiko
@@ -40,6 +56,8 @@ class BackupConfig:
     # Common options
     create_timestamped_dirs: bool = False
     compress: bool = False
+    delta: bool = True  # Only transfer files changed since the last sync
+    sftp_concurrency: int = 4  # Parallel SFTP channels for uploads
 
 
 def _load_config() -> BackupConfig | None:
@@ -65,7 +83,12 @@ def _load_config() -> BackupConfig | None:
         enable=enable,
         create_timestamped_dirs=os.getenv("BACKUP_CREATE_TIMESTAMPED_DIRS", "false").strip().lower() in {"1", "true", "yes", "on"},
         compress=os.getenv("BACKUP_COMPRESS", "false").strip().lower() in {"1", "true", "yes", "on"},
+        delta=os.getenv("BACKUP_SYNC_DELTA", "true").strip().lower() not in {"0", "false", "no", "off"},
     )
+    try:
+        config.sftp_concurrency = max(1, int(os.getenv("BACKUP_SFTP_CONCURRENCY", "4")))
+    except ValueError:
+        pass
     
     if backup_type in {"sftp", "scp"}:
         config.host = os.getenv("BACKUP_HOST", "").strip() or None
@@ -90,6 +113,76 @@ def _load_config() -> BackupConfig | None:
     return config
 
 
+MANIFEST_NAME = ".backup_sync_manifest.json"
+SESSION_IDLE_SECONDS = 300.0  # Pooled SSH sessions idle longer than this are reconnected
+
+
+def _target_key(config: BackupConfig) -> str:
+    """Identify the backup destination; each destination has its own manifest section."""
+    if config.backup_type == "local":
+        return f"local:{config.local_backup_path}"
+    return f"{config.backup_type}:{config.username}@{config.host}:{config.port}:{config.remote_path or '.'}"
+
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SyncManifest:
+    """Size, mtime and content hash of every file last synced to each target."""
+
+    def __init__(self, path: Path, target: str):
+        self.path = path
+        self.target = target
+        self._data: dict[str, Any] = {"targets": {}}
+        try:
+            loaded = json.loads(path.read_text(encoding="utf-8"))
+            if isinstance(loaded, dict) and isinstance(loaded.get("targets"), dict):
+                self._data = loaded
+        except (OSError, ValueError):
+            pass
+        self._entries: dict[str, dict[str, Any]] = self._data["targets"].setdefault(target, {})
+
+    def changed(self, file_paths: list[tuple[Path, str]]) -> tuple[list[tuple[Path, str, dict]], int]:
+        """Split files into those to transfer (with their new manifest entry) and an unchanged count.
+
+        Size and mtime decide without reading the file; only files whose
+        stat changed are hashed, so a touched but identical file is not sent.
+        """
+        pending: list[tuple[Path, str, dict]] = []
+        unchanged = 0
+        for local_path, rel_path in file_paths:
+            stat = local_path.stat()
+            entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+            previous = self._entries.get(rel_path)
+            if previous and previous.get("size") == entry["size"] and previous.get("mtime_ns") == entry["mtime_ns"]:
+                unchanged += 1
+                continue
+            entry["sha256"] = _file_digest(local_path)
+            if previous and previous.get("sha256") == entry["sha256"]:
+                self._entries[rel_path] = entry
+                unchanged += 1
+                continue
+            pending.append((local_path, rel_path, entry))
+        return pending, unchanged
+
+    def record(self, rel_path: str, entry: dict) -> None:
+        """Mark a file as transferred with the entry returned by :meth:`changed`."""
+        self._entries[rel_path] = entry
+
+    def save(self) -> None:
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        try:
+            tmp.write_text(json.dumps(self._data, sort_keys=True), encoding="utf-8")
+            tmp.replace(self.path)
+        except OSError:
+            pass  # A missing manifest only means the next sync transfers everything again
+
+
 def _iter_paths(paths: Iterable[Path], data_dir: Path) -> list[tuple[Path, str]]:
     """Iterate over paths and return (local_path, relative_path) tuples."""
     out: list[tuple[Path, str]] = []
@@ -103,7 +196,7 @@ def _iter_paths(paths: Iterable[Path], data_dir: Path) -> list[tuple[Path, str]]
         if path is None:
             continue
         
-        if not path.exists() or not path.is_file():
+        if not path.exists() or not path.is_file() or path.name == MANIFEST_NAME:
             continue
         
         try:
@@ -147,113 +240,272 @@ def _create_ssh_client(config: BackupConfig):
     except Exception as e:
         raise RuntimeError(f"SSH connection failed: {e}") from e
     
+    transport = client.get_transport()
+    if transport is not None:
+        transport.set_keepalive(30)
     return client
 
 
-def _backup_sftp(config: BackupConfig, file_paths: list[tuple[Path, str]]) -> dict:
-    """Backup files using SFTP."""
-    client = _create_ssh_client(config)
-    uploads = []
-    
-    try:
-        sftp = client.open_sftp()
-        
-        # Create base directory if it doesn't exist
-        base_path = config.remote_path or "."
-        if config.create_timestamped_dirs:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            base_path = f"{base_path.rstrip('/')}/{timestamp}"
-        
-        # Ensure remote directory exists
+class _SSHSession:
+    """A pooled SSH connection with its SFTP channels and known remote directories."""
+
+    def __init__(self, client: SSHClient):
+        self.client = client
+        self.sftp_channels: list[SFTPClient] = []
+        self.remote_dirs: set[str] = set()
+        self.last_used = time.monotonic()
+        self.lock = threading.Lock()  # One sync at a time per session
+        self.users = 0  # Syncs holding the session; guarded by the pool lock
+        self.retired = False  # Dropped from the pool; closed once the last user releases it
+
+    def is_usable(self) -> bool:
+        """Whether the session can be handed out; a session in use never counts as idle."""
+        transport = self.client.get_transport()
+        if transport is None or not transport.is_active():
+            return False
+        return self.users > 0 or time.monotonic() - self.last_used < SESSION_IDLE_SECONDS
+
+    def sftp(self, count: int) -> list[SFTPClient]:
+        """Return ``count`` SFTP channels, opening more on the shared transport as needed."""
+        while len(self.sftp_channels) < count:
+            self.sftp_channels.append(self.client.open_sftp())
+        return self.sftp_channels[:count]
+
+    def close(self) -> None:
+        for channel in self.sftp_channels:
+            try:
+                channel.close()
+            except Exception:
+                pass
+        self.sftp_channels.clear()
         try:
-            sftp.mkdir(base_path)
+            self.client.close()
         except Exception:
-            pass  # Directory might already exist
-        
+            pass
+
+
+class SSHSessionPool:
+    """Keeps one SSH session per backup target across syncs."""
+
+    def __init__(self):
+        self._sessions: dict[tuple, _SSHSession] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(config: BackupConfig) -> tuple:
+        return (config.host, config.port, config.username, config.password, config.private_key_path)
+
+    @contextmanager
+    def session(self, config: BackupConfig) -> Iterator[_SSHSession]:
+        """Hold a connected session for ``config``, reconnecting stale ones.
+
+        A session is never closed while a sync holds it. If the block raises,
+        the session is dropped from the pool so the next sync reconnects, and
+        it is closed once its last user releases it.
+        """
+        key = self._key(config)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None and not session.is_usable():
+                self._retire(key, session)
+                session = None
+            if session is None:
+                session = _SSHSession(_create_ssh_client(config))
+                self._sessions[key] = session
+            session.users += 1
+        try:
+            yield session
+        except Exception:
+            with self._lock:
+                self._retire(key, session)
+            raise
+        finally:
+            with self._lock:
+                session.users -= 1
+                session.last_used = time.monotonic()
+                close = session.retired and not session.users
+            if close:
+                session.close()
+
+    def _retire(self, key: tuple, session: _SSHSession) -> None:
+        # Caller holds self._lock
+        if self._sessions.get(key) is session:
+            del self._sessions[key]
+        session.retired = True
+        if not session.users:
+            session.close()
+
+    def close_all(self) -> None:
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+
+_SESSION_POOL = SSHSessionPool()
+atexit.register(_SESSION_POOL.close_all)
+
+
+def close_sessions() -> None:
+    """Close all pooled SSH sessions."""
+    _SESSION_POOL.close_all()
+
+
+def _remote_base_path(config: BackupConfig) -> str:
+    base_path = config.remote_path or "."
+    if config.create_timestamped_dirs:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        base_path = f"{base_path.rstrip('/')}/{timestamp}"
+    return base_path
+
+
+def _ensure_remote_dir(sftp: SFTPClient, session: _SSHSession, remote_dir: str) -> None:
+    """Create a remote directory and its parents, remembering what exists."""
+    if not remote_dir or remote_dir in session.remote_dirs:
+        return
+    parent = remote_dir.rsplit("/", 1)[0] if "/" in remote_dir.strip("/") else ""
+    if parent and parent != remote_dir:
+        _ensure_remote_dir(sftp, session, parent)
+    try:
+        sftp.stat(remote_dir)
+    except OSError:
+        try:
+            sftp.mkdir(remote_dir)
+        except OSError:
+            pass  # Created concurrently or not permitted; put() reports real failures
+    session.remote_dirs.add(remote_dir)
+
+
+def _select_changes(config: BackupConfig, file_paths: list[tuple[Path, str]], force: bool):
+    """Return (manifest or None, files to transfer with manifest entries, unchanged count)."""
+    if not config.delta or force or config.create_timestamped_dirs:
+        pending = []
         for local_path, rel_path in file_paths:
-            remote_file = f"{base_path}/{rel_path}".replace("//", "/")
-            
-            # Create remote directory structure if needed
-            remote_dir = "/".join(remote_file.split("/")[:-1])
-            if remote_dir:
-                try:
-                    sftp.mkdir(remote_dir)
-                except Exception:
-                    pass  # Directory might already exist
-            
-            # Upload file
-            sftp.put(str(local_path), remote_file)
-            uploads.append({
-                "local_path": str(local_path),
-                "remote_path": remote_file,
-                "size": local_path.stat().st_size,
-            })
-        
-        sftp.close()
-    finally:
-        client.close()
-    
+            stat = local_path.stat()
+            pending.append((local_path, rel_path, {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}))
+        return None, pending, 0
+    manifest = SyncManifest(config.data_dir / MANIFEST_NAME, _target_key(config))
+    pending, unchanged = manifest.changed(file_paths)
+    return manifest, pending, unchanged
+
+
+def _record(manifest: SyncManifest | None, rel_path: str, entry: dict) -> None:
+    if manifest is not None:
+        manifest.record(rel_path, entry)
+
+
+def _backup_sftp(config: BackupConfig, file_paths: list[tuple[Path, str]], *, force: bool = False) -> dict:
+    """Backup new and changed files over pooled SFTP channels."""
+    manifest, pending, unchanged = _select_changes(config, file_paths, force)
+    uploads = []
+    base_path = _remote_base_path(config)
+
+    if pending:
+        try:
+            with _SESSION_POOL.session(config) as session, session.lock:
+                workers = min(config.sftp_concurrency, len(pending))
+                channels = session.sftp(workers)
+                _ensure_remote_dir(channels[0], session, base_path.rstrip("/") or "/")
+                targets = []
+                for local_path, rel_path, entry in pending:
+                    remote_file = f"{base_path}/{rel_path}".replace("//", "/")
+                    _ensure_remote_dir(channels[0], session, remote_file.rsplit("/", 1)[0])
+                    targets.append((local_path, rel_path, entry, remote_file))
+
+                # Each worker owns one channel; uploads are pipelined within a file by put()
+                batches = [targets[index::workers] for index in range(workers)]
+
+                def _upload(batch_index: int) -> list[dict]:
+                    done = []
+                    sftp = channels[batch_index]
+                    for local_path, rel_path, entry, remote_file in batches[batch_index]:
+                        sftp.put(str(local_path), remote_file)  # Confirms the remote size before recording
+                        _record(manifest, rel_path, entry)
+                        done.append({"local_path": str(local_path), "remote_path": remote_file, "size": entry["size"]})
+                    return done
+
+                errors: list[BaseException] = []
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="backup-sftp") as executor:
+                    futures = [executor.submit(_upload, index) for index in range(workers)]
+                    for future in futures:
+                        try:
+                            uploads.extend(future.result())
+                        except BaseException as exc:
+                            errors.append(exc)
+                if errors:
+                    raise errors[0]
+        finally:
+            if manifest is not None:
+                manifest.save()
+
     return {
         "status": "ok",
         "method": "sftp",
         "uploaded": uploads,
         "count": len(uploads),
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "unchanged": unchanged,
+        "timestamp": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
     }
 
 
-def _backup_scp(config: BackupConfig, file_paths: list[tuple[Path, str]]) -> dict:
-    """Backup files using SCP command."""
+def _backup_scp(config: BackupConfig, file_paths: list[tuple[Path, str]], *, force: bool = False) -> dict:
+    """Backup new and changed files using one SCP command per remote directory."""
+    import shlex
+
+    manifest, pending, unchanged = _select_changes(config, file_paths, force)
     uploads = []
-    
-    # Prepare base path
-    base_path = config.remote_path or "."
-    if config.create_timestamped_dirs:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        base_path = f"{base_path.rstrip('/')}/{timestamp}"
-    
-    # Create remote directory using SSH
-    client = _create_ssh_client(config)
+    base_path = _remote_base_path(config)
+
+    by_dir: dict[str, list[tuple[Path, str, dict, str]]] = {}
+    for local_path, rel_path, entry in pending:
+        remote_file = f"{base_path}/{rel_path}".replace("//", "/")
+        by_dir.setdefault(remote_file.rsplit("/", 1)[0] or "/", []).append((local_path, rel_path, entry, remote_file))
+
     try:
-        stdin, stdout, stderr = client.exec_command(f"mkdir -p {base_path}")
-        stdout.channel.recv_exit_status()  # Wait for command to complete
+        if by_dir:
+            # Create all remote directories with one command on the pooled session
+            with _SESSION_POOL.session(config) as session, session.lock:
+                missing = sorted(d for d in by_dir if d not in session.remote_dirs)
+                if missing:
+                    _, stdout, _ = session.client.exec_command("mkdir -p " + " ".join(shlex.quote(d) for d in missing))
+                    stdout.channel.recv_exit_status()  # Wait for command to complete
+                    session.remote_dirs.update(missing)
+
+        for remote_dir, entries in by_dir.items():
+            # Build SCP command
+            cmd = ["scp", "-P", str(config.port)]
+
+            if config.private_key_path:
+                cmd.extend(["-i", config.private_key_path])
+
+            cmd.extend(str(local_path) for local_path, _, _, _ in entries)
+            cmd.append(f"{config.username}@{config.host}:{remote_dir}/")
+
+            # Execute SCP; files that share a remote directory go in one transfer
+            try:
+                subprocess.run(cmd, capture_output=True, text=True, check=True)
+            except subprocess.CalledProcessError as e:
+                raise RuntimeError(f"SCP failed for {remote_dir}: {e.stderr}") from e
+            for local_path, rel_path, entry, remote_file in entries:
+                _record(manifest, rel_path, entry)
+                uploads.append({"local_path": str(local_path), "remote_path": remote_file, "size": entry["size"]})
     finally:
-        client.close()
-    
-    for local_path, rel_path in file_paths:
-        remote_file = f"{base_path}/{rel_path}".replace("//", "/")
-        remote_target = f"{config.username}@{config.host}:{remote_file}"
-        
-        # Build SCP command
-        cmd = ["scp", "-P", str(config.port)]
-        
-        if config.private_key_path:
-            cmd.extend(["-i", config.private_key_path])
-        
-        cmd.extend([str(local_path), remote_target])
-        
-        # Execute SCP
-        try:
-            subprocess.run(cmd, capture_output=True, text=True, check=True)
-            uploads.append({
-                "local_path": str(local_path),
-                "remote_path": remote_file,
-                "size": local_path.stat().st_size,
-            })
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"SCP failed for {local_path}: {e.stderr}") from e
-    
+        if manifest is not None:
+            manifest.save()
+
     return {
         "status": "ok",
         "method": "scp",
         "uploaded": uploads,
         "count": len(uploads),
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "unchanged": unchanged,
+        "timestamp": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
     }
 
 
-def _backup_local(config: BackupConfig, file_paths: list[tuple[Path, str]]) -> dict:
-    """Backup files to local directory."""
+def _backup_local(config: BackupConfig, file_paths: list[tuple[Path, str]], *, force: bool = False) -> dict:
+    """Backup new and changed files to local directory."""
     if not config.local_backup_path:
         raise RuntimeError("Local backup path not configured")
     
@@ -265,31 +517,42 @@ def _backup_local(config: BackupConfig, file_paths: list[tuple[Path, str]]) -> d
     
     backup_dir.mkdir(parents=True, exist_ok=True)
     
+    manifest, pending, unchanged = _select_changes(config, file_paths, force)
     copies = []
-    for local_path, rel_path in file_paths:
-        dest_path = backup_dir / rel_path
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Copy file
-        shutil.copy2(local_path, dest_path)
-        copies.append({
-            "local_path": str(local_path),
-            "backup_path": str(dest_path),
-            "size": local_path.stat().st_size,
-        })
+    try:
+        for local_path, rel_path, entry in pending:
+            dest_path = backup_dir / rel_path
+            dest_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Copy file
+            shutil.copy2(local_path, dest_path)
+            _record(manifest, rel_path, entry)
+            copies.append({
+                "local_path": str(local_path),
+                "backup_path": str(dest_path),
+                "size": entry["size"],
+            })
+    finally:
+        if manifest is not None:
+            manifest.save()
     
     return {
         "status": "ok",
         "method": "local",
         "copied": copies,
         "count": len(copies),
+        "unchanged": unchanged,
         "backup_dir": str(backup_dir),
-        "timestamp": datetime.now(datetime.UTC).isoformat().replace("+00:00", "Z"),
+        "timestamp": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
     }
 
 
-def sync_paths(paths: Sequence[Path | str], *, note: str | None = None) -> dict:
-    """Sync specified paths using the configured backup method."""
+def sync_paths(paths: Sequence[Path | str], *, note: str | None = None, force: bool = False) -> dict:
+    """Sync specified paths using the configured backup method.
+
+    Files unchanged since their last sync to the same target are skipped
+    unless ``force`` is set (or ``BACKUP_SYNC_DELTA=false``).
+    """
     config = _load_config()
     if config is None:
         return {"status": "skipped", "reason": "Backup sync disabled or not configured"}
@@ -300,11 +563,11 @@ def sync_paths(paths: Sequence[Path | str], *, note: str | None = None) -> dict:
     
     try:
         if config.backup_type == "sftp":
-            result = _backup_sftp(config, file_paths)
+            result = _backup_sftp(config, file_paths, force=force)
         elif config.backup_type == "scp":
-            result = _backup_scp(config, file_paths)
+            result = _backup_scp(config, file_paths, force=force)
         elif config.backup_type == "local":
-            result = _backup_local(config, file_paths)
+            result = _backup_local(config, file_paths, force=force)
         else:
             return {"status": "error", "reason": f"Unknown backup type: {config.backup_type}"}
         
@@ -317,11 +580,11 @@ def sync_paths(paths: Sequence[Path | str], *, note: str | None = None) -> dict:
         return {
             "status": "error",
             "reason": str(e),
-            "timestamp": datetime.now(datetime.UTC).isoformat().replace("+00:00", "Z"),
+            "timestamp": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
         }
 
 
-def sync_data_dir(*, note: str | None = None) -> dict:
+def sync_data_dir(*, note: str | None = None, force: bool = False) -> dict:
     """Sync all files in the data directory using the configured backup method."""
     config = _load_config()
     if config is None:
@@ -332,4 +595,4 @@ def sync_data_dir(*, note: str | None = None) -> dict:
         if path.is_file():
             files.append(path)
     
-    return sync_paths(files, note=note or "full")
+    return sync_paths(files, note=note or "full", force=force)
@@ -22,11 +22,13 @@ Required Slack App permissions (OAuth Scopes):
 
 from __future__ import annotations
 
+import asyncio
 import os
 from typing import TYPE_CHECKING, Any
 
 from infrastructure_atlas.bots.adapters.base import BotAdapter
 from infrastructure_atlas.bots.formatters import SlackFormatter
+from infrastructure_atlas.bots.streaming import ProgressiveReply, StreamRateLimited
 from infrastructure_atlas.infrastructure.logging import get_logger
 
 if TYPE_CHECKING:
@@ -43,6 +45,9 @@ class SlackAdapter(BotAdapter):
 
     platform = "slack"
 
+    # chat.update is a Tier 3 method (~50 calls/minute per workspace)
+    stream_edit_interval = float(os.getenv("ATLAS_SLACK_STREAM_INTERVAL", "1.2"))
+
     def __init__(
         self,
         bot_token: str | None = None,
@@ -86,22 +91,11 @@ class SlackAdapter(BotAdapter):
         """
         client = self._get_client()
 
-        kwargs: dict[str, Any] = {"channel": chat_id}
+        kwargs: dict[str, Any] = {"channel": chat_id, **self._content_kwargs(content)}
 
         if reply_to:
             kwargs["thread_ts"] = reply_to
 
-        # Handle different content formats
-        if isinstance(content, dict):
-            if "blocks" in content:
-                kwargs["blocks"] = content["blocks"]
-                # Extract text fallback from blocks for notifications
-                kwargs["text"] = self._extract_text_fallback(content["blocks"])
-            else:
-                kwargs["text"] = str(content)
-        else:
-            kwargs["text"] = str(content)
-
         try:
             response = client.chat_postMessage(**kwargs)
             return response.get("ts", "")
@@ -109,6 +103,35 @@ class SlackAdapter(BotAdapter):
             logger.error(f"Failed to send Slack message: {e}")
             raise
 
+    async def update_message(self, chat_id: str, message_id: str, content: Any) -> None:
+        """Replace the content of a message posted by the bot (chat.update).
+
+        Args:
+            chat_id: Channel ID the message was posted in
+            message_id: Message timestamp returned by send_message
+            content: New content (text string or Block Kit dict)
+
+        Raises:
+            StreamRateLimited: If Slack rate limited the call
+        """
+        client = self._get_client()
+        try:
+            client.chat_update(channel=chat_id, ts=message_id, **self._content_kwargs(content))
+        except Exception as e:
+            response = getattr(e, "response", None)
+            if getattr(response, "status_code", None) == 429:
+                retry_after = float((getattr(response, "headers", None) or {}).get("Retry-After", 1))
+                raise StreamRateLimited(retry_after) from e
+            logger.error(f"Failed to update Slack message: {e}")
+            raise
+
+    def _content_kwargs(self, content: Any) -> dict[str, Any]:
+        """Build chat.postMessage/chat.update arguments for text or Block Kit content."""
+        if isinstance(content, dict) and "blocks" in content:
+            # Extract text fallback from blocks for notifications
+            return {"blocks": content["blocks"], "text": self._extract_text_fallback(content["blocks"])}
+        return {"text": str(content)}
+
     def _extract_text_fallback(self, blocks: list[dict]) -> str:
         """Extract plain text fallback from Block Kit blocks."""
         texts = []
@@ -554,6 +577,28 @@ class SlackWebhookHandler:
                 thread_ts=thread_ts,
             )
 
+    async def _replace_progress(self, reply: ProgressiveReply, channel_id: str, blocks: list[dict]) -> bool:
+        """Replace the progress message with the final blocks.
+
+        Returns:
+            True if the progress message now shows the final content, False if
+            the caller should post a new message instead
+        """
+        message_ts = await reply.close()
+        if not message_ts or not blocks:
+            return False
+        try:
+            try:
+                await self.adapter.update_message(channel_id, message_ts, {"blocks": blocks})
+            except StreamRateLimited as limited:
+                await asyncio.sleep(min(limited.retry_after, 10.0))
+                await self.adapter.update_message(channel_id, message_ts, {"blocks": blocks})
+            logger.info(f"Replaced progress message after {reply.edits} edit(s)")
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to replace Slack progress message, posting a new one: {e}")
+            return False
+
     async def _process_message(
         self,
         text: str,
@@ -581,6 +626,14 @@ class SlackWebhookHandler:
         if message_ts:
             await self.adapter.add_reaction(channel_id, message_ts, "hourglass_flowing_sand")
 
+        # Post one message early and edit it as tool progress and partial text arrive
+        reply = ProgressiveReply(
+            self.formatter,
+            post=lambda content: self.adapter.send_message(channel_id, content, reply_to=reply_ts),
+            edit=lambda ts, content: self.adapter.update_message(channel_id, ts, content),
+            min_interval=self.adapter.stream_edit_interval,
+        )
+
         try:
             # Use thread_ts in conversation ID only for actual threaded conversations
             # For DMs (no thread_ts), all messages share the same session via channel_id
@@ -608,6 +661,13 @@ class SlackWebhookHandler:
                     # Slack doesn't support typing indicators for bots
                     pass
 
+                elif response.type == BotResponseType.PARTIAL:
+                    reply.set_text(response.content or "")
+
+                elif response.type == BotResponseType.TOOL_CALL:
+                    if isinstance(response.content, dict):
+                        reply.update_tool(response.content)
+
                 elif response.type == BotResponseType.TEXT:
                     # Always use Slack formatter for proper mrkdwn formatting
                     raw_content = response.content or ""
@@ -622,6 +682,8 @@ class SlackWebhookHandler:
                     content_text = raw_content if isinstance(raw_content, str) else str(raw_content)
                     blocks = formatted.content.get("blocks", []) if isinstance(formatted.content, dict) else []
                     logger.info(f"Sending Slack message with {len(blocks)} blocks")
+                    if await self._replace_progress(reply, channel_id, blocks):
+                        continue
                     try:
                         await say(
                             blocks=blocks,
@@ -635,8 +697,11 @@ class SlackWebhookHandler:
                 elif response.type == BotResponseType.ERROR:
                     error_msg = response.content if isinstance(response.content, str) else str(response.content or "An error occurred")
                     formatted = self.formatter.format_error(error_msg)
+                    blocks = formatted.content.get("blocks", []) if isinstance(formatted.content, dict) else []
+                    if await self._replace_progress(reply, channel_id, blocks):
+                        continue
                     await say(
-                        blocks=formatted.content.get("blocks", []) if isinstance(formatted.content, dict) else [],
+                        blocks=blocks,
                         text=f"Error: {error_msg[:200]}",
                         thread_ts=reply_ts,
                     )
@@ -685,14 +750,18 @@ class SlackWebhookHandler:
                                 thread_ts=reply_ts,
                             )
 
+            await reply.close()
             logger.debug("[SLACK] Finished processing all responses from orchestrator")
 
         except Exception as e:
             logger.error(f"Error processing Slack message: {e}", exc_info=True)
-            await say(
-                text=f":warning: *Error processing message*\n`{str(e)[:200]}`",
-                thread_ts=reply_ts,
-            )
+            error_text = f":warning: *Error processing message*\n`{str(e)[:200]}`"
+            error_blocks = [{"type": "section", "text": {"type": "mrkdwn", "text": error_text}}]
+            if not await self._replace_progress(reply, channel_id, error_blocks):
+                await say(
+                    text=error_text,
+                    thread_ts=reply_ts,
+                )
 
         finally:
             # Remove "thinking" reaction when done (success or error)
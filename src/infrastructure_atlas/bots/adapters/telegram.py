@@ -2,6 +2,7 @@
 
 This adapter handles:
 - Sending messages with HTML formatting
+- Editing messages in place while an agent reply streams in
 - Typing indicators
 - Webhook signature verification
 - User info retrieval
@@ -9,6 +10,7 @@ This adapter handles:
 
 from __future__ import annotations
 
+import asyncio
 import hmac
 import os
 from typing import Any
@@ -17,6 +19,7 @@ import httpx
 
 from infrastructure_atlas.bots.adapters.base import BotAdapter
 from infrastructure_atlas.bots.formatters import TelegramFormatter
+from infrastructure_atlas.bots.streaming import ProgressiveReply, StreamRateLimited
 from infrastructure_atlas.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
@@ -31,6 +34,10 @@ class TelegramAdapter(BotAdapter):
 
     platform = "telegram"
 
+    # Telegram allows about one message per second per chat and 20 per minute in groups
+    stream_edit_interval = float(os.getenv("ATLAS_TELEGRAM_STREAM_INTERVAL", "1.5"))
+    group_stream_edit_interval = 3.0
+
     def __init__(self, bot_token: str | None = None):
         """Initialize the Telegram adapter.
 
@@ -91,6 +98,53 @@ class TelegramAdapter(BotAdapter):
             else:
                 raise RuntimeError(f"Failed to send Telegram message: {data.get('description')}")
 
+    async def edit_message(self, chat_id: str, message_id: str, content: Any) -> None:
+        """Replace the text of a message sent by the bot (editMessageText).
+
+        Args:
+            chat_id: Telegram chat ID
+            message_id: Message ID returned by send_message
+            content: New message content (HTML string)
+
+        Raises:
+            StreamRateLimited: If Telegram asked to retry later
+        """
+        url = f"{self.api_base}/editMessageText"
+        payload: dict[str, Any] = {
+            "chat_id": chat_id,
+            "message_id": int(message_id),
+            "text": content if isinstance(content, str) else str(content),
+            "parse_mode": "HTML",
+        }
+
+        async with httpx.AsyncClient() as client:
+            response = await client.post(url, json=payload, timeout=30.0)
+            data = response.json()
+
+            if not data.get("ok"):
+                error_desc = data.get("description", "Unknown error")
+                if "can't parse entities" in error_desc.lower():
+                    del payload["parse_mode"]
+                    payload["text"] = self._strip_html(payload["text"])
+                    response = await client.post(url, json=payload, timeout=30.0)
+                    data = response.json()
+
+            if data.get("ok"):
+                return
+            error_desc = data.get("description", "Unknown error")
+            if "message is not modified" in error_desc.lower():
+                return
+            if data.get("error_code") == 429:
+                raise StreamRateLimited(float((data.get("parameters") or {}).get("retry_after", 1)))
+            raise RuntimeError(f"Failed to edit Telegram message: {error_desc}")
+
+    def stream_interval(self, chat_id: str) -> float:
+        """Minimum seconds between edits of one streamed reply in ``chat_id``."""
+        # Group and channel chat IDs are negative
+        if chat_id.startswith("-"):
+            return max(self.stream_edit_interval, self.group_stream_edit_interval)
+        return self.stream_edit_interval
+
     def _strip_html(self, text: str) -> str:
         """Remove HTML tags and unescape entities for plain text fallback."""
         import re
@@ -313,7 +367,13 @@ class TelegramWebhookHandler:
             await self._handle_command(chat_id, user_id, username, text, message_id)
             return
 
-        # Regular message - route to orchestrator
+        # Regular message - route to orchestrator, editing one reply as it streams in
+        reply = ProgressiveReply(
+            self.adapter.formatter,
+            post=lambda content: self.adapter.send_message(chat_id, content, reply_to=message_id),
+            edit=lambda reply_id, content: self.adapter.edit_message(chat_id, reply_id, content),
+            min_interval=self.adapter.stream_interval(chat_id),
+        )
         try:
             async for response in self.orchestrator.process_message(
                 platform="telegram",
@@ -325,18 +385,12 @@ class TelegramWebhookHandler:
             ):
                 if response.type.value == "typing":
                     await self.adapter.send_typing_indicator(chat_id)
-                elif response.type.value == "text" and response.formatted:
-                    await self.adapter.send_message(
-                        chat_id=chat_id,
-                        content=response.formatted.content,
-                        reply_to=message_id,
-                    )
-                elif response.type.value == "error" and response.formatted:
-                    await self.adapter.send_message(
-                        chat_id=chat_id,
-                        content=response.formatted.content,
-                        reply_to=message_id,
-                    )
+                elif response.type.value == "partial":
+                    reply.set_text(response.content or "")
+                elif response.type.value == "tool_call" and isinstance(response.content, dict):
+                    reply.update_tool(response.content)
+                elif response.type.value in ("text", "error") and response.formatted:
+                    await self._deliver_final(reply, chat_id, message_id, response.formatted.content)
                 elif response.type.value == "unauthorized":
                     await self.adapter.send_message(
                         chat_id=chat_id,
@@ -347,7 +401,34 @@ class TelegramWebhookHandler:
         except Exception as e:
             logger.error(f"Error processing Telegram message: {e}", exc_info=True)
             error_msg = self.adapter.formatter.format_error(f"An error occurred: {e}")
-            await self.adapter.send_message(chat_id, error_msg.content, reply_to=message_id)
+            await self._deliver_final(reply, chat_id, message_id, error_msg.content)
+        finally:
+            await reply.close()
+
+    async def _deliver_final(
+        self,
+        reply: ProgressiveReply,
+        chat_id: str,
+        message_id: str,
+        content: str,
+    ) -> None:
+        """Replace the streamed progress message with the final content.
+
+        Falls back to sending a new message when nothing was streamed or the
+        edit fails.
+        """
+        reply_id = await reply.close()
+        if reply_id:
+            try:
+                try:
+                    await self.adapter.edit_message(chat_id, reply_id, content)
+                except StreamRateLimited as limited:
+                    await asyncio.sleep(min(limited.retry_after, 10.0))
+                    await self.adapter.edit_message(chat_id, reply_id, content)
+                return
+            except Exception as e:
+                logger.warning(f"Failed to replace Telegram progress message, sending a new one: {e}")
+        await self.adapter.send_message(chat_id=chat_id, content=content, reply_to=message_id)
 
     async def _handle_command(
         self,
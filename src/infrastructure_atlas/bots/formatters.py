@@ -47,6 +47,33 @@ class MessageFormatter(ABC):
     def format_agent_response(self, agent_id: str, response: str, tool_calls: list[dict] | None = None) -> FormattedMessage:
         """Format a complete agent response, optionally with tool calls."""
 
+    # Partial replies are re-sent on every edit, so keep them short
+    progress_max_length = 3000
+
+    def format_progress(self, response: str, tools: list[dict[str, Any]] | None = None) -> FormattedMessage:
+        """Format an in-progress reply: tool progress lines plus the partial answer.
+
+        Partial markdown is not converted; the final reply replaces this message.
+        """
+        lines = []
+        for tool in tools or []:
+            name = tool.get("tool", "unknown")
+            if tool.get("status") == "finished":
+                lines.append(f"✅ {name} ({tool.get('duration_ms', 0) / 1000:.1f}s)")
+            else:
+                lines.append(f"⏳ {name}…")
+        if response:
+            if lines:
+                lines.append("")
+            lines.append(response + " …")
+        text, truncated = self.truncate("\n".join(lines) or "…", min(self.max_length, self.progress_max_length))
+        return FormattedMessage(
+            content=text,
+            platform=self.platform,
+            truncated=truncated,
+            original_length=len(text),
+        )
+
     def truncate(self, text: str, max_length: int | None = None) -> tuple[str, bool]:
         """Truncate text to fit platform limit. Returns (text, was_truncated)."""
         limit = max_length or self.max_length
@@ -172,6 +199,12 @@ class TelegramFormatter(MessageFormatter):
 
         return "\n".join(result)
 
+    def format_progress(self, response: str, tools: list[dict[str, Any]] | None = None) -> FormattedMessage:
+        """Format an in-progress reply as escaped HTML."""
+        formatted = super().format_progress(response, tools)
+        formatted.content = self._escape_html(formatted.content)
+        return formatted
+
     def format_text(self, text: str, compact: bool = False) -> FormattedMessage:
         """Format plain text for Telegram using HTML."""
         if compact:
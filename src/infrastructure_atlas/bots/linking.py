@@ -15,6 +15,7 @@ from datetime import UTC, datetime, timedelta
 from sqlalchemy import select
 from sqlalchemy.orm import Session, joinedload
 
+from infrastructure_atlas.bots.persistence import invalidate_conversation_ref, invalidate_linked_identity
 from infrastructure_atlas.db.models import BotPlatformAccount, User
 
 
@@ -126,6 +127,8 @@ class UserLinkingService:
             if expires < now:
                 return None
 
+        invalidate_linked_identity(platform, platform_user_id)
+
         # Check if this platform user is already linked to an account
         existing = self.db.execute(
             select(BotPlatformAccount).where(
@@ -143,7 +146,9 @@ class UserLinkingService:
                 return existing
             else:
                 # Linked to a different user - unlink the old one first
+                # (its conversations are deleted with it)
                 self.db.delete(existing)
+                invalidate_conversation_ref()
 
         # Update account with verified info
         account.platform_user_id = platform_user_id
@@ -204,8 +209,11 @@ class UserLinkingService:
         if not account:
             return False
 
+        invalidate_linked_identity(account.platform, account.platform_user_id)
         self.db.delete(account)
         self.db.commit()
+        # Conversations cascade with the account
+        invalidate_conversation_ref()
         return True
 
     def unlink_user_platform(self, user_id: str, platform: str) -> bool:
@@ -229,9 +237,12 @@ class UserLinkingService:
             return False
 
         for account in accounts:
+            invalidate_linked_identity(account.platform, account.platform_user_id)
             self.db.delete(account)
 
         self.db.commit()
+        # Conversations cascade with the accounts
+        invalidate_conversation_ref()
         return True
 
     def get_user_by_platform(self, platform: str, platform_user_id: str) -> User | None:
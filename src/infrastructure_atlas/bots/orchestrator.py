@@ -18,12 +18,20 @@ from datetime import UTC, datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
 from infrastructure_atlas.bots.formatters import FormattedMessage, FormatterRegistry
 from infrastructure_atlas.bots.linking import UserLinkingService
-from infrastructure_atlas.db.models import BotConversation, BotMessage, BotPlatformAccount
+from infrastructure_atlas.bots.persistence import (
+    BotMessageRecord,
+    ConversationRef,
+    LinkedIdentity,
+    get_bot_message_writer,
+    get_conversation_ref,
+    get_linked_identity,
+)
+from infrastructure_atlas.db.models import BotConversation, BotMessage
 from infrastructure_atlas.infrastructure.logging import get_logger
 
 if TYPE_CHECKING:
@@ -37,6 +45,7 @@ class BotResponseType(str, Enum):
     """Types of bot response chunks."""
 
     TEXT = "text"
+    PARTIAL = "partial"  # In-progress answer text, replaced by the final TEXT
     TOOL_CALL = "tool_call"
     TYPING = "typing"
     ERROR = "error"
@@ -120,6 +129,7 @@ class BotOrchestrator:
             self._runtime = PlaygroundRuntime(
                 skills_registry=self.skills,
                 db_session=self.db,
+                session_registry_name="bots.playground_sessions",
             )
         return self._runtime
 
@@ -155,9 +165,11 @@ class BotOrchestrator:
         start_time = time.perf_counter()
         formatter = self.formatters.get(platform)
 
-        # Verify user authorization
-        account = self.linking.get_linked_account(platform, platform_user_id)
-        if not account:
+        # Verify user authorization (cached briefly per platform user)
+        identity = get_linked_identity(
+            platform, platform_user_id, lambda: self._load_identity(platform, platform_user_id)
+        )
+        if not identity:
             yield BotResponse(
                 type=BotResponseType.UNAUTHORIZED,
                 content="Your account is not linked to Atlas. Please link your account first.",
@@ -171,7 +183,7 @@ class BotOrchestrator:
         conversation = await self._get_or_create_conversation(
             platform=platform,
             platform_conversation_id=platform_conversation_id,
-            account=account,
+            account_id=identity.account_id,
         )
 
         logger.info(
@@ -191,9 +203,8 @@ class BotOrchestrator:
         agent_id, cleaned_message = self._parse_agent_mention(message)
 
         # Update conversation with agent if specified
-        if agent_id:
-            conversation.agent_id = agent_id
-            self.db.commit()
+        if agent_id and agent_id != conversation.agent_id:
+            self._set_conversation_agent(conversation, agent_id)
 
         # Yield typing indicator
         yield BotResponse(type=BotResponseType.TYPING, content=None)
@@ -206,21 +217,8 @@ class BotOrchestrator:
         error_msg: str | None = None
 
         try:
-            # Get user info for tracking
-            user = account.user
-            user_id = None
-            username = None
-
-            if user:
-                # SQLAlchemy eager-loaded relationship
-                user_id = str(user.id) if user.id else None
-                username = user.username
-            elif hasattr(account, "user_id") and account.user_id:
-                # MongoDB - look up user separately
-                atlas_user = self.linking.get_user_by_platform(platform, platform_user_id)
-                if atlas_user:
-                    user_id = str(atlas_user.id) if hasattr(atlas_user, "id") else None
-                    username = getattr(atlas_user, "username", None)
+            user_id = identity.user_id
+            username = identity.username
 
             # Lazy import to avoid heavy langchain/transformers at startup
             from infrastructure_atlas.agents.playground import ChatEventType
@@ -249,6 +247,22 @@ class BotOrchestrator:
                         "name": tool_name,
                         "duration_ms": event.data.get("duration_ms", 0),
                     })
+                    yield BotResponse(
+                        type=BotResponseType.TOOL_CALL,
+                        content={
+                            "tool": tool_name,
+                            "status": "finished",
+                            "duration_ms": event.data.get("duration_ms", 0),
+                        },
+                        agent_id=agent_id,
+                    )
+
+                elif event.type == ChatEventType.TEXT_DELTA:
+                    yield BotResponse(
+                        type=BotResponseType.PARTIAL,
+                        content=event.data.get("content", ""),
+                        agent_id=agent_id,
+                    )
 
                 elif event.type == ChatEventType.MESSAGE_DELTA:
                     response_text = event.data.get("content", "")
@@ -320,9 +334,8 @@ class BotOrchestrator:
                 error=error_msg,
             )
 
-        # Update conversation timestamp
-        conversation.last_message_at = datetime.now(UTC)
-        self.db.commit()
+        # Update conversation timestamp (written in the background)
+        get_bot_message_writer().touch(conversation.id, datetime.now(UTC))
 
         yield BotResponse(
             type=BotResponseType.DONE,
@@ -368,18 +381,88 @@ class BotOrchestrator:
         logger.warning(f"Unknown agent mentioned: {agent_name}")
         return None, message
 
+    def _load_identity(self, platform: str, platform_user_id: str) -> LinkedIdentity | None:
+        """Look up the verified account of a platform user and its Atlas user.
+
+        Args:
+            platform: Platform name
+            platform_user_id: Platform-specific user ID
+
+        Returns:
+            LinkedIdentity if the account is linked, None otherwise
+        """
+        account = self.linking.get_linked_account(platform, platform_user_id)
+        if not account:
+            return None
+
+        user = account.user
+        user_id = None
+        username = None
+
+        if user:
+            # SQLAlchemy eager-loaded relationship
+            user_id = str(user.id) if user.id else None
+            username = user.username
+        elif hasattr(account, "user_id") and account.user_id:
+            # MongoDB - look up user separately
+            atlas_user = self.linking.get_user_by_platform(platform, platform_user_id)
+            if atlas_user:
+                user_id = str(atlas_user.id) if hasattr(atlas_user, "id") else None
+                username = getattr(atlas_user, "username", None)
+
+        return LinkedIdentity(account_id=account.id, user_id=user_id, username=username)
+
     async def _get_or_create_conversation(
         self,
         platform: str,
         platform_conversation_id: str,
-        account: BotPlatformAccount,
+        account_id: Any,
+    ) -> ConversationRef:
+        """Get or create the conversation for a chat (cached briefly).
+
+        Args:
+            platform: Platform name
+            platform_conversation_id: Chat/channel ID
+            account_id: Linked platform account ID
+
+        Returns:
+            ConversationRef for the conversation record
+        """
+
+        def load() -> ConversationRef:
+            conversation = self._load_conversation(platform, platform_conversation_id, account_id)
+            return ConversationRef(
+                id=conversation.id,
+                session_id=conversation.session_id,
+                agent_id=conversation.agent_id,
+            )
+
+        return get_conversation_ref(platform, platform_conversation_id, load)
+
+    def _set_conversation_agent(self, conversation: ConversationRef, agent_id: str) -> None:
+        """Persist the agent a conversation was routed to."""
+        import os
+
+        conversation.agent_id = agent_id
+        if os.getenv("ATLAS_STORAGE_BACKEND", "sqlite").lower() == "mongodb":
+            return
+        self.db.execute(
+            update(BotConversation).where(BotConversation.id == conversation.id).values(agent_id=agent_id)
+        )
+        self.db.commit()
+
+    def _load_conversation(
+        self,
+        platform: str,
+        platform_conversation_id: str,
+        account_id: Any,
     ) -> BotConversation:
         """Get or create a conversation record.
 
         Args:
             platform: Platform name
             platform_conversation_id: Chat/channel ID
-            account: Linked platform account
+            account_id: Linked platform account ID
 
         Returns:
             BotConversation record
@@ -390,9 +473,7 @@ class BotOrchestrator:
         backend = os.getenv("ATLAS_STORAGE_BACKEND", "sqlite").lower()
 
         if backend == "mongodb":
-            return await self._get_or_create_conversation_mongodb(
-                platform, platform_conversation_id, account
-            )
+            return self._load_conversation_mongodb(platform, platform_conversation_id, account_id)
 
         # SQLAlchemy/SQLite path
         conversation = self.db.execute(
@@ -409,7 +490,7 @@ class BotOrchestrator:
         conversation = BotConversation(
             platform=platform,
             platform_conversation_id=platform_conversation_id,
-            platform_account_id=account.id,
+            platform_account_id=account_id,
             session_id=str(uuid.uuid4()),
         )
         self.db.add(conversation)
@@ -426,11 +507,11 @@ class BotOrchestrator:
 
         return conversation
 
-    async def _get_or_create_conversation_mongodb(
+    def _load_conversation_mongodb(
         self,
         platform: str,
         platform_conversation_id: str,
-        account: BotPlatformAccount,
+        account_id: Any,
     ) -> BotConversation:
         """Get or create a conversation record in MongoDB."""
         import uuid
@@ -470,7 +551,7 @@ class BotOrchestrator:
             "_id": str(uuid.uuid4()),
             "platform": platform,
             "platform_conversation_id": platform_conversation_id,
-            "platform_account_id": str(account.id) if account.id else None,
+            "platform_account_id": str(account_id) if account_id else None,
             "session_id": session_id,
             "agent_id": None,
             "last_message_at": now,
@@ -497,7 +578,7 @@ class BotOrchestrator:
 
     async def _log_message(
         self,
-        conversation: BotConversation,
+        conversation: ConversationRef,
         direction: str,
         content: str,
         platform_message_id: str | None = None,
@@ -508,8 +589,8 @@ class BotOrchestrator:
         cost_usd: float = 0.0,
         duration_ms: int | None = None,
         error: str | None = None,
-    ) -> BotMessage | None:
-        """Log a message to the database.
+    ) -> None:
+        """Queue a message for the database message log.
 
         Args:
             conversation: Conversation record
@@ -524,23 +605,22 @@ class BotOrchestrator:
             duration_ms: Processing time
             error: Error message if any
 
-        Returns:
-            Created BotMessage record
+        The message is written in the background by the bot message writer.
         """
         import os
 
         backend = os.getenv("ATLAS_STORAGE_BACKEND", "sqlite").lower()
 
         if backend == "mongodb":
-            return await self._log_message_mongodb(
+            await self._log_message_mongodb(
                 conversation, direction, content, platform_message_id,
                 agent_id, tool_calls, input_tokens, output_tokens,
                 cost_usd, duration_ms, error
             )
+            return
 
-        # SQLAlchemy path
-        try:
-            message = BotMessage(
+        get_bot_message_writer().log(
+            BotMessageRecord(
                 conversation_id=conversation.id,
                 direction=direction,
                 content=content,
@@ -553,17 +633,11 @@ class BotOrchestrator:
                 duration_ms=duration_ms,
                 error=error,
             )
-            self.db.add(message)
-            self.db.commit()
-            return message
-        except Exception as e:
-            logger.error(f"Failed to log bot message: {e!s}")
-            self.db.rollback()
-            return None
+        )
 
     async def _log_message_mongodb(
         self,
-        conversation: BotConversation,
+        conversation: ConversationRef,
         direction: str,
         content: str,
         platform_message_id: str | None = None,
@@ -0,0 +1,370 @@
+"""Cached lookups and batched writes for bot message processing.
+
+Every inbound bot message needs the linked Atlas account of the sender and the
+conversation record of the chat. Both change rarely, so they are cached
+process-wide for a short time as plain snapshots (bot orchestrators and their
+database sessions are created per event, ORM objects cannot outlive them).
+
+Message logs and conversation timestamps are written by
+:class:`BotMessageWriter`: callers enqueue records and return immediately, a
+background task flushes them in batches from a worker thread so synchronous
+database drivers never block the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import threading
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from infrastructure_atlas.infrastructure.caching import TTLCache
+from infrastructure_atlas.infrastructure.logging import get_logger
+from infrastructure_atlas.infrastructure.metrics import increment_counter
+from infrastructure_atlas.infrastructure.repository_factory import get_storage_backend
+
+logger = get_logger(__name__)
+
+LINKED_IDENTITY_TTL_SECONDS = 60.0
+# Accounts are unlinked (and their conversations deleted) by the API or CLI
+# process, whose invalidations never reach the bot process; keep this short
+CONVERSATION_TTL_SECONDS = 60.0
+
+
+@dataclass(frozen=True, slots=True)
+class LinkedIdentity:
+    """Verified platform account together with the Atlas user it belongs to."""
+
+    account_id: Any
+    user_id: str | None
+    username: str | None
+
+
+@dataclass(slots=True)
+class ConversationRef:
+    """Identifiers of a bot conversation needed while handling a message."""
+
+    id: Any
+    session_id: str
+    agent_id: str | None = None
+
+
+_LINKED_IDENTITIES: TTLCache[tuple[str, str], LinkedIdentity | None] = TTLCache(
+    ttl_seconds=LINKED_IDENTITY_TTL_SECONDS, name="bots.linked_identities"
+)
+_CONVERSATIONS: TTLCache[tuple[str, str], ConversationRef] = TTLCache(
+    ttl_seconds=CONVERSATION_TTL_SECONDS, name="bots.conversations"
+)
+
+
+def get_linked_identity(
+    platform: str,
+    platform_user_id: str,
+    loader: Callable[[], LinkedIdentity | None],
+) -> LinkedIdentity | None:
+    """Return the cached identity for a platform user, loading it on a miss.
+
+    Unlinked users are not cached, so a fresh ``/link`` takes effect at once.
+    """
+    key = (platform, platform_user_id)
+    identity = _LINKED_IDENTITIES.get(key, loader)
+    if identity is None:
+        _LINKED_IDENTITIES.invalidate(key)
+    return identity
+
+
+def invalidate_linked_identity(platform: str | None = None, platform_user_id: str | None = None) -> None:
+    """Forget cached identities after linking or unlinking accounts.
+
+    Without ``platform_user_id`` every cached identity is dropped.
+    """
+    if platform is not None and platform_user_id is not None:
+        _LINKED_IDENTITIES.invalidate((platform, platform_user_id))
+    else:
+        _LINKED_IDENTITIES.invalidate()
+
+
+def get_conversation_ref(
+    platform: str,
+    platform_conversation_id: str,
+    loader: Callable[[], ConversationRef],
+) -> ConversationRef:
+    """Return the cached conversation for a chat, loading or creating it on a miss."""
+    return _CONVERSATIONS.get((platform, platform_conversation_id), loader)
+
+
+def invalidate_conversation_ref(platform: str | None = None, platform_conversation_id: str | None = None) -> None:
+    """Forget cached conversations after they were deleted, e.g. with an unlinked account.
+
+    Without ``platform_conversation_id`` every cached conversation is dropped.
+    """
+    if platform is not None and platform_conversation_id is not None:
+        _CONVERSATIONS.invalidate((platform, platform_conversation_id))
+    else:
+        _CONVERSATIONS.invalidate()
+
+
+def _forget_conversation_id(conversation_id: Any) -> None:
+    """Forget cached refs to a conversation that no longer exists."""
+    for key, entry in list(_CONVERSATIONS.store.items()):
+        if entry.value.id == conversation_id:
+            _CONVERSATIONS.invalidate(key)
+
+
+@dataclass(slots=True)
+class BotMessageRecord:
+    """A bot message waiting to be written to the message log."""
+
+    conversation_id: Any
+    direction: str
+    content: str
+    platform_message_id: str | None = None
+    agent_id: str | None = None
+    tool_calls: list[dict[str, Any]] | None = None
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+    duration_ms: int | None = None
+    error: str | None = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+
+class BotMessageWriter:
+    """Batches message log inserts and conversation timestamp updates.
+
+    Records are buffered in memory and written by a background task at most
+    ``flush_interval`` seconds after they were enqueued (sooner once
+    ``max_batch`` records are waiting). Repeated timestamp updates of one
+    conversation collapse into a single update. Records that failed to write
+    (and only those) are retried on the next flush until ``max_pending``
+    records are buffered.
+    """
+
+    def __init__(self, *, flush_interval: float = 0.5, max_batch: int = 200, max_pending: int = 10_000):
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.max_pending = max_pending
+        self._records: list[BotMessageRecord] = []
+        self._touched: dict[Any, datetime] = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self._wakeup: asyncio.Event | None = None
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._records) + len(self._touched)
+
+    def log(self, record: BotMessageRecord) -> None:
+        """Queue a message log entry."""
+        with self._lock:
+            self._records.append(record)
+            full = len(self._records) >= self.max_batch
+        self._schedule(urgent=full)
+
+    def touch(self, conversation_id: Any, timestamp: datetime | None = None) -> None:
+        """Queue an update of a conversation's ``last_message_at``."""
+        timestamp = timestamp or datetime.now(UTC)
+        with self._lock:
+            current = self._touched.get(conversation_id)
+            if current is None or timestamp > current:
+                self._touched[conversation_id] = timestamp
+        self._schedule()
+
+    def _schedule(self, urgent: bool = False) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush_sync()  # No event loop (CLI, scripts): write synchronously
+            return
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._wakeup = asyncio.Event()
+            self._task = loop.create_task(self._run())
+        if urgent and self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        wakeup = self._wakeup
+        if wakeup is None:
+            raise RuntimeError("BotMessageWriter worker started without a wakeup event")
+        while self.pending:
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=self.flush_interval)
+            except TimeoutError:
+                pass
+            wakeup.clear()
+            if not await self.flush():
+                await asyncio.sleep(self.flush_interval)  # Back off after a failed write
+
+    async def flush(self) -> bool:
+        """Write everything queued so far without blocking the event loop."""
+        return await asyncio.to_thread(self.flush_sync)
+
+    def flush_sync(self) -> bool:
+        """Write everything queued so far.
+
+        Returns:
+            False if some records could not be written and were re-queued
+        """
+        with self._write_lock:
+            with self._lock:
+                records, self._records = self._records, []
+                touched, self._touched = self._touched, {}
+            if not records and not touched:
+                return True
+            try:
+                discarded = 0
+                if get_storage_backend() == "mongodb":
+                    failed = self._write_mongodb(records, touched)
+                else:
+                    discarded = self._write_sql(records, touched)
+                    failed = []
+            except Exception as exc:
+                increment_counter("bot_message_write_failures_total")
+                self._requeue(records, touched)
+                logger.error(f"Failed to write {len(records)} bot message(s): {exc}")
+                return False
+            increment_counter("bot_messages_written_total", amount=len(records) - len(failed) - discarded)
+            if failed:
+                increment_counter("bot_message_write_failures_total")
+                self._requeue(failed, {})
+                logger.error(f"Failed to write {len(failed)} of {len(records)} bot message(s); re-queued")
+                return False
+            return True
+
+    def _requeue(self, records: list[BotMessageRecord], touched: dict[Any, datetime]) -> None:
+        with self._lock:
+            if len(self._records) + len(records) > self.max_pending:
+                logger.error(f"Dropping {len(records)} bot message log(s); write backlog is full")
+            else:
+                self._records[:0] = records
+            for conversation_id, timestamp in touched.items():
+                current = self._touched.get(conversation_id)
+                if current is None or timestamp > current:
+                    self._touched[conversation_id] = timestamp
+
+    @staticmethod
+    def _write_sql(records: list[BotMessageRecord], touched: dict[Any, datetime]) -> int:
+        """Write in one transaction and return the number of records discarded.
+
+        If the batch violates a constraint, the records of conversations that
+        were deleted meanwhile (an account unlinked from another process) are
+        discarded, their cached refs are dropped, and the rest is written
+        again. Any other failure propagates so the whole batch is retried.
+        """
+        from sqlalchemy import select, update
+        from sqlalchemy.exc import IntegrityError
+
+        from infrastructure_atlas.db import get_batch_sessionmaker
+        from infrastructure_atlas.db.models import BotConversation, BotMessage
+
+        def _write(db: Any, batch: list[BotMessageRecord]) -> None:
+            db.add_all([BotMessage(**asdict(record)) for record in batch])
+            for conversation_id, timestamp in touched.items():
+                db.execute(
+                    update(BotConversation)
+                    .where(BotConversation.id == conversation_id)
+                    .values(last_message_at=timestamp)
+                )
+            db.commit()
+
+        with get_batch_sessionmaker()() as db:
+            try:
+                _write(db, records)
+                return 0
+            except IntegrityError:
+                db.rollback()
+            conversation_ids = {record.conversation_id for record in records}
+            existing = set(db.scalars(select(BotConversation.id).where(BotConversation.id.in_(conversation_ids))))
+            kept = [record for record in records if record.conversation_id in existing]
+            _write(db, kept)
+
+        for conversation_id in conversation_ids - existing:
+            _forget_conversation_id(conversation_id)
+        discarded = len(records) - len(kept)
+        logger.warning(f"Discarded {discarded} bot message log(s) of deleted conversations")
+        return discarded
+
+    @staticmethod
+    def _write_mongodb(records: list[BotMessageRecord], touched: dict[Any, datetime]) -> list[BotMessageRecord]:
+        """Write to MongoDB and return the records that were not inserted.
+
+        Timestamp updates are idempotent and go first, so an exception never
+        follows a partial insert. Messages are inserted unordered: a record
+        whose id collided with another writer's (ids come from
+        ``get_next_id()``) fails on its own and is retried with a fresh id.
+        """
+        from pymongo.errors import BulkWriteError
+
+        from infrastructure_atlas.domain.entities import BotMessageEntity
+        from infrastructure_atlas.infrastructure.mongodb import get_mongodb_client
+        from infrastructure_atlas.infrastructure.mongodb.repositories import (
+            MongoDBBotConversationRepository,
+            MongoDBBotMessageRepository,
+        )
+
+        db = get_mongodb_client().atlas
+        if touched:
+            conversations = MongoDBBotConversationRepository(db)
+            for conversation_id, timestamp in touched.items():
+                conversations.update_last_message_at(conversation_id, timestamp)
+        if not records:
+            return []
+        messages = MongoDBBotMessageRepository(db)
+        next_id = messages.get_next_id()
+        try:
+            messages.create_many(
+                [
+                    BotMessageEntity(
+                        id=next_id + offset,
+                        conversation_id=record.conversation_id,
+                        direction=record.direction,
+                        content=record.content,
+                        platform_message_id=record.platform_message_id,
+                        agent_id=record.agent_id,
+                        tool_calls=record.tool_calls,
+                        input_tokens=record.input_tokens,
+                        output_tokens=record.output_tokens,
+                        cost_usd=record.cost_usd,
+                        duration_ms=record.duration_ms,
+                        created_at=record.created_at,
+                    )
+                    for offset, record in enumerate(records)
+                ],
+                ordered=False,
+            )
+        except BulkWriteError as exc:
+            failed = {error["index"] for error in exc.details.get("writeErrors", [])}
+            return [record for index, record in enumerate(records) if index in failed]
+        return []
+
+
+_WRITER = BotMessageWriter()
+
+
+def get_bot_message_writer() -> BotMessageWriter:
+    """Return the process-wide bot message writer."""
+    return _WRITER
+
+
+@atexit.register
+def _flush_on_exit() -> None:
+    if _WRITER.pending:
+        _WRITER.flush_sync()
+
+
+__all__ = [
+    "BotMessageRecord",
+    "BotMessageWriter",
+    "ConversationRef",
+    "LinkedIdentity",
+    "get_bot_message_writer",
+    "get_conversation_ref",
+    "get_linked_identity",
+    "invalidate_conversation_ref",
+    "invalidate_linked_identity",
+]
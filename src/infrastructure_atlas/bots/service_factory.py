@@ -16,6 +16,15 @@ from contextlib import contextmanager
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any, Iterator
 
+from infrastructure_atlas.bots.persistence import (
+    BotMessageRecord,
+    ConversationRef,
+    LinkedIdentity,
+    get_bot_message_writer,
+    get_conversation_ref,
+    get_linked_identity,
+    invalidate_linked_identity,
+)
 from infrastructure_atlas.infrastructure.logging import get_logger
 from infrastructure_atlas.infrastructure.repository_factory import get_storage_backend
 
@@ -237,6 +246,7 @@ class MongoDBUserLinkingService:
 
         # Check if this platform user is already linked to a verified account
         existing = self._accounts.get_verified_by_platform_user(platform, platform_user_id)
+        invalidate_linked_identity(platform, platform_user_id)
 
         if existing:
             if existing.user_id == account.user_id:
@@ -296,6 +306,7 @@ class MongoDBUserLinkingService:
         Returns:
             True if account was deleted, False if not found
         """
+        invalidate_linked_identity()
         return self._accounts.delete(account_id)
 
     def unlink_user_platform(self, user_id: str, platform: str) -> bool:
@@ -308,6 +319,7 @@ class MongoDBUserLinkingService:
         Returns:
             True if any accounts were deleted
         """
+        invalidate_linked_identity()
         count = self._accounts.delete_by_user_id(user_id, platform)
         return count > 0
 
@@ -387,6 +399,7 @@ class MongoDBBotOrchestrator:
             self._runtime = PlaygroundRuntime(
                 skills_registry=self._skills,
                 db_session=None,  # MongoDB doesn't need SQLAlchemy session
+                session_registry_name="bots.playground_sessions",
             )
         return self._runtime
 
@@ -438,9 +451,11 @@ class MongoDBBotOrchestrator:
         start_time = time.perf_counter()
         formatter = self.formatters.get(platform)
 
-        # Verify user authorization
-        account = self._linking.get_linked_account(platform, platform_user_id)
-        if not account:
+        # Verify user authorization (cached briefly per platform user)
+        identity = get_linked_identity(
+            platform, platform_user_id, lambda: self._load_identity(platform, platform_user_id)
+        )
+        if not identity:
             yield BotResponse(
                 type=BotResponseType.UNAUTHORIZED,
                 content="Your account is not linked to Atlas. Please link your account first.",
@@ -450,14 +465,11 @@ class MongoDBBotOrchestrator:
             )
             return
 
-        # Get user
-        user = self._users.get_by_id(account.user_id) if account.user_id else None
-
         # Get or create conversation
         conversation = await self._get_or_create_conversation(
             platform=platform,
             platform_conversation_id=platform_conversation_id,
-            account=account,
+            account_id=identity.account_id,
         )
 
         # Log inbound message
@@ -472,7 +484,8 @@ class MongoDBBotOrchestrator:
         agent_id, cleaned_message = self._parse_agent_mention(message)
 
         # Update conversation with agent if specified
-        if agent_id:
+        if agent_id and agent_id != conversation.agent_id:
+            conversation.agent_id = agent_id
             self._conversations._collection.update_one(
                 {"_id": conversation.id},
                 {"$set": {"agent_id": agent_id}},
@@ -493,8 +506,8 @@ class MongoDBBotOrchestrator:
                 agent_id=agent_id or self.DEFAULT_AGENT,
                 message=cleaned_message,
                 session_id=conversation.session_id,
-                user_id=user.id if user else None,
-                username=user.username if user else None,
+                user_id=identity.user_id,
+                username=identity.username,
                 client=platform,
                 platform_user_info=platform_user_info,
             ):
@@ -512,6 +525,22 @@ class MongoDBBotOrchestrator:
                         "name": tool_name,
                         "duration_ms": event.data.get("duration_ms", 0),
                     })
+                    yield BotResponse(
+                        type=BotResponseType.TOOL_CALL,
+                        content={
+                            "tool": tool_name,
+                            "status": "finished",
+                            "duration_ms": event.data.get("duration_ms", 0),
+                        },
+                        agent_id=agent_id,
+                    )
+
+                elif event.type == ChatEventType.TEXT_DELTA:
+                    yield BotResponse(
+                        type=BotResponseType.PARTIAL,
+                        content=event.data.get("content", ""),
+                        agent_id=agent_id,
+                    )
 
                 elif event.type == ChatEventType.MESSAGE_DELTA:
                     response_text = event.data.get("content", "")
@@ -584,8 +613,8 @@ class MongoDBBotOrchestrator:
                 error=error_msg,
             )
 
-        # Update conversation timestamp
-        self._conversations.update_last_message_at(conversation.id, datetime.now(UTC))
+        # Update conversation timestamp (written in the background)
+        get_bot_message_writer().touch(conversation.id, datetime.now(UTC))
 
         yield BotResponse(
             type=BotResponseType.DONE,
@@ -631,18 +660,61 @@ class MongoDBBotOrchestrator:
         logger.warning(f"Unknown agent mentioned: {agent_name}")
         return None, message
 
+    def _load_identity(self, platform: str, platform_user_id: str) -> LinkedIdentity | None:
+        """Look up the verified account of a platform user and its Atlas user.
+
+        Returns:
+            LinkedIdentity if the account is linked, None otherwise
+        """
+        account = self._linking.get_linked_account(platform, platform_user_id)
+        if not account:
+            return None
+        user = self._users.get_by_id(account.user_id) if account.user_id else None
+        return LinkedIdentity(
+            account_id=account.id,
+            user_id=user.id if user else None,
+            username=user.username if user else None,
+        )
+
     async def _get_or_create_conversation(
         self,
         platform: str,
         platform_conversation_id: str,
-        account: Any,
+        account_id: Any,
+    ) -> ConversationRef:
+        """Get or create the conversation for a chat (cached briefly).
+
+        Args:
+            platform: Platform name
+            platform_conversation_id: Chat/channel ID
+            account_id: Linked platform account ID
+
+        Returns:
+            ConversationRef for the conversation record
+        """
+
+        def load() -> ConversationRef:
+            conversation = self._load_conversation(platform, platform_conversation_id, account_id)
+            return ConversationRef(
+                id=conversation.id,
+                session_id=conversation.session_id,
+                agent_id=conversation.agent_id,
+            )
+
+        return get_conversation_ref(platform, platform_conversation_id, load)
+
+    def _load_conversation(
+        self,
+        platform: str,
+        platform_conversation_id: str,
+        account_id: Any,
     ) -> Any:
         """Get or create a conversation record.
 
         Args:
             platform: Platform name
             platform_conversation_id: Chat/channel ID
-            account: Linked platform account
+            account_id: Linked platform account ID
 
         Returns:
             BotConversationEntity record
@@ -664,7 +736,7 @@ class MongoDBBotOrchestrator:
             id=next_id,
             platform=platform,
             platform_conversation_id=platform_conversation_id,
-            platform_account_id=account.id,
+            platform_account_id=account_id,
             agent_id=None,
             session_id=str(uuid.uuid4()),
             created_at=now,
@@ -696,8 +768,8 @@ class MongoDBBotOrchestrator:
         cost_usd: float = 0.0,
         duration_ms: int | None = None,
         error: str | None = None,
-    ) -> Any:
-        """Log a message to the database.
+    ) -> None:
+        """Queue a message for the database message log.
 
         Args:
             conversation: Conversation record
@@ -712,16 +784,10 @@ class MongoDBBotOrchestrator:
             duration_ms: Processing time
             error: Error message if any
 
-        Returns:
-            Created BotMessageEntity record
+        The message is written in the background by the bot message writer.
         """
-        from infrastructure_atlas.domain.entities import BotMessageEntity
-
-        try:
-            now = datetime.now(UTC)
-            next_id = self._messages.get_next_id()
-            message = BotMessageEntity(
-                id=next_id,
+        get_bot_message_writer().log(
+            BotMessageRecord(
                 conversation_id=conversation.id,
                 direction=direction,
                 content=content,
@@ -732,13 +798,9 @@ class MongoDBBotOrchestrator:
                 output_tokens=output_tokens,
                 cost_usd=cost_usd,
                 duration_ms=duration_ms,
-                created_at=now,
+                error=error,
             )
-            self._messages.create(message)
-            return message
-        except Exception as e:
-            logger.error(f"Failed to log bot message: {e!s}")
-            return None
+        )
 
     def get_available_agents(self) -> list[dict[str, Any]]:
         """Get list of available agents for help messages.
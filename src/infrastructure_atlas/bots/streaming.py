@@ -0,0 +1,168 @@
+"""Progressive delivery of agent replies to chat platforms.
+
+Agents can take tens of seconds to answer. Instead of waiting for the final
+text, platform handlers post one placeholder message as soon as there is
+something to show (a tool starting or the first partial text) and keep editing
+it while the agent works (Slack ``chat.update``, Telegram ``editMessageText``).
+
+Edits are coalesced: state changes only mark the reply dirty and a single
+background flusher sends the latest rendering at most once per
+``min_interval`` seconds. Intermediate states that arrive in between are never
+sent. When the platform answers with a rate limit, the flusher waits for the
+requested ``retry_after`` before the next edit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from infrastructure_atlas.bots.formatters import MessageFormatter
+from infrastructure_atlas.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class StreamRateLimited(Exception):
+    """Raised by edit/post callbacks when the platform asks us to slow down."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"Rate limited, retry after {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+class ProgressiveReply:
+    """One platform message that is edited in place while an agent replies.
+
+    Example usage:
+        reply = ProgressiveReply(formatter, post=post, edit=edit, min_interval=1.0)
+        async for response in orchestrator.process_message(...):
+            if response.type == BotResponseType.PARTIAL:
+                reply.set_text(response.content)
+            elif response.type == BotResponseType.TOOL_CALL:
+                reply.update_tool(response.content)
+        message_id = await reply.close()
+        # edit message_id with the final formatted answer, or post a new one
+    """
+
+    def __init__(
+        self,
+        formatter: MessageFormatter,
+        *,
+        post: Callable[[Any], Awaitable[str | None]],
+        edit: Callable[[str, Any], Awaitable[None]],
+        min_interval: float = 1.0,
+    ):
+        """Create a progressive reply.
+
+        Args:
+            formatter: Platform formatter used to render progress
+            post: Sends the first rendering and returns its platform message ID
+            edit: Replaces the content of a posted message
+            min_interval: Minimum seconds between two platform calls
+        """
+        self.formatter = formatter
+        self._post = post
+        self._edit = edit
+        self.min_interval = min_interval
+        self.message_id: str | None = None
+        self._text = ""
+        self._tools: list[dict[str, Any]] = []
+        self._rendered: Any = None
+        self._dirty = False
+        self._next_send = 0.0
+        self._flusher: asyncio.Task[None] | None = None
+        self._failed = False
+        self._sending = False
+        self._closed = False
+        self.edits = 0
+
+    @property
+    def active(self) -> bool:
+        """True while progress can still be delivered to the platform."""
+        return not self._failed
+
+    def set_text(self, text: str) -> None:
+        """Replace the partial answer text."""
+        self._text = text
+        self._schedule()
+
+    def update_tool(self, progress: dict[str, Any]) -> None:
+        """Record a tool start (``status="started"``) or completion (``"finished"``)."""
+        if progress.get("status") == "finished":
+            for tool in reversed(self._tools):
+                if tool.get("tool") == progress.get("tool") and tool.get("status") != "finished":
+                    tool.update(progress)
+                    break
+            else:
+                self._tools.append(dict(progress))
+        else:
+            self._tools.append(dict(progress))
+            # Text produced before a tool call is superseded by the next model turn
+            self._text = ""
+        self._schedule()
+
+    def _schedule(self) -> None:
+        if self._failed or self._closed:
+            return
+        self._dirty = True
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        while self._dirty and not self._failed and not self._closed:
+            delay = self._next_send - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._dirty = False
+            self._sending = True
+            try:
+                await self._send()
+            finally:
+                self._sending = False
+
+    async def _send(self) -> None:
+        rendered = self.formatter.format_progress(self._text, self._tools).content
+        if rendered == self._rendered:
+            return  # Platforms reject edits that do not change the message
+        try:
+            if self.message_id is None:
+                self.message_id = await self._post(rendered)
+            else:
+                await self._edit(self.message_id, rendered)
+                self.edits += 1
+            self._rendered = rendered
+            self._next_send = time.monotonic() + self.min_interval
+        except StreamRateLimited as exc:
+            logger.debug(f"Progressive reply throttled by platform for {exc.retry_after:.1f}s")
+            self._next_send = time.monotonic() + max(exc.retry_after, self.min_interval)
+            self._dirty = True
+        except Exception as exc:
+            logger.warning(f"Progressive reply disabled after delivery error: {exc}")
+            self._failed = True
+
+    async def close(self) -> str | None:
+        """Stop sending progress and return the posted message ID, if any.
+
+        Pending intermediate states are dropped; a call already in flight is
+        awaited so its message ID is known. The caller replaces the message
+        with the final answer.
+        """
+        self._closed = True
+        self._dirty = False
+        task = self._flusher
+        if task is not None and not task.done():
+            if not self._sending:
+                task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            except Exception as exc:
+                logger.debug(f"Progressive reply flusher ended with error: {exc}")
+        return self.message_id
+
+
+__all__ = ["ProgressiveReply", "StreamRateLimited"]
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import importlib
 import json
 import os
 import subprocess
 import sys
 from contextlib import ExitStack
-from dataclasses import asdict
+from dataclasses import asdict, dataclass
 from datetime import UTC
 from getpass import getuser
 from zoneinfo import ZoneInfo
@@ -14,17 +15,114 @@ import typer
 from rich import print
 from rich.console import Console
 from rich.table import Table
+from typer.core import TyperGroup
 
 from .env import load_env, project_root
 from .infrastructure.caching import get_cache_registry
 from .infrastructure.logging import get_logger, logging_context
-from .interfaces.cli.commvault import app as commvault_cli_app
-from .interfaces.cli.vcenter import app as vcenter_cli_app
 
 # Enable -h as an alias for --help everywhere
 HELP_CTX = {"help_option_names": ["-h", "--help"]}
 
-app = typer.Typer(help="Infrastructure Atlas CLI", context_settings=HELP_CTX)
+
+@dataclass(frozen=True, slots=True)
+class _LazySubcommand:
+    """A command group whose Typer app is imported only when it is invoked."""
+
+    import_path: str
+    help: str
+    module: str | None = None  # Module registry key; None for core commands
+
+
+# The CLI submodules pull in heavy stacks (FastAPI app, pyVmomi, LangChain,
+# pandas, ...). Their help text is repeated here so `atlas --help` and
+# `atlas <other command>` never import them.
+_LAZY_SUBCOMMANDS: dict[str, _LazySubcommand] = {
+    # Core commands (always enabled)
+    "api": _LazySubcommand("infrastructure_atlas.interfaces.cli.server:app", "API server"),
+    "tasks": _LazySubcommand("infrastructure_atlas.interfaces.cli.tasks:app", "Dataset cache tasks"),
+    "search": _LazySubcommand("infrastructure_atlas.interfaces.cli.search:app", "Cross-system search aggregator"),
+    "db": _LazySubcommand("infrastructure_atlas.interfaces.cli.database:app", "Database utilities"),
+    "users": _LazySubcommand("infrastructure_atlas.interfaces.cli.users:app", "User administration helpers"),
+    "tickets": _LazySubcommand("infrastructure_atlas.interfaces.cli.tickets:app", "Draft ticket management"),
+    # Module-specific commands (only listed when the module is enabled)
+    "netbox": _LazySubcommand("infrastructure_atlas.interfaces.cli.netbox:app", "NetBox helpers", "netbox"),
+    "vcenter": _LazySubcommand("infrastructure_atlas.interfaces.cli.vcenter:app", "vCenter utilities", "vcenter"),
+    "commvault": _LazySubcommand(
+        "infrastructure_atlas.interfaces.cli.commvault:app", "Commvault backup helpers", "commvault"
+    ),
+    "zabbix": _LazySubcommand("infrastructure_atlas.interfaces.cli.zabbix:app", "Zabbix helpers", "zabbix"),
+    "jira": _LazySubcommand("infrastructure_atlas.interfaces.cli.jira:app", "Jira helpers", "jira"),
+    "confluence": _LazySubcommand(
+        "infrastructure_atlas.interfaces.cli.confluence:app", "Confluence helpers", "confluence"
+    ),
+    "foreman": _LazySubcommand("infrastructure_atlas.interfaces.cli.foreman:app", "Foreman utilities", "foreman"),
+    "bots": _LazySubcommand("infrastructure_atlas.interfaces.cli.bots:app", "Bot platform management", "bots"),
+}
+
+
+def _enabled_subcommands() -> dict[str, _LazySubcommand]:
+    """Return the lazy command groups whose module is enabled."""
+    from .infrastructure.modules import get_module_registry, initialize_modules
+
+    initialize_modules()
+    registry = get_module_registry()
+    enabled: dict[str, _LazySubcommand] = {}
+    for name, spec in _LAZY_SUBCOMMANDS.items():
+        if spec.module is None or registry.is_enabled(spec.module):
+            enabled[name] = spec
+        else:
+            logger.debug("%s module disabled, skipping CLI commands", spec.module)
+    return enabled
+
+
+class _LazyTyperGroup(TyperGroup):
+    """Root command group that imports subcommand apps on demand.
+
+    Help listings and shell completion of command names use lightweight
+    placeholders; the real Typer app is imported when a command is resolved
+    for invocation (or for its own ``--help``).
+    """
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)
+        self._lazy_specs: dict[str, _LazySubcommand] | None = None
+
+    def _lazy(self) -> dict[str, _LazySubcommand]:
+        if self._lazy_specs is None:
+            self._lazy_specs = _enabled_subcommands()
+        return self._lazy_specs
+
+    def _load(self, name: str) -> None:
+        spec = self._lazy().get(name)
+        if spec is None or name in self.commands:
+            return
+        module_name, _, attribute = spec.import_path.partition(":")
+        sub_app = getattr(importlib.import_module(module_name), attribute)
+        group = typer.main.get_group(sub_app)
+        group.name = name
+        self.commands[name] = group
+
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        lazy = [name for name in self._lazy() if name not in self.commands]
+        return lazy + super().list_commands(ctx)
+
+    def get_command(self, ctx: typer.Context, cmd_name: str):
+        command = super().get_command(ctx, cmd_name)
+        if command is not None:
+            return command
+        spec = self._lazy().get(cmd_name)
+        if spec is None:
+            return None
+        return TyperGroup(name=cmd_name, help=spec.help)
+
+    def resolve_command(self, ctx: typer.Context, args: list[str]):
+        if args:
+            self._load(args[0])
+        return super().resolve_command(ctx, args)
+
+
+app = typer.Typer(help="Infrastructure Atlas CLI", context_settings=HELP_CTX, cls=_LazyTyperGroup)
 
 console = Console()
 logger = get_logger(__name__)
@@ -117,91 +215,6 @@ def _common(
     )
 
 
-# Import extracted CLI modules
-from .interfaces.cli import bots as bots_cli
-from .interfaces.cli import database as database_cli
-from .interfaces.cli import foreman as foreman_cli
-from .interfaces.cli import jira as jira_cli
-from .interfaces.cli import confluence as confluence_cli
-from .interfaces.cli import netbox as netbox_cli
-from .interfaces.cli import search as search_cli
-from .interfaces.cli import server as server_cli
-from .interfaces.cli import tasks as tasks_cli
-from .interfaces.cli import tickets as tickets_cli
-from .interfaces.cli import users as users_cli_module
-from .interfaces.cli import zabbix as zabbix_cli
-
-
-def _register_cli_commands() -> None:
-    """Register CLI commands conditionally based on module registry."""
-    from .infrastructure.modules import get_module_registry, initialize_modules
-
-    # Initialize module system
-    initialize_modules()
-    registry = get_module_registry()
-
-    # Core commands (always enabled)
-    app.add_typer(server_cli.app, name="api")
-    app.add_typer(tasks_cli.app, name="tasks")
-    app.add_typer(search_cli.app, name="search")
-    app.add_typer(database_cli.app, name="db")
-    app.add_typer(users_cli_module.app, name="users")
-    app.add_typer(tickets_cli.app, name="tickets")
-
-    # Module-specific commands (conditional)
-    if registry.is_enabled("netbox"):
-        app.add_typer(netbox_cli.app, name="netbox")
-        logger.debug("Enabled NetBox CLI commands")
-    else:
-        logger.debug("NetBox module disabled, skipping CLI commands")
-
-    if registry.is_enabled("vcenter"):
-        app.add_typer(vcenter_cli_app, name="vcenter")
-        logger.debug("Enabled vCenter CLI commands")
-    else:
-        logger.debug("vCenter module disabled, skipping CLI commands")
-
-    if registry.is_enabled("commvault"):
-        app.add_typer(commvault_cli_app, name="commvault")
-        logger.debug("Enabled Commvault CLI commands")
-    else:
-        logger.debug("Commvault module disabled, skipping CLI commands")
-
-    if registry.is_enabled("zabbix"):
-        app.add_typer(zabbix_cli.app, name="zabbix")
-        logger.debug("Enabled Zabbix CLI commands")
-    else:
-        logger.debug("Zabbix module disabled, skipping CLI commands")
-
-    if registry.is_enabled("jira"):
-        app.add_typer(jira_cli.app, name="jira")
-        logger.debug("Enabled Jira CLI commands")
-    else:
-        logger.debug("Jira module disabled, skipping CLI commands")
-
-    if registry.is_enabled("confluence"):
-        app.add_typer(confluence_cli.app, name="confluence")
-        logger.debug("Enabled Confluence CLI commands")
-    else:
-        logger.debug("Confluence module disabled, skipping CLI commands")
-
-    if registry.is_enabled("foreman"):
-        app.add_typer(foreman_cli.app, name="foreman")
-        logger.debug("Enabled Foreman CLI commands")
-    else:
-        logger.debug("Foreman module is disabled, skipping CLI commands")
-
-    if registry.is_enabled("bots"):
-        app.add_typer(bots_cli.app, name="bots")
-        logger.debug("Enabled Bots CLI commands")
-    else:
-        logger.debug("Bots module is disabled, skipping CLI commands")
-
-
-# Register commands on module initialization
-_register_cli_commands()
-
-
 def _safe_int(value: object, default: int = 0) -> int:
     try:
         if isinstance(value, bool):
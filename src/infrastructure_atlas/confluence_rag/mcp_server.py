@@ -1153,6 +1153,17 @@ class AtlasMCPServer:
                 if result is not None:
                     sections.append(result)
 
+            # Exact hostname/IP/MAC/serial matches across every source indexed in this process
+            from infrastructure_atlas.infrastructure.host_identity import get_host_identity_index
+
+            identity = get_host_identity_index().lookup(query)[: limit * 5]
+            if identity:
+                lines = []
+                for ref in identity:
+                    where = f" ({ref.scope_name or ref.scope})" if ref.scope else ""
+                    lines.append(f"- **{ref.name}** - {ref.source} {ref.kind}{where}, ID {ref.record_id}")
+                sections.insert(0, ("Identity Matches", "\n".join(lines)))
+
             # Build output
             if not sections:
                 output += "*No results found in any system.*"
@@ -8,7 +8,7 @@ future.
 
 from __future__ import annotations
 
-from .config import get_database_url, get_engine, get_sessionmaker
+from .config import get_batch_sessionmaker, get_database_url, get_engine, get_sessionmaker
 from .models import Base, GlobalAPIKey, SecureSetting, User, UserAPIKey, VCenterConfig
 
 # Note: init_database is NOT imported here to avoid circular imports with alembic.
@@ -21,6 +21,7 @@ __all__ = [
     "User",
     "UserAPIKey",
     "VCenterConfig",
+    "get_batch_sessionmaker",
     "get_database_url",
     "get_engine",
     "get_sessionmaker",
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from sqlalchemy import create_engine, event
@@ -74,6 +75,12 @@ def get_sessionmaker(*, engine: Engine | None = None) -> sessionmaker:
     return sessionmaker(bind=engine, expire_on_commit=False, future=True)
 
 
+@lru_cache(maxsize=1)
+def get_batch_sessionmaker() -> sessionmaker:
+    """Shared session factory for background batch writers (write-behind flushes)."""
+    return get_sessionmaker()
+
+
 def ensure_sqlite_parent(path: Path) -> None:
     if path.suffix and path.parent:
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -4,7 +4,19 @@ import uuid
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import JSON, Boolean, DateTime, Float, ForeignKey, Integer, String, Text, UniqueConstraint, func
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -234,6 +246,37 @@ class AIActivityLog(Base):
     user: Mapped[User | None] = relationship()
 
 
+class AIUsageRollup(Base):
+    """Pre-aggregated AI usage counters per time bucket, incremented at log time."""
+
+    __tablename__ = "ai_usage_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "granularity", "bucket", "provider", "model", "user_id", "app_name", name="uq_ai_usage_rollup_key"
+        ),
+        Index("ix_ai_usage_rollups_granularity_bucket", "granularity", "bucket"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    granularity: Mapped[str] = mapped_column(String(8), nullable=False)
+    bucket: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+    provider: Mapped[str] = mapped_column(String(32), nullable=False)
+    model: Mapped[str] = mapped_column(String(128), nullable=False)
+    # Empty strings instead of NULL so the unique key treats "no user/app" as one bucket
+    user_id: Mapped[str] = mapped_column(String(36), default="", nullable=False)
+    app_name: Mapped[str] = mapped_column(String(64), default="", nullable=False)
+
+    request_count: Mapped[int] = mapped_column(default=0, nullable=False)
+    tokens_prompt: Mapped[int] = mapped_column(default=0, nullable=False)
+    tokens_completion: Mapped[int] = mapped_column(default=0, nullable=False)
+    tokens_reasoning: Mapped[int] = mapped_column(default=0, nullable=False)
+    tokens_total: Mapped[int] = mapped_column(default=0, nullable=False)
+    cost_usd: Mapped[float] = mapped_column(default=0.0, nullable=False)
+    # Sum/count of reported tokens-per-second so averages can be derived without raw logs
+    tps_sum: Mapped[float] = mapped_column(default=0.0, nullable=False)
+    tps_count: Mapped[int] = mapped_column(default=0, nullable=False)
+
+
 class AIModelConfig(Base):
     """Custom model configurations and pricing overrides."""
 
@@ -472,7 +515,9 @@ class PlaygroundSession(Base):
     # Session state
     state: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
     config_override: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
-    messages: Mapped[list[dict[str, Any]]] = mapped_column(JSON, nullable=False, default=list)
+    # Legacy inline history; conversation turns live in playground_session_messages
+    messages: Mapped[list[dict[str, Any]]] = mapped_column(JSON, nullable=False, default=list, deferred=True)
+    message_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
     # Metrics
     total_tokens: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
@@ -488,6 +533,21 @@ class PlaygroundSession(Base):
     user: Mapped[User | None] = relationship(back_populates="playground_sessions")
 
 
+class PlaygroundSessionMessage(Base):
+    """One conversation turn of a playground session, appended and never rewritten."""
+
+    __tablename__ = "playground_session_messages"
+    __table_args__ = (UniqueConstraint("session_id", "seq", name="uq_playground_session_message_seq"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    session_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("playground_sessions.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    seq: Mapped[int] = mapped_column(Integer, nullable=False)  # 0-based position in the conversation
+    message: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, nullable=False)
+
+
 class PlaygroundPreset(Base):
     """Saved configuration presets for agent playground."""
 
@@ -552,6 +612,10 @@ class PlaygroundUsage(Base):
     # Performance
     duration_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
+    # Estimated prompt tokens before/after token-budget compaction
+    context_tokens_before: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    context_tokens_after: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
     # Error tracking
     error: Mapped[str | None] = mapped_column(Text, nullable=True)
 
@@ -16,7 +16,7 @@ from .commvault import (
 from .confluence import ConfluenceAttachment
 from .jira import JiraAttachment
 from .netbox import NetboxDeviceRecord, NetboxVMRecord
-from .vcenter import VCenterVM
+from .vcenter import VCenterVM, VCenterVMSearch
 from .zabbix import (
     ZabbixAckResult,
     ZabbixHost,
@@ -40,6 +40,7 @@ __all__ = [
     "NetboxDeviceRecord",
     "NetboxVMRecord",
     "VCenterVM",
+    "VCenterVMSearch",
     "ZabbixAckResult",
     "ZabbixHost",
     "ZabbixHostGroup",
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Any
@@ -50,3 +51,38 @@ class VCenterVM:
     total_provisioned_bytes: int | None = None
     raw_summary: Mapping[str, Any] | None = None
     raw_detail: Mapping[str, Any] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class VCenterVMSearch:
+    """Filters of a cached VM search; a VM matches when every given filter does."""
+
+    config_ids: tuple[str, ...] | None = None
+    name: str | None = None  # Exact, case-insensitive
+    name_pattern: str | None = None  # Regex, case-insensitive
+    ip_address: str | None = None
+    mac_address: str | None = None
+    instance_uuid: str | None = None
+    guest_host_name: str | None = None  # Exact, case-insensitive
+    power_state: str | None = None
+
+    @property
+    def identifier(self) -> str | None:
+        """The first exact identifier filter, usable for an index lookup."""
+        return self.name or self.ip_address or self.mac_address or self.instance_uuid or self.guest_host_name
+
+    def matches(self, vm: VCenterVM) -> bool:
+        """Check a VM against every filter except ``config_ids``."""
+        return all(
+            (
+                not self.name or vm.name.lower() == self.name.lower(),
+                not self.name_pattern or re.search(self.name_pattern, vm.name, re.IGNORECASE) is not None,
+                not self.ip_address
+                or self.ip_address in (vm.ip_addresses or ())
+                or vm.guest_ip_address == self.ip_address,
+                not self.mac_address or self.mac_address.strip().lower() in (vm.mac_addresses or ()),
+                not self.instance_uuid or (vm.instance_uuid or "").lower() == self.instance_uuid.lower(),
+                not self.guest_host_name or (vm.guest_host_name or "").lower() == self.guest_host_name.lower(),
+                not self.power_state or (vm.power_state or "").upper() == self.power_state.upper(),
+            )
+        )
@@ -5,8 +5,6 @@ from pathlib import Path
 
 from dotenv import find_dotenv, load_dotenv
 
-from infrastructure_atlas.infrastructure.security import sync_secure_settings
-
 
 def project_root() -> Path:
     """Return the repo root (directory containing pyproject.toml)."""
@@ -33,7 +31,10 @@ def load_env(override: bool = False, dotenv_path: Path | None = None) -> Path:
     # Fallback to root/.env if find_dotenv returned empty or a directory
     if not env_path or str(env_path) == "." or env_path.is_dir():
         env_path = root / ".env"
-    # Load database-stored settings FIRST (user overrides via UI)
+    # Load database-stored settings FIRST (user overrides via UI); imported here
+    # because the security package pulls in the database layer, which needs env
+    from infrastructure_atlas.infrastructure.security import sync_secure_settings
+
     sync_secure_settings()
     # Then load .env file (override=False means it won't overwrite existing vars)
     load_dotenv(dotenv_path=str(env_path), override=override)
@@ -1,7 +1,19 @@
 """Infrastructure layer: persistence, external APIs, caching, and background work."""
 
-from . import db
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
 from .logging import setup_logging
 from .settings import Settings, as_dict, load_settings
 
 __all__ = ["Settings", "as_dict", "db", "load_settings", "setup_logging"]
+
+
+def __getattr__(name: str) -> Any:
+    # The persistence layer loads SQLAlchemy; import it only when used so
+    # lightweight helpers (logging, caching, settings) stay cheap to import.
+    if name == "db":
+        return importlib.import_module(".db", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
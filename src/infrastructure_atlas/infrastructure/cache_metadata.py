@@ -0,0 +1,169 @@
+"""Metadata sidecars for JSON cache files.
+
+Status pages and dataset listings only need a handful of facts about a cache
+(when it was generated, how many records it holds), but the cache files
+themselves can be tens of megabytes. Every JSON cache written through
+:func:`write_json_cache` gets a small ``<name>.meta`` sidecar next to it with
+those facts plus the byte size and SHA-256 checksum of the data file, so
+status paths can answer without parsing the cache.
+
+The sidecar also records the data file's modification time. If the cache is
+rewritten by something that does not maintain the sidecar (an older release,
+a restored backup, a manual edit) :func:`read_cache_metadata` treats the
+sidecar as stale and returns None; :func:`load_cache_status` then loads the
+cache once and backfills the sidecar.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Callable, Mapping
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from infrastructure_atlas.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+SIDECAR_SUFFIX = ".meta"
+
+
+def sidecar_path(path: Path) -> Path:
+    """Return the metadata sidecar path for a cache file (``foo.json.meta``)."""
+    return path.with_name(path.name + SIDECAR_SUFFIX)
+
+
+def _json_safe(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
+def write_cache_metadata(path: Path, summary: Mapping[str, Any], *, data: bytes | None = None) -> dict[str, Any] | None:
+    """Write the sidecar for an existing cache file.
+
+    Args:
+        path: The cache file the metadata describes
+        summary: Dataset facts such as ``generated_at`` and record counts
+        data: The bytes just written to ``path``; read from disk when omitted
+
+    Returns:
+        The metadata written, or None if the cache file is missing or the
+        sidecar could not be written
+    """
+    try:
+        if data is None:
+            data = path.read_bytes()
+        stat = path.stat()
+    except OSError:
+        return None
+    meta = {key: _json_safe(value) for key, value in summary.items()}
+    meta.update(
+        size_bytes=len(data),
+        sha256=hashlib.sha256(data).hexdigest(),
+        mtime_ns=stat.st_mtime_ns,
+    )
+    try:
+        _atomic_write(sidecar_path(path), json.dumps(meta, sort_keys=True).encode("utf-8"))
+    except OSError:
+        logger.warning(f"Failed to write cache metadata for {path}", exc_info=True)
+        return None
+    return meta
+
+
+def write_json_cache(
+    path: Path,
+    payload: Mapping[str, Any],
+    summary: Mapping[str, Any],
+    *,
+    indent: int | None = 2,
+    sort_keys: bool = False,
+) -> dict[str, Any] | None:
+    """Atomically write a JSON cache file together with its metadata sidecar.
+
+    Args:
+        path: Destination cache file
+        payload: JSON-serialisable cache content
+        summary: Dataset facts stored in the sidecar (``generated_at``, counts)
+        indent: ``json.dumps`` indentation of the cache file
+        sort_keys: Whether to sort keys in the cache file
+
+    Returns:
+        The metadata written to the sidecar, or None if only the cache file
+        could be written
+    """
+    data = json.dumps(payload, indent=indent, sort_keys=sort_keys).encode("utf-8")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _atomic_write(path, data)
+    return write_cache_metadata(path, summary, data=data)
+
+
+def read_cache_metadata(path: Path) -> dict[str, Any] | None:
+    """Return the sidecar metadata of a cache file without reading the cache.
+
+    Returns None when the cache file does not exist, when there is no sidecar,
+    or when the cache file changed since the sidecar was written.
+    """
+    try:
+        stat = os.stat(path)
+        meta = json.loads(sidecar_path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(meta, dict):
+        return None
+    if meta.get("size_bytes") != stat.st_size or meta.get("mtime_ns") != stat.st_mtime_ns:
+        return None
+    return meta
+
+
+def load_cache_status(
+    path: Path,
+    load_meta: Callable[[], Mapping[str, Any] | None],
+) -> dict[str, Any] | None:
+    """Return cache metadata from the sidecar, backfilling it when missing.
+
+    Args:
+        path: The cache file
+        load_meta: Fallback that fully loads the cache and returns its summary
+            (``generated_at``, counts); only called without a valid sidecar
+
+    Returns:
+        The summary plus ``size_bytes`` and ``sha256``, or None when nothing
+        is cached
+    """
+    meta = read_cache_metadata(path)
+    if meta is None:
+        summary = load_meta()
+        if summary is None:
+            return None
+        meta = write_cache_metadata(path, summary) or {key: _json_safe(value) for key, value in summary.items()}
+    meta.pop("mtime_ns", None)
+    return meta
+
+
+def remove_cache_metadata(path: Path) -> None:
+    """Delete the sidecar of a cache file, if any."""
+    try:
+        sidecar_path(path).unlink(missing_ok=True)
+    except OSError:
+        logger.warning(f"Failed to remove cache metadata for {path}", exc_info=True)
+
+
+__all__ = [
+    "SIDECAR_SUFFIX",
+    "load_cache_status",
+    "read_cache_metadata",
+    "remove_cache_metadata",
+    "sidecar_path",
+    "write_cache_metadata",
+    "write_json_cache",
+]
@@ -5,7 +5,7 @@ import time
 from collections.abc import Callable, Iterable, Mapping, MutableMapping
 from dataclasses import dataclass, field
 from threading import Lock
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, Protocol, TypeVar
 
 K = TypeVar("K")
 V = TypeVar("V")
@@ -28,6 +28,12 @@ class CacheMetrics:
     created_at: float = field(default_factory=time.monotonic)
     last_refresh: float | None = None
 
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups served from the cache (0.0 before the first lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
     def snapshot(self) -> CacheMetrics:
         return CacheMetrics(
             hits=self.hits,
@@ -41,11 +47,17 @@ class CacheMetrics:
 
 @dataclass
 class TTLCache(Generic[K, V]):
-    """In-memory TTL cache with thread-safe access and instrumentation."""
+    """In-memory TTL cache with thread-safe access and instrumentation.
+
+    Expired entries are only replaced when their key is requested again. For
+    caches keyed by free-form input set ``max_entries``: storing a new key
+    into a full cache first drops expired entries, then the oldest ones.
+    """
 
     ttl_seconds: float
     name: str | None = None
     store: MutableMapping[K, CacheEntry[V]] = field(default_factory=dict)
+    max_entries: int | None = None
     _lock: Lock = field(default_factory=Lock, init=False, repr=False)
     _metrics: CacheMetrics = field(default_factory=CacheMetrics, init=False, repr=False)
     _listeners: list[Callable[[K | None], None]] = field(default_factory=list, init=False, repr=False)
@@ -66,11 +78,27 @@ class TTLCache(Generic[K, V]):
         value = loader()
 
         with self._lock:
+            if self.max_entries is not None:
+                self.store.pop(key, None)  # Re-stored keys count as newest
+                self._make_room(now)
             self.store[key] = CacheEntry(value=value, expires_at=now + self.ttl_seconds)
             self._metrics.loads += 1
             self._metrics.last_refresh = time.monotonic()
         return value
 
+    def _make_room(self, now: float) -> None:
+        # Caller holds self._lock
+        if self.max_entries is None or len(self.store) < self.max_entries:
+            return
+        expired = [key for key, entry in self.store.items() if entry.expires_at <= now]
+        for key in expired:
+            del self.store[key]
+        removed = len(expired)
+        while self.store and len(self.store) >= self.max_entries:
+            del self.store[next(iter(self.store))]
+            removed += 1
+        self._metrics.evictions += removed
+
     def invalidate(self, key: K | None = None) -> None:
         listeners: Iterable[Callable[[K | None], None]]
         removed = 0
@@ -99,14 +127,29 @@ class TTLCache(Generic[K, V]):
             return len(self.store)
 
 
+class InstrumentedCache(Protocol):
+    """What the registry needs from a cache; implemented by :class:`TTLCache`."""
+
+    name: str | None
+
+    @property
+    def ttl_seconds(self) -> float: ...
+
+    def invalidate(self, key: Any | None = None) -> None: ...
+
+    def snapshot_metrics(self) -> CacheMetrics: ...
+
+    def size(self) -> int: ...
+
+
 class CacheRegistry:
     """Registry for cache lookup and coordinated invalidation."""
 
     def __init__(self) -> None:
-        self._caches: dict[str, TTLCache[Any, Any]] = {}
+        self._caches: dict[str, InstrumentedCache] = {}
         self._lock = Lock()
 
-    def register(self, cache: TTLCache[Any, Any]) -> None:
+    def register(self, cache: InstrumentedCache) -> None:
         if cache.name is None:
             return
         with self._lock:
@@ -118,7 +161,7 @@ class CacheRegistry:
 
     def invalidate(self, name: str | None = None, key: Any | None = None) -> None:
         with self._lock:
-            targets: Iterable[TTLCache[Any, Any]]
+            targets: Iterable[InstrumentedCache]
             if name is None:
                 targets = tuple(self._caches.values())
             else:
@@ -145,6 +188,19 @@ class CacheRegistry:
         with self._lock:
             return tuple(self._caches.keys())
 
+    def publish_metrics(self) -> None:
+        """Mirror cache sizes and hit/miss/eviction counts into the metrics registry."""
+        from infrastructure_atlas.infrastructure.metrics import set_gauge
+
+        for name, info in self.snapshot().items():
+            labels = {"cache": name}
+            metrics = info["metrics"]
+            set_gauge("cache_entries", info["size"], labels=labels)
+            set_gauge("cache_hits", metrics.hits, labels=labels)
+            set_gauge("cache_misses", metrics.misses, labels=labels)
+            set_gauge("cache_evictions", metrics.evictions, labels=labels)
+            set_gauge("cache_hit_rate", metrics.hit_rate, labels=labels)
+
 
 _GLOBAL_CACHE_REGISTRY = CacheRegistry()
 
@@ -153,4 +209,4 @@ def get_cache_registry() -> CacheRegistry:
     return _GLOBAL_CACHE_REGISTRY
 
 
-__all__ = ["CacheMetrics", "CacheRegistry", "TTLCache", "get_cache_registry"]
+__all__ = ["CacheMetrics", "CacheRegistry", "InstrumentedCache", "TTLCache", "get_cache_registry"]
@@ -27,8 +27,11 @@ from .foreman_client import (
     ForemanClient,
     ForemanClientConfig,
     ForemanClientError,
+    ForemanClientPool,
+    get_foreman_client_pool,
 )
 from .netbox_client import NetboxClient, NetboxClientConfig
+from .netbox_snapshot import NetboxSnapshot, NetboxSnapshotStore
 from .vcenter_client import (
     VCenterAPIError,
     VCenterAuthError,
@@ -53,6 +56,9 @@ from .git_client import (
     GitRepoInfo,
 )
 from .puppet_parser import (
+    PARSER_VERSION as PUPPET_PARSER_VERSION,
+    PuppetAccessIndex,
+    PuppetFileCache,
     PuppetGroup,
     PuppetInventory,
     PuppetParser,
@@ -77,6 +83,8 @@ __all__ = [
     "ForemanClient",
     "ForemanClientConfig",
     "ForemanClientError",
+    "ForemanClientPool",
+    "get_foreman_client_pool",
     "JiraAPIError",
     "JiraAuthError",
     "JiraClient",
@@ -93,6 +101,11 @@ __all__ = [
     "GitRepoInfo",
     "NetboxClient",
     "NetboxClientConfig",
+    "NetboxSnapshot",
+    "NetboxSnapshotStore",
+    "PUPPET_PARSER_VERSION",
+    "PuppetAccessIndex",
+    "PuppetFileCache",
     "PuppetGroup",
     "PuppetInventory",
     "PuppetParser",
@@ -3,18 +3,35 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Mapping, Sequence
-from dataclasses import dataclass
+import math
+import os
+import threading
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from types import TracebackType
 from typing import Any
 
 import requests
 from requests import Session
+from requests.adapters import HTTPAdapter
 
-from infrastructure_atlas.infrastructure.caching import CacheMetrics, TTLCache
+from infrastructure_atlas.infrastructure.caching import CacheMetrics, TTLCache, get_cache_registry
 
 logger = logging.getLogger(__name__)
 
+MAX_CONCURRENCY_ENV = "FOREMAN_MAX_CONCURRENCY"
+_DEFAULT_MAX_CONCURRENCY = 4
+# Host listings cached per search string; pooled clients live for the whole process
+_HOSTS_CACHE_MAX_ENTRIES = 16
+
+
+def _max_concurrency_from_env() -> int:
+    try:
+        return max(1, int(os.getenv(MAX_CONCURRENCY_ENV, str(_DEFAULT_MAX_CONCURRENCY))))
+    except ValueError:
+        return _DEFAULT_MAX_CONCURRENCY
+
 
 class ForemanClientError(RuntimeError):
     """Base error raised for Foreman client failures."""
@@ -38,21 +55,36 @@ class ForemanClientConfig:
     verify_ssl: bool = True
     timeout: int = 30
     cache_ttl_seconds: float = 300.0  # 5 minutes default cache
+    # Parallel page/bulk requests during inventory refresh (FOREMAN_MAX_CONCURRENCY)
+    max_concurrency: int = field(default_factory=_max_concurrency_from_env)
 
 
 class ForemanClient:
-    """REST client for Foreman API interactions with caching."""
+    """REST client for Foreman API interactions with caching.
+
+    Clients handed out by :class:`ForemanClientPool` are shared by every
+    request for the same configuration; for those ``with client:`` does not
+    close the session, only the pool does.
+    """
 
     _API_VERSION = "/api/v2"
     _HOSTS_ENDPOINT = "/api/v2/hosts"
     _STATUS_ENDPOINT = "/api/v2/status"
+    _FACT_VALUES_ENDPOINT = "/api/v2/fact_values"
+    _PUPPETCLASSES_ENDPOINT = "/api/v2/puppetclasses"
     _PER_PAGE = 1000  # Foreman API max per_page
 
-    def __init__(self, config: ForemanClientConfig) -> None:
+    _POOL_CONNECTIONS = 16  # Keep-alive connections per client (API worker threads share it)
+
+    def __init__(self, config: ForemanClientConfig, *, cache_namespace: str | None = None) -> None:
         self._config = config
         self._base_url = config.base_url.rstrip("/")
         self._timeout = max(int(config.timeout or 30), 1)
+        self._pooled = False
         self._session: Session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self._POOL_CONNECTIONS)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
         self._session.verify = bool(config.verify_ssl)
         # Foreman 1.24.3 uses HTTP Basic Auth with username:token
         self._session.auth = (config.username, config.token)
@@ -63,26 +95,35 @@ class ForemanClient:
             }
         )
         # Set up caching
+        namespace = cache_namespace or config.base_url
         self._hosts_cache = TTLCache[str, list[Mapping[str, Any]]](
             ttl_seconds=config.cache_ttl_seconds,
-            name=f"foreman.hosts.{config.base_url}",
+            name=f"foreman.hosts.{namespace}",
+            max_entries=_HOSTS_CACHE_MAX_ENTRIES,
         )
         self._host_details_cache = TTLCache[str, Mapping[str, Any]](
             ttl_seconds=config.cache_ttl_seconds,
-            name=f"foreman.host_details.{config.base_url}",
+            name=f"foreman.host_details.{namespace}",
         )
         self._puppet_classes_cache = TTLCache[str, list[Mapping[str, Any]]](
             ttl_seconds=config.cache_ttl_seconds,
-            name=f"foreman.puppet_classes.{config.base_url}",
+            name=f"foreman.puppet_classes.{namespace}",
         )
         self._puppet_parameters_cache = TTLCache[str, list[Mapping[str, Any]]](
             ttl_seconds=config.cache_ttl_seconds,
-            name=f"foreman.puppet_parameters.{config.base_url}",
+            name=f"foreman.puppet_parameters.{namespace}",
         )
         self._puppet_facts_cache = TTLCache[str, Mapping[str, Any]](
             ttl_seconds=config.cache_ttl_seconds,
-            name=f"foreman.puppet_facts.{config.base_url}",
+            name=f"foreman.puppet_facts.{namespace}",
         )
+        self._caches: dict[str, TTLCache[str, Any]] = {
+            "hosts": self._hosts_cache,
+            "host_details": self._host_details_cache,
+            "puppet_classes": self._puppet_classes_cache,
+            "puppet_parameters": self._puppet_parameters_cache,
+            "puppet_facts": self._puppet_facts_cache,
+        }
         if not config.verify_ssl:
             try:  # optional dependency
                 from urllib3 import disable_warnings
@@ -101,7 +142,12 @@ class ForemanClient:
         exc: BaseException | None,
         tb: TracebackType | None,
     ) -> None:
-        self.close()
+        if not self._pooled:
+            self.close()
+
+    @property
+    def config(self) -> ForemanClientConfig:
+        return self._config
 
     def close(self) -> None:
         """Close the HTTP session."""
@@ -109,21 +155,23 @@ class ForemanClient:
 
     def invalidate_cache(self) -> None:
         """Invalidate all cached data."""
-        self._hosts_cache.invalidate()
-        self._host_details_cache.invalidate()
-        self._puppet_classes_cache.invalidate()
-        self._puppet_parameters_cache.invalidate()
-        self._puppet_facts_cache.invalidate()
+        for cache in self._caches.values():
+            cache.invalidate()
 
     def cache_metrics(self) -> Mapping[str, CacheMetrics]:
         """Get cache performance metrics."""
-        return {
-            "hosts": self._hosts_cache.snapshot_metrics(),
-            "host_details": self._host_details_cache.snapshot_metrics(),
-            "puppet_classes": self._puppet_classes_cache.snapshot_metrics(),
-            "puppet_parameters": self._puppet_parameters_cache.snapshot_metrics(),
-            "puppet_facts": self._puppet_facts_cache.snapshot_metrics(),
-        }
+        return {name: cache.snapshot_metrics() for name, cache in self._caches.items()}
+
+    def cache_sizes(self) -> Mapping[str, int]:
+        """Get the number of cached entries per cache."""
+        return {name: cache.size() for name, cache in self._caches.items()}
+
+    def unregister_caches(self) -> None:
+        """Remove this client's caches from the global cache registry."""
+        registry = get_cache_registry()
+        for cache in self._caches.values():
+            if cache.name:
+                registry.unregister(cache.name)
 
     def _request(
         self,
@@ -200,12 +248,20 @@ class ForemanClient:
         except Exception as exc:
             raise ForemanClientError(f"Failed to connect to Foreman: {exc}") from exc
 
-    def list_hosts(self, *, search: str | None = None, force_refresh: bool = False) -> list[Mapping[str, Any]]:
+    def list_hosts(
+        self,
+        *,
+        search: str | None = None,
+        force_refresh: bool = False,
+        parallel: bool = False,
+    ) -> list[Mapping[str, Any]]:
         """List all hosts from Foreman with pagination support.
 
         Args:
             search: Optional search query string.
             force_refresh: If True, bypass cache and fetch fresh data.
+            parallel: If True, read the total from page 1 and fetch the
+                remaining pages concurrently (``max_concurrency`` at a time).
 
         Returns:
             List of all host records (fetches all pages automatically).
@@ -215,37 +271,205 @@ class ForemanClient:
         if force_refresh:
             self._hosts_cache.invalidate(cache_key)
 
-        return self._hosts_cache.get(cache_key, lambda: self._fetch_all_hosts(search))
+        return self._hosts_cache.get(cache_key, lambda: self._fetch_all_hosts(search, parallel=parallel))
 
-    def _fetch_all_hosts(self, search: str | None = None) -> list[Mapping[str, Any]]:
+    def _fetch_all_hosts(self, search: str | None = None, *, parallel: bool = False) -> list[Mapping[str, Any]]:
         """Fetch all hosts by paginating through all pages."""
+        params: dict[str, Any] = {}
+        if search:
+            params["search"] = search
+        concurrency = self._max_concurrency if parallel else 1
+
         all_hosts: list[Mapping[str, Any]] = []
-        page = 1
+        seen_ids: set[Any] = set()
+        for payload in self._fetch_pages(self._HOSTS_ENDPOINT, params, concurrency=concurrency):
+            results = payload.get("results") or []
+            if not isinstance(results, list):
+                continue
+            for item in results:
+                if not isinstance(item, Mapping):
+                    continue
+                # Hosts created while pages are fetched shift later pages; skip repeats
+                host_id = item.get("id")
+                if host_id is not None:
+                    if host_id in seen_ids:
+                        continue
+                    seen_ids.add(host_id)
+                all_hosts.append(item)
+
+        return all_hosts
+
+    @property
+    def _max_concurrency(self) -> int:
+        return max(int(self._config.max_concurrency or 1), 1)
+
+    def _fetch_pages(
+        self,
+        path: str,
+        params: Mapping[str, Any],
+        *,
+        concurrency: int = 1,
+    ) -> list[Mapping[str, Any]]:
+        """Fetch every page of a paginated index endpoint.
+
+        Page 1 is always fetched first. With ``concurrency`` above 1 and a
+        total in the response, the remaining pages are requested in parallel;
+        otherwise pages are walked one by one until a short page.
+
+        Returns:
+            The page payloads in page order.
+
+        Raises:
+            ForemanClientError: If a page after the first returned no data, so
+                a truncated listing is never mistaken for the full one.
+        """
         per_page = self._PER_PAGE
 
-        while True:
-            params: dict[str, Any] = {"page": page, "per_page": per_page}
-            if search:
-                params["search"] = search
+        def _fetch(number: int) -> Any:
+            return self._request("GET", path, params={**params, "page": number, "per_page": per_page})
 
-            payload = self._request("GET", self._HOSTS_ENDPOINT, params=params)
+        def _page(number: int) -> Mapping[str, Any]:
+            payload = _fetch(number)
             if not isinstance(payload, Mapping):
-                break
+                raise ForemanClientError(f"Foreman returned no data for page {number} of {path}")
+            return payload
 
-            results = payload.get("results") or []
-            if isinstance(results, list):
-                all_hosts.extend(item for item in results if isinstance(item, Mapping))
+        first = _fetch(1)
+        if not isinstance(first, Mapping):
+            return []
+        pages = [first]
+
+        # ``subtotal`` counts the matches of the search, ``total`` every record
+        total = first.get("subtotal")
+        if not isinstance(total, int):
+            total = first.get("total")
+
+        if concurrency > 1 and isinstance(total, int):
+            remaining = range(2, math.ceil(total / per_page) + 1)
+            if remaining:
+                with ThreadPoolExecutor(
+                    max_workers=min(concurrency, len(remaining)),
+                    thread_name_prefix="foreman-pages",
+                ) as executor:
+                    pages.extend(executor.map(_page, remaining))
+            return pages
+
+        fetched = self._page_size(first)
+        number = 1
+        while fetched and fetched == per_page and not (isinstance(total, int) and number * per_page >= total):
+            number += 1
+            payload = _page(number)
+            pages.append(payload)
+            fetched = self._page_size(payload)
+        return pages
 
-            # Check if we've fetched all pages
-            total = payload.get("total") or payload.get("subtotal")
-            if isinstance(total, int) and len(all_hosts) >= total:
-                break
-            if not results or len(results) < per_page:
-                break
+    @staticmethod
+    def _page_size(payload: Mapping[str, Any]) -> int:
+        """Number of records on a page (fact_values pages are keyed by host)."""
+        results = payload.get("results")
+        if isinstance(results, Mapping):
+            return sum(len(value) if isinstance(value, Mapping | list) else 1 for value in results.values())
+        return len(results) if isinstance(results, list) else 0
+
+    def _map_bounded(self, func: Callable[[Any], Any], items: Iterable[Any]) -> list[Any]:
+        """Apply ``func`` to ``items`` with at most ``max_concurrency`` requests in flight."""
+        items = list(items)
+        if self._max_concurrency == 1 or len(items) < 2:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_concurrency, len(items)),
+            thread_name_prefix="foreman-bulk",
+        ) as executor:
+            return list(executor.map(func, items))
+
+    def fetch_fact_values(
+        self,
+        fact_names: Sequence[str],
+        *,
+        search: str | None = None,
+        parallel: bool = True,
+    ) -> dict[str, dict[str, Any]]:
+        """Bulk-load selected Puppet facts of all hosts from ``/api/v2/fact_values``.
 
-            page += 1
+        One paged query replaces a ``/hosts/:id/facts`` request per host.
 
-        return all_hosts
+        Args:
+            fact_names: Fact names to load (e.g. ``os::name``, ``serialnumber``).
+            search: Optional extra search narrowing the hosts or facts.
+            parallel: Fetch the pages after the first concurrently.
+
+        Returns:
+            Mapping of host name -> {fact name: value}.
+        """
+        names = [name.strip() for name in fact_names if name and name.strip()]
+        if not names:
+            return {}
+        query = "name ^ ({})".format(", ".join(names))
+        if search:
+            query = f"({search}) and {query}"
+
+        concurrency = self._max_concurrency if parallel else 1
+        facts_by_host: dict[str, dict[str, Any]] = {}
+        for payload in self._fetch_pages(self._FACT_VALUES_ENDPOINT, {"search": query}, concurrency=concurrency):
+            results = payload.get("results")
+            if not isinstance(results, Mapping):
+                continue
+            for host_name, facts in results.items():
+                if isinstance(facts, Mapping):
+                    facts_by_host.setdefault(str(host_name), {}).update(facts)
+        return facts_by_host
+
+    def list_puppet_class_names(self) -> list[str]:
+        """List the names of all Puppet classes known to Foreman."""
+        names: list[str] = []
+        for payload in self._fetch_pages(self._PUPPETCLASSES_ENDPOINT, {}, concurrency=self._max_concurrency):
+            results = payload.get("results")
+            # Results are grouped by Puppet module: {"ntp": [{"id": 1, "name": "ntp"}, ...]}
+            groups: Iterable[Any] = results.values() if isinstance(results, Mapping) else results or []
+            for group in groups:
+                entries = group if isinstance(group, list) else [group]
+                for entry in entries:
+                    if isinstance(entry, Mapping) and entry.get("name"):
+                        names.append(str(entry["name"]))
+        return sorted(set(names))
+
+    def fetch_host_puppet_classes(self, class_names: Sequence[str] | None = None) -> dict[str, list[str]]:
+        """Bulk-load the Puppet classes of all hosts with one host search per class.
+
+        Foreman has no index of host/class assignments, so each class is
+        resolved with ``/api/v2/hosts?search=class = <name>&thin=true``; the
+        searches run ``max_concurrency`` at a time. That is at least one
+        request per class; it only beats one ``/hosts/:id/puppetclasses``
+        call per host when there are far more hosts than classes.
+
+        Args:
+            class_names: Classes to resolve; defaults to every Puppet class.
+
+        Returns:
+            Mapping of host name -> sorted class names.
+        """
+        names = list(class_names) if class_names is not None else self.list_puppet_class_names()
+
+        def _hosts_with_class(class_name: str) -> tuple[str, list[str]]:
+            pages = self._fetch_pages(
+                self._HOSTS_ENDPOINT,
+                {"search": f'class = "{class_name}"', "thin": "true"},
+            )
+            hosts = [
+                str(item["name"])
+                for payload in pages
+                for item in payload.get("results") or []
+                if isinstance(item, Mapping) and item.get("name")
+            ]
+            return class_name, hosts
+
+        classes_by_host: dict[str, list[str]] = {}
+        for class_name, host_names in self._map_bounded(_hosts_with_class, names):
+            for host_name in host_names:
+                classes_by_host.setdefault(host_name, []).append(class_name)
+        for classes in classes_by_host.values():
+            classes.sort()
+        return classes_by_host
 
     def get_host(self, host_id: int | str) -> Mapping[str, Any] | None:
         """Get a specific host by ID (alias for get_host_detail for backward compatibility).
@@ -405,4 +629,85 @@ class ForemanClient:
         }
 
 
-__all__ = ["ForemanClient", "ForemanClientConfig", "ForemanClientError", "ForemanAuthError", "ForemanAPIError"]
+class ForemanClientPool:
+    """One long-lived :class:`ForemanClient` per Foreman configuration.
+
+    Pooled clients keep their HTTP session (keep-alive connections) and TTL
+    caches for the lifetime of the process, so host details, Puppet data and
+    facts fetched by one request serve the next. A client is replaced when
+    the connection settings it was built with change, and dropped with
+    :meth:`invalidate` when its configuration is updated or deleted.
+
+    Replaced and dropped clients are not closed: requests still running on
+    them finish normally, and their connections are released once the last
+    reference goes away.
+    """
+
+    def __init__(self) -> None:
+        self._clients: dict[str, ForemanClient] = {}
+        self._lock = threading.Lock()
+
+    def get(self, config_id: str, config: ForemanClientConfig) -> ForemanClient:
+        """Return the pooled client for ``config_id``, creating or replacing it as needed."""
+        with self._lock:
+            client = self._clients.get(config_id)
+            if client is not None and client.config == config:
+                return client
+            replaced = client is not None
+            client = ForemanClient(config, cache_namespace=config_id)
+            client._pooled = True
+            self._clients[config_id] = client
+        if replaced:
+            logger.info("Foreman connection settings changed for %s; replacing pooled client", config_id)
+        return client
+
+    def invalidate(self, config_id: str | None = None) -> None:
+        """Drop the pooled client of ``config_id`` (or all clients) and unregister its caches."""
+        with self._lock:
+            if config_id is None:
+                dropped = list(self._clients.values())
+                self._clients.clear()
+            else:
+                client = self._clients.pop(config_id, None)
+                dropped = [client] if client is not None else []
+        for client in dropped:
+            client.unregister_caches()
+
+    def cache_metrics(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Per-configuration cache metrics of the pooled clients, including hit rates."""
+        with self._lock:
+            clients = dict(self._clients)
+        result: dict[str, dict[str, dict[str, Any]]] = {}
+        for config_id, client in clients.items():
+            sizes = client.cache_sizes()
+            result[config_id] = {
+                name: {
+                    "hits": metrics.hits,
+                    "misses": metrics.misses,
+                    "loads": metrics.loads,
+                    "evictions": metrics.evictions,
+                    "hit_rate": metrics.hit_rate,
+                    "size": sizes.get(name, 0),
+                }
+                for name, metrics in client.cache_metrics().items()
+            }
+        return result
+
+
+_CLIENT_POOL = ForemanClientPool()
+
+
+def get_foreman_client_pool() -> ForemanClientPool:
+    """Return the process-wide Foreman client pool."""
+    return _CLIENT_POOL
+
+
+__all__ = [
+    "ForemanAPIError",
+    "ForemanAuthError",
+    "ForemanClient",
+    "ForemanClientConfig",
+    "ForemanClientError",
+    "ForemanClientPool",
+    "get_foreman_client_pool",
+]
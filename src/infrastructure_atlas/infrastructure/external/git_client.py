@@ -230,6 +230,32 @@ class GitClient:
             commit_date=commit_date,
         )
 
+    def changed_files(self, old_commit: str, new_commit: str = "HEAD") -> list[str] | None:
+        """List files changed between two commits (``git diff --name-only``).
+
+        Args:
+            old_commit: Commit the caller last saw.
+            new_commit: Commit to compare against.
+
+        Returns:
+            Repository-relative paths, renames reported as both old and new
+            path, or None when the diff is unavailable (e.g. ``old_commit``
+            is no longer in the history after a force push).
+        """
+        if not self.is_cloned():
+            return None
+        try:
+            result = self._run_git(
+                ["diff", "--name-only", "--no-renames", f"{old_commit}..{new_commit}"],
+                check=False,
+            )
+        except GitClientError:
+            return None
+        if result.returncode != 0:
+            logger.debug("git diff %s..%s failed: %s", old_commit, new_commit, result.stderr.strip())
+            return None
+        return [line for line in result.stdout.splitlines() if line]
+
     def get_files(self, pattern: str = "**/*") -> list[Path]:
         """Get list of files matching a glob pattern.
 
@@ -3,9 +3,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Iterable, Mapping, Sequence
+import os
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any
 
 try:  # optional dependency
@@ -16,15 +18,49 @@ except Exception:  # pragma: no cover - adapter functions guard against missing
 from infrastructure_atlas.domain.integrations import NetboxDeviceRecord, NetboxVMRecord
 from infrastructure_atlas.domain.integrations.netbox import JSONValue
 from infrastructure_atlas.infrastructure.caching import CacheMetrics, TTLCache
+from infrastructure_atlas.infrastructure.host_identity import (
+    get_host_identity_index,
+    netbox_device_refs,
+    netbox_vm_refs,
+)
+
+from .netbox_snapshot import NetboxSnapshot, NetboxSnapshotStore
 
 logger = logging.getLogger(__name__)
 
+# Brief nested objects lack fields the records read through them; snapshot syncs
+# copy these from the full related objects (previously fetched lazily by pynetbox).
+# kind -> ((field, (app, endpoint), attributes), ...)
+_RELATED_FIELDS: dict[str, tuple[tuple[str, tuple[str, str], tuple[str, ...]], ...]] = {
+    "devices": (
+        ("site", ("dcim", "sites"), ("region", "group")),
+        ("tenant", ("tenancy", "tenants"), ("group",)),
+    ),
+    "vms": (
+        ("tenant", ("tenancy", "tenants"), ("group",)),
+        ("cluster", ("virtualization", "clusters"), ("site",)),
+    ),
+}
+_ID_BATCH = 100  # ids per ?id=... filter request
+
 
 @dataclass(slots=True)
 class NetboxClientConfig:
     url: str
     token: str
     cache_ttl_seconds: float = 300.0
+    # Persist inventories on disk and refresh them with last_updated deltas.
+    # ``None`` uses ``<NETBOX_DATA_DIR>/netbox_snapshot``.
+    snapshot_dir: Path | None = None
+    snapshot_enabled: bool = True
+
+
+def _default_snapshot_dir() -> Path:
+    from infrastructure_atlas.env import project_root
+
+    raw = os.getenv("NETBOX_DATA_DIR", "data")
+    base = Path(raw) if os.path.isabs(raw) else project_root() / raw
+    return base / "netbox_snapshot"
 
 
 class NetboxClient:
@@ -45,16 +81,20 @@ class NetboxClient:
             ttl_seconds=config.cache_ttl_seconds,
             name="netbox.vms",
         )
+        self._version: tuple[int, ...] | None = None
+        self._snapshots: NetboxSnapshotStore | None = None
+        if config.snapshot_enabled:
+            self._snapshots = NetboxSnapshotStore(config.snapshot_dir or _default_snapshot_dir(), config.url)
 
     def list_devices(self, *, force_refresh: bool = False) -> Sequence[NetboxDeviceRecord]:
         if force_refresh:
             self._device_cache.invalidate()
-        return self._device_cache.get("devices", self._fetch_devices)
+        return self._device_cache.get("devices", lambda: self._fetch_devices(force_refresh=force_refresh))
 
     def list_vms(self, *, force_refresh: bool = False) -> Sequence[NetboxVMRecord]:
         if force_refresh:
             self._vm_cache.invalidate()
-        return self._vm_cache.get("vms", self._fetch_vms)
+        return self._vm_cache.get("vms", lambda: self._fetch_vms(force_refresh=force_refresh))
 
     async def list_devices_async(self, *, force_refresh: bool = False) -> Sequence[NetboxDeviceRecord]:
         return await asyncio.to_thread(self.list_devices, force_refresh=force_refresh)
@@ -63,10 +103,10 @@ class NetboxClient:
         return await asyncio.to_thread(self.list_vms, force_refresh=force_refresh)
 
     def list_device_metadata(self) -> Mapping[str, str]:
-        return self._fetch_metadata(self._nb.dcim.devices)
+        return self._fetch_metadata(self._nb.dcim.devices) or {}
 
     def list_vm_metadata(self) -> Mapping[str, str]:
-        return self._fetch_metadata(self._nb.virtualization.virtual_machines)
+        return self._fetch_metadata(self._nb.virtualization.virtual_machines) or {}
 
     def get_device(self, device_id: str | int) -> NetboxDeviceRecord:
         raw = self._nb.dcim.devices.get(device_id)
@@ -116,43 +156,201 @@ class NetboxClient:
             "vms": self._vm_cache.snapshot_metrics(),
         }
 
-    def _fetch_devices(self) -> Sequence[NetboxDeviceRecord]:
-        records: Iterable[Any] = self._nb.dcim.devices.all()  # type: ignore[attr-defined]
-        return tuple(_build_device_record(it) for it in records)
-
-    def _fetch_vms(self) -> Sequence[NetboxVMRecord]:
-        records: Iterable[Any] = self._nb.virtualization.virtual_machines.all()  # type: ignore[attr-defined]
-        return tuple(_build_vm_record(it) for it in records)
-
-    def _fetch_metadata(self, endpoint) -> dict[str, str]:
-        metadata: dict[str, str] = {}
-        iterator: Iterable[Any] | None = None
+    def _fetch_devices(self, *, force_refresh: bool = False) -> Sequence[NetboxDeviceRecord]:
+        if self._snapshots is None:
+            records: Iterable[Any] = self._nb.dcim.devices.all()  # type: ignore[attr-defined]
+            devices = tuple(_build_device_record(it) for it in records)
+        else:
+            devices = self._sync_snapshot("devices", self._nb.dcim.devices, _build_device_record, force_refresh)
+        get_host_identity_index().update_partition("netbox:devices", netbox_device_refs(devices))
+        return devices
+
+    def _fetch_vms(self, *, force_refresh: bool = False) -> Sequence[NetboxVMRecord]:
+        if self._snapshots is None:
+            records: Iterable[Any] = self._nb.virtualization.virtual_machines.all()  # type: ignore[attr-defined]
+            vms = tuple(_build_vm_record(it) for it in records)
+        else:
+            vms = self._sync_snapshot(
+                "vms", self._nb.virtualization.virtual_machines, _build_vm_record, force_refresh
+            )
+        get_host_identity_index().update_partition("netbox:vms", netbox_vm_refs(vms))
+        return vms
+
+    def _sync_snapshot(
+        self,
+        kind: str,
+        endpoint,
+        build: Callable[[Any], Any],
+        force_refresh: bool = False,
+    ) -> tuple[Any, ...]:
+        """Load the on-disk snapshot and bring it up to date with a delta refresh.
+
+        A snapshot younger than the cache TTL is served without contacting NetBox
+        unless ``force_refresh`` is set.
+        Otherwise objects with ``last_updated`` at or after the snapshot watermark
+        are re-fetched and deletions are detected by diffing the current id set.
+        Records are rebuilt as pynetbox objects from the stored payloads.
+        """
+        if self._snapshots is None:
+            raise RuntimeError("NetBox snapshots are disabled for this client")
+        snapshot = self._snapshots.load(kind)
+        now = datetime.now(UTC)
+        if (
+            not force_refresh
+            and snapshot is not None
+            and snapshot.age_seconds(now) < self._config.cache_ttl_seconds
+        ):
+            return tuple(build(_snapshot_record(endpoint, raw)) for raw in snapshot.records.values())
+
+        if snapshot is None or not snapshot.watermark:
+            records = self._full_records(kind, endpoint)
+        else:
+            records = self._delta_records(kind, endpoint, snapshot)
+        self._attach_related(kind, records)
+
+        fresh = NetboxSnapshot(kind=kind, url=self._config.url, synced_at=now, records=records)
+        fresh.watermark = max((_normalize_last_updated(raw.get("last_updated")) for raw in records.values()), default="")
         try:
-            iterator = endpoint.values("id", "last_updated")
-        except Exception:
-            iterator = None
-        if iterator is None:
+            self._snapshots.save(fresh)
+        except Exception as exc:
+            logger.warning("Failed to persist NetBox %s snapshot: %s", kind, exc)
+        return tuple(build(_snapshot_record(endpoint, raw)) for raw in records.values())
+
+    def _full_records(self, kind: str, endpoint) -> dict[str, Mapping[str, Any]]:
+        records = {str(raw["id"]): raw for raw in (_raw_record(it) for it in endpoint.all())}
+        logger.info("NetBox %s snapshot rebuilt with %d objects", kind, len(records))
+        return records
+
+    def _delta_records(self, kind: str, endpoint, snapshot: NetboxSnapshot) -> dict[str, Mapping[str, Any]]:
+        records = dict(snapshot.records)
+        metadata = self._fetch_metadata(endpoint)
+        if metadata is None:
+            # No cheap id listing on this NetBox; a delta would cost as much as a full sync
+            return self._full_records(kind, endpoint)
+        current_ids = set(metadata)
+        if not current_ids and records:
+            # Can't tell "everything was deleted" from "id listing unsupported"; start over
+            logger.info("NetBox %s id listing returned nothing; rebuilding snapshot", kind)
+            return self._full_records(kind, endpoint)
+
+        changed = 0
+        for item in endpoint.filter(last_updated__gte=snapshot.watermark):
+            raw = _raw_record(item)
+            records[str(raw["id"])] = raw
+            changed += 1
+
+        deleted = records.keys() - current_ids
+        for identifier in deleted:
+            del records[identifier]
+
+        # Objects the watermark query can miss (e.g. restored with an older timestamp)
+        missing = sorted(current_ids - records.keys(), key=int)
+        for start in range(0, len(missing), _ID_BATCH):
+            for item in endpoint.filter(id=missing[start : start + _ID_BATCH]):
+                raw = _raw_record(item)
+                records[str(raw["id"])] = raw
+
+        logger.info(
+            "NetBox %s snapshot refreshed: %d changed, %d deleted, %d backfilled",
+            kind,
+            changed,
+            len(deleted),
+            len(missing),
+        )
+        return records
+
+    def _attach_related(self, kind: str, records: dict[str, Mapping[str, Any]]) -> None:
+        """Copy fields of related objects into the records' brief nested objects.
+
+        One ``?id=`` query per 100 related objects replaces a lazy pynetbox
+        fetch per record. On failure the nested objects stay brief and pynetbox
+        fetches the missing fields on access, as it did before snapshots.
+        """
+        for field_name, (app, name), attributes in _RELATED_FIELDS.get(kind, ()):
+            ids = sorted(
+                {
+                    nested["id"]
+                    for raw in records.values()
+                    if isinstance(nested := raw.get(field_name), Mapping) and nested.get("id") is not None
+                }
+            )
+            if not ids:
+                continue
+            endpoint = getattr(getattr(self._nb, app), name)
+            details: dict[Any, dict[str, Any]] = {}
             try:
-                iterator = endpoint.filter(limit=0, fields="id,last_updated")
-            except Exception:
-                iterator = None
-        if iterator is None:
-            return metadata
-        for item in iterator:
-            if isinstance(item, Mapping):
-                identifier = item.get("id")
-                last_updated = item.get("last_updated")
-            elif isinstance(item, tuple | list) and len(item) >= 2:
-                identifier, last_updated = item[0], item[1]
-            else:
-                identifier = getattr(item, "id", None)
-                last_updated = getattr(item, "last_updated", None)
+                for start in range(0, len(ids), _ID_BATCH):
+                    for item in endpoint.filter(id=ids[start : start + _ID_BATCH]):
+                        full = _raw_record(item)
+                        details[full.get("id")] = {attribute: full.get(attribute) for attribute in attributes}
+            except Exception as exc:
+                logger.warning("Failed to load NetBox %s.%s for %s snapshot: %s", app, name, kind, exc)
+                continue
+            for key, raw in records.items():
+                nested = raw.get(field_name)
+                if isinstance(nested, Mapping) and nested.get("id") in details:
+                    records[key] = {**raw, field_name: {**nested, **details[nested["id"]]}}
+
+    def _netbox_version(self) -> tuple[int, ...]:
+        """NetBox API version as a tuple, e.g. ``(4, 1)``; ``()`` when unknown."""
+        if self._version is None:
+            try:
+                self._version = tuple(int(part) for part in str(self._nb.version).split(".")[:2])
+            except Exception as exc:
+                logger.debug("Unable to determine NetBox version", exc_info=exc)
+                return ()
+        return self._version
+
+    def _fetch_metadata(self, endpoint) -> dict[str, str] | None:
+        """Map every object id to its ``last_updated`` without pulling full objects.
+
+        NetBox 4 honours ``fields=``; older versions ignore it and would return
+        full objects, so they get ``brief=1`` (ids only, no ``last_updated``).
+        Returns ``None`` when neither applies or the listing fails.
+        """
+        version = self._netbox_version()
+        if version >= (4, 0):
+            params: dict[str, Any] = {"fields": "id,last_updated"}
+        elif version >= (2, 10):
+            params = {"brief": 1}
+        else:
+            return None
+        metadata: dict[str, str] = {}
+        try:
+            items = list(endpoint.filter(**params))
+        except Exception as exc:
+            logger.warning("NetBox id listing failed: %s", exc)
+            return None
+        for item in items:
+            # Read the returned payload; attribute access on a brief pynetbox
+            # record would lazily fetch the full object
+            data = _raw_record(item)
+            identifier = data.get("id")
             if identifier is None:
                 continue
-            metadata[str(identifier)] = _normalize_last_updated(last_updated)
+            metadata[str(identifier)] = _normalize_last_updated(data.get("last_updated"))
         return metadata
 
 
+def _snapshot_record(endpoint, raw: Mapping[str, Any]) -> Any:
+    """Rebuild the pynetbox record a snapshot payload was taken from."""
+    try:
+        return endpoint.return_obj(dict(raw), endpoint.api, endpoint)
+    except Exception:  # pragma: no cover - best effort fallback
+        return raw
+
+
+def _raw_record(record: Any) -> Mapping[str, Any]:
+    """Full nested representation of a NetBox object, suitable for the snapshot."""
+    if isinstance(record, Mapping):
+        return dict(record)
+    try:
+        # pynetbox records iterate as (field, value) pairs with nested objects expanded
+        return dict(record)
+    except Exception:  # pragma: no cover - best effort fallback
+        return dict(_serialize(record))
+
+
 def _serialize(record: Any) -> Mapping[str, JSONValue]:
     data: Mapping[str, JSONValue]
     if hasattr(record, "serialize"):
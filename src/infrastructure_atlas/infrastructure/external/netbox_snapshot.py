@@ -0,0 +1,92 @@
+"""On-disk NetBox inventory snapshots used for warm starts and delta refreshes."""
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+
+@dataclass(slots=True)
+class NetboxSnapshot:
+    """Raw NetBox objects of one kind keyed by id, plus refresh bookkeeping."""
+
+    kind: str
+    url: str
+    synced_at: datetime
+    watermark: str = ""
+    records: dict[str, Mapping[str, Any]] = field(default_factory=dict)
+
+    def age_seconds(self, now: datetime | None = None) -> float:
+        return ((now or datetime.now(UTC)) - self.synced_at).total_seconds()
+
+
+class NetboxSnapshotStore:
+    """Persist snapshots as gzip-compressed JSON files, one per object kind.
+
+    Files are replaced atomically, so concurrent processes (API workers, bots,
+    MCP server, CLI) can share a directory; the last writer wins.
+    """
+
+    def __init__(self, directory: Path, url: str) -> None:
+        self._directory = directory
+        self._url = url.rstrip("/")
+
+    def path(self, kind: str) -> Path:
+        return self._directory / f"netbox_{kind}.json.gz"
+
+    def load(self, kind: str) -> NetboxSnapshot | None:
+        path = self.path(kind)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            logger.warning("Ignoring unreadable NetBox snapshot %s: %s", path, exc)
+            return None
+        if payload.get("version") != SNAPSHOT_VERSION or payload.get("url") != self._url:
+            return None
+        try:
+            synced_at = datetime.fromisoformat(payload["synced_at"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        return NetboxSnapshot(
+            kind=kind,
+            url=self._url,
+            synced_at=synced_at,
+            watermark=payload.get("watermark") or "",
+            records={str(item.get("id")): item for item in payload.get("records", []) if item.get("id") is not None},
+        )
+
+    def save(self, snapshot: NetboxSnapshot) -> None:
+        payload = {
+            "version": SNAPSHOT_VERSION,
+            "url": self._url,
+            "kind": snapshot.kind,
+            "synced_at": snapshot.synced_at.isoformat(),
+            "watermark": snapshot.watermark,
+            "records": list(snapshot.records.values()),
+        }
+        self._directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=f".netbox_{snapshot.kind}.", dir=self._directory)
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=5) as handle:
+                handle.write(json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8"))
+            os.replace(tmp_name, self.path(snapshot.kind))
+        except Exception:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+
+__all__ = ["NetboxSnapshot", "NetboxSnapshotStore"]
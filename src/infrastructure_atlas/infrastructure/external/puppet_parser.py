@@ -5,14 +5,24 @@ following the VoiceWorks/user management structure:
 - site/user/manifests/virtual_users/*.pp - User definitions
 - site/user/manifests/virtual_groups/*.pp - Group definitions with members
 - site/user/manifests/groups/*_full.pp - Sudo access definitions
+
+Each file is parsed on its own into a small JSON-serialisable result; the
+results are then combined into a :class:`PuppetInventory`. A
+:class:`PuppetFileCache` keeps those per-file results keyed by content hash,
+so a refresh only re-runs the regexes over files whose content changed, and
+with a list of changed paths (``git diff --name-only``) it does not even scan
+the repository.
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import re
-from dataclasses import dataclass, field
+from collections.abc import Iterable, Mapping
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +78,156 @@ class PuppetInventory:
     user_access: list[PuppetUserAccess] = field(default_factory=list)
     sudo_users: set[str] = field(default_factory=set)
     removed_users: set[str] = field(default_factory=set)
+    _access_index: PuppetAccessIndex | None = field(default=None, init=False, repr=False, compare=False)
+
+    def access_index(self) -> PuppetAccessIndex:
+        """Return the lookup index of this inventory, building it on first use.
+
+        Inventories are not modified after parsing or loading, so the index
+        stays valid for the lifetime of the object.
+        """
+        index = self._access_index
+        if index is None:
+            index = PuppetAccessIndex.build(self)
+            self._access_index = index
+        return index
+
+
+@dataclass(slots=True, frozen=True)
+class PuppetAccessIndex:
+    """Precomputed joins over a :class:`PuppetInventory` for the Puppet views.
+
+    Built once per inventory in O(users + groups + access entries), so the
+    user, group and access-matrix endpoints become dictionary lookups.
+    """
+
+    user_groups: dict[str, list[str]]  # username -> group names, in access order
+    user_access: dict[str, list[dict[str, Any]]]  # username -> access entries
+    group_sudo_member_count: dict[str, int]
+    group_member_details: dict[str, list[dict[str, Any]]]
+    matrix: dict[str, dict[str, Any]]  # username -> {"_user": {...}, group: {...}}
+    matrix_users: list[str]  # Users with any access, sorted case-insensitively
+    group_names: list[str]  # Sorted case-insensitively
+    usernames: list[str]  # Sorted case-insensitively
+    sudo_users: frozenset[str]
+    removed_users: frozenset[str]
+
+    @classmethod
+    def build(cls, inventory: PuppetInventory) -> PuppetAccessIndex:
+        sudo_users = frozenset(inventory.sudo_users)
+        user_groups: dict[str, list[str]] = {}
+        user_access: dict[str, list[dict[str, Any]]] = {}
+        matrix: dict[str, dict[str, Any]] = {}
+        for access in inventory.user_access:
+            user_groups.setdefault(access.username, []).append(access.group_name)
+            user_access.setdefault(access.username, []).append(
+                {"group_name": access.group_name, "has_sudo": access.has_sudo, "access_type": access.access_type}
+            )
+            row = matrix.get(access.username)
+            if row is None:
+                user = inventory.users.get(access.username)
+                row = matrix[access.username] = {
+                    "_user": {
+                        "enabled": user.enabled if user else False,
+                        "has_sudo_any": access.username in sudo_users,
+                        "key_name": user.key_name if user else None,
+                    }
+                }
+            row[access.group_name] = {"has_sudo": access.has_sudo, "access_type": access.access_type}
+
+        group_sudo_member_count: dict[str, int] = {}
+        group_member_details: dict[str, list[dict[str, Any]]] = {}
+        for group_name, group in inventory.groups.items():
+            group_sudo_member_count[group_name] = sum(1 for member in group.members if member in sudo_users)
+            details = []
+            for member in group.members:
+                user = inventory.users.get(member)
+                details.append(
+                    {
+                        "username": member,
+                        "has_sudo": member in sudo_users,
+                        "enabled": user.enabled if user else False,
+                        "key_name": user.key_name if user else None,
+                    }
+                )
+            group_member_details[group_name] = details
+
+        return cls(
+            user_groups=user_groups,
+            user_access=user_access,
+            group_sudo_member_count=group_sudo_member_count,
+            group_member_details=group_member_details,
+            matrix=matrix,
+            matrix_users=sorted(matrix, key=str.lower),
+            group_names=sorted(inventory.groups, key=str.lower),
+            usernames=sorted(inventory.users, key=str.lower),
+            sudo_users=sudo_users,
+            removed_users=frozenset(inventory.removed_users),
+        )
+
+
+# Bump when parsing rules change so cached per-file results are discarded
+PARSER_VERSION = 1
+
+_USERS_DIR = "site/user/manifests/virtual_users"
+_GROUPS_DIR = "site/user/manifests/virtual_groups"
+_SUDO_DIR = "site/user/manifests/groups"
+_SUDOERS_DIR = "site/user/files/groups"
+_VIRTUAL_PP = "site/user/manifests/virtual.pp"
+_REMOVE_PP = "site/user/manifests/remove.pp"
+
+# Parser for each (directory, file name suffix) and for the two single files;
+# shared by the directory scan and the changed-file filter
+_DIRECTORY_KINDS: dict[tuple[str, str], str] = {
+    (_USERS_DIR, ".pp"): "user",
+    (_GROUPS_DIR, ".pp"): "group",
+    (_SUDO_DIR, "_full.pp"): "sudo",
+    (_SUDOERS_DIR, "_full"): "sudoers",
+}
+_FILE_KINDS: dict[str, str] = {_VIRTUAL_PP: "virtual", _REMOVE_PP: "remove"}
+
+# Parsed secrets are not persisted, matching the inventory cache
+_SECRET_USER_FIELDS = ("password_hash", "ssh_key")
+
+
+def _file_kind(rel_path: str) -> str | None:
+    """Return which parser handles a repository-relative path, if any."""
+    if rel_path in _FILE_KINDS:
+        return _FILE_KINDS[rel_path]
+    directory, _, name = rel_path.rpartition("/")
+    for (kind_directory, suffix), kind in _DIRECTORY_KINDS.items():
+        if directory == kind_directory and name.endswith(suffix):
+            return kind
+    return None
+
+
+@dataclass(slots=True)
+class PuppetFileCache:
+    """Per-file parse results keyed by repository-relative path.
+
+    Each entry holds the SHA-256 of the file content and the parsed result,
+    so unchanged files are never parsed twice. ``commit_hash`` records the
+    commit the entries describe; with it the caller can ask git which files
+    changed since.
+    """
+
+    commit_hash: str | None = None
+    entries: dict[str, dict[str, Any]] = field(default_factory=dict)
+    parsed_files: int = 0  # Files (re)parsed by the last parse_inventory call
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"version": PARSER_VERSION, "commit_hash": self.commit_hash, "entries": self.entries}
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any] | None) -> PuppetFileCache:
+        """Rebuild a cache; payloads from another parser version yield an empty cache."""
+        if not isinstance(payload, Mapping) or payload.get("version") != PARSER_VERSION:
+            return cls()
+        entries = payload.get("entries")
+        return cls(
+            commit_hash=payload.get("commit_hash"),
+            entries=dict(entries) if isinstance(entries, Mapping) else {},
+        )
 
 
 class PuppetParser:
@@ -120,50 +280,178 @@ class PuppetParser:
         """
         self.repo_path = Path(repo_path)
 
-    def parse_inventory(self) -> PuppetInventory:
+    def parse_inventory(
+        self,
+        file_cache: PuppetFileCache | None = None,
+        *,
+        changed_paths: Iterable[str] | None = None,
+    ) -> PuppetInventory:
         """Parse the complete Puppet user management inventory.
 
+        Args:
+            file_cache: Per-file results of an earlier parse; updated in place.
+            changed_paths: Repository-relative paths changed since
+                ``file_cache`` was filled (e.g. from ``git diff --name-only``).
+                Only these files are read; every other cached entry is reused
+                without touching the filesystem. Without it, the manifest
+                directories are scanned and files whose content hash matches
+                a cached entry are not parsed again.
+
         Returns:
             PuppetInventory with all parsed data.
         """
-        inventory = PuppetInventory()
+        cache = file_cache if file_cache is not None else PuppetFileCache()
+        cache.parsed_files = 0
+
+        changed = set(changed_paths) if changed_paths is not None else None
+        if changed is None or not cache.entries:
+            changed = None
+            paths = self._scan_paths()
+            for stale in set(cache.entries) - paths:
+                del cache.entries[stale]
+        else:
+            paths = set(cache.entries) | {rel_path for rel_path in changed if _file_kind(rel_path) is not None}
+
+        results: dict[str, dict[str, Any]] = {}
+        for rel_path in sorted(paths):
+            if changed is None or rel_path in changed or rel_path not in cache.entries:
+                entry = self._load_entry(rel_path, cache)
+            else:
+                entry = cache.entries[rel_path]
+            if entry is None:
+                cache.entries.pop(rel_path, None)
+                continue
+            results[rel_path] = entry["result"]
+
+        return self._assemble(results)
+
+    def _scan_paths(self) -> set[str]:
+        """Find every file the parser reads, relative to the repository root."""
+        paths: set[str] = set()
+        for directory, suffix in _DIRECTORY_KINDS:
+            base = self.repo_path / directory
+            if not base.exists():
+                if directory in (_USERS_DIR, _GROUPS_DIR):
+                    logger.warning("Puppet manifest directory not found: %s", base)
+                continue
+            paths.update(f"{directory}/{path.name}" for path in base.glob(f"*{suffix}") if path.is_file())
+        for rel_path in _FILE_KINDS:
+            if (self.repo_path / rel_path).exists():
+                paths.add(rel_path)
+            elif rel_path == _VIRTUAL_PP:
+                logger.warning("virtual.pp not found: %s", self.repo_path / rel_path)
+        return paths
+
+    def _load_entry(self, rel_path: str, cache: PuppetFileCache) -> dict[str, Any] | None:
+        """Read a file and return its cache entry, parsing it only if its content changed."""
+        path = self.repo_path / rel_path
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as exc:
+            logger.warning("Failed to read Puppet file %s: %s", path, exc)
+            return None
 
-        # Parse user definitions
-        self._parse_virtual_users(inventory)
+        digest = hashlib.sha256(data).hexdigest()
+        entry = cache.entries.get(rel_path)
+        if entry is not None and entry.get("sha256") == digest:
+            return entry
 
-        # Parse group definitions
-        self._parse_virtual_groups(inventory)
+        kind = _file_kind(rel_path)
+        content = data.decode("utf-8", errors="replace")
+        try:
+            result = self._parse_file(kind, content, path.name)
+        except Exception as exc:
+            logger.warning("Failed to parse Puppet file %s: %s", path, exc)
+            result = {"kind": kind}
+        cache.parsed_files += 1
+        entry = {"sha256": digest, "result": result}
+        cache.entries[rel_path] = entry
+        return entry
+
+    def _parse_file(self, kind: str | None, content: str, filename: str) -> dict[str, Any]:
+        """Parse one file into a JSON-serialisable result (no cross-file logic)."""
+        result: dict[str, Any] = {"kind": kind}
+        if kind == "user":
+            user = self._parse_user_file(content, filename)
+            if user is not None:
+                data = asdict(user)
+                for secret in _SECRET_USER_FIELDS:
+                    data[secret] = None
+                result["user"] = data
+        elif kind == "group":
+            group = self._parse_group_file(content, filename)
+            if group is not None:
+                result["group"] = asdict(group)
+        elif kind == "virtual":
+            result["disabled"] = [match.group(1) for match in self._COMMENTED_CLASS_PATTERN.finditer(content)]
+            result["enabled"] = [match.group(1) for match in self._CLASS_DECLARATION_PATTERN.finditer(content)]
+        elif kind == "remove":
+            result["removed"] = [match.group(1) for match in self._REMOVE_USER_PATTERN.finditer(content)]
+        elif kind == "sudo":
+            result.update(self._parse_sudo_file(content))
+        elif kind == "sudoers":
+            # Parse sudoers format: username ALL=(ALL) ALL or %groupname ALL=(ALL) ALL
+            user_match = re.search(r"^(\w+)\s+ALL=", content, re.MULTILINE)
+            if user_match and not user_match.group(1).startswith("%"):
+                result["user"] = user_match.group(1)
+        return result
+
+    def _assemble(self, results: Mapping[str, Mapping[str, Any]]) -> PuppetInventory:
+        """Combine per-file results into an inventory."""
+        inventory = PuppetInventory()
+        by_kind: dict[str | None, list[Mapping[str, Any]]] = {}
+        for rel_path in sorted(results):
+            result = results[rel_path]
+            by_kind.setdefault(result.get("kind"), []).append(result)
+
+        for result in by_kind.get("user", []):
+            data = result.get("user")
+            if data:
+                user = PuppetUser(**data)
+                inventory.users[user.username] = user
+
+        for result in by_kind.get("group", []):
+            data = result.get("group")
+            if data:
+                group = PuppetGroup(
+                    **{**data, "members": list(data["members"]), "not_members": list(data["not_members"])}
+                )
+                inventory.groups[group.name] = group
 
         # Check which users are enabled in virtual.pp
-        self._parse_virtual_pp(inventory)
+        for result in by_kind.get("virtual", []):
+            for username in result.get("disabled", []):
+                if username in inventory.users:
+                    inventory.users[username].enabled = False
+            for username in result.get("enabled", []):
+                if username in inventory.users:
+                    inventory.users[username].enabled = True
 
-        # Parse remove.pp to find removed users
-        self._parse_remove_pp(inventory)
+        # Users marked for removal in remove.pp are disabled
+        for result in by_kind.get("remove", []):
+            for username in result.get("removed", []):
+                inventory.removed_users.add(username)
+                if username in inventory.users:
+                    inventory.users[username].enabled = False
 
-        # Parse sudo access from groups/*_full.pp
-        self._parse_sudo_access(inventory)
+        # Sudo access from groups/*_full.pp and the sudoers files
+        for result in by_kind.get("sudo", []):
+            if result.get("user"):
+                inventory.sudo_users.add(result["user"])
+            group_name = result.get("group")
+            if group_name and group_name in inventory.groups:
+                inventory.sudo_users.update(inventory.groups[group_name].members)
+        for result in by_kind.get("sudoers", []):
+            if result.get("user"):
+                inventory.sudo_users.add(result["user"])
 
         # Build user access relationships
         self._build_user_access(inventory)
 
         return inventory
 
-    def _parse_virtual_users(self, inventory: PuppetInventory) -> None:
-        """Parse user definitions from virtual_users/*.pp files."""
-        users_dir = self.repo_path / "site" / "user" / "manifests" / "virtual_users"
-        if not users_dir.exists():
-            logger.warning("Virtual users directory not found: %s", users_dir)
-            return
-
-        for pp_file in users_dir.glob("*.pp"):
-            try:
-                content = pp_file.read_text(encoding="utf-8", errors="replace")
-                user = self._parse_user_file(content, pp_file.name)
-                if user:
-                    inventory.users[user.username] = user
-            except Exception as exc:
-                logger.warning("Failed to parse user file %s: %s", pp_file, exc)
-
     def _parse_user_file(self, content: str, filename: str) -> PuppetUser | None:
         """Parse a single user definition file."""
         match = self._USER_BLOCK_PATTERN.search(content)
@@ -269,22 +557,6 @@ class PuppetParser:
 
         return None
 
-    def _parse_virtual_groups(self, inventory: PuppetInventory) -> None:
-        """Parse group definitions from virtual_groups/*.pp files."""
-        groups_dir = self.repo_path / "site" / "user" / "manifests" / "virtual_groups"
-        if not groups_dir.exists():
-            logger.warning("Virtual groups directory not found: %s", groups_dir)
-            return
-
-        for pp_file in groups_dir.glob("*.pp"):
-            try:
-                content = pp_file.read_text(encoding="utf-8", errors="replace")
-                group = self._parse_group_file(content, pp_file.name)
-                if group:
-                    inventory.groups[group.name] = group
-            except Exception as exc:
-                logger.warning("Failed to parse group file %s: %s", pp_file, exc)
-
     def _parse_group_file(self, content: str, filename: str) -> PuppetGroup | None:
         """Parse a single group definition file."""
         # Extract group name from @user::vwgroup block or from filename
@@ -321,100 +593,31 @@ class PuppetParser:
         values = re.findall(r"['\"]([^'\"]+)['\"]", array_str)
         return [v.strip() for v in values if v.strip()]
 
-    def _parse_virtual_pp(self, inventory: PuppetInventory) -> None:
-        """Parse virtual.pp to determine which users are enabled."""
-        virtual_pp = self.repo_path / "site" / "user" / "manifests" / "virtual.pp"
-        if not virtual_pp.exists():
-            logger.warning("virtual.pp not found: %s", virtual_pp)
-            return
-
-        try:
-            content = virtual_pp.read_text(encoding="utf-8", errors="replace")
-
-            # Find commented out users
-            for match in self._COMMENTED_CLASS_PATTERN.finditer(content):
-                username = match.group(1)
-                if username in inventory.users:
-                    inventory.users[username].enabled = False
-
-            # Find enabled users
-            for match in self._CLASS_DECLARATION_PATTERN.finditer(content):
-                username = match.group(1)
-                if username in inventory.users:
-                    inventory.users[username].enabled = True
-
-        except Exception as exc:
-            logger.warning("Failed to parse virtual.pp: %s", exc)
-
-    def _parse_remove_pp(self, inventory: PuppetInventory) -> None:
-        """Parse remove.pp to find users marked for removal."""
-        remove_pp = self.repo_path / "site" / "user" / "manifests" / "remove.pp"
-        if not remove_pp.exists():
-            return
-
-        try:
-            content = remove_pp.read_text(encoding="utf-8", errors="replace")
-            for match in self._REMOVE_USER_PATTERN.finditer(content):
-                username = match.group(1)
-                inventory.removed_users.add(username)
-                # Mark as disabled if exists
-                if username in inventory.users:
-                    inventory.users[username].enabled = False
-        except Exception as exc:
-            logger.warning("Failed to parse remove.pp: %s", exc)
-
-    def _parse_sudo_access(self, inventory: PuppetInventory) -> None:
-        """Parse groups/*_full.pp files to determine sudo access."""
-        groups_dir = self.repo_path / "site" / "user" / "manifests" / "groups"
-        if not groups_dir.exists():
-            return
-
-        # Parse *_full.pp files for sudo access
-        for pp_file in groups_dir.glob("*_full.pp"):
-            try:
-                content = pp_file.read_text(encoding="utf-8", errors="replace")
-                # Check if this grants sudo access (has sudoers file reference)
-                if "/etc/sudoers.d/" in content:
-                    # Extract users who get this access
-                    # Can be individual user files (username_full.pp) or group-based
-
-                    # Check if it's for a specific user
-                    user_realize = re.search(
-                        r"User::Vwuser\[\s*['\"]([^'\"]+)['\"]\s*\]",
-                        content,
-                        re.IGNORECASE,
-                    )
-                    if user_realize:
-                        username = user_realize.group(1)
-                        inventory.sudo_users.add(username)
-
-                    # Check if it references a group's members
-                    group_members_ref = re.search(
-                        r"\$user::virtual_groups::([^:]+)::members",
-                        content,
-                        re.IGNORECASE,
-                    )
-                    if group_members_ref:
-                        group_name = group_members_ref.group(1)
-                        if group_name in inventory.groups:
-                            for member in inventory.groups[group_name].members:
-                                inventory.sudo_users.add(member)
-
-            except Exception as exc:
-                logger.warning("Failed to parse sudo file %s: %s", pp_file, exc)
-
-        # Also check sudoers files directly
-        sudoers_dir = self.repo_path / "site" / "user" / "files" / "groups"
-        if sudoers_dir.exists():
-            for sudoers_file in sudoers_dir.glob("*_full"):
-                try:
-                    content = sudoers_file.read_text(encoding="utf-8", errors="replace")
-                    # Parse sudoers format: username ALL=(ALL) ALL or %groupname ALL=(ALL) ALL
-                    user_match = re.search(r"^(\w+)\s+ALL=", content, re.MULTILINE)
-                    if user_match and not user_match.group(1).startswith("%"):
-                        inventory.sudo_users.add(user_match.group(1))
-                except Exception as exc:
-                    logger.warning("Failed to parse sudoers file %s: %s", sudoers_file, exc)
+    def _parse_sudo_file(self, content: str) -> dict[str, Any]:
+        """Parse a groups/*_full.pp file for the user or group it grants sudo to."""
+        result: dict[str, Any] = {}
+        # Only files that install a sudoers file grant sudo access
+        if "/etc/sudoers.d/" not in content:
+            return result
+
+        # Individual user files (username_full.pp) realize the user
+        user_realize = re.search(
+            r"User::Vwuser\[\s*['\"]([^'\"]+)['\"]\s*\]",
+            content,
+            re.IGNORECASE,
+        )
+        if user_realize:
+            result["user"] = user_realize.group(1)
+
+        # Group-based files reference a group's members
+        group_members_ref = re.search(
+            r"\$user::virtual_groups::([^:]+)::members",
+            content,
+            re.IGNORECASE,
+        )
+        if group_members_ref:
+            result["group"] = group_members_ref.group(1)
+        return result
 
     def _build_user_access(self, inventory: PuppetInventory) -> None:
         """Build user access relationships from groups."""
@@ -437,6 +640,9 @@ class PuppetParser:
 
 
 __all__ = [
+    "PARSER_VERSION",
+    "PuppetAccessIndex",
+    "PuppetFileCache",
     "PuppetGroup",
     "PuppetInventory",
     "PuppetParser",
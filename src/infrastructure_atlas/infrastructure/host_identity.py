@@ -0,0 +1,470 @@
+"""Cross-source host identity index.
+
+Maps normalised identifiers (hostnames and their short names, IP addresses, MAC
+addresses, serial numbers and UUIDs) to the records that describe a host in
+NetBox, vCenter, Foreman, Commvault and Zabbix, so "which records describe
+server X" is a handful of dictionary lookups instead of a scan per source.
+
+The index is split into partitions, one per source instance (``netbox:devices``,
+``vcenter:<config id>``, ...). Each partition is rebuilt on its own whenever the
+cache that feeds it refreshes; passing a ``version`` (typically the cache's
+``generated_at``) makes repeated updates from unchanged caches free. Partitions
+without a push hook can be loaded via :meth:`HostIdentityIndex.ensure_partition`,
+or off the request path via :meth:`HostIdentityIndex.refresh_in_background`.
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import re
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from infrastructure_atlas.infrastructure.logging import get_logger
+from infrastructure_atlas.infrastructure.metrics import increment_counter
+
+logger = get_logger(__name__)
+
+_MAC_SEPARATORS = re.compile(r"[\s:.\-]")
+_HEX = re.compile(r"^[0-9a-f]+$")
+
+# Identifier kinds used as the first element of index keys
+NAME = "name"
+IP = "ip"
+MAC = "mac"
+SERIAL = "serial"
+
+
+@dataclass(frozen=True, slots=True)
+class HostRecordRef:
+    """A single source record known under one or more host identifiers.
+
+    ``record`` holds the source object itself (a NetBox record, ``VCenterVM``,
+    Foreman host dict, ...) so callers can render it without another lookup.
+    """
+
+    source: str
+    kind: str
+    record_id: str
+    name: str
+    scope: str | None = None
+    scope_name: str | None = None
+    names: tuple[str, ...] = ()
+    ips: tuple[str, ...] = ()
+    macs: tuple[str, ...] = ()
+    serials: tuple[str, ...] = ()
+    record: Any = field(default=None, compare=False, hash=False, repr=False)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "source": self.source,
+            "kind": self.kind,
+            "id": self.record_id,
+            "name": self.name,
+            "scope": self.scope,
+            "scope_name": self.scope_name,
+            "ips": list(self.ips),
+            "macs": list(self.macs),
+        }
+
+
+def normalize_hostname(value: Any) -> tuple[str, ...]:
+    """Return the lower-cased hostname and, for FQDNs, its short name."""
+    if value is None:
+        return ()
+    text = str(value).strip().lower().rstrip(".")
+    if not text:
+        return ()
+    if normalize_ip(text):
+        return ()
+    short = text.split(".", 1)[0]
+    return (text, short) if short and short != text else (text,)
+
+
+def normalize_ip(value: Any) -> str | None:
+    """Return the canonical address for ``value`` (prefix lengths are dropped)."""
+    if value is None:
+        return None
+    text = str(value).strip()
+    if not text:
+        return None
+    try:
+        return ipaddress.ip_interface(text).ip.compressed
+    except ValueError:
+        return None
+
+
+def normalize_mac(value: Any) -> str | None:
+    """Return ``aa:bb:cc:dd:ee:ff`` for any common MAC notation."""
+    if value is None:
+        return None
+    text = _MAC_SEPARATORS.sub("", str(value).strip().lower())
+    if len(text) != 12 or not _HEX.match(text):
+        return None
+    return ":".join(text[i : i + 2] for i in range(0, 12, 2))
+
+
+def normalize_serial(value: Any) -> str | None:
+    """Return a comparable serial number or UUID."""
+    if value is None:
+        return None
+    text = str(value).strip().lower()
+    if not text:
+        return None
+    try:
+        return str(uuid.UUID(text))
+    except ValueError:
+        return text
+
+
+def identity_keys(ref: HostRecordRef) -> set[tuple[str, str]]:
+    """All index keys under which ``ref`` can be found."""
+    keys: set[tuple[str, str]] = set()
+    for raw in (ref.name, *ref.names):
+        keys.update((NAME, name) for name in normalize_hostname(raw))
+    for raw in ref.ips:
+        if address := normalize_ip(raw):
+            keys.add((IP, address))
+    for raw in ref.macs:
+        if mac := normalize_mac(raw):
+            keys.add((MAC, mac))
+    for raw in ref.serials:
+        if serial := normalize_serial(raw):
+            keys.add((SERIAL, serial))
+    return keys
+
+
+def query_keys(query: str) -> list[tuple[str, str]]:
+    """Index keys a free-form query (hostname, IP, MAC, serial or UUID) can hit.
+
+    An FQDN only matches that FQDN; a short name matches records indexed under
+    the same short name.
+    """
+    text = (query or "").strip()
+    if not text:
+        return []
+    if address := normalize_ip(text):
+        return [(IP, address)]
+    if mac := normalize_mac(text):
+        return [(MAC, mac)]
+    keys = [(NAME, name) for name in normalize_hostname(text)[:1]]
+    if serial := normalize_serial(text):
+        keys.append((SERIAL, serial))
+    return keys
+
+
+@dataclass(slots=True)
+class _Partition:
+    version: Any
+    loaded_at: float
+    keys: dict[tuple[str, str], tuple[HostRecordRef, ...]]
+    size: int
+
+
+class HostIdentityIndex:
+    """Thread-safe identifier → record index partitioned by source."""
+
+    def __init__(self) -> None:
+        self._partitions: dict[str, _Partition] = {}
+        self._lock = threading.Lock()
+        self._load_locks: dict[str, threading.Lock] = {}
+        self._background: set[str] = set()
+
+    def update_partition(
+        self,
+        partition: str,
+        refs: Iterable[HostRecordRef] | Callable[[], Iterable[HostRecordRef]],
+        *,
+        version: Any = None,
+    ) -> bool:
+        """Replace the records of ``partition``.
+
+        Args:
+            partition: Partition name, e.g. ``vcenter:<config id>``
+            refs: Records, or a callable producing them (only called when the
+                partition actually needs rebuilding)
+            version: Opaque version of the source data; an update carrying the
+                version already indexed only marks the partition as fresh
+
+        Returns:
+            True when the partition was rebuilt
+        """
+        if version is not None:
+            with self._lock:
+                current = self._partitions.get(partition)
+                if current is not None and current.version == version:
+                    current.loaded_at = time.monotonic()
+                    return False
+        records = refs() if callable(refs) else refs
+        keys: dict[tuple[str, str], list[HostRecordRef]] = {}
+        size = 0
+        for ref in records:
+            size += 1
+            for key in identity_keys(ref):
+                keys.setdefault(key, []).append(ref)
+        built = _Partition(
+            version=version,
+            loaded_at=time.monotonic(),
+            keys={key: tuple(values) for key, values in keys.items()},
+            size=size,
+        )
+        with self._lock:
+            self._partitions[partition] = built
+        logger.debug(f"Host identity partition {partition} indexed {size} record(s) under {len(keys)} key(s)")
+        return True
+
+    def ensure_partition(
+        self,
+        partition: str,
+        loader: Callable[[], Iterable[HostRecordRef]],
+        *,
+        max_age_seconds: float,
+    ) -> None:
+        """Load ``partition`` via ``loader`` when missing or older than ``max_age_seconds``.
+
+        Loader failures are logged and leave the previous partition in place.
+        """
+        if not self.is_stale(partition, max_age_seconds):
+            return
+        with self._lock:
+            load_lock = self._load_locks.setdefault(partition, threading.Lock())
+        with load_lock:
+            if not self.is_stale(partition, max_age_seconds):
+                return
+            try:
+                self.update_partition(partition, list(loader()))
+            except Exception as exc:
+                logger.warning(f"Failed to load host identity partition {partition}: {exc}")
+
+    def refresh_in_background(
+        self,
+        partition: str,
+        loader: Callable[[], Iterable[HostRecordRef]],
+        *,
+        max_age_seconds: float,
+    ) -> bool:
+        """Like :meth:`ensure_partition`, but load in a daemon thread and return at once.
+
+        Lookups keep using the current (possibly stale or missing) partition
+        until the load finishes.
+
+        Returns:
+            True when a load was started
+        """
+        if not self.is_stale(partition, max_age_seconds):
+            return False
+        with self._lock:
+            if partition in self._background:
+                return False
+            self._background.add(partition)
+
+        def _run() -> None:
+            try:
+                self.ensure_partition(partition, loader, max_age_seconds=max_age_seconds)
+            finally:
+                with self._lock:
+                    self._background.discard(partition)
+
+        threading.Thread(target=_run, name=f"host-identity-{partition}", daemon=True).start()
+        return True
+
+    def drop_partition(self, partition: str) -> None:
+        with self._lock:
+            self._partitions.pop(partition, None)
+
+    def has_partition(self, partition: str) -> bool:
+        with self._lock:
+            return partition in self._partitions
+
+    def is_stale(self, partition: str, max_age_seconds: float) -> bool:
+        """True when ``partition`` is missing or was last confirmed over ``max_age_seconds`` ago."""
+        with self._lock:
+            current = self._partitions.get(partition)
+        return current is None or time.monotonic() - current.loaded_at >= max_age_seconds
+
+    def lookup(
+        self,
+        query: str,
+        *,
+        source: str | None = None,
+        kind: str | None = None,
+        scope: str | None = None,
+    ) -> list[HostRecordRef]:
+        """Return every record known under ``query``, optionally filtered.
+
+        Results are de-duplicated across identifier kinds.
+        """
+        keys = query_keys(query)
+        if not keys:
+            return []
+        with self._lock:
+            partitions = list(self._partitions.values())
+        seen: set[HostRecordRef] = set()
+        results: list[HostRecordRef] = []
+        for key in keys:
+            for part in partitions:
+                for ref in part.keys.get(key, ()):
+                    if ref in seen:
+                        continue
+                    if source is not None and ref.source != source:
+                        continue
+                    if kind is not None and ref.kind != kind:
+                        continue
+                    if scope is not None and ref.scope != scope:
+                        continue
+                    seen.add(ref)
+                    results.append(ref)
+        increment_counter("host_identity_lookups_total", labels={"result": "hit" if results else "miss"})
+        return results
+
+    def stats(self) -> dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                name: {"records": part.size, "keys": len(part.keys), "age_seconds": round(now - part.loaded_at, 1)}
+                for name, part in self._partitions.items()
+            }
+
+
+@lru_cache(maxsize=1)
+def get_host_identity_index() -> HostIdentityIndex:
+    """Return the process-wide host identity index."""
+    return HostIdentityIndex()
+
+
+# ---------------------------------------------------------------------------
+# Source adapters
+# ---------------------------------------------------------------------------
+
+
+def _strings(*values: Any) -> tuple[str, ...]:
+    return tuple(str(value) for value in values if value not in (None, ""))
+
+
+def netbox_device_refs(devices: Iterable[Any]) -> list[HostRecordRef]:
+    return [
+        HostRecordRef(
+            source="netbox",
+            kind="device",
+            record_id=str(device.id),
+            name=device.name or "",
+            ips=_strings(device.primary_ip, device.primary_ip4, device.primary_ip6, device.oob_ip),
+            serials=_strings(device.serial, device.asset_tag),
+            record=device,
+        )
+        for device in devices
+    ]
+
+
+def netbox_vm_refs(vms: Iterable[Any]) -> list[HostRecordRef]:
+    return [
+        HostRecordRef(
+            source="netbox",
+            kind="vm",
+            record_id=str(vm.id),
+            name=vm.name or "",
+            ips=_strings(vm.primary_ip, vm.primary_ip4, vm.primary_ip6),
+            record=vm,
+        )
+        for vm in vms
+    ]
+
+
+def vcenter_vm_refs(config_id: str, config_name: str | None, vms: Iterable[Any]) -> list[HostRecordRef]:
+    return [
+        HostRecordRef(
+            source="vcenter",
+            kind="vm",
+            record_id=str(vm.vm_id),
+            name=vm.name or "",
+            scope=config_id,
+            scope_name=config_name,
+            names=_strings(vm.guest_host_name),
+            ips=_strings(vm.guest_ip_address, *(vm.ip_addresses or ())),
+            macs=_strings(*(vm.mac_addresses or ())),
+            serials=_strings(vm.instance_uuid, vm.bios_uuid),
+            record=vm,
+        )
+        for vm in vms
+    ]
+
+
+def foreman_host_refs(config_id: str, config_name: str | None, hosts: Iterable[Mapping[str, Any]]) -> list[HostRecordRef]:
+    return [
+        HostRecordRef(
+            source="foreman",
+            kind="host",
+            record_id=str(host.get("id") or host.get("name") or ""),
+            name=str(host.get("name") or ""),
+            scope=config_id,
+            scope_name=config_name,
+            names=_strings(host.get("certname")),
+            ips=_strings(host.get("ip"), host.get("ip6")),
+            macs=_strings(host.get("mac")),
+            serials=_strings(host.get("uuid")),
+            record=host,
+        )
+        for host in hosts
+        if isinstance(host, Mapping)
+    ]
+
+
+def commvault_client_refs(clients: Iterable[Mapping[str, Any]]) -> list[HostRecordRef]:
+    return [
+        HostRecordRef(
+            source="commvault",
+            kind="client",
+            record_id=str(client.get("client_id") if client.get("client_id") is not None else client.get("name")),
+            name=str(client.get("display_name") or client.get("name") or ""),
+            names=_strings(client.get("name"), *(client.get("name_variants") or ())),
+            record=client,
+        )
+        for client in clients
+    ]
+
+
+def zabbix_host_refs(hosts: Iterable[Mapping[str, Any]]) -> list[HostRecordRef]:
+    refs: list[HostRecordRef] = []
+    for host in hosts:
+        if not isinstance(host, Mapping):
+            continue
+        interfaces = [item for item in host.get("interfaces") or () if isinstance(item, Mapping)]
+        inventory = host.get("inventory") if isinstance(host.get("inventory"), Mapping) else {}
+        refs.append(
+            HostRecordRef(
+                source="zabbix",
+                kind="host",
+                record_id=str(host.get("hostid") or ""),
+                name=str(host.get("name") or host.get("host") or ""),
+                names=_strings(host.get("host"), *(item.get("dns") for item in interfaces)),
+                ips=_strings(*(item.get("ip") for item in interfaces)),
+                macs=_strings(inventory.get("macaddress_a"), inventory.get("macaddress_b")),
+                serials=_strings(inventory.get("serialno_a"), inventory.get("serialno_b")),
+                record=host,
+            )
+        )
+    return refs
+
+
+__all__ = [
+    "HostIdentityIndex",
+    "HostRecordRef",
+    "commvault_client_refs",
+    "foreman_host_refs",
+    "get_host_identity_index",
+    "identity_keys",
+    "netbox_device_refs",
+    "netbox_vm_refs",
+    "normalize_hostname",
+    "normalize_ip",
+    "normalize_mac",
+    "normalize_serial",
+    "query_keys",
+    "vcenter_vm_refs",
+    "zabbix_host_refs",
+]
@@ -24,6 +24,17 @@ class CounterMetric:
             self.values[key] = self.values.get(key, 0.0) + amount
 
 
+@dataclass
+class GaugeMetric:
+    values: dict[_LabelKey, float]
+    lock: threading.Lock
+
+    def set(self, *, labels: dict[str, str], value: float) -> None:
+        key = _freeze_labels(**labels)
+        with self.lock:
+            self.values[key] = value
+
+
 @dataclass
 class HistogramMetric:
     observations: dict[_LabelKey, list[float]]
@@ -48,6 +59,7 @@ class HistogramMetric:
 class MetricsRegistry:
     def __init__(self) -> None:
         self.counters: dict[str, CounterMetric] = {}
+        self.gauges: dict[str, GaugeMetric] = {}
         self.histograms: dict[str, HistogramMetric] = {}
         self._lock = threading.Lock()
 
@@ -59,6 +71,14 @@ class MetricsRegistry:
                 self.counters[name] = metric
             return metric
 
+    def gauge(self, name: str) -> GaugeMetric:
+        with self._lock:
+            metric = self.gauges.get(name)
+            if metric is None:
+                metric = GaugeMetric(values={}, lock=threading.Lock())
+                self.gauges[name] = metric
+            return metric
+
     def histogram(self, name: str) -> HistogramMetric:
         with self._lock:
             metric = self.histograms.get(name)
@@ -76,6 +96,13 @@ class MetricsRegistry:
                 ]
                 for name, metric in self.counters.items()
             }
+            gauges = {
+                name: [
+                    {"labels": dict(labels), "value": value}
+                    for labels, value in metric.values.items()
+                ]
+                for name, metric in self.gauges.items()
+            }
             histograms = {
                 name: [
                     {"labels": dict(labels), "values": list(values)}
@@ -83,7 +110,7 @@ class MetricsRegistry:
                 ]
                 for name, metric in self.histograms.items()
             }
-        return {"counters": counters, "histograms": histograms}
+        return {"counters": counters, "gauges": gauges, "histograms": histograms}
 
 
 _REGISTRY_STATE: dict[str, MetricsRegistry] = {"instance": MetricsRegistry()}
@@ -102,6 +129,14 @@ def record_http_request(duration_seconds: float, *, method: str, path_template:
     )
 
 
+def increment_counter(name: str, *, labels: dict[str, str] | None = None, amount: float = 1.0) -> None:
+    _registry().counter(name).inc(labels=labels or {}, amount=amount)
+
+
+def set_gauge(name: str, value: float, *, labels: dict[str, str] | None = None) -> None:
+    _registry().gauge(name).set(labels=labels or {}, value=value)
+
+
 def get_metrics_snapshot() -> dict[str, Any]:
     return _registry().snapshot()
 
@@ -134,6 +169,14 @@ def snapshot_to_prometheus(snapshot: dict[str, Any] | None = None) -> str:
             value = sample.get("value", 0.0)
             lines.append(f"{name}{labels} {value}")
 
+    gauges = data.get("gauges", {})
+    for name, samples in gauges.items():
+        lines.append(f"# TYPE {name} gauge")
+        for sample in samples:
+            labels = _format_labels(sample.get("labels", {}))
+            value = sample.get("value", 0.0)
+            lines.append(f"{name}{labels} {value}")
+
     histograms = data.get("histograms", {})
     for name, samples in histograms.items():
         lines.append(f"# TYPE {name} summary")
@@ -154,7 +197,9 @@ def snapshot_to_prometheus(snapshot: dict[str, Any] | None = None) -> str:
 __all__ = [
     "MetricsRegistry",
     "get_metrics_snapshot",
+    "increment_counter",
     "record_http_request",
     "reset_metrics",
+    "set_gauge",
     "snapshot_to_prometheus",
 ]
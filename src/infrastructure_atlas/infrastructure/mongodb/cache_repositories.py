@@ -6,21 +6,27 @@ the IO contention issues with concurrent agent/MCP access.
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
+import hashlib
+from collections.abc import Iterable, Mapping, Sequence
 from datetime import UTC, datetime
 from typing import Any
 
+import bson
 from pymongo.collection import Collection
 from pymongo.database import Database
 from pymongo.operations import ReplaceOne
 
-from infrastructure_atlas.domain.integrations.vcenter import VCenterVM
+from infrastructure_atlas.domain.integrations.vcenter import VCenterVM, VCenterVMSearch
 from infrastructure_atlas.infrastructure.logging import get_logger
 
 from . import mappers
 
 logger = get_logger(__name__)
 
+# Case-insensitive equality on name/guest_host_name; must match the collation of
+# the ``idx_name_ci`` and ``idx_guest_host_name_ci`` indexes to use them.
+CASE_INSENSITIVE_COLLATION = {"locale": "en", "strength": 2}
+
 
 def _now_utc() -> datetime:
     """Get current UTC datetime."""
@@ -32,10 +38,15 @@ class MongoDBVCenterCacheRepository:
 
     Key benefit: Document-level updates instead of full JSON file rewrites.
     Each VM is stored as a separate document, allowing concurrent updates.
+
+    A summary document per configuration in ``vcenter_cache_meta`` (VM count,
+    refresh time, BSON size and checksum) is kept up to date by every write so
+    status listings never have to touch the VM documents.
     """
 
     def __init__(self, db: Database) -> None:
         self._collection: Collection = db["vcenter_vms"]
+        self._meta: Collection = db["vcenter_cache_meta"]
 
     def get_vm(self, config_id: str, vm_id: str) -> VCenterVM | None:
         """Get a single VM by config and VM ID."""
@@ -59,6 +70,7 @@ class MongoDBVCenterCacheRepository:
             doc,
             upsert=True,
         )
+        self._write_partial_metadata(config_id)
 
     def upsert_vms(self, config_id: str, vms: Iterable[VCenterVM]) -> int:
         """Insert or update multiple VMs (bulk operation).
@@ -85,11 +97,14 @@ class MongoDBVCenterCacheRepository:
             return 0
 
         result = self._collection.bulk_write(operations, ordered=False)
+        self._write_partial_metadata(config_id)
         return result.upserted_count + result.modified_count
 
     def delete_vm(self, config_id: str, vm_id: str) -> bool:
         """Delete a single VM."""
         result = self._collection.delete_one({"config_id": config_id, "vm_id": vm_id})
+        if result.deleted_count:
+            self._write_partial_metadata(config_id)
         return result.deleted_count > 0
 
     def delete_vms_for_config(self, config_id: str) -> int:
@@ -99,6 +114,7 @@ class MongoDBVCenterCacheRepository:
             The number of VMs deleted.
         """
         result = self._collection.delete_many({"config_id": config_id})
+        self._meta.delete_one({"_id": config_id})
         return result.deleted_count
 
     def replace_all_vms(self, config_id: str, vms: Iterable[VCenterVM]) -> dict[str, int]:
@@ -123,9 +139,41 @@ class MongoDBVCenterCacheRepository:
 
         documents = [mappers.vcenter_vm_to_document(vm, config_id) for vm in vm_list]
         self._collection.insert_many(documents, ordered=False)
+        self._write_full_metadata(config_id, documents)
 
         return {"deleted": deleted, "inserted": len(documents)}
 
+    def _write_partial_metadata(self, config_id: str) -> None:
+        # Size and checksum describe the last full refresh; after a partial
+        # update only the count and refresh time are known.
+        self._meta.update_one(
+            {"_id": config_id},
+            {
+                "$set": {"vm_count": self.get_vm_count(config_id), "generated_at": _now_utc()},
+                "$unset": {"size_bytes": "", "sha256": ""},
+            },
+            upsert=True,
+        )
+
+    def _write_full_metadata(self, config_id: str, documents: Sequence[Mapping[str, Any]]) -> None:
+        digest = hashlib.sha256()
+        size_bytes = 0
+        for doc in sorted(documents, key=lambda item: item["_id"]):
+            encoded = bson.encode(doc)
+            digest.update(encoded)
+            size_bytes += len(encoded)
+        self._meta.replace_one(
+            {"_id": config_id},
+            {
+                "_id": config_id,
+                "vm_count": len(documents),
+                "generated_at": _now_utc(),
+                "size_bytes": size_bytes,
+                "sha256": digest.hexdigest(),
+            },
+            upsert=True,
+        )
+
     def search_vms(
         self,
         config_id: str | None = None,
@@ -146,24 +194,72 @@ class MongoDBVCenterCacheRepository:
         Returns:
             List of matching VMs.
         """
+        search = VCenterVMSearch(
+            config_ids=(config_id,) if config_id else None,
+            name_pattern=name_pattern,
+            ip_address=ip_address,
+            power_state=power_state,
+        )
+        return [vm for _, vm in self.search_vms_with_config(search, limit=limit)]
+
+    def search_vms_with_config(
+        self,
+        search: VCenterVMSearch,
+        *,
+        limit: int = 100,
+        fields: Sequence[str] | None = None,
+    ) -> list[tuple[str, VCenterVM]]:
+        """Search VMs with one indexed query, returning ``(config_id, vm)`` pairs.
+
+        Args:
+            search: Filters to apply; IP and MAC addresses match any NIC.
+            limit: Maximum results to return.
+            fields: Only load these document fields; the remaining VM attributes
+                keep their empty defaults.
+        """
         query: dict[str, Any] = {}
-        if config_id:
-            query["config_id"] = config_id
-        if name_pattern:
-            query["name"] = {"$regex": name_pattern, "$options": "i"}
-        if ip_address:
-            query["ip_addresses"] = ip_address
-        if power_state:
-            query["power_state"] = power_state.upper()
-
-        cursor = self._collection.find(query).limit(limit).sort("name", 1)
-        return [mappers.document_to_vcenter_vm(doc) for doc in cursor]
+        if search.config_ids is not None:
+            query["config_id"] = {"$in": list(search.config_ids)}
+        if search.name_pattern:
+            query["name"] = {"$regex": search.name_pattern, "$options": "i"}
+        elif search.name:
+            query["name"] = search.name
+        if search.ip_address:
+            query["ip_addresses"] = search.ip_address
+        if search.mac_address:
+            query["mac_addresses"] = search.mac_address.strip().lower()
+        if search.instance_uuid:
+            query["instance_uuid"] = search.instance_uuid
+        if search.guest_host_name:
+            query["guest_host_name"] = search.guest_host_name
+        if search.power_state:
+            query["power_state"] = search.power_state.upper()
+
+        projection = None
+        if fields is not None:
+            projection = dict.fromkeys(("config_id", "vm_id", "name", *fields), 1)
+        cursor = self._collection.find(query, projection)
+        if search.name or search.guest_host_name:
+            cursor = cursor.collation(CASE_INSENSITIVE_COLLATION)
+        cursor = cursor.sort("name", 1).limit(limit)
+        return [(str(doc.get("config_id") or ""), mappers.document_to_vcenter_vm(doc)) for doc in cursor]
 
     def get_cache_metadata(self, config_id: str) -> dict[str, Any] | None:
         """Get cache metadata for a configuration.
 
         Returns metadata about the cached VMs including count and last update time.
+        Reads the summary document written with the cache; caches written before
+        summaries existed are aggregated from the VM documents instead.
         """
+        summary = self._meta.find_one({"_id": config_id})
+        if summary:
+            return {
+                "config_id": config_id,
+                "vm_count": summary.get("vm_count", 0),
+                "generated_at": summary.get("generated_at"),
+                "size_bytes": summary.get("size_bytes"),
+                "sha256": summary.get("sha256"),
+            }
         pipeline = [
             {"$match": {"config_id": config_id}},
             {
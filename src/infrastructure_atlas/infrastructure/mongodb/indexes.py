@@ -204,6 +204,24 @@ AI_ACTIVITY_LOGS_INDEXES = CollectionIndexes(
     ),
 )
 
+AI_USAGE_ROLLUPS_INDEXES = CollectionIndexes(
+    collection="ai_usage_rollups",
+    indexes=(
+        IndexModel(
+            [
+                ("granularity", ASCENDING),
+                ("bucket", ASCENDING),
+                ("provider", ASCENDING),
+                ("model", ASCENDING),
+                ("user_id", ASCENDING),
+                ("app_name", ASCENDING),
+            ],
+            unique=True,
+            name="idx_rollup_key_unique",
+        ),
+    ),
+)
+
 AI_MODEL_CONFIGS_INDEXES = CollectionIndexes(
     collection="ai_model_configs",
     indexes=(
@@ -243,6 +261,13 @@ BOT_WEBHOOK_CONFIGS_INDEXES = CollectionIndexes(
     ),
 )
 
+RATE_LIMIT_COUNTERS_INDEXES = CollectionIndexes(
+    collection="rate_limit_counters",
+    indexes=(
+        IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0, name="idx_expires_at_ttl"),
+    ),
+)
+
 # =============================================================================
 # Cache Collection Indexes (from JSON files)
 # =============================================================================
@@ -256,6 +281,15 @@ VCENTER_VMS_INDEXES = CollectionIndexes(
         IndexModel([("power_state", ASCENDING)], name="idx_power_state"),
         IndexModel([("ip_addresses", ASCENDING)], name="idx_ip_addresses"),
         IndexModel([("instance_uuid", ASCENDING)], sparse=True, name="idx_instance_uuid"),
+        IndexModel([("mac_addresses", ASCENDING)], name="idx_mac_addresses"),
+        # Case-insensitive exact lookups (skills resolve VMs by name / guest hostname)
+        IndexModel([("name", ASCENDING)], collation={"locale": "en", "strength": 2}, name="idx_name_ci"),
+        IndexModel(
+            [("guest_host_name", ASCENDING)],
+            collation={"locale": "en", "strength": 2},
+            sparse=True,
+            name="idx_guest_host_name_ci",
+        ),
         IndexModel([("cluster", ASCENDING)], sparse=True, name="idx_cluster"),
         IndexModel([("datacenter", ASCENDING)], sparse=True, name="idx_datacenter"),
         IndexModel([("name", TEXT), ("guest_host_name", TEXT)], name="idx_text_search"),
@@ -296,11 +330,13 @@ APPLICATION_INDEXES: tuple[CollectionIndexes, ...] = (
     PLAYGROUND_PRESETS_INDEXES,
     PLAYGROUND_USAGE_INDEXES,
     AI_ACTIVITY_LOGS_INDEXES,
+    AI_USAGE_ROLLUPS_INDEXES,
     AI_MODEL_CONFIGS_INDEXES,
     BOT_PLATFORM_ACCOUNTS_INDEXES,
     BOT_CONVERSATIONS_INDEXES,
     BOT_MESSAGES_INDEXES,
     BOT_WEBHOOK_CONFIGS_INDEXES,
+    RATE_LIMIT_COUNTERS_INDEXES,
 )
 
 # All cache indexes
@@ -362,8 +362,34 @@ def _migrate_module_configs(session: Session, app_db: Database) -> int:
     return len(documents)
 
 
+def _playground_session_messages(session: Session) -> dict[str, list[Any]]:
+    """Load playground history from playground_session_messages, keyed by session id.
+
+    Alembic 20261018_0022 moved history out of ``playground_sessions.messages``
+    into this table; databases from before that revision do not have it.
+    """
+    if not _table_exists(session, "playground_session_messages"):
+        return {}
+
+    import json
+
+    history: dict[str, list[Any]] = {}
+    result = session.execute(
+        text("SELECT session_id, message FROM playground_session_messages ORDER BY session_id, seq")
+    )
+    for row in result.mappings():
+        message = row["message"]
+        if isinstance(message, str):
+            try:
+                message = json.loads(message)
+            except (json.JSONDecodeError, ValueError):
+                continue
+        history.setdefault(row["session_id"], []).append(message)
+    return history
+
+
 def _migrate_playground_sessions(session: Session, app_db: Database) -> int:
-    """Migrate playground_sessions table."""
+    """Migrate playground_sessions table with the history of each session."""
     result = session.execute(text("SELECT * FROM playground_sessions"))
     rows = result.mappings().all()
 
@@ -372,6 +398,7 @@ def _migrate_playground_sessions(session: Session, app_db: Database) -> int:
 
     import json
 
+    history = _playground_session_messages(session)
     documents = []
     for row in rows:
         state = row.get("state")
@@ -388,12 +415,15 @@ def _migrate_playground_sessions(session: Session, app_db: Database) -> int:
             except (json.JSONDecodeError, ValueError):
                 config_override = {}
 
-        messages = row.get("messages")
-        if isinstance(messages, str):
-            try:
-                messages = json.loads(messages)
-            except (json.JSONDecodeError, ValueError):
-                messages = []
+        messages = history.get(row["id"])
+        if messages is None:
+            messages = row.get("messages")
+            if isinstance(messages, str):
+                try:
+                    messages = json.loads(messages)
+                except (json.JSONDecodeError, ValueError):
+                    messages = []
+        messages = messages or []
 
         doc = {
             "_id": row["id"],
@@ -401,7 +431,8 @@ def _migrate_playground_sessions(session: Session, app_db: Database) -> int:
             "user_id": row.get("user_id"),
             "state": state or {},
             "config_override": config_override or {},
-            "messages": messages or [],
+            "messages": messages,
+            "message_count": len(messages),
             "total_tokens": row.get("total_tokens", 0),
             "total_cost_usd": row.get("total_cost_usd"),
             "client": row.get("client", "web"),
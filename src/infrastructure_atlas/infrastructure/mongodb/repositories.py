@@ -12,7 +12,7 @@ from typing import Any
 
 from pymongo.collection import Collection
 from pymongo.database import Database
-from pymongo.errors import DuplicateKeyError
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
 from infrastructure_atlas.domain.entities import (
     BotConversationEntity,
@@ -41,12 +41,41 @@ from infrastructure_atlas.domain.repositories import (
 
 from . import mappers
 
+DUPLICATE_KEY_ERROR = 11000
+
 
 def _now_utc() -> datetime:
     """Get current UTC datetime."""
     return datetime.now(UTC)
 
 
+def insert_new_documents(
+    collection: Collection, docs: list[dict[str, Any]]
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Insert documents that carry their own ``_id``, tolerating earlier partial writes.
+
+    Documents are inserted unordered. One that fails with a duplicate key was
+    stored by an earlier attempt of the same batch and is neither inserted nor
+    failed. ``insert_many`` gets copies, so ``docs`` is left untouched.
+
+    Returns:
+        Tuple of (documents inserted now, documents that failed for another reason).
+    """
+    if not docs:
+        return [], []
+    try:
+        collection.insert_many([dict(doc) for doc in docs], ordered=False)
+    except BulkWriteError as exc:
+        errors = exc.details.get("writeErrors", [])
+        skipped = {error["index"] for error in errors}
+        failed = {error["index"] for error in errors if error.get("code") != DUPLICATE_KEY_ERROR}
+        return (
+            [doc for index, doc in enumerate(docs) if index not in skipped],
+            [doc for index, doc in enumerate(docs) if index in failed],
+        )
+    return list(docs), []
+
+
 class MongoDBUserRepository(UserRepository):
     """MongoDB implementation of UserRepository."""
 
@@ -945,6 +974,18 @@ class MongoDBBotMessageRepository:
         self._collection.insert_one(doc)
         return entity
 
+    def create_many(self, entities: list[BotMessageEntity], *, ordered: bool = True) -> list[BotMessageEntity]:
+        """Create several messages with one round trip.
+
+        With ``ordered=False`` every document is attempted; failures are
+        reported together in a ``BulkWriteError``.
+        """
+        if entities:
+            self._collection.insert_many(
+                [mappers.bot_message_to_document(entity) for entity in entities], ordered=ordered
+            )
+        return entities
+
     def delete_by_conversation_id(self, conversation_id: int) -> int:
         """Delete all messages for a conversation."""
         result = self._collection.delete_many({"conversation_id": conversation_id})
@@ -990,6 +1031,7 @@ class MongoDBBotWebhookConfigRepository:
 
 
 __all__ = [
+    "DUPLICATE_KEY_ERROR",
     "MongoDBBotConversationRepository",
     "MongoDBBotMessageRepository",
     "MongoDBBotPlatformAccountRepository",
@@ -1002,4 +1044,5 @@ __all__ = [
     "MongoDBUserAPIKeyRepository",
     "MongoDBUserRepository",
     "MongoDBVCenterConfigRepository",
+    "insert_new_documents",
 ]
@@ -1,4 +1,5 @@
 """Queue implementations for background job processing."""
 from .in_memory import InMemoryJobQueue
+from .write_behind import WriteBehindBuffer, flush_all_write_behind_buffers, get_write_behind_buffer
 
-__all__ = ["InMemoryJobQueue"]
+__all__ = ["InMemoryJobQueue", "WriteBehindBuffer", "flush_all_write_behind_buffers", "get_write_behind_buffer"]
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import os
+import time
 import uuid
-from collections import deque
+from collections import OrderedDict, deque
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
@@ -17,6 +19,14 @@ logger = get_logger(__name__)
 
 T = TypeVar("T")
 
+# A waiting request's priority band rises one level per AGING_SECONDS of waiting
+AGING_SECONDS = float(os.getenv("ATLAS_CHAT_QUEUE_AGING_SECONDS", "15"))
+# Deficit round robin: credit a user gains per round, and request cost in
+# credits (one per TOKENS_PER_COST_UNIT estimated tokens, capped)
+DRR_QUANTUM = 1
+TOKENS_PER_COST_UNIT = 4000
+MAX_REQUEST_COST = 8
+
 
 class RequestPriority(Enum):
     """Priority levels for chat requests."""
@@ -62,10 +72,32 @@ class QueuedRequest:
     
     # Async coordination
     _future: asyncio.Future[Any] | None = field(default=None, init=False)
+
+    # Scheduling
+    enqueued_at: float = field(default_factory=time.monotonic, init=False)
+    is_waiting: bool = field(default=True, init=False)
     
     def __post_init__(self):
         if self._future is None:
             self._future = asyncio.Future()
+
+    @property
+    def user_key(self) -> str:
+        """Fairness key: the user, else the session, so anonymous sessions are not lumped together."""
+        if self.user_id:
+            return f"user:{self.user_id}"
+        if self.session_id:
+            return f"session:{self.session_id}"
+        return "anonymous"
+
+    @property
+    def session_key(self) -> str:
+        return self.session_id or self.id
+
+    @property
+    def cost(self) -> int:
+        """Scheduling cost in round-robin credits, derived from the token estimate."""
+        return min(MAX_REQUEST_COST, 1 + max(self.estimated_tokens, 0) // TOKENS_PER_COST_UNIT)
     
     @property
     def wait_time_ms(self) -> int:
@@ -125,45 +157,181 @@ class QueuedRequest:
             self._future.cancel()
 
 
+class _UserFlow:
+    """Pending requests of one user, grouped per session in round-robin order."""
+
+    __slots__ = ("credited", "deficit", "sessions")
+
+    def __init__(self) -> None:
+        self.sessions: OrderedDict[str, deque[QueuedRequest]] = OrderedDict()
+        self.deficit = 0
+        self.credited = False
+
+    def peek(self) -> QueuedRequest:
+        return next(iter(self.sessions.values()))[0]
+
+    def pop(self) -> QueuedRequest:
+        session_key, requests = next(iter(self.sessions.items()))
+        request = requests.popleft()
+        if requests:
+            self.sessions.move_to_end(session_key)  # Next session's turn
+        else:
+            del self.sessions[session_key]
+        return request
+
+
+class _PriorityBand:
+    """Deficit round robin over the users waiting at one priority level."""
+
+    __slots__ = ("arrivals", "size", "users")
+
+    def __init__(self) -> None:
+        self.users: OrderedDict[str, _UserFlow] = OrderedDict()
+        # Arrival order of every request in the band; dispatched and cancelled
+        # entries are skipped lazily when they reach the front.
+        self.arrivals: deque[QueuedRequest] = deque()
+        self.size = 0
+
+    def oldest(self) -> QueuedRequest | None:
+        while self.arrivals and not self.arrivals[0].is_waiting:
+            self.arrivals.popleft()
+        return self.arrivals[0] if self.arrivals else None
+
+    def push(self, request: QueuedRequest) -> None:
+        flow = self.users.get(request.user_key)
+        if flow is None:
+            flow = self.users[request.user_key] = _UserFlow()
+        flow.sessions.setdefault(request.session_key, deque()).append(request)
+        self.arrivals.append(request)
+        self.size += 1
+
+    def pop(self) -> QueuedRequest:
+        """Take the next request by deficit round robin across users."""
+        while True:
+            user_key, flow = next(iter(self.users.items()))
+            if not flow.credited:
+                flow.deficit += DRR_QUANTUM
+                flow.credited = True
+            request = flow.peek()
+            if request.cost <= flow.deficit:
+                flow.deficit -= request.cost
+                flow.pop()
+                if not flow.sessions:
+                    del self.users[user_key]  # Idle users do not bank credit
+                self.size -= 1
+                return request
+            flow.credited = False
+            self.users.move_to_end(user_key)
+
+    def remove_session(self, session_id: str) -> list[QueuedRequest]:
+        removed: list[QueuedRequest] = []
+        for user_key, flow in list(self.users.items()):
+            requests = flow.sessions.pop(session_id, None)
+            if requests:
+                removed.extend(requests)
+            if not flow.sessions:
+                del self.users[user_key]
+        self.size -= len(removed)
+        return removed
+
+
+class _FairScheduler:
+    """Chooses which pending request runs next.
+
+    Higher priorities go first, but a band's effective priority rises by one
+    level for every ``AGING_SECONDS`` its oldest request has waited, so low
+    priority work cannot starve. Within a band, users share by deficit round
+    robin weighted with each request's estimated cost, and a user's sessions
+    take turns, so one chatty user or session cannot monopolise the queue.
+    """
+
+    def __init__(self) -> None:
+        self._bands: dict[RequestPriority, _PriorityBand] = {priority: _PriorityBand() for priority in RequestPriority}
+
+    def __len__(self) -> int:
+        return sum(band.size for band in self._bands.values())
+
+    def push(self, request: QueuedRequest) -> None:
+        self._bands[request.priority].push(request)
+
+    def pop(self) -> QueuedRequest | None:
+        now = time.monotonic()
+        best: tuple[float, int] | None = None
+        chosen: _PriorityBand | None = None
+        for priority, band in self._bands.items():
+            oldest = band.oldest()
+            if oldest is None:
+                continue
+            waited = now - oldest.enqueued_at
+            rank = (priority.value + waited // AGING_SECONDS, priority.value)
+            if best is None or rank > best:
+                best, chosen = rank, band
+        if chosen is None:
+            return None
+        request = chosen.pop()
+        request.is_waiting = False
+        return request
+
+    def remove_session(self, session_id: str) -> list[QueuedRequest]:
+        removed: list[QueuedRequest] = []
+        for band in self._bands.values():
+            removed.extend(band.remove_session(session_id))
+        for request in removed:
+            request.is_waiting = False
+        return removed
+
+    def sizes(self) -> dict[str, int]:
+        return {priority.name: band.size for priority, band in self._bands.items()}
+
+    def waiting_users(self) -> int:
+        return len({user for band in self._bands.values() for user in band.users})
+
+
 class ChatRequestQueue:
-    """Queue manager for chat API requests with priority handling."""
-    
+    """Queue manager for chat API requests with priority handling and per-user fairness.
+
+    The processor sleeps on a condition variable and is woken when a request
+    arrives or a running request finishes, so requests start as soon as a
+    slot is free.
+    """
+
     def __init__(self, max_concurrent: int = 3, max_queue_size: int = 100):
         self.max_concurrent = max_concurrent
         self.max_queue_size = max_queue_size
-        
-        # Queue storage by priority
-        self._queues: dict[RequestPriority, deque[QueuedRequest]] = {
-            priority: deque() for priority in RequestPriority
-        }
-        
+
+        # Pending requests
+        self._scheduler = _FairScheduler()
+
         # Currently processing requests
         self._processing: dict[str, QueuedRequest] = {}
-        
+
         # Completed requests (for metrics)
         self._completed: deque[QueuedRequest] = deque(maxlen=1000)
-        
+
         # Queue management
         self._lock = asyncio.Lock()
+        self._changed = asyncio.Condition(self._lock)
         self._processor_task: asyncio.Task[None] | None = None
         self._shutdown = False
         self._pending_tasks: set[asyncio.Task[None]] = set()
-        
+
         # Metrics
         self._total_queued = 0
         self._total_processed = 0
         self._total_failed = 0
-    
+
     async def start(self) -> None:
         """Start the queue processor."""
         if self._processor_task is None or self._processor_task.done():
             self._shutdown = False
             self._processor_task = asyncio.create_task(self._process_queue())
             logger.info("Chat request queue processor started")
-    
+
     async def stop(self) -> None:
         """Stop the queue processor."""
-        self._shutdown = True
+        async with self._changed:
+            self._shutdown = True
+            self._changed.notify_all()
         if self._processor_task:
             self._processor_task.cancel()
             try:
@@ -179,7 +347,7 @@ class ChatRequestQueue:
                 pass
         self._pending_tasks.clear()
         logger.info("Chat request queue processor stopped")
-    
+
     async def enqueue(
         self,
         func: Callable[..., T],
@@ -191,13 +359,13 @@ class ChatRequestQueue:
         **kwargs: Any,
     ) -> QueuedRequest:
         """Add a request to the queue."""
-        
-        async with self._lock:
+
+        async with self._changed:
             # Check queue size limits
-            total_queued = sum(len(q) for q in self._queues.values())
+            total_queued = len(self._scheduler)
             if total_queued >= self.max_queue_size:
                 raise RuntimeError(f"Queue is full (max {self.max_queue_size} requests)")
-            
+
             # Create request
             request = QueuedRequest(
                 priority=priority,
@@ -208,11 +376,11 @@ class ChatRequestQueue:
                 args=args,
                 kwargs=kwargs,
             )
-            
-            # Add to appropriate priority queue
-            self._queues[priority].append(request)
+
+            self._scheduler.push(request)
             self._total_queued += 1
-            
+            self._changed.notify()
+
             logger.debug(
                 "Request queued",
                 extra={
@@ -225,46 +393,38 @@ class ChatRequestQueue:
                     "queue_size": total_queued + 1,
                 }
             )
-            
+
             return request
-    
-    async def _get_next_request(self) -> QueuedRequest | None:
-        """Get the next request to process (highest priority first)."""
-        async with self._lock:
-            # Process in priority order (highest first)
-            for priority in sorted(RequestPriority, key=lambda p: p.value, reverse=True):
-                queue = self._queues[priority]
-                if queue:
-                    return queue.popleft()
-            return None
-    
+
+    def _can_start(self) -> bool:
+        return self._shutdown or (len(self._processing) < self.max_concurrent and len(self._scheduler) > 0)
+
     async def _process_queue(self) -> None:
         """Main queue processing loop."""
         logger.info("Starting chat request queue processor")
-        
+
         while not self._shutdown:
             try:
-                # Check if we can process more requests
-                if len(self._processing) >= self.max_concurrent:
-                    await asyncio.sleep(0.1)
-                    continue
-                
-                # Get next request
-                request = await self._get_next_request()
-                if not request:
-                    await asyncio.sleep(0.1)
-                    continue
-                
-                # Start processing
-                request.status = RequestStatus.PROCESSING
-                request.started_at = datetime.now(UTC)
-                self._processing[request.id] = request
-                
+                async with self._changed:
+                    await self._changed.wait_for(self._can_start)
+                    if self._shutdown:
+                        break
+                    request = self._scheduler.pop()
+                    if request is None:
+                        continue
+
+                    # Start processing
+                    request.status = RequestStatus.PROCESSING
+                    request.started_at = datetime.now(UTC)
+                    self._processing[request.id] = request
+
                 # Process in background
                 task = asyncio.create_task(self._process_request(request))
                 self._pending_tasks.add(task)
                 task.add_done_callback(self._pending_tasks.discard)
-                
+
+            except asyncio.CancelledError:
+                raise
             except Exception as exc:
                 logger.error(
                     "Error in queue processor",
@@ -274,7 +434,7 @@ class ChatRequestQueue:
                     }
                 )
                 await asyncio.sleep(1)
-    
+
     async def _process_request(self, request: QueuedRequest) -> None:
         """Process a single request."""
         
@@ -329,15 +489,16 @@ class ChatRequestQueue:
             )
         
         finally:
-            # Remove from processing and add to completed
-            async with self._lock:
+            # Remove from processing, add to completed and free the slot
+            async with self._changed:
                 self._processing.pop(request.id, None)
                 self._completed.append(request)
+                self._changed.notify()
     
     async def get_queue_stats(self) -> dict[str, Any]:
         """Get current queue statistics."""
         async with self._lock:
-            total_queued = sum(len(q) for q in self._queues.values())
+            total_queued = len(self._scheduler)
             
             # Calculate average wait times
             recent_completed = [r for r in self._completed if r.completed_at and 
@@ -358,9 +519,8 @@ class ChatRequestQueue:
                 "total_failed": self._total_failed,
                 "avg_wait_time_ms": int(avg_wait_time),
                 "avg_processing_time_ms": int(avg_processing_time),
-                "queue_by_priority": {
-                    priority.name: len(queue) for priority, queue in self._queues.items()
-                },
+                "queue_by_priority": self._scheduler.sizes(),
+                "waiting_users": self._scheduler.waiting_users(),
                 "processing_requests": [
                     {
                         "id": req.id,
@@ -378,17 +538,9 @@ class ChatRequestQueue:
         
         async with self._lock:
             # Cancel pending requests
-            for priority_queue in self._queues.values():
-                to_remove = []
-                for i, request in enumerate(priority_queue):
-                    if request.session_id == session_id and request.status == RequestStatus.PENDING:
-                        request.cancel()
-                        to_remove.append(i)
-                        cancelled_count += 1
-                
-                # Remove cancelled requests (reverse order to maintain indices)
-                for i in reversed(to_remove):
-                    del priority_queue[i]
+            for request in self._scheduler.remove_session(session_id):
+                request.cancel()
+                cancelled_count += 1
         
         if cancelled_count > 0:
             logger.info(
@@ -0,0 +1,286 @@
+"""Bounded in-process write-behind buffer for high-volume append-only writes.
+
+Producers hand items to :meth:`WriteBehindBuffer.submit`, which only appends to
+an in-memory deque. A daemon worker drains the buffer in batches whenever
+``batch_size`` items are pending or ``interval_seconds`` have elapsed, and passes
+each batch to a flush callback (typically a bulk SQL insert or ``insert_many``).
+
+When the buffer is full new items are dropped and counted rather than blocking
+the request path. A batch whose flush fails is put back at the front of the
+buffer (within ``max_size``) and retried with exponential backoff; it is only
+discarded after ``max_retries`` consecutive failures. A flush callback that
+stored part of a batch raises :class:`PartialFlushError` so only the rest is
+retried. All registered buffers
+are flushed on interpreter exit and on API shutdown via
+:func:`flush_all_write_behind_buffers`; a buffer that was closed keeps
+rejecting items, which callers treat like a full buffer.
+"""
+
+from __future__ import annotations
+
+import atexit
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar
+
+from infrastructure_atlas.infrastructure.logging import get_logger
+from infrastructure_atlas.infrastructure.metrics import increment_counter, set_gauge
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_SIZE = 10_000
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_INTERVAL_SECONDS = 2.0
+DEFAULT_MAX_RETRIES = 5
+MAX_BACKOFF_SECONDS = 60.0
+
+
+class PartialFlushError(Exception):
+    """Raised by a flush callback that stored only part of a batch.
+
+    Only ``failed`` is re-queued; the other items count as flushed.
+    """
+
+    def __init__(self, failed: list[Any], message: str):
+        super().__init__(message)
+        self.failed = failed
+
+
+class WriteBehindBuffer(Generic[T]):
+    """Thread-safe bounded buffer that flushes items to storage in batches."""
+
+    max_retries = DEFAULT_MAX_RETRIES  # Consecutive failed flushes after which a batch is discarded
+
+    def __init__(
+        self,
+        name: str,
+        flush_batch: Callable[[list[T]], None],
+        *,
+        max_size: int = DEFAULT_MAX_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        interval_seconds: float = DEFAULT_INTERVAL_SECONDS,
+    ):
+        """Create a buffer; use :func:`get_write_behind_buffer` for shared buffers.
+
+        Args:
+            name: Identifier used in logs and metric labels
+            flush_batch: Callable persisting a batch of items; on an exception the
+                batch is re-queued and retried
+            max_size: Maximum number of pending items before new items are dropped
+            batch_size: Pending item count that triggers an early flush
+            interval_seconds: Maximum time an item waits before being flushed
+        """
+        self.name = name
+        self._flush_batch = flush_batch
+        self._max_size = max_size
+        self._batch_size = batch_size
+        self._interval = interval_seconds
+        self._consecutive_failures = 0
+        self._items: deque[T] = deque()
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+        self._closed = False
+        self._dropped = 0
+        self._flushed = 0
+        self._failed = 0
+
+    @property
+    def depth(self) -> int:
+        return len(self._items)
+
+    def submit(self, item: T) -> bool:
+        """Queue ``item`` for the next batch.
+
+        Returns:
+            False when the buffer is full (or closed) and the item was dropped
+        """
+        with self._condition:
+            if self._closed or len(self._items) >= self._max_size:
+                self._dropped += 1
+                increment_counter("write_behind_dropped_total", labels={"buffer": self.name})
+                return False
+            self._items.append(item)
+            depth = len(self._items)
+            if depth >= self._batch_size:
+                self._condition.notify()
+            self._ensure_worker()
+        set_gauge("write_behind_queue_depth", depth, labels={"buffer": self.name})
+        return True
+
+    def flush(self) -> int:
+        """Persist every pending item on the calling thread.
+
+        Stops at the first failed batch, which stays queued for a retry.
+
+        Returns:
+            Number of items written by the flush callback
+        """
+        total = 0
+        with self._flush_lock:
+            while True:
+                with self._condition:
+                    batch = [self._items.popleft() for _ in range(min(self._batch_size, len(self._items)))]
+                    depth = len(self._items)
+                if not batch:
+                    break
+                set_gauge("write_behind_queue_depth", depth, labels={"buffer": self.name})
+                if not self._write(batch):
+                    break
+                total += len(batch)
+        return total
+
+    def close(self) -> None:
+        """Stop accepting items, stop the worker and flush what is pending."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            worker = self._worker
+        if worker is not None and worker is not threading.current_thread():
+            worker.join(timeout=self._interval + 5)
+        self.flush()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "depth": self.depth,
+            "max_size": self._max_size,
+            "dropped": self._dropped,
+            "flushed": self._flushed,
+            "failed": self._failed,
+            "consecutive_failures": self._consecutive_failures,
+        }
+
+    def _write(self, batch: list[T]) -> bool:
+        try:
+            self._flush_batch(batch)
+        except PartialFlushError as exc:
+            written = len(batch) - len(exc.failed)
+            self._flushed += written
+            increment_counter("write_behind_flushed_total", labels={"buffer": self.name}, amount=written)
+            return self._write_failed(exc.failed, exc)
+        except Exception as exc:
+            return self._write_failed(batch, exc)
+        self._consecutive_failures = 0
+        self._flushed += len(batch)
+        increment_counter("write_behind_flushed_total", labels={"buffer": self.name}, amount=len(batch))
+        return True
+
+    def _write_failed(self, batch: list[T], exc: Exception) -> bool:
+        """Re-queue a failed batch, or discard it after ``max_retries`` consecutive failures."""
+        self._consecutive_failures += 1
+        if self._consecutive_failures > self.max_retries:
+            self._consecutive_failures = 0
+            self._failed += len(batch)
+            increment_counter("write_behind_failed_total", labels={"buffer": self.name}, amount=len(batch))
+            logger.error(
+                f"Write-behind buffer {self.name} discarded {len(batch)} item(s) after "
+                f"{self.max_retries + 1} failed flushes: {exc}"
+            )
+            return False
+        self._requeue(batch)
+        increment_counter("write_behind_retried_total", labels={"buffer": self.name}, amount=len(batch))
+        logger.warning(
+            f"Write-behind buffer {self.name} failed to flush {len(batch)} item(s), "
+            f"retrying in {self._backoff_seconds():.1f}s: {exc}"
+        )
+        return False
+
+    def _requeue(self, batch: list[T]) -> None:
+        """Put a failed batch back in front of newer items, dropping the newest beyond ``max_size``."""
+        with self._condition:
+            self._items.extendleft(reversed(batch))
+            overflow = len(self._items) - self._max_size
+            for _ in range(max(overflow, 0)):
+                self._items.pop()
+            if overflow > 0:
+                self._dropped += overflow
+                increment_counter("write_behind_dropped_total", labels={"buffer": self.name}, amount=overflow)
+
+    def _backoff_seconds(self) -> float:
+        if not self._consecutive_failures:
+            return self._interval
+        return min(self._interval * 2**self._consecutive_failures, MAX_BACKOFF_SECONDS)
+
+    def _ensure_worker(self) -> None:
+        # Caller holds self._condition
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name=f"write-behind-{self.name}", daemon=True)
+            self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            deadline = time.monotonic() + self._backoff_seconds()
+            with self._condition:
+                # While backing off, a full batch does not cut the wait short
+                while not self._closed and (self._consecutive_failures or len(self._items) < self._batch_size):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                if self._closed:
+                    return
+            self.flush()
+
+
+_BUFFERS: dict[str, WriteBehindBuffer[Any]] = {}
+_BUFFERS_LOCK = threading.Lock()
+
+
+def get_write_behind_buffer(
+    name: str,
+    flush_batch: Callable[[list[Any]], None],
+    **options: Any,
+) -> WriteBehindBuffer[Any]:
+    """Return the process-wide buffer called ``name``, creating it on first use.
+
+    Registered buffers are flushed by :func:`flush_all_write_behind_buffers`.
+    ``flush_batch`` and ``options`` are only used when the buffer is created.
+    """
+    with _BUFFERS_LOCK:
+        buffer = _BUFFERS.get(name)
+        if buffer is None:
+            buffer = WriteBehindBuffer(name, flush_batch, **options)
+            _BUFFERS[name] = buffer
+        return buffer
+
+
+def get_write_behind_buffers() -> dict[str, WriteBehindBuffer[Any]]:
+    """Return a snapshot of all registered buffers keyed by name."""
+    with _BUFFERS_LOCK:
+        return dict(_BUFFERS)
+
+
+def flush_all_write_behind_buffers() -> int:
+    """Flush every registered buffer; used on shutdown.
+
+    Returns:
+        Total number of items flushed
+    """
+    total = 0
+    for buffer in get_write_behind_buffers().values():
+        try:
+            total += buffer.flush()
+        except Exception as exc:  # pragma: no cover - defensive during shutdown
+            logger.error(f"Failed to flush write-behind buffer {buffer.name}: {exc}")
+    return total
+
+
+atexit.register(flush_all_write_behind_buffers)
+
+
+__all__ = [
+    "DEFAULT_BATCH_SIZE",
+    "DEFAULT_INTERVAL_SECONDS",
+    "DEFAULT_MAX_RETRIES",
+    "DEFAULT_MAX_SIZE",
+    "PartialFlushError",
+    "WriteBehindBuffer",
+    "flush_all_write_behind_buffers",
+    "get_write_behind_buffer",
+    "get_write_behind_buffers",
+]
@@ -0,0 +1,253 @@
+"""Counter stores backing the sliding-window rate limiter.
+
+The rate limiter keeps one counter per fixed time bucket (e.g. "requests in
+minute 29,384,712") and estimates the sliding-window total from the current
+and the previous bucket, so a check reads a constant number of counters no
+matter how many requests the window holds.
+
+Stores only need atomic increments, plain reads and expiry:
+
+- :class:`InMemoryRateLimitStore`: per-process, the default
+- :class:`SQLiteRateLimitStore`: a small SQLite file shared by all workers on
+  one host (``ATLAS_RATE_LIMIT_STORE=sqlite``)
+- :class:`MongoDBRateLimitStore`: the ``rate_limit_counters`` collection,
+  shared by every process using the same database
+  (``ATLAS_RATE_LIMIT_STORE=mongodb``)
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Protocol
+
+from infrastructure_atlas.env import project_root
+from infrastructure_atlas.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+STORE_ENV = "ATLAS_RATE_LIMIT_STORE"
+SQLITE_PATH_ENV = "ATLAS_RATE_LIMIT_DB"
+
+_SWEEP_INTERVAL_SECONDS = 60.0
+
+
+class RateLimitStore(Protocol):
+    """Expiring numeric counters shared by the rate limiters using the store."""
+
+    #: True if calls perform I/O and should run off the event loop
+    blocking: bool
+
+    def get_many(self, keys: Sequence[str]) -> list[float]:
+        """Return the values of ``keys``; missing or expired keys read as 0."""
+        ...
+
+    def incr_many(self, increments: Sequence[tuple[str, float]], ttl_seconds: float) -> None:
+        """Atomically add to counters, (re)setting their expiry."""
+        ...
+
+    def put(self, key: str, value: float, ttl_seconds: float) -> None:
+        """Overwrite a value."""
+        ...
+
+    def clear(self, prefix: str) -> None:
+        """Delete every key starting with ``prefix``."""
+        ...
+
+
+class InMemoryRateLimitStore:
+    """Process-local store; limits are enforced per worker process."""
+
+    blocking = False
+
+    def __init__(self) -> None:
+        self._values: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+        self._next_sweep = time.monotonic() + _SWEEP_INTERVAL_SECONDS
+
+    def get_many(self, keys: Sequence[str]) -> list[float]:
+        now = time.monotonic()
+        with self._lock:
+            result = []
+            for key in keys:
+                entry = self._values.get(key)
+                result.append(entry[0] if entry is not None and entry[1] > now else 0.0)
+            return result
+
+    def incr_many(self, increments: Sequence[tuple[str, float]], ttl_seconds: float) -> None:
+        now = time.monotonic()
+        expires_at = now + ttl_seconds
+        with self._lock:
+            for key, amount in increments:
+                entry = self._values.get(key)
+                current = entry[0] if entry is not None and entry[1] > now else 0.0
+                self._values[key] = (current + amount, expires_at)
+            self._sweep(now)
+
+    def put(self, key: str, value: float, ttl_seconds: float) -> None:
+        with self._lock:
+            self._values[key] = (value, time.monotonic() + ttl_seconds)
+
+    def clear(self, prefix: str) -> None:
+        with self._lock:
+            for key in [key for key in self._values if key.startswith(prefix)]:
+                del self._values[key]
+
+    def _sweep(self, now: float) -> None:
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + _SWEEP_INTERVAL_SECONDS
+        for key in [key for key, (_, expires_at) in self._values.items() if expires_at <= now]:
+            del self._values[key]
+
+
+class SQLiteRateLimitStore:
+    """Counters in a SQLite file, shared by all processes on the host.
+
+    Increments use ``INSERT ... ON CONFLICT DO UPDATE`` inside one write
+    transaction, so concurrent workers never lose updates.
+    """
+
+    blocking = True
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._next_sweep = 0.0
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_counters ("
+                "key TEXT PRIMARY KEY, value REAL NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def get_many(self, keys: Sequence[str]) -> list[float]:
+        if not keys:
+            return []
+        placeholders = ",".join("?" * len(keys))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT key, value FROM rate_limit_counters WHERE key IN ({placeholders}) AND expires_at > ?",  # noqa: S608
+                (*keys, time.time()),
+            ).fetchall()
+        values = dict(rows)
+        return [float(values.get(key, 0.0)) for key in keys]
+
+    def incr_many(self, increments: Sequence[tuple[str, float]], ttl_seconds: float) -> None:
+        now = time.time()
+        expires_at = now + ttl_seconds
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO rate_limit_counters (key, value, expires_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET "
+                    "value = CASE WHEN expires_at > ? THEN value + excluded.value ELSE excluded.value END, "
+                    "expires_at = excluded.expires_at",
+                    [(key, amount, expires_at, now) for key, amount in increments],
+                )
+                if now >= self._next_sweep:
+                    self._next_sweep = now + _SWEEP_INTERVAL_SECONDS
+                    self._conn.execute("DELETE FROM rate_limit_counters WHERE expires_at <= ?", (now,))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def put(self, key: str, value: float, ttl_seconds: float) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO rate_limit_counters (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, time.time() + ttl_seconds),
+            )
+
+    def clear(self, prefix: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM rate_limit_counters WHERE substr(key, 1, ?) = ?",
+                (len(prefix), prefix),
+            )
+
+
+class MongoDBRateLimitStore:
+    """Counters in MongoDB, shared by every process using the database.
+
+    Increments are ``$inc`` upserts; a TTL index on ``expires_at`` removes
+    old buckets (see ``RATE_LIMIT_COUNTERS_INDEXES``).
+    """
+
+    blocking = True
+
+    def __init__(self, db: Any) -> None:
+        self._collection = db["rate_limit_counters"]
+
+    def get_many(self, keys: Sequence[str]) -> list[float]:
+        if not keys:
+            return []
+        cursor = self._collection.find(
+            {"_id": {"$in": list(keys)}, "expires_at": {"$gt": datetime.now(UTC)}},
+            {"value": 1},
+        )
+        values = {doc["_id"]: doc.get("value", 0.0) for doc in cursor}
+        return [float(values.get(key, 0.0)) for key in keys]
+
+    def incr_many(self, increments: Sequence[tuple[str, float]], ttl_seconds: float) -> None:
+        from pymongo import UpdateOne
+
+        expires_at = datetime.fromtimestamp(time.time() + ttl_seconds, tz=UTC)
+        # Bucket keys are never reused after they expire, so a plain $inc is safe
+        self._collection.bulk_write(
+            [
+                UpdateOne({"_id": key}, {"$inc": {"value": amount}, "$set": {"expires_at": expires_at}}, upsert=True)
+                for key, amount in increments
+            ],
+            ordered=False,
+        )
+
+    def put(self, key: str, value: float, ttl_seconds: float) -> None:
+        expires_at = datetime.fromtimestamp(time.time() + ttl_seconds, tz=UTC)
+        self._collection.replace_one({"_id": key}, {"_id": key, "value": value, "expires_at": expires_at}, upsert=True)
+
+    def clear(self, prefix: str) -> None:
+        import re
+
+        self._collection.delete_many({"_id": {"$regex": f"^{re.escape(prefix)}"}})
+
+
+def create_rate_limit_store(kind: str | None = None) -> RateLimitStore:
+    """Create the store selected by ``ATLAS_RATE_LIMIT_STORE`` (memory, sqlite, mongodb).
+
+    Falls back to the in-memory store if the shared store cannot be opened.
+    """
+    kind = (kind or os.getenv(STORE_ENV) or "memory").strip().lower()
+    try:
+        if kind == "sqlite":
+            path = os.getenv(SQLITE_PATH_ENV) or str(project_root() / "data" / "rate_limits.sqlite3")
+            return SQLiteRateLimitStore(path)
+        if kind == "mongodb":
+            from infrastructure_atlas.infrastructure.mongodb import get_mongodb_client
+
+            return MongoDBRateLimitStore(get_mongodb_client().atlas)
+    except Exception as exc:
+        logger.warning(f"Rate limit store '{kind}' unavailable, limits are per process: {exc}")
+        return InMemoryRateLimitStore()
+    if kind != "memory":
+        logger.warning(f"Unknown {STORE_ENV} value '{kind}', using in-memory rate limits")
+    return InMemoryRateLimitStore()
+
+
+__all__ = [
+    "InMemoryRateLimitStore",
+    "MongoDBRateLimitStore",
+    "RateLimitStore",
+    "SQLiteRateLimitStore",
+    "create_rate_limit_store",
+]
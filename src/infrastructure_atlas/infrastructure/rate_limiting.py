@@ -1,17 +1,28 @@
-"""Rate limiting and retry infrastructure for OpenAI API calls."""
+"""Rate limiting and retry infrastructure for OpenAI API calls.
+
+Usage limits are enforced with sliding-window counters kept in a pluggable
+store (see :mod:`infrastructure_atlas.infrastructure.rate_limit_store`), so
+they can be shared by several worker processes.
+"""
 
 from __future__ import annotations
 
 import asyncio
 import os
 import random
-from collections import defaultdict
+import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any, TypeVar
 
 from infrastructure_atlas.infrastructure.logging import get_logger
+from infrastructure_atlas.infrastructure.rate_limit_store import (
+    InMemoryRateLimitStore,
+    RateLimitStore,
+    create_rate_limit_store,
+)
+from infrastructure_atlas.infrastructure.session_registry import BoundedSessionRegistry
 
 logger = get_logger(__name__)
 
@@ -78,163 +89,190 @@ class TokenUsage:
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class _Window:
+    metric: str
+    seconds: int
+
+
+_WINDOWS = (
+    _Window("requests", 60),
+    _Window("requests", 3600),
+    _Window("tokens", 60),
+    _Window("tokens", 3600),
+)
+_COUNTER_TTL_SECONDS = 2 * max(window.seconds for window in _WINDOWS)
+_ERROR_MARKER_TTL_SECONDS = 24 * 3600
+
+
 class RateLimitState:
-    """Current rate limiting state for tracking usage."""
-    
-    # Request tracking
-    requests_this_minute: list[datetime] = field(default_factory=list)
-    requests_this_hour: list[datetime] = field(default_factory=list)
-    
-    # Token tracking
-    tokens_this_minute: list[tuple[datetime, int]] = field(default_factory=list)
-    tokens_this_hour: list[tuple[datetime, int]] = field(default_factory=list)
-    
-    # Stabilization tracking
-    last_rate_limit_error: datetime | None = None
-    stabilization_active: bool = False
-    
-    # Error tracking
-    consecutive_errors: int = 0
-    last_error_time: datetime | None = None
-    
-    def cleanup_old_entries(self) -> None:
-        """Remove entries older than their tracking windows."""
-        now = datetime.now(UTC)
-        minute_ago = now - timedelta(minutes=1)
-        hour_ago = now - timedelta(hours=1)
-        
-        # Clean up request tracking
-        self.requests_this_minute = [ts for ts in self.requests_this_minute if ts > minute_ago]
-        self.requests_this_hour = [ts for ts in self.requests_this_hour if ts > hour_ago]
-        
-        # Clean up token tracking
-        self.tokens_this_minute = [(ts, tokens) for ts, tokens in self.tokens_this_minute if ts > minute_ago]
-        self.tokens_this_hour = [(ts, tokens) for ts, tokens in self.tokens_this_hour if ts > hour_ago]
-    
+    """Current rate limiting state for tracking usage.
+
+    Requests and tokens are counted per fixed bucket (one per minute and one
+    per hour) in a :class:`RateLimitStore`. The sliding-window total is
+    estimated as ``previous * (1 - elapsed) + current``, where ``elapsed`` is
+    the fraction of the current bucket that has passed, so checks read a
+    constant number of counters. With a shared store (SQLite, MongoDB) the
+    counters and the last rate limit error are shared by all workers; the
+    consecutive error count stays per process.
+    """
+
+    def __init__(self, store: RateLimitStore | None = None, namespace: str = "openai"):
+        self.store: RateLimitStore = store if store is not None else InMemoryRateLimitStore()
+        self.namespace = namespace
+
+        # Stabilization tracking (refreshed from the store on every usage read)
+        self.last_rate_limit_error: datetime | None = None
+        self.stabilization_active = False
+
+        # Error tracking
+        self.consecutive_errors = 0
+        self.last_error_time: datetime | None = None
+
+    def _bucket_key(self, window: _Window, bucket: int) -> str:
+        return f"{self.namespace}:{window.metric}:{window.seconds}:{bucket}"
+
+    @property
+    def _error_key(self) -> str:
+        return f"{self.namespace}:last_rate_limit_error"
+
     def add_request(self, token_count: int = 0) -> None:
         """Record a new request and its token usage."""
-        now = datetime.now(UTC)
-        self.requests_this_minute.append(now)
-        self.requests_this_hour.append(now)
-        
-        if token_count > 0:
-            self.tokens_this_minute.append((now, token_count))
-            self.tokens_this_hour.append((now, token_count))
-        
-        self.cleanup_old_entries()
-    
+        now = time.time()
+        increments: list[tuple[str, float]] = []
+        for window in _WINDOWS:
+            amount = 1 if window.metric == "requests" else token_count
+            if amount > 0:
+                increments.append((self._bucket_key(window, int(now // window.seconds)), amount))
+        self.store.incr_many(increments, _COUNTER_TTL_SECONDS)
+
     def get_current_usage(self) -> dict[str, Any]:
         """Get current usage statistics."""
-        self.cleanup_old_entries()
-        
-        tokens_minute = sum(tokens for _, tokens in self.tokens_this_minute)
-        tokens_hour = sum(tokens for _, tokens in self.tokens_this_hour)
-        
+        now = time.time()
+        keys: list[str] = []
+        for window in _WINDOWS:
+            bucket = int(now // window.seconds)
+            keys.extend((self._bucket_key(window, bucket - 1), self._bucket_key(window, bucket)))
+        keys.append(self._error_key)
+        values = self.store.get_many(keys)
+
+        totals: dict[tuple[str, int], int] = {}
+        for index, window in enumerate(_WINDOWS):
+            previous, current = values[2 * index], values[2 * index + 1]
+            elapsed = (now % window.seconds) / window.seconds
+            totals[(window.metric, window.seconds)] = int(previous * (1 - elapsed) + current)
+
+        error_at = values[-1]
+        self.last_rate_limit_error = datetime.fromtimestamp(error_at, tz=UTC) if error_at else None
+
         return {
-            "requests_per_minute": len(self.requests_this_minute),
-            "requests_per_hour": len(self.requests_this_hour),
-            "tokens_per_minute": tokens_minute,
-            "tokens_per_hour": tokens_hour,
+            "requests_per_minute": totals[("requests", 60)],
+            "requests_per_hour": totals[("requests", 3600)],
+            "tokens_per_minute": totals[("tokens", 60)],
+            "tokens_per_hour": totals[("tokens", 3600)],
             "stabilization_active": self.stabilization_active,
             "consecutive_errors": self.consecutive_errors,
         }
-    
-    def check_stabilization_period(self, config: RateLimitConfig) -> bool:
-        """Check if we're in a stabilization period after rate limiting."""
+
+    def stabilization_remaining(self, config: RateLimitConfig) -> float:
+        """Seconds left in the stabilization period, as of the last usage read."""
         if not self.last_rate_limit_error:
             self.stabilization_active = False
-            return False
-        
-        now = datetime.now(UTC)
+            return 0.0
         stabilization_end = self.last_rate_limit_error + timedelta(minutes=config.stabilization_period_minutes)
-        
-        if now < stabilization_end:
-            self.stabilization_active = True
-            return True
-        else:
-            self.stabilization_active = False
-            return False
-    
+        remaining = (stabilization_end - datetime.now(UTC)).total_seconds()
+        self.stabilization_active = remaining > 0
+        return max(remaining, 0.0)
+
+    def check_stabilization_period(self, config: RateLimitConfig) -> bool:
+        """Check if we're in a stabilization period after rate limiting."""
+        self.get_current_usage()
+        return self.stabilization_remaining(config) > 0
+
     def record_rate_limit_error(self) -> None:
         """Record that a rate limit error occurred."""
         self.last_rate_limit_error = datetime.now(UTC)
         self.stabilization_active = True
         self.consecutive_errors += 1
         self.last_error_time = self.last_rate_limit_error
-    
+        self.store.put(self._error_key, self.last_rate_limit_error.timestamp(), _ERROR_MARKER_TTL_SECONDS)
+
     def record_success(self) -> None:
         """Record a successful request."""
         self.consecutive_errors = 0
         self.last_error_time = None
 
+    def reset(self) -> None:
+        """Forget all usage and errors, for every process sharing the store."""
+        self.store.clear(f"{self.namespace}:")
+        self.last_rate_limit_error = None
+        self.stabilization_active = False
+        self.consecutive_errors = 0
+        self.last_error_time = None
+
 
 class RateLimiter:
     """Rate limiter for OpenAI API requests with exponential backoff."""
     
-    def __init__(self, config: RateLimitConfig | None = None):
+    def __init__(self, config: RateLimitConfig | None = None, store: RateLimitStore | None = None):
         self.config = config or RateLimitConfig.from_env()
-        self.state = RateLimitState()
-        self._lock = asyncio.Lock()
+        self.state = RateLimitState(store if store is not None else create_rate_limit_store())
+    
+    async def _call(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a state operation, off the event loop if the store does I/O."""
+        if self.state.store.blocking:
+            return await asyncio.to_thread(func, *args)
+        return func(*args)
     
     async def can_make_request(self, estimated_tokens: int = 0) -> tuple[bool, str | None]:
         """Check if a request can be made without exceeding rate limits."""
-        async with self._lock:
-            self.state.cleanup_old_entries()
-            
-            # Check stabilization period
-            if self.state.check_stabilization_period(self.config):
-                if self.state.last_rate_limit_error:
-                    remaining = (
-                        self.state.last_rate_limit_error +
-                        timedelta(minutes=self.config.stabilization_period_minutes) -
-                        datetime.now(UTC)
-                    ).total_seconds()
-                    return False, f"In stabilization period for {remaining:.0f} more seconds"
-                else:
-                    return False, "In stabilization period"
-            
-            usage = self.state.get_current_usage()
-            
-            # Check request limits
-            if usage["requests_per_minute"] >= self.config.requests_per_minute:
-                return False, "Request rate limit exceeded (per minute)"
-            
-            if usage["requests_per_hour"] >= self.config.requests_per_hour:
-                return False, "Request rate limit exceeded (per hour)"
-            
-            # Check token limits
-            if estimated_tokens > 0:
-                if usage["tokens_per_minute"] + estimated_tokens > self.config.tokens_per_minute:
-                    return False, "Token rate limit would be exceeded (per minute)"
-                
-                if usage["tokens_per_hour"] + estimated_tokens > self.config.tokens_per_hour:
-                    return False, "Token rate limit would be exceeded (per hour)"
+        usage = await self._call(self.state.get_current_usage)
+        
+        # Check stabilization period
+        remaining = self.state.stabilization_remaining(self.config)
+        if remaining > 0:
+            return False, f"In stabilization period for {remaining:.0f} more seconds"
+        
+        # Check request limits
+        if usage["requests_per_minute"] >= self.config.requests_per_minute:
+            return False, "Request rate limit exceeded (per minute)"
+        
+        if usage["requests_per_hour"] >= self.config.requests_per_hour:
+            return False, "Request rate limit exceeded (per hour)"
+        
+        # Check token limits
+        if estimated_tokens > 0:
+            if usage["tokens_per_minute"] + estimated_tokens > self.config.tokens_per_minute:
+                return False, "Token rate limit would be exceeded (per minute)"
             
-            return True, None
+            if usage["tokens_per_hour"] + estimated_tokens > self.config.tokens_per_hour:
+                return False, "Token rate limit would be exceeded (per hour)"
+        
+        return True, None
     
     async def record_request(self, token_count: int = 0) -> None:
         """Record that a request was made."""
-        async with self._lock:
-            self.state.add_request(token_count)
+        await self._call(self.state.add_request, token_count)
     
     async def record_rate_limit_error(self) -> None:
         """Record that a rate limit error occurred."""
-        async with self._lock:
-            self.state.record_rate_limit_error()
-            logger.warning(
-                "Rate limit error recorded, entering stabilization period",
-                extra={
-                    "event": "rate_limit_error",
-                    "stabilization_minutes": self.config.stabilization_period_minutes,
-                    "consecutive_errors": self.state.consecutive_errors,
-                }
-            )
+        await self._call(self.state.record_rate_limit_error)
+        logger.warning(
+            "Rate limit error recorded, entering stabilization period",
+            extra={
+                "event": "rate_limit_error",
+                "stabilization_minutes": self.config.stabilization_period_minutes,
+                "consecutive_errors": self.state.consecutive_errors,
+            }
+        )
     
     async def record_success(self) -> None:
         """Record that a request succeeded."""
-        async with self._lock:
-            self.state.record_success()
+        self.state.record_success()
+    
+    async def reset(self) -> None:
+        """Reset usage counters and stabilization state."""
+        await self._call(self.state.reset)
     
     def calculate_retry_delay(self, attempt: int) -> float:
         """Calculate delay for exponential backoff with jitter."""
@@ -259,25 +297,25 @@ class RateLimiter:
     
     async def get_usage_stats(self) -> dict[str, Any]:
         """Get current usage statistics."""
-        async with self._lock:
-            self.state.cleanup_old_entries()
-            usage = self.state.get_current_usage()
-            
-            # Add rate limit percentages
-            usage["request_utilization_minute"] = (
-                usage["requests_per_minute"] / self.config.requests_per_minute * 100
-            )
-            usage["request_utilization_hour"] = (
-                usage["requests_per_hour"] / self.config.requests_per_hour * 100
-            )
-            usage["token_utilization_minute"] = (
-                usage["tokens_per_minute"] / self.config.tokens_per_minute * 100
-            )
-            usage["token_utilization_hour"] = (
-                usage["tokens_per_hour"] / self.config.tokens_per_hour * 100
-            )
-            
-            return usage
+        usage = await self._call(self.state.get_current_usage)
+        self.state.stabilization_remaining(self.config)
+        usage["stabilization_active"] = self.state.stabilization_active
+        
+        # Add rate limit percentages
+        usage["request_utilization_minute"] = (
+            usage["requests_per_minute"] / self.config.requests_per_minute * 100
+        )
+        usage["request_utilization_hour"] = (
+            usage["requests_per_hour"] / self.config.requests_per_hour * 100
+        )
+        usage["token_utilization_minute"] = (
+            usage["tokens_per_minute"] / self.config.tokens_per_minute * 100
+        )
+        usage["token_utilization_hour"] = (
+            usage["tokens_per_hour"] / self.config.tokens_per_hour * 100
+        )
+        
+        return usage
 
 
 async def with_rate_limiting(
@@ -457,12 +495,40 @@ def _is_server_error(exc: Exception) -> bool:
     return any(indicator in msg for indicator in server_error_indicators)
 
 
+@dataclass(slots=True)
+class SessionUsageTotals:
+    """Running token usage totals for one session."""
+
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+    cost_usd: float = 0.0
+    request_count: int = 0
+    first_request: datetime | None = None
+    last_request: datetime | None = None
+
+    def add(self, usage: TokenUsage) -> None:
+        self.prompt_tokens += usage.prompt_tokens
+        self.completion_tokens += usage.completion_tokens
+        self.total_tokens += usage.total_tokens
+        self.cost_usd += usage.cost_usd
+        self.request_count += 1
+        if self.first_request is None:
+            self.first_request = usage.timestamp
+        self.last_request = usage.timestamp
+
+
 class TokenUsageTracker:
     """Tracks token usage across requests for analytics and cost monitoring."""
     
     def __init__(self):
         self._usage_history: list[TokenUsage] = []
-        self._session_usage: dict[str, list[TokenUsage]] = defaultdict(list)
+        # Aggregated per session; idle sessions are dropped after the idle window
+        self._session_usage: BoundedSessionRegistry[str, SessionUsageTotals] = BoundedSessionRegistry(
+            "rate_limiting.session_usage",
+            max_entries=int(os.getenv("ATLAS_USAGE_TRACKER_MAX_SESSIONS", "5000")),
+            idle_seconds=float(os.getenv("ATLAS_USAGE_TRACKER_IDLE_SECONDS", "86400")),
+        )
         self._lock = asyncio.Lock()
     
     async def record_usage(
@@ -488,7 +554,11 @@ class TokenUsageTracker:
             self._usage_history.append(usage)
             
             if session_id:
-                self._session_usage[session_id].append(usage)
+                totals = self._session_usage.get(session_id)
+                if totals is None:
+                    totals = SessionUsageTotals()
+                    self._session_usage.put(session_id, totals)
+                totals.add(usage)
             
             # Keep only last 1000 entries to prevent memory growth
             if len(self._usage_history) > 1000:
@@ -511,9 +581,9 @@ class TokenUsageTracker:
     async def get_session_usage(self, session_id: str) -> dict[str, Any]:
         """Get token usage statistics for a specific session."""
         async with self._lock:
-            session_usage = self._session_usage.get(session_id, [])
+            totals = self._session_usage.get(session_id)
             
-            if not session_usage:
+            if totals is None or not totals.request_count:
                 return {
                     "total_prompt_tokens": 0,
                     "total_completion_tokens": 0,
@@ -523,13 +593,13 @@ class TokenUsageTracker:
                 }
             
             return {
-                "total_prompt_tokens": sum(u.prompt_tokens for u in session_usage),
-                "total_completion_tokens": sum(u.completion_tokens for u in session_usage),
-                "total_tokens": sum(u.total_tokens for u in session_usage),
-                "total_cost_usd": sum(u.cost_usd for u in session_usage),
-                "request_count": len(session_usage),
-                "first_request": session_usage[0].timestamp.isoformat(),
-                "last_request": session_usage[-1].timestamp.isoformat(),
+                "total_prompt_tokens": totals.prompt_tokens,
+                "total_completion_tokens": totals.completion_tokens,
+                "total_tokens": totals.total_tokens,
+                "total_cost_usd": totals.cost_usd,
+                "request_count": totals.request_count,
+                "first_request": totals.first_request.isoformat(),
+                "last_request": totals.last_request.isoformat(),
             }
     
     async def get_recent_usage(self, hours: int = 24) -> dict[str, Any]:
@@ -589,6 +659,7 @@ __all__ = [
     "RateLimitConfig",
     "RateLimitState",
     "RateLimiter",
+    "SessionUsageTotals",
     "TokenUsage",
     "TokenUsageTracker",
     "get_rate_limiter",
@@ -0,0 +1,233 @@
+"""Bounded in-memory registry for per-session state.
+
+Long-lived processes (bot containers, the API) keep chat sessions, usage totals
+and similar per-session objects in memory. :class:`BoundedSessionRegistry`
+caps those maps: entries are kept in least-recently-used order, the oldest are
+evicted once ``max_entries`` is exceeded, and entries idle for longer than
+``idle_seconds`` are evicted on the next access.
+
+An optional ``on_evict`` callback runs *before* an entry is removed so callers
+can flush unsaved state to the database. If the entry is touched while it is
+being flushed it stays in the registry.
+
+Registries register themselves with the :class:`CacheRegistry` (unless
+``register=False``), so their size and eviction counts appear in
+``atlas cache-stats`` and on ``/metrics``.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from infrastructure_atlas.infrastructure.caching import CacheMetrics, get_cache_registry
+from infrastructure_atlas.infrastructure.logging import get_logger
+from infrastructure_atlas.infrastructure.metrics import increment_counter, set_gauge
+
+logger = get_logger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+DEFAULT_MAX_ENTRIES = 1_000
+DEFAULT_IDLE_SECONDS = 6 * 3600.0
+
+_MISSING: Any = object()
+
+
+@dataclass(slots=True)
+class _Slot(Generic[V]):
+    value: V
+    last_access: float
+
+
+class BoundedSessionRegistry(Generic[K, V]):
+    """Thread-safe LRU map with idle-timeout eviction and flush-before-evict."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        idle_seconds: float = DEFAULT_IDLE_SECONDS,
+        on_evict: Callable[[K, V], None] | None = None,
+        register: bool = True,
+    ):
+        """Create a registry.
+
+        Args:
+            name: Identifier used in the cache registry, logs and metric labels
+            max_entries: Maximum number of entries kept in memory
+            idle_seconds: Entries not accessed for this long are evicted
+            on_evict: Callback persisting an entry before it is dropped
+            register: Register with the global CacheRegistry; disable for
+                short-lived owners (e.g. per-request objects)
+        """
+        self.name = name
+        self.max_entries = max_entries
+        self.idle_seconds = idle_seconds
+        self._on_evict = on_evict
+        self._entries: OrderedDict[K, _Slot[V]] = OrderedDict()
+        self._lock = threading.RLock()
+        self._metrics = CacheMetrics()
+        self._registered = register
+        if register:
+            get_cache_registry().register(self)
+
+    # CacheRegistry protocol -------------------------------------------------
+    @property
+    def ttl_seconds(self) -> float:
+        return self.idle_seconds
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def snapshot_metrics(self) -> CacheMetrics:
+        with self._lock:
+            return self._metrics.snapshot()
+
+    def invalidate(self, key: K | None = None) -> None:
+        """Flush and drop ``key`` (or every entry when ``key`` is None)."""
+        with self._lock:
+            keys = list(self._entries) if key is None else [key] if key in self._entries else []
+        self._evict(keys, reason="invalidate", force=True)
+
+    # Mapping-style access ---------------------------------------------------
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Return the value for ``key`` and mark it as recently used."""
+        self.evict_idle()
+        with self._lock:
+            slot = self._entries.get(key)
+            if slot is None:
+                self._metrics.misses += 1
+                return default
+            slot.last_access = time.monotonic()
+            self._entries.move_to_end(key)
+            self._metrics.hits += 1
+            return slot.value
+
+    def put(self, key: K, value: V) -> None:
+        """Insert or replace ``key``, evicting least-recently-used entries if full."""
+        with self._lock:
+            self._entries[key] = _Slot(value=value, last_access=time.monotonic())
+            self._entries.move_to_end(key)
+            self._metrics.loads += 1
+            self._metrics.last_refresh = time.monotonic()
+            overflow = len(self._entries) - self.max_entries
+            victims = list(self._entries)[:overflow] if overflow > 0 else []
+        if victims:
+            self._evict(victims, reason="lru")
+        self.evict_idle()
+        self._publish_size()
+
+    def pop(self, key: K, default: V | None = None) -> V | None:
+        """Remove ``key`` without flushing; used when the caller deletes the session."""
+        with self._lock:
+            slot = self._entries.pop(key, None)
+        self._publish_size()
+        return default if slot is None else slot.value
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __getitem__(self, key: K) -> V:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value  # type: ignore[return-value]
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self.put(key, value)
+
+    def __delitem__(self, key: K) -> None:
+        with self._lock:
+            del self._entries[key]
+        self._publish_size()
+
+    def __len__(self) -> int:
+        return self.size()
+
+    def __iter__(self) -> Iterator[K]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def items(self) -> list[tuple[K, V]]:
+        with self._lock:
+            return [(key, slot.value) for key, slot in self._entries.items()]
+
+    def values(self) -> list[V]:
+        with self._lock:
+            return [slot.value for slot in self._entries.values()]
+
+    # Eviction ---------------------------------------------------------------
+    def evict_idle(self) -> int:
+        """Evict entries idle for longer than ``idle_seconds``.
+
+        Entries are kept in access order, so this only inspects expired ones.
+
+        Returns:
+            Number of entries evicted
+        """
+        cutoff = time.monotonic() - self.idle_seconds
+        with self._lock:
+            victims = []
+            for key, slot in self._entries.items():
+                if slot.last_access > cutoff:
+                    break
+                victims.append(key)
+        if not victims:
+            return 0
+        return self._evict(victims, reason="idle")
+
+    def _evict(self, keys: list[K], *, reason: str, force: bool = False) -> int:
+        evicted = 0
+        for key in keys:
+            with self._lock:
+                slot = self._entries.get(key)
+                if slot is None:
+                    continue
+                touched_at = slot.last_access
+            if self._on_evict is not None:
+                try:
+                    self._on_evict(key, slot.value)
+                except Exception as exc:
+                    increment_counter("session_registry_flush_failures_total", labels={"registry": self.name})
+                    logger.error(f"Failed to flush {self.name} entry {key!r} before eviction: {exc}")
+            with self._lock:
+                current = self._entries.get(key)
+                if current is not slot or (not force and current.last_access != touched_at):
+                    continue  # Replaced or used again while flushing
+                del self._entries[key]
+                self._metrics.evictions += 1
+            evicted += 1
+            increment_counter("session_registry_evictions_total", labels={"registry": self.name, "reason": reason})
+        if evicted:
+            logger.debug(f"Evicted {evicted} {self.name} entr{'y' if evicted == 1 else 'ies'} ({reason})")
+            self._publish_size()
+        return evicted
+
+    def _publish_size(self) -> None:
+        if not self._registered:
+            return
+        set_gauge("session_registry_size", self.size(), labels={"registry": self.name})
+
+    def stats(self) -> dict[str, Any]:
+        metrics = self.snapshot_metrics()
+        return {
+            "name": self.name,
+            "size": self.size(),
+            "max_entries": self.max_entries,
+            "idle_seconds": self.idle_seconds,
+            "hits": metrics.hits,
+            "misses": metrics.misses,
+            "evictions": metrics.evictions,
+        }
+
+
+__all__ = ["DEFAULT_IDLE_SECONDS", "DEFAULT_MAX_ENTRIES", "BoundedSessionRegistry"]
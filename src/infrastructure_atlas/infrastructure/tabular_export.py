@@ -0,0 +1,288 @@
+"""Streaming tabular export engine for XLSX and CSV files.
+
+Rows are consumed from any iterable of mappings and written straight to the
+target using openpyxl's write-only mode (or ``csv.writer``), so large
+exports run in memory bounded by the column-width sample window instead of the
+full dataset. Cell formatting uses workbook-level named styles rather than
+per-cell style objects.
+"""
+
+from __future__ import annotations
+
+import csv
+import warnings
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime
+from itertools import chain, islice
+from pathlib import Path
+from typing import IO, Any
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.filters import AutoFilter
+from openpyxl.worksheet.table import Table, TableColumn, TableStyleInfo
+
+Row = Mapping[str, Any]
+HeaderLabel = Mapping[str, str] | Callable[[str], str] | None
+
+TITLE_STYLE = "atlas_title"
+HEADER_STYLE = "atlas_header"
+CELL_STYLE = "atlas_cell"
+DATETIME_STYLE = "atlas_datetime"
+
+# Rows buffered up-front to size columns; write-only sheets need widths before the first row.
+WIDTH_SAMPLE_ROWS = 500
+MAX_COLUMN_WIDTH = 50
+
+
+@dataclass(slots=True)
+class ExportResult:
+    """Summary of a completed export."""
+
+    row_count: int
+    headers: list[str]
+
+    @property
+    def column_count(self) -> int:
+        return len(self.headers)
+
+
+def union_headers(rows: Iterable[Row]) -> list[str]:
+    """Return the ordered union of keys across ``rows`` in a single pass."""
+    seen: dict[str, None] = {}
+    for row in rows:
+        for key in row:
+            if key not in seen:
+                seen[key] = None
+    return list(seen)
+
+
+def _resolve_headers(
+    rows: Iterable[Row],
+    headers: Sequence[str] | None,
+) -> tuple[Iterable[Row], list[str]]:
+    if headers is not None:
+        return rows, list(headers)
+    # Without explicit headers every row has to be seen before the header row can be
+    # written, so one-shot iterators are materialised here. Pass ``headers`` to stream.
+    if not isinstance(rows, Sequence):
+        rows = list(rows)
+    return rows, union_headers(rows)
+
+
+def _label_for(header: str, header_labels: HeaderLabel) -> str:
+    if header_labels is None:
+        return header
+    if callable(header_labels):
+        return header_labels(header)
+    return header_labels.get(header, header)
+
+
+def _register_named_styles(workbook: Workbook) -> None:
+    thin = Side(style="thin")
+    border = Border(left=thin, right=thin, top=thin, bottom=thin)
+    workbook.add_named_style(
+        NamedStyle(
+            name=TITLE_STYLE,
+            font=Font(bold=True, size=14),
+            fill=PatternFill(start_color="D9E2F3", end_color="D9E2F3", fill_type="solid"),
+            alignment=Alignment(horizontal="left", vertical="center"),
+        )
+    )
+    workbook.add_named_style(
+        NamedStyle(
+            name=HEADER_STYLE,
+            font=Font(bold=True, color="FFFFFF"),
+            fill=PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid"),
+            alignment=Alignment(horizontal="center", vertical="center", wrap_text=True),
+            border=border,
+        )
+    )
+    workbook.add_named_style(
+        NamedStyle(
+            name=CELL_STYLE,
+            alignment=Alignment(vertical="center", wrap_text=True),
+            border=border,
+        )
+    )
+    workbook.add_named_style(
+        NamedStyle(
+            name=DATETIME_STYLE,
+            alignment=Alignment(vertical="center"),
+            border=border,
+            number_format="YYYY-MM-DD HH:MM",
+        )
+    )
+
+
+def _sample_widths(labels: Sequence[str], sample: Sequence[Sequence[Any]]) -> list[int]:
+    widths = [min(len(label), MAX_COLUMN_WIDTH) for label in labels]
+    for values in sample:
+        for idx, value in enumerate(values):
+            if value is None or value == "":
+                continue
+            length = len(str(value))
+            if length > widths[idx]:
+                widths[idx] = min(length, MAX_COLUMN_WIDTH)
+    return [min(width + 2, MAX_COLUMN_WIDTH) for width in widths]
+
+
+def write_xlsx(
+    target: str | Path | IO[bytes],
+    rows: Iterable[Row],
+    headers: Sequence[str] | None = None,
+    *,
+    sheet_name: str = "Data",
+    title: str | None = None,
+    header_labels: HeaderLabel = None,
+    value_formatter: Callable[[Any], Any] | None = None,
+    styled: bool = True,
+    freeze_panes: str | None = None,
+    table_name: str | None = None,
+) -> ExportResult:
+    """Stream ``rows`` into a write-only XLSX workbook saved to ``target``.
+
+    Args:
+        target: File path or binary buffer to save the workbook to
+        rows: Iterable of mappings; generators are streamed when ``headers`` is given
+        headers: Column keys in output order (defaults to the ordered union of row keys)
+        sheet_name: Worksheet title (truncated to Excel's 31 characters)
+        title: Optional title row written above the header row
+        header_labels: Mapping or callable turning column keys into display labels
+        value_formatter: Optional callable applied to every cell value
+        styled: Apply the named header/cell styles; disable for the fastest plain output
+        freeze_panes: Cell to freeze at (defaults to the first data row)
+        table_name: Render the data as an Excel table with this display name instead
+            of a plain auto-filter
+
+    Returns:
+        ExportResult with the number of data rows and the header list
+    """
+    rows, resolved = _resolve_headers(rows, headers)
+    labels = [_label_for(header, header_labels) for header in resolved]
+
+    def _values(row: Row) -> list[Any]:
+        if value_formatter is None:
+            return [row.get(header) for header in resolved]
+        return [value_formatter(row.get(header)) for header in resolved]
+
+    value_rows: Iterator[list[Any]] = (_values(row) for row in rows)
+    sample = list(islice(value_rows, WIDTH_SAMPLE_ROWS))
+
+    workbook = Workbook(write_only=True)
+    if styled:
+        _register_named_styles(workbook)
+    sheet = workbook.create_sheet(title=sheet_name[:31] or "Data")
+
+    column_count = max(len(resolved), 1)
+    for idx, width in enumerate(_sample_widths(labels, sample), 1):
+        sheet.column_dimensions[get_column_letter(idx)].width = width
+
+    header_row = 3 if title else 1
+    sheet.freeze_panes = freeze_panes or f"A{header_row + 1}"
+
+    def _cell(value: Any, style: str) -> Any:
+        if not styled:
+            return value
+        cell = WriteOnlyCell(sheet, value=value)
+        cell.style = style
+        return cell
+
+    if title:
+        sheet.append([_cell(title, TITLE_STYLE)])
+        sheet.append([])
+    sheet.append([_cell(label, HEADER_STYLE) for label in labels])
+
+    row_count = 0
+    for values in chain(sample, value_rows):
+        if styled:
+            sheet.append(
+                [
+                    _cell(value, DATETIME_STYLE if isinstance(value, (datetime, date)) else CELL_STYLE)
+                    for value in values
+                ]
+            )
+        else:
+            sheet.append(values)
+        row_count += 1
+
+    ref = f"A{header_row}:{get_column_letter(column_count)}{header_row + max(row_count, 1)}"
+    if table_name and row_count:
+        table = Table(
+            displayName=table_name,
+            ref=ref,
+            autoFilter=AutoFilter(ref=ref),
+            tableColumns=[TableColumn(id=idx, name=str(label)) for idx, label in enumerate(labels, 1)],
+        )
+        table.tableStyleInfo = TableStyleInfo(
+            name="TableStyleMedium9",
+            showFirstColumn=False,
+            showLastColumn=False,
+            showRowStripes=True,
+            showColumnStripes=True,
+        )
+        with warnings.catch_warnings():
+            # Columns are supplied above; openpyxl warns unconditionally in write-only mode.
+            warnings.simplefilter("ignore", UserWarning)
+            sheet.add_table(table)
+    elif resolved:
+        sheet.auto_filter.ref = ref
+
+    workbook.save(target)
+    return ExportResult(row_count=row_count, headers=resolved)
+
+
+def write_csv(
+    handle: IO[str],
+    rows: Iterable[Row],
+    headers: Sequence[str] | None = None,
+    *,
+    delimiter: str = ",",
+    title: str | None = None,
+    header_labels: HeaderLabel = None,
+    value_formatter: Callable[[Any], Any] | None = None,
+) -> ExportResult:
+    """Stream ``rows`` as CSV into an open text handle.
+
+    Args:
+        handle: Text stream opened with ``newline=""``
+        rows: Iterable of mappings; generators are streamed when ``headers`` is given
+        headers: Column keys in output order (defaults to the ordered union of row keys)
+        delimiter: Field delimiter
+        title: Optional title written as a ``#`` comment line
+        header_labels: Mapping or callable turning column keys into display labels
+        value_formatter: Optional callable applied to every cell value
+
+    Returns:
+        ExportResult with the number of data rows and the header list
+    """
+    rows, resolved = _resolve_headers(rows, headers)
+    if title:
+        handle.write(f"# {title}\n")
+
+    writer = csv.writer(handle, delimiter=delimiter)
+    writer.writerow([_label_for(header, header_labels) for header in resolved])
+
+    row_count = 0
+    for row in rows:
+        if value_formatter is None:
+            writer.writerow([row.get(header, "") for header in resolved])
+        else:
+            writer.writerow([value_formatter(row.get(header, "")) for header in resolved])
+        row_count += 1
+    return ExportResult(row_count=row_count, headers=resolved)
+
+
+__all__ = [
+    "CELL_STYLE",
+    "DATETIME_STYLE",
+    "HEADER_STYLE",
+    "TITLE_STYLE",
+    "ExportResult",
+    "union_headers",
+    "write_csv",
+    "write_xlsx",
+]
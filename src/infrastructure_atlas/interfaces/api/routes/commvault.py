@@ -28,11 +28,13 @@ from infrastructure_atlas.domain.integrations.commvault import (
     CommvaultStoragePool,
 )
 from infrastructure_atlas.env import project_root
+from infrastructure_atlas.infrastructure.cache_metadata import write_json_cache
 from infrastructure_atlas.infrastructure.external.commvault_client import (
     CommvaultClient,
     CommvaultClientConfig,
     CommvaultError,
 )
+from infrastructure_atlas.infrastructure.host_identity import commvault_client_refs, get_host_identity_index
 from infrastructure_atlas.infrastructure.logging import get_logger, logging_context
 
 router = APIRouter(prefix="/commvault", tags=["commvault"])
@@ -68,6 +70,35 @@ COMMVAULT_SERVER_EXPORT_COLUMNS: list[tuple[str, str]] = [
     ("savings", "Savings"),
 ]
 
+# Raw job fields included in the XLSX/CSV server exports
+COMMVAULT_SERVER_JOB_FIELDS: tuple[str, ...] = (
+    "job_id",
+    "job_type",
+    "status",
+    "localized_status",
+    "localized_operation",
+    "client_name",
+    "client_id",
+    "destination_client_name",
+    "subclient_name",
+    "backup_set_name",
+    "application_name",
+    "backup_level_name",
+    "plan_name",
+    "client_groups",
+    "storage_policy_name",
+    "start_time",
+    "end_time",
+    "elapsed_seconds",
+    "size_of_application_bytes",
+    "size_on_media_bytes",
+    "total_num_files",
+    "percent_complete",
+    "percent_savings",
+    "average_throughput_gb_per_hr",
+    "retain_until",
+)
+
 # Optional urllib3 imports for TLS warning suppression
 try:
     from urllib3 import disable_warnings as _disable_urllib3_warnings
@@ -352,31 +383,27 @@ def _serialise_commvault_plan(plan: CommvaultPlan) -> dict[str, Any]:
     }
 
 
+def _cache_summary(payload: Mapping[str, Any]) -> dict[str, Any]:
+    """Fields of a Commvault cache payload mirrored into its metadata sidecar."""
+    return {"generated_at": payload.get("generated_at"), "total_cached": payload.get("total_cached")}
+
+
 def _write_commvault_backups_json(payload: Mapping[str, Any]) -> None:
     """Write Commvault backups JSON to disk."""
     path = _data_dir() / COMMVAULT_BACKUPS_JSON
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    with tmp.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2)
-    tmp.replace(path)
+    write_json_cache(path, payload, _cache_summary(payload))
 
 
 def _write_commvault_storage_json(payload: Mapping[str, Any]) -> None:
     """Write Commvault storage JSON to disk."""
     path = _data_dir() / COMMVAULT_STORAGE_JSON
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    with tmp.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2)
-    tmp.replace(path)
+    write_json_cache(path, payload, _cache_summary(payload))
 
 
 def _write_commvault_plans_json(payload: Mapping[str, Any]) -> None:
     """Write Commvault plans JSON to disk."""
     path = _data_dir() / COMMVAULT_PLANS_JSON
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    with tmp.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2)
-    tmp.replace(path)
+    write_json_cache(path, payload, _cache_summary(payload))
 
 
 def _load_commvault_backups() -> dict[str, Any]:
@@ -768,8 +795,52 @@ def _normalise_commvault_client_name(value: Any) -> str:
     return str(value).strip()
 
 
-def _cached_commvault_clients() -> tuple[list[dict[str, Any]], list[Mapping[str, Any]], str | None]:
-    """Get cached Commvault clients from backups data."""
+_CommvaultClients = tuple[list[dict[str, Any]], list[Mapping[str, Any]], str | None]
+
+
+class _CommvaultClientsMemo:
+    """Clients derived from the backups cache, keyed on the cache file's mtime and size."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._signature: tuple[int, int] | None = None
+        self._value: _CommvaultClients | None = None
+
+    def get(self, signature: tuple[int, int] | None) -> _CommvaultClients:
+        with self._lock:
+            if self._value is not None and signature is not None and self._signature == signature:
+                return self._value
+            self._value = _derive_commvault_clients()
+            self._signature = signature
+            return self._value
+
+
+_commvault_clients_memo = _CommvaultClientsMemo()
+
+
+def _cached_commvault_clients() -> _CommvaultClients:
+    """Get cached Commvault clients from backups data.
+
+    The derived client list is memoised on the backups file's mtime and size and is
+    also published to the host identity index. Callers must treat it as read-only.
+    """
+    path = _data_dir() / COMMVAULT_BACKUPS_JSON
+    try:
+        stat = path.stat()
+        signature: tuple[int, int] | None = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        signature = None
+    clients, jobs, generated_at = _commvault_clients_memo.get(signature)
+    get_host_identity_index().update_partition(
+        "commvault:clients",
+        lambda: commvault_client_refs(clients),
+        version=signature,
+    )
+    return clients, jobs, generated_at
+
+
+def _derive_commvault_clients() -> tuple[list[dict[str, Any]], list[Mapping[str, Any]], str | None]:
+    """Group cached backup jobs into client records with name variants."""
     cache = _load_commvault_backups()
     jobs_payload = cache.get("jobs")
     if not isinstance(jobs_payload, list):
@@ -1546,102 +1617,46 @@ def _render_commvault_server_docx(
     return buffer
 
 
+def _commvault_server_job_rows(jobs: Iterable[Mapping[str, Any]]) -> Iterable[dict[str, Any]]:
+    """Yield job rows flattened for tabular export."""
+    for job in jobs:
+        row = dict(job)
+        groups = row.get("client_groups")
+        if isinstance(groups, list):
+            row["client_groups"] = ";".join(groups)
+        yield row
+
+
 def _render_commvault_server_xlsx(
     summary: dict[str, Any],
     jobs: list[dict[str, Any]],
 ) -> BytesIO:
     """Render Commvault server jobs as XLSX."""
     try:
-        from openpyxl import Workbook  # type: ignore
+        from infrastructure_atlas.infrastructure.tabular_export import write_xlsx
     except ImportError as exc:  # pragma: no cover - dependency managed elsewhere
         raise HTTPException(status_code=500, detail="openpyxl is required for XLSX export") from exc
 
-    workbook = Workbook()
-    sheet = workbook.active
     display_name = summary.get("display_name") or summary.get("name") or f"#{summary.get('client_id')}"
-    sheet.title = display_name[:31]
-
-    headers = [
-        "job_id",
-        "job_type",
-        "status",
-        "localized_status",
-        "localized_operation",
-        "client_name",
-        "client_id",
-        "destination_client_name",
-        "subclient_name",
-        "backup_set_name",
-        "application_name",
-        "backup_level_name",
-        "plan_name",
-        "client_groups",
-        "storage_policy_name",
-        "start_time",
-        "end_time",
-        "elapsed_seconds",
-        "size_of_application_bytes",
-        "size_on_media_bytes",
-        "total_num_files",
-        "percent_complete",
-        "percent_savings",
-        "average_throughput_gb_per_hr",
-        "retain_until",
-    ]
-    sheet.append(headers)
-
-    for job in jobs:
-        row = dict(job)
-        groups = row.get("client_groups")
-        if isinstance(groups, list):
-            row["client_groups"] = ";".join(groups)
-        sheet.append([row.get(header, "") for header in headers])
 
     buffer = BytesIO()
-    workbook.save(buffer)
+    write_xlsx(
+        buffer,
+        _commvault_server_job_rows(jobs),
+        COMMVAULT_SERVER_JOB_FIELDS,
+        sheet_name=display_name,
+        styled=False,
+    )
     buffer.seek(0)
     return buffer
 
 
 def _render_commvault_server_csv(jobs: list[dict[str, Any]]) -> StringIO:
     """Render Commvault server jobs as CSV."""
-    fieldnames = [
-        "job_id",
-        "job_type",
-        "status",
-        "localized_status",
-        "localized_operation",
-        "client_name",
-        "client_id",
-        "destination_client_name",
-        "subclient_name",
-        "backup_set_name",
-        "application_name",
-        "backup_level_name",
-        "plan_name",
-        "client_groups",
-        "storage_policy_name",
-        "start_time",
-        "end_time",
-        "elapsed_seconds",
-        "size_of_application_bytes",
-        "size_on_media_bytes",
-        "total_num_files",
-        "percent_complete",
-        "percent_savings",
-        "average_throughput_gb_per_hr",
-        "retain_until",
-    ]
+    from infrastructure_atlas.infrastructure.tabular_export import write_csv
 
     buffer = StringIO()
-    writer = csv.DictWriter(buffer, fieldnames=fieldnames)
-    writer.writeheader()
-    for job in jobs:
-        row = dict(job)
-        groups = row.get("client_groups")
-        if isinstance(groups, list):
-            row["client_groups"] = ";".join(groups)
-        writer.writerow({key: row.get(key, "") for key in fieldnames})
+    write_csv(buffer, _commvault_server_job_rows(jobs), COMMVAULT_SERVER_JOB_FIELDS)
     buffer.seek(0)
     return buffer
 
@@ -2155,52 +2170,16 @@ def commvault_backups_file(
     if not jobs:
         raise HTTPException(status_code=404, detail="Commvault export not available")
 
-    fieldnames = [
-        "job_id",
-        "job_type",
-        "status",
-        "localized_status",
-        "localized_operation",
-        "client_name",
-        "client_id",
-        "destination_client_name",
-        "subclient_name",
-        "backup_set_name",
-        "application_name",
-        "backup_level_name",
-        "plan_name",
-        "client_groups",
-        "storage_policy_name",
-        "start_time",
-        "end_time",
-        "elapsed_seconds",
-        "size_of_application_bytes",
-        "size_on_media_bytes",
-        "total_num_files",
-        "percent_complete",
-        "percent_savings",
-        "average_throughput_gb_per_hr",
-        "retain_until",
-    ]
-
     def _iter_rows():
-        import csv as _csv
-        from io import StringIO
-
         buffer = StringIO()
-        writer = _csv.DictWriter(buffer, fieldnames=fieldnames)
+        writer = csv.DictWriter(buffer, fieldnames=COMMVAULT_SERVER_JOB_FIELDS, extrasaction="ignore")
         writer.writeheader()
         yield buffer.getvalue()
         buffer.seek(0)
         buffer.truncate(0)
 
-        writer = _csv.DictWriter(buffer, fieldnames=fieldnames)
-        for job in jobs:
-            row = dict(job)
-            groups = row.get("client_groups")
-            if isinstance(groups, list):
-                row["client_groups"] = ";".join(groups)
-            writer.writerow({k: row.get(k, "") for k in fieldnames})
+        for row in _commvault_server_job_rows(jobs):
+            writer.writerow(row)
             yield buffer.getvalue()
             buffer.seek(0)
             buffer.truncate(0)
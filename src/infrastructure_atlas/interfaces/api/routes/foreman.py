@@ -10,7 +10,7 @@ from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request
 from infrastructure_atlas.application.dto.foreman import foreman_config_to_dto, foreman_configs_to_dto
 from infrastructure_atlas.application.services import create_foreman_service
 from infrastructure_atlas.application.services.foreman import ForemanServiceProtocol
-from infrastructure_atlas.infrastructure.external import ForemanAuthError, ForemanClientError
+from infrastructure_atlas.infrastructure.external import ForemanAuthError, ForemanClientError, get_foreman_client_pool
 from infrastructure_atlas.infrastructure.security.secret_store import SecretStoreUnavailable
 from infrastructure_atlas.interfaces.api.dependencies import AdminUserDep, CurrentUserDep
 from infrastructure_atlas.interfaces.api.schemas import ForemanConfigCreate, ForemanConfigUpdate
@@ -98,6 +98,7 @@ def _meta_to_payload(meta: dict[str, object]) -> dict[str, object]:
         "generated_at": generated_at_str,
         "host_count": meta.get("host_count"),
         "source": meta.get("source"),
+        "enrichment": meta.get("enrichment"),
     }
 
 
@@ -138,6 +139,12 @@ def test_connection(admin: AdminUserDep, config_id: str, service: ForemanService
         raise HTTPException(status_code=503, detail=str(exc)) from exc
 
 
+@router.get("/cache-metrics")
+def cache_metrics(admin: AdminUserDep):
+    """Hit/miss counts and hit rates of the pooled Foreman client caches, per configuration."""
+    return {"configs": get_foreman_client_pool().cache_metrics()}
+
+
 @router.get("/hosts")
 def list_hosts(
     user: CurrentUserDep,
@@ -189,8 +196,7 @@ def list_hosts(
         else:
             # Direct API call (CLI or refresh)
             client = service.get_client(config.id)
-            with client:
-                hosts = client.list_hosts(search=search, force_refresh=refresh)
+            hosts = client.list_hosts(search=search, force_refresh=refresh)
             return {"results": hosts, "total": len(hosts), "config_id": config.id}
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
@@ -259,11 +265,10 @@ def get_host_detail(
 
     try:
         client = service.get_client(config.id)
-        with client:
-            host_detail = client.get_host_detail(host_id)
-            if not host_detail:
-                raise HTTPException(status_code=404, detail=f"Host {host_id} not found")
-            return host_detail
+        host_detail = client.get_host_detail(host_id)
+        if not host_detail:
+            raise HTTPException(status_code=404, detail=f"Host {host_id} not found")
+        return host_detail
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     except (ForemanAuthError, ForemanClientError) as exc:
@@ -296,9 +301,8 @@ def get_host_puppet_classes(
 
     try:
         client = service.get_client(config.id)
-        with client:
-            classes = client.get_host_puppet_classes(host_id)
-            return {"results": classes, "total": len(classes)}
+        classes = client.get_host_puppet_classes(host_id)
+        return {"results": classes, "total": len(classes)}
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     except (ForemanAuthError, ForemanClientError) as exc:
@@ -331,9 +335,8 @@ def get_host_puppet_parameters(
 
     try:
         client = service.get_client(config.id)
-        with client:
-            parameters = client.get_host_puppet_parameters(host_id)
-            return {"results": parameters, "total": len(parameters)}
+        parameters = client.get_host_puppet_parameters(host_id)
+        return {"results": parameters, "total": len(parameters)}
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     except (ForemanAuthError, ForemanClientError) as exc:
@@ -367,15 +370,14 @@ def get_host_puppet_facts(
 
     try:
         client = service.get_client(config.id)
-        with client:
-            facts = client.get_host_puppet_facts(host_id)
+        facts = client.get_host_puppet_facts(host_id)
 
-            # Filter by search if provided
-            if search:
-                search_lower = search.lower()
-                facts = {k: v for k, v in facts.items() if search_lower in k.lower()}
+        # Filter by search if provided
+        if search:
+            search_lower = search.lower()
+            facts = {k: v for k, v in facts.items() if search_lower in k.lower()}
 
-            return {"results": facts, "total": len(facts)}
+        return {"results": facts, "total": len(facts)}
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     except (ForemanAuthError, ForemanClientError) as exc:
@@ -408,11 +410,10 @@ def get_host_puppet_status(
 
     try:
         client = service.get_client(config.id)
-        with client:
-            status = client.get_host_puppet_status(host_id)
-            if not status:
-                raise HTTPException(status_code=404, detail=f"Host {host_id} not found")
-            return status
+        status = client.get_host_puppet_status(host_id)
+        if not status:
+            raise HTTPException(status_code=404, detail=f"Host {host_id} not found")
+        return status
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     except (ForemanAuthError, ForemanClientError) as exc:
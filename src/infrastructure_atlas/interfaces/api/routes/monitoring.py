@@ -225,9 +225,8 @@ async def reset_rate_limits(user: OptionalUserDep) -> dict[str, Any]:
     try:
         rate_limiter = get_rate_limiter()
         
-        # Reset the rate limiter state
-        async with rate_limiter._lock:
-            rate_limiter.state = type(rate_limiter.state)()
+        # Reset the rate limiter state (shared with other workers if the store is)
+        await rate_limiter.reset()
         
         logger.info(
             "Rate limiting state reset by admin",
@@ -3,31 +3,85 @@
 from __future__ import annotations
 
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Literal
 
 import requests
 from fastapi import APIRouter, HTTPException, Query
+from requests.adapters import HTTPAdapter
 
+from infrastructure_atlas.infrastructure.caching import TTLCache
 from infrastructure_atlas.infrastructure.modules import get_module_registry
 
 router = APIRouter(tags=["netbox"])
 
+MAX_CONCURRENCY_ENV = "NETBOX_MAX_CONCURRENCY"
+SEARCH_TTL_ENV = "NETBOX_SEARCH_TTL_SECONDS"
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_SEARCH_TTL_SECONDS = 30.0
+_PAGE_LIMIT = 200  # NetBox page size used by searches
+_SEARCH_CACHE_MAX_ENTRIES = 64  # Keys include the free-text query; full result sets can be large
+_POOL_CONNECTIONS = 16  # Keep-alive connections shared by API worker threads
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        value = float(os.getenv(name, "") or default)
+    except ValueError:
+        return default
+    return value if value >= 0 else default
+
+
+_SEARCH_CACHE: TTLCache[tuple[str, str, str, int], dict[str, Any]] = TTLCache(
+    ttl_seconds=_env_number(SEARCH_TTL_ENV, DEFAULT_SEARCH_TTL_SECONDS),
+    name="netbox.search",
+    max_entries=_SEARCH_CACHE_MAX_ENTRIES,
+)
+
+
+class _NetboxSessionHolder:
+    """The authenticated NetBox API session shared by all requests.
+
+    The session (and its keep-alive connection pool) is rebuilt only when
+    the URL or token change. A replaced session is not closed, so requests
+    still running on it finish normally.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._key: tuple[str, str] | None = None
+        self._session: requests.Session | None = None
+
+    def get(self, base: str, token: str) -> requests.Session:
+        with self._lock:
+            if self._session is not None and self._key == (base, token):
+                return self._session
+            sess = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=_POOL_CONNECTIONS)
+            sess.mount("https://", adapter)
+            sess.mount("http://", adapter)
+            sess.headers.update({"Authorization": f"Token {token}", "Accept": "application/json"})
+            try:
+                from infrastructure_atlas.env import apply_extra_headers as _apply
+
+                _apply(sess)
+            except Exception:
+                pass
+            self._key, self._session = (base, token), sess
+            return sess
+
+
+_SESSIONS = _NetboxSessionHolder()
+
 
 def _nb_session() -> tuple[requests.Session, str]:
-    """Create authenticated NetBox API session."""
+    """Return the process-wide authenticated NetBox API session and base URL."""
     base = os.getenv("NETBOX_URL", "").strip()
     token = os.getenv("NETBOX_TOKEN", "").strip()
     if not base or not token:
         raise HTTPException(status_code=400, detail="NETBOX_URL/NETBOX_TOKEN not configured in .env")
-    sess = requests.Session()
-    sess.headers.update({"Authorization": f"Token {token}", "Accept": "application/json"})
-    try:
-        from infrastructure_atlas.env import apply_extra_headers as _apply
-
-        _apply(sess)
-    except Exception:
-        pass
-    return sess, base.rstrip("/")
+    return _SESSIONS.get(base, token), base.rstrip("/")
 
 
 # Module guard dependency
@@ -57,11 +111,21 @@ def netbox_search(
     """Search NetBox live (no CSV) using the built-in ?q= filter.
 
     Returns rows with common fields across devices/VMs and a suggested column list.
+    The device, VM and IP address endpoints are queried concurrently, and
+    results are cached for ``NETBOX_SEARCH_TTL_SECONDS`` (default 30s).
     """
     require_netbox_enabled()
     if not (q and q.strip()):
         return {"columns": [], "rows": [], "total": 0}
     sess, base = _nb_session()
+    result = _SEARCH_CACHE.get((base, dataset, q, int(limit)), lambda: _search(sess, base, dataset, q, int(limit)))
+    # Callers get their own row list; the cached result stays untouched
+    return {**result, "rows": list(result["rows"])}
+
+
+def _search(sess: requests.Session, base: str, dataset: str, q: str, limit: int) -> dict[str, Any]:
+    """Run a live NetBox search (uncached)."""
+    max_workers = max(1, int(_env_number(MAX_CONCURRENCY_ENV, DEFAULT_MAX_CONCURRENCY)))
 
     def _status_label(x):
         if isinstance(x, dict):
@@ -75,20 +139,51 @@ def netbox_search(
         r.raise_for_status()
         return r.json()
 
-    def _collect(endpoint: str, q: str, max_items: int | None) -> list[dict]:
-        items: list[dict] = []
-        # NetBox uses DRF pagination: limit/offset/next
-        page_limit = 200  # reasonable page size
-        url = f"{base}{endpoint}?q={requests.utils.quote(q)}&limit={page_limit}&offset=0"
-        while url:
-            data = _get(url)
+    def _collect_all(endpoints: list[str], q: str, max_items: int | None) -> dict[str, list[dict]]:
+        """Fetch every endpoint's matches, running all page requests on one bounded pool.
+
+        NetBox uses DRF pagination (limit/offset/next). The first page of each
+        endpoint is fetched concurrently; once its ``count`` is known the
+        remaining pages are requested by offset, also concurrently.
+        """
+        page_limit = _PAGE_LIMIT if max_items is None else min(_PAGE_LIMIT, max_items)
+
+        def _page_url(endpoint: str, offset: int) -> str:
+            return f"{base}{endpoint}?q={requests.utils.quote(q)}&limit={page_limit}&offset={offset}"
+
+        def _results(data: Any) -> list[dict]:
             results = data.get("results", []) if isinstance(data, dict) else []
-            if not isinstance(results, list):
-                break
-            items.extend(results)
-            if max_items is not None and len(items) >= max_items:
-                return items[:max_items]
-            url = data.get("next") if isinstance(data, dict) else None
+            return results if isinstance(results, list) else []
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="netbox-search") as executor:
+            first_pages = dict(zip(endpoints, executor.map(lambda e: _get(_page_url(e, 0)), endpoints), strict=True))
+
+            items: dict[str, list[dict]] = {}
+            pending: list[tuple[str, int]] = []
+            for endpoint, data in first_pages.items():
+                items[endpoint] = _results(data)
+                if not isinstance(data, dict) or not data.get("next"):
+                    continue
+                count = data.get("count")
+                if not isinstance(count, int):
+                    # No count to plan offsets from: follow next links sequentially
+                    url = data.get("next")
+                    while url and (max_items is None or len(items[endpoint]) < max_items):
+                        page = _get(url)
+                        if not isinstance(page, dict) or not isinstance(page.get("results"), list):
+                            break
+                        items[endpoint].extend(page["results"])
+                        url = page.get("next")
+                    continue
+                wanted = count if max_items is None else min(count, max_items)
+                pending.extend((endpoint, offset) for offset in range(page_limit, wanted, page_limit))
+
+            pages = executor.map(lambda job: _get(_page_url(*job)), pending)
+            for (endpoint, _offset), data in zip(pending, pages, strict=True):
+                items[endpoint].extend(_results(data))
+
+        if max_items is not None:
+            items = {endpoint: found[:max_items] for endpoint, found in items.items()}
         return items
 
     def _map_device(it):
@@ -193,18 +288,28 @@ def netbox_search(
             "type": "virtual_machine",
         }
 
+    devices_endpoint = "/api/dcim/devices/"
+    vms_endpoint = "/api/virtualization/virtual-machines/"
+    ips_endpoint = "/api/ipam/ip-addresses/"
+    endpoints = {
+        "devices": [devices_endpoint],
+        "vms": [vms_endpoint],
+        "all": [devices_endpoint, vms_endpoint, ips_endpoint],
+    }[dataset]
+
     rows: list[dict[str, Any]] = []
     try:
         max_items = None if int(limit) == 0 else int(limit)
+        collected = _collect_all(endpoints, q, max_items)
         if dataset in ("devices", "all"):
-            results = _collect("/api/dcim/devices/", q, max_items)
+            results = collected[devices_endpoint]
             for it in results:
                 d = _map_device(it)
                 if dataset == "all":
                     d["Type"] = "device"
                 rows.append(d)
         if dataset in ("vms", "all"):
-            results = _collect("/api/virtualization/virtual-machines/", q, max_items)
+            results = collected[vms_endpoint]
             for it in results:
                 v = _map_vm(it)
                 if dataset == "all":
@@ -235,7 +340,7 @@ def netbox_search(
                     "ui_path": ui_path,
                 }
 
-            ip_results = _collect("/api/ipam/ip-addresses/", q, max_items)
+            ip_results = collected[ips_endpoint]
             for it in ip_results:
                 rows.append(_map_ip(it))
     except HTTPException:
@@ -20,7 +20,7 @@ from pydantic import BaseModel, Field
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from infrastructure_atlas.db.models import PlaygroundPreset, User
+from infrastructure_atlas.db.models import PlaygroundPreset, PlaygroundSessionMessage, User
 from infrastructure_atlas.db.models import PlaygroundSession as DBSession
 from infrastructure_atlas.infrastructure.logging import get_logger
 
@@ -527,7 +527,7 @@ def list_sessions(
             {
                 "session_id": s.id,
                 "agent_id": s.agent_id,
-                "message_count": len(s.messages or []),
+                "message_count": s.message_count,
                 "total_tokens": s.total_tokens,
                 "total_cost_usd": s.total_cost_usd,
                 "created_at": s.created_at.isoformat() if s.created_at else None,
@@ -552,10 +552,16 @@ def get_session(session_id: str, request: Request) -> SessionResponse:
         if not session:
             raise HTTPException(status_code=404, detail="Session not found")
 
+        messages = db.execute(
+            select(PlaygroundSessionMessage.message)
+            .where(PlaygroundSessionMessage.session_id == session_id)
+            .order_by(PlaygroundSessionMessage.seq)
+        ).scalars().all()
+
         return SessionResponse(
             session_id=session.id,
             agent_id=session.agent_id,
-            messages=session.messages or [],
+            messages=list(messages),
             state=session.state or {},
             config_override=session.config_override or {},
             total_tokens=session.total_tokens or 0,
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import io
 from datetime import UTC, datetime
-from typing import Annotated, Any
+from typing import Annotated
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
@@ -249,16 +249,13 @@ def list_users(
 
     try:
         _, inventory, meta = service.get_inventory(config.id, refresh=refresh)
+        index = inventory.access_index()
 
         # Build user list with group access info
         users_list = []
         for username, puppet_user in inventory.users.items():
             # Get groups this user is a member of
-            user_groups = [
-                access.group_name
-                for access in inventory.user_access
-                if access.username == username
-            ]
+            user_groups = index.user_groups.get(username, [])
 
             # Apply search filter
             if search:
@@ -278,9 +275,9 @@ def list_users(
                 "has_password": puppet_user.has_password,
                 "has_ssh_key": puppet_user.has_ssh_key,
                 "enabled": puppet_user.enabled,
-                "has_sudo": username in inventory.sudo_users,
+                "has_sudo": username in index.sudo_users,
                 "groups": user_groups,
-                "is_removed": username in inventory.removed_users,
+                "is_removed": username in index.removed_users,
                 # Security details
                 "password_algorithm": puppet_user.password_algorithm,
                 "account_locked": puppet_user.account_locked,
@@ -329,6 +326,7 @@ def list_groups(
 
     try:
         _, inventory, meta = service.get_inventory(config.id, refresh=refresh)
+        index = inventory.access_index()
 
         groups_list = []
         for group_name, puppet_group in inventory.groups.items():
@@ -341,16 +339,13 @@ def list_groups(
                 ):
                     continue
 
-            # Count members with sudo
-            sudo_members = [m for m in puppet_group.members if m in inventory.sudo_users]
-
             groups_list.append({
                 "name": puppet_group.name,
                 "gid": puppet_group.gid,
                 "members": puppet_group.members,
                 "not_members": puppet_group.not_members,
                 "member_count": len(puppet_group.members),
-                "sudo_member_count": len(sudo_members),
+                "sudo_member_count": index.group_sudo_member_count.get(group_name, 0),
             })
 
         # Sort by name
@@ -399,17 +394,7 @@ def get_user_detail(
             raise HTTPException(status_code=404, detail=f"User {username} not found")
 
         puppet_user = inventory.users[username]
-
-        # Get all access entries for this user
-        user_access = [
-            {
-                "group_name": access.group_name,
-                "has_sudo": access.has_sudo,
-                "access_type": access.access_type,
-            }
-            for access in inventory.user_access
-            if access.username == username
-        ]
+        index = inventory.access_index()
 
         return {
             "username": puppet_user.username,
@@ -419,10 +404,10 @@ def get_user_detail(
             "has_password": puppet_user.has_password,
             "has_ssh_key": puppet_user.has_ssh_key,
             "enabled": puppet_user.enabled,
-            "has_sudo": username in inventory.sudo_users,
-            "is_removed": username in inventory.removed_users,
+            "has_sudo": username in index.sudo_users,
+            "is_removed": username in index.removed_users,
             "source_file": puppet_user.source_file,
-            "access": user_access,
+            "access": index.user_access.get(username, []),
             "config_id": config.id,
             "meta": _meta_to_payload(meta or {}),
         }
@@ -464,22 +449,10 @@ def get_group_detail(
 
         puppet_group = inventory.groups[group_name]
 
-        # Build member details
-        members_detail = []
-        for member in puppet_group.members:
-            member_user = inventory.users.get(member)
-            has_sudo = member in inventory.sudo_users
-            members_detail.append({
-                "username": member,
-                "has_sudo": has_sudo,
-                "enabled": member_user.enabled if member_user else False,
-                "key_name": member_user.key_name if member_user else None,
-            })
-
         return {
             "name": puppet_group.name,
             "gid": puppet_group.gid,
-            "members": members_detail,
+            "members": inventory.access_index().group_member_details.get(group_name, []),
             "not_members": puppet_group.not_members,
             "source_file": puppet_group.source_file,
             "config_id": config.id,
@@ -520,33 +493,13 @@ def get_access_matrix(
     try:
         _, inventory, meta = service.get_inventory(config.id, refresh=False)
 
-        # Build access matrix
         # Structure: { username: { group_name: { has_sudo, access_type } } }
-        matrix: dict[str, dict[str, Any]] = {}
-
-        for access in inventory.user_access:
-            if access.username not in matrix:
-                user_obj = inventory.users.get(access.username)
-                matrix[access.username] = {
-                    "_user": {
-                        "enabled": user_obj.enabled if user_obj else False,
-                        "has_sudo_any": access.username in inventory.sudo_users,
-                        "key_name": user_obj.key_name if user_obj else None,
-                    }
-                }
-            matrix[access.username][access.group_name] = {
-                "has_sudo": access.has_sudo,
-                "access_type": access.access_type,
-            }
-
-        # Get sorted lists
-        all_users = sorted(matrix.keys(), key=str.lower)
-        all_groups = sorted(inventory.groups.keys(), key=str.lower)
+        index = inventory.access_index()
 
         return {
-            "users": all_users,
-            "groups": all_groups,
-            "matrix": matrix,
+            "users": index.matrix_users,
+            "groups": index.group_names,
+            "matrix": index.matrix,
             "config_id": config.id,
             "meta": _meta_to_payload(meta or {}),
         }
@@ -590,6 +543,8 @@ def export_puppet_data(
     except GitClientError as exc:
         raise HTTPException(status_code=502, detail=f"Git error: {exc}") from exc
 
+    index = inventory.access_index()
+
     # Create workbook
     wb = Workbook()
 
@@ -641,11 +596,7 @@ def export_puppet_data(
             status = "Active"
 
         # Get groups
-        user_groups = [
-            access.group_name
-            for access in inventory.user_access
-            if access.username == username
-        ]
+        user_groups = index.user_groups.get(username, [])
 
         # Security notes
         notes = []
@@ -727,8 +678,8 @@ def export_puppet_data(
     # ===== Sheet 3: Access Matrix =====
     ws_matrix = wb.create_sheet("Access Matrix")
 
-    all_groups = sorted(inventory.groups.keys(), key=str.lower)
-    all_usernames = sorted(inventory.users.keys(), key=str.lower)
+    all_groups = index.group_names
+    all_usernames = index.usernames
 
     # Build matrix data
     matrix_headers = ["Username", "Sudo Access"] + all_groups
@@ -739,15 +690,9 @@ def export_puppet_data(
         cell.alignment = header_alignment
         cell.border = thin_border
 
-    # Build user->group membership lookup
-    user_group_map: dict[str, set[str]] = {u: set() for u in all_usernames}
-    for access in inventory.user_access:
-        if access.username in user_group_map:
-            user_group_map[access.username].add(access.group_name)
-
     for row_idx, username in enumerate(all_usernames, 2):
         has_sudo = username in inventory.sudo_users
-        user_groups = user_group_map.get(username, set())
+        user_groups = index.matrix.get(username, {})
 
         # Username cell
         cell = ws_matrix.cell(row=row_idx, column=1, value=username)
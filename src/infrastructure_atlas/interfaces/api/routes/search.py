@@ -10,6 +10,11 @@ from fastapi import APIRouter, HTTPException, Query, Request
 
 from infrastructure_atlas.application.services import create_vcenter_service
 from infrastructure_atlas.infrastructure.external import ZabbixClient
+from infrastructure_atlas.infrastructure.host_identity import (
+    HostRecordRef,
+    get_host_identity_index,
+    zabbix_host_refs,
+)
 
 from .confluence import confluence_search
 from .jira import jira_search
@@ -17,6 +22,9 @@ from .netbox import netbox_search
 
 router = APIRouter(prefix="/search", tags=["search"])
 
+# Zabbix has no local cache, so its identity partition is reloaded in the background at most this often
+ZABBIX_IDENTITY_MAX_AGE_SECONDS = 300.0
+
 
 # Helper functions
 
@@ -145,6 +153,19 @@ def _zbx_rpc(method: str, params: dict[str, Any], client: ZabbixClient | None =
     return result
 
 
+def _zabbix_identity_refs(client: ZabbixClient) -> list[HostRecordRef]:
+    """Load every Zabbix host with the identifiers needed by the identity index."""
+    hosts = client.rpc(
+        "host.get",
+        {
+            "output": ["hostid", "host", "name"],
+            "selectInterfaces": ["ip", "dns"],
+            "selectInventory": ["macaddress_a", "macaddress_b", "serialno_a", "serialno_b"],
+        },
+    )
+    return zabbix_host_refs(hosts or [])
+
+
 # API Routes
 
 
@@ -241,7 +262,14 @@ def search_aggregate(
     # Zabbix: active (problems) and historical (events)
     try:
         client = _zabbix_client()
-        hostids: list[int] = []
+        index = get_host_identity_index()
+        index.refresh_in_background(
+            "zabbix",
+            lambda: _zabbix_identity_refs(client),
+            max_age_seconds=ZABBIX_IDENTITY_MAX_AGE_SECONDS,
+        )
+        # Exact hostname/IP/MAC/serial hits from the identity index, merged with the fuzzy matches below
+        hostids: list[int] = [int(ref.record_id) for ref in index.lookup(q, source="zabbix") if ref.record_id.isdigit()]
         try:
             # Fuzzy host search on both 'name' and 'host', allow partial matches and wildcards
             patt = f"*{q}*"
@@ -278,10 +306,10 @@ def search_aggregate(
                             pass
                 except Exception:
                     pass
-            # Deduplicate
-            hostids = sorted({i for i in hostids if isinstance(i, int)})
         except Exception:
-            hostids = []
+            pass
+        # Deduplicate
+        hostids = sorted({i for i in hostids if isinstance(i, int)})
         zbx = {"active": [], "historical": []}
         base_web = client.web_base or _zbx_web_base() or ""
         # Active problems (prefer hostids; fallback to name search)
@@ -452,10 +480,9 @@ def search_aggregate(
 
     # Commvault: jobs matching client_name or subclient_name (last 24h by default, or just recent list)
     try:
-        from infrastructure_atlas.interfaces.api.routes.commvault import _load_commvault_backups
+        from infrastructure_atlas.interfaces.api.routes.commvault import _cached_commvault_clients
 
-        backups_data = _load_commvault_backups()
-        jobs = backups_data.get("jobs", [])
+        _, jobs, _ = _cached_commvault_clients()
         
         cv_matches = []
         ql = q.lower().strip()
@@ -495,4 +522,7 @@ def search_aggregate(
     except Exception as ex:
         out["commvault"] = {"error": str(ex)}
 
+    # Identity: exact hostname/IP/MAC/serial matches across every indexed source
+    out["identity"] = [ref.to_dict() for ref in get_host_identity_index().lookup(q)]
+
     return out
@@ -2,19 +2,15 @@
 
 from __future__ import annotations
 
-import asyncio
-import shlex
 import time
 from contextlib import contextmanager
-from datetime import UTC, datetime
 from typing import Any
 
 from fastapi import APIRouter, HTTPException, Request
 
-from infrastructure_atlas.env import project_root
 from infrastructure_atlas.infrastructure.logging import get_logger, logging_context
+from infrastructure_atlas.interfaces.shared.refresh import get_refresh_executor
 from infrastructure_atlas.interfaces.shared.tasks import (
-    _append_task_output,
     _build_dataset_command,
     _build_dataset_metadata,
     _collect_task_dataset_definitions,
@@ -76,11 +72,6 @@ def require_permission(request: Request, permission: str) -> None:
         raise HTTPException(status_code=403, detail="Forbidden: missing permission")
 
 
-def _write_log(msg: str) -> None:
-    """Write to log (for task output)."""
-    logger.info(msg)
-
-
 # API Routes
 
 
@@ -100,7 +91,11 @@ def list_task_datasets(request: Request) -> dict[str, Any]:
 
 @router.post("/datasets/{dataset_id}/refresh")
 async def refresh_task_dataset(dataset_id: str, request: Request) -> dict[str, Any]:
-    """Refresh a specific dataset by running its command."""
+    """Refresh a specific dataset and wait for the refresh to finish.
+
+    Refreshes run in-process unless ``ATLAS_TASKS_REFRESH_MODE=subprocess``.
+    A request for a dataset that is already refreshing joins the running job.
+    """
     require_permission(request, "export.run")
     definitions = {definition.id: definition for definition in _collect_task_dataset_definitions()}
     definition = definitions.get(dataset_id)
@@ -109,84 +104,64 @@ async def refresh_task_dataset(dataset_id: str, request: Request) -> dict[str, A
 
     meta_before = _build_dataset_metadata(definition)
     command = _build_dataset_command(definition, meta_before)
-    if not command:
+    if not command and definition.refresher is None:
         raise HTTPException(status_code=400, detail="Dataset cannot be refreshed automatically")
     before_snapshot = _serialize_dataset(definition, meta_before, command)
 
     actor = getattr(request.state, "user", None)
     actor_name = getattr(actor, "username", None)
-    command_display = shlex.join(command)
-    started_at = datetime.now(UTC)
-    output_lines: list[str] = []
+    executor = get_refresh_executor()
+    try:
+        job = executor.submit(definition, command)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
 
     with task_logging(
         "tasks.refresh",
         dataset=dataset_id,
-        command=command_display,
+        mode=job.mode,
+        command=job.command_display,
         actor=actor_name,
     ) as task_log:
-        start_line = f"$ {command_display}"
-        _append_task_output(output_lines, start_line)
-        _write_log(start_line)
-        proc = await asyncio.create_subprocess_exec(
-            *command,
-            cwd=str(project_root()),
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.STDOUT,
-        )
-        rc = 0
-        try:
-            if proc.stdout is None:
-                raise RuntimeError("task runner missing stdout pipe")
-            while True:
-                chunk = await proc.stdout.readline()
-                if not chunk:
-                    break
-                try:
-                    text = chunk.decode(errors="ignore").rstrip("\n")
-                except Exception:
-                    text = str(chunk)
-                _append_task_output(output_lines, text)
-                _write_log(text)
-        finally:
-            rc = await proc.wait()
-            exit_line = f"[exit {rc}]"
-            _append_task_output(output_lines, exit_line)
-            _write_log(exit_line)
-            task_log.add_success(return_code=rc)
-            if rc != 0:
-                logger.warning(
-                    "Dataset refresh finished with non-zero exit code",
-                    extra={
-                        "event": "task_warning",
-                        "return_code": rc,
-                        "dataset_id": dataset_id,
-                        "shell_command": command_display,
-                    },
-                )
-
-    completed_at = datetime.now(UTC)
-    duration_ms = int((completed_at - started_at).total_seconds() * 1000)
-    success = rc == 0
+        await job.wait()
+        task_log.add_success(return_code=job.return_code, status=job.status)
+        if not job.success:
+            logger.warning(
+                "Dataset refresh did not succeed",
+                extra={
+                    "event": "task_warning",
+                    "status": job.status,
+                    "return_code": job.return_code,
+                    "dataset_id": dataset_id,
+                    "shell_command": job.command_display,
+                },
+            )
 
     meta_after = _build_dataset_metadata(definition)
     command_after = _build_dataset_command(definition, meta_after)
     after_snapshot = _serialize_dataset(definition, meta_after, command_after)
 
-    return {
-        "dataset": dataset_id,
-        "label": definition.label,
-        "success": success,
-        "return_code": rc,
-        "command": command,
-        "command_display": command_display,
-        "output": output_lines,
-        "started_at": started_at.isoformat(),
-        "completed_at": completed_at.isoformat(),
-        "duration_ms": duration_ms,
-        "before": before_snapshot,
-        "after": after_snapshot,
-    }
+    payload = job.to_dict()
+    payload.update(before=before_snapshot, after=after_snapshot)
+    return payload
+
+
+@router.get("/datasets/{dataset_id}/refresh")
+def get_task_dataset_refresh(dataset_id: str, request: Request) -> dict[str, Any]:
+    """Return status and progress output of the current or last refresh of a dataset."""
+    require_permission(request, "export.run")
+    job = get_refresh_executor().get_job(dataset_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="No refresh has run for this dataset")
+    return job.to_dict()
+
+
+@router.post("/datasets/{dataset_id}/refresh/cancel")
+def cancel_task_dataset_refresh(dataset_id: str, request: Request) -> dict[str, Any]:
+    """Cancel a queued or running refresh of a dataset."""
+    require_permission(request, "export.run")
+    cancelled = get_refresh_executor().cancel(dataset_id)
+    return {"dataset": dataset_id, "cancelled": cancelled}
 
 
 __all__ = ["router"]
@@ -15,6 +15,8 @@ from rich import print
 from rich.console import Console
 from rich.table import Table
 
+from infrastructure_atlas.infrastructure.cache_metadata import write_json_cache
+
 # Lazy imports from api.app to avoid circular import (cli -> api.app -> bootstrap_api -> chat -> api.app)
 
 
@@ -1196,12 +1198,13 @@ def _data_dir() -> Path:
 
 
 def _write_json_cache(filename: str, payload: dict[str, Any]) -> Path:
-    """Write JSON cache file atomically."""
+    """Write JSON cache file atomically, together with its metadata sidecar."""
     path = _data_dir() / filename
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    with tmp.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2)
-    tmp.replace(path)
+    write_json_cache(
+        path,
+        payload,
+        {"generated_at": payload.get("generated_at"), "total_cached": payload.get("total_cached")},
+    )
     return path
 
 
@@ -19,3 +19,13 @@ def db_init(echo: bool = typer.Option(False, "--echo", help="Echo SQL while runn
         os.environ["SQLALCHEMY_ECHO"] = "1"
     init_database()
     print("[green]Database initialised[/green]")
+
+
+@app.command("rebuild-usage-rollups")
+def db_rebuild_usage_rollups():
+    """Backfill the AI usage dashboard rollups from the raw activity logs."""
+    from infrastructure_atlas.ai.usage_service import create_usage_service
+
+    service = create_usage_service()
+    processed = service.rebuild_usage_rollups()
+    print(f"[green]Rolled up {processed} AI activity log entries[/green]")
@@ -212,6 +212,9 @@ def refresh_inventory(
                     print(f"[green]✓[/green] Refreshed {host_count} hosts (cached at {generated_at})")
                 else:
                     print(f"[green]✓[/green] Refreshed {host_count} hosts")
+                enrichment = meta.get("enrichment") or {}
+                for error in enrichment.get("errors") or []:
+                    print(f"[yellow]![/yellow] Enrichment skipped: {error}")
             except (ForemanAuthError, ForemanClientError) as exc:
                 print(f"[red]✗[/red] API error: {exc}")
                 raise typer.Exit(1)
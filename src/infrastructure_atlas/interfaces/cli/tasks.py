@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import shlex
 import subprocess
 from time import monotonic
@@ -11,8 +12,17 @@ from rich import print as _print
 from rich.console import Console
 from rich.table import Table
 
+from infrastructure_atlas.db.setup import init_database
 from infrastructure_atlas.env import load_env, project_root
+from infrastructure_atlas.interfaces.shared.refresh import (
+    MODE_INPROCESS,
+    MODE_SUBPROCESS,
+    RefreshJob,
+    get_refresh_executor,
+    refresh_mode,
+)
 from infrastructure_atlas.interfaces.shared.tasks import (
+    DatasetDefinition,
     _build_dataset_command,
     _build_dataset_metadata,
     _collect_task_dataset_definitions,
@@ -22,6 +32,22 @@ app = typer.Typer(help="Dataset cache tasks", context_settings={"help_option_nam
 console = Console()
 
 
+async def _refresh_in_process(targets: list[tuple[DatasetDefinition, list[str] | None]]) -> list[RefreshJob]:
+    """Refresh datasets through the shared executor, printing each result as it finishes."""
+    executor = get_refresh_executor()
+    jobs = [executor.submit(definition, command, mode=MODE_INPROCESS) for definition, command in targets]
+    for finished in asyncio.as_completed([job.wait() for job in jobs]):
+        job = await finished
+        duration = (job.duration_ms or 0) / 1000
+        if job.success:
+            _print(f"[green]Completed[/green] {job.dataset_id} in {duration:.1f}s")
+        else:
+            _print(f"[red]Failed[/red] {job.dataset_id} ({job.status}) after {duration:.1f}s")
+        for line in job.output:
+            console.print(f"  {line}", style="dim", markup=False, highlight=False)
+    return jobs
+
+
 @app.command("refresh")
 def tasks_refresh(
     dataset_ids: list[str] | None = typer.Argument(
@@ -31,9 +57,19 @@ def tasks_refresh(
     ),
     list_only: bool = typer.Option(False, "--list", help="List available datasets."),
     dry_run: bool = typer.Option(False, "--dry-run", help="Show commands without executing them."),
+    use_subprocess: bool = typer.Option(
+        False,
+        "--subprocess",
+        help="Run each refresh as a separate atlas CLI process (also ATLAS_TASKS_REFRESH_MODE=subprocess).",
+    ),
 ):
-    """Refresh cached datasets used by the Tasks dashboard."""
+    """Refresh cached datasets used by the Tasks dashboard.
+
+    Datasets refresh in-process, a few at a time; ``--subprocess`` runs their
+    CLI commands one after another instead.
+    """
     load_env()
+    mode = MODE_SUBPROCESS if use_subprocess else refresh_mode()
 
     definitions = _collect_task_dataset_definitions()
     if not definitions:
@@ -81,10 +117,18 @@ def tasks_refresh(
 
     failures = 0
     ran_any = False
+    in_process: list[tuple[DatasetDefinition, list[str] | None]] = []
     for definition in targets:
         meta = _build_dataset_metadata(definition)
         command = _build_dataset_command(definition, meta)
         label = definition.label or definition.id
+        if mode == MODE_INPROCESS and definition.refresher is not None:
+            if dry_run:
+                _print(f"[cyan]{definition.id}[/cyan] in-process refresh")
+                ran_any = True
+            else:
+                in_process.append((definition, command))
+            continue
         if not command:
             _print(f"[yellow]Skipping[/yellow] {label} ({definition.id}) — no command configured.")
             continue
@@ -104,6 +148,15 @@ def tasks_refresh(
             ran_any = True
             _print(f"[green]Completed[/green] in {duration:.1f}s")
 
+    if in_process:
+        init_database()
+        _print(f"[cyan]Refreshing[/cyan] {', '.join(definition.id for definition, _ in in_process)} in-process…")
+        for job in asyncio.run(_refresh_in_process(in_process)):
+            if job.success:
+                ran_any = True
+            else:
+                failures += 1
+
     if not ran_any:
         _print("[yellow]No commands were executed.[/yellow]")
     if failures and not dry_run:
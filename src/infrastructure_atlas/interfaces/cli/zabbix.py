@@ -9,13 +9,11 @@ from datetime import UTC, datetime
 from typing import Any
 
 import typer
-from fastapi import HTTPException
 from rich import print
 from rich.console import Console
 from rich.table import Table
 from zoneinfo import ZoneInfo
 
-from infrastructure_atlas.api.app import zabbix_problems as zabbix_problems_api
 from infrastructure_atlas.env import load_env
 from infrastructure_atlas.infrastructure.modules import get_module_registry
 
@@ -179,6 +177,11 @@ def zabbix_dashboard_cli(
 
     include_subgroups_flag = 1 if include_subgroups and gid_value_opt else 0
 
+    # Imported on use: the API routes are only needed by this command
+    from fastapi import HTTPException
+
+    from infrastructure_atlas.interfaces.api.routes.zabbix import zabbix_problems as zabbix_problems_api
+
     try:
         payload = zabbix_problems_api(
             severities=sev_value,
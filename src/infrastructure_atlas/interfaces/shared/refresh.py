@@ -0,0 +1,321 @@
+"""Dataset refresh executor shared by the Tasks API and CLI.
+
+Refreshes run in-process by default: each dataset's ``refresher`` calls the
+application services directly (``VCenterService.refresh_inventory``,
+``ForemanService.refresh_inventory``, the Commvault cache refreshes) in a
+worker thread. This skips interpreter start-up and CLI imports, and the
+refreshed data lands in the caches and indexes of the running process.
+
+The previous behaviour, spawning ``uv run atlas ...`` for each refresh, stays
+available with ``ATLAS_TASKS_REFRESH_MODE=subprocess`` and is used for
+datasets that only define a command.
+
+The executor
+
+- runs at most ``ATLAS_TASKS_MAX_CONCURRENT`` refreshes at a time (default 2),
+- runs one refresh per dataset at a time; a second request for a dataset that
+  is already queued or running joins the existing job,
+- collects progress lines on the :class:`RefreshJob`, which can be polled
+  while the refresh runs,
+- cancels queued jobs immediately, terminates subprocesses, and stops
+  in-process refreshes at their next step boundary.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import shlex
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from infrastructure_atlas.env import project_root
+from infrastructure_atlas.infrastructure.logging import get_logger
+from infrastructure_atlas.interfaces.shared.tasks import _append_task_output
+
+if TYPE_CHECKING:
+    from infrastructure_atlas.interfaces.shared.tasks import DatasetDefinition
+
+logger = get_logger(__name__)
+
+REFRESH_MODE_ENV = "ATLAS_TASKS_REFRESH_MODE"
+MAX_CONCURRENT_ENV = "ATLAS_TASKS_MAX_CONCURRENT"
+
+MODE_INPROCESS = "inprocess"
+MODE_SUBPROCESS = "subprocess"
+
+DEFAULT_MAX_CONCURRENT = 2
+
+
+class RefreshCancelled(Exception):
+    """Raised inside a refresher when its job was cancelled."""
+
+
+def refresh_mode() -> str:
+    """Return the configured refresh mode (``inprocess`` or ``subprocess``)."""
+    raw = (os.getenv(REFRESH_MODE_ENV) or MODE_INPROCESS).strip().lower()
+    if raw not in (MODE_INPROCESS, MODE_SUBPROCESS):
+        logger.warning(f"Unknown {REFRESH_MODE_ENV} value '{raw}', refreshing in-process")
+        return MODE_INPROCESS
+    return raw
+
+
+def _max_concurrent_from_env() -> int:
+    try:
+        return max(1, int(os.getenv(MAX_CONCURRENT_ENV, str(DEFAULT_MAX_CONCURRENT))))
+    except ValueError:
+        return DEFAULT_MAX_CONCURRENT
+
+
+@dataclass(slots=True, eq=False)
+class RefreshJob:
+    """One refresh of a dataset, from queueing to completion."""
+
+    dataset_id: str
+    label: str
+    mode: str
+    command: list[str] | None = None
+    status: str = "queued"
+    output: list[str] = field(default_factory=list)
+    queued_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    started_at: datetime | None = None
+    completed_at: datetime | None = None
+    return_code: int | None = None
+    error: str | None = None
+    _cancel: threading.Event = field(default_factory=threading.Event, repr=False)
+    _output_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _process: asyncio.subprocess.Process | None = field(default=None, repr=False)
+    _task: asyncio.Task[None] | None = field(default=None, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("succeeded", "failed", "cancelled")
+
+    @property
+    def success(self) -> bool:
+        return self.status == "succeeded"
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel.is_set()
+
+    @property
+    def command_display(self) -> str | None:
+        return shlex.join(self.command) if self.command else None
+
+    @property
+    def duration_ms(self) -> int | None:
+        if self.started_at is None:
+            return None
+        end = self.completed_at or datetime.now(UTC)
+        return int((end - self.started_at).total_seconds() * 1000)
+
+    def report(self, line: str) -> None:
+        """Record a progress line; safe to call from the refresher thread."""
+        with self._output_lock:
+            _append_task_output(self.output, line)
+        logger.info(line)
+
+    def raise_if_cancelled(self) -> None:
+        """Stop an in-process refresher at a step boundary once cancelled."""
+        if self._cancel.is_set():
+            raise RefreshCancelled(self.dataset_id)
+
+    async def wait(self) -> RefreshJob:
+        """Wait for the job to finish; the refresh keeps running if the waiter is cancelled."""
+        if self._task is not None:
+            await asyncio.shield(self._task)
+        return self
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._output_lock:
+            output = list(self.output)
+        return {
+            "dataset": self.dataset_id,
+            "label": self.label,
+            "mode": self.mode,
+            "status": self.status,
+            "success": self.success,
+            "return_code": self.return_code,
+            "error": self.error,
+            "command": self.command,
+            "command_display": self.command_display,
+            "output": output,
+            "queued_at": self.queued_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "duration_ms": self.duration_ms,
+        }
+
+
+class DatasetRefreshExecutor:
+    """Runs dataset refreshes with bounded concurrency, one job per dataset."""
+
+    def __init__(self, max_concurrent: int | None = None):
+        self.max_concurrent = max_concurrent or _max_concurrent_from_env()
+        self._jobs: dict[str, RefreshJob] = {}
+        self._slots: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_concurrent)
+            self._loop = loop
+        return self._slots
+
+    def get_job(self, dataset_id: str) -> RefreshJob | None:
+        """Return the current or most recent job of a dataset."""
+        return self._jobs.get(dataset_id)
+
+    def active_jobs(self) -> list[RefreshJob]:
+        return [job for job in self._jobs.values() if not job.done]
+
+    def submit(
+        self,
+        definition: DatasetDefinition,
+        command: list[str] | None = None,
+        *,
+        mode: str | None = None,
+    ) -> RefreshJob:
+        """Queue a refresh, or return the job already queued or running for the dataset.
+
+        Args:
+            definition: Dataset to refresh
+            command: CLI command used in subprocess mode
+            mode: ``inprocess`` or ``subprocess``; defaults to ``refresh_mode()``
+
+        Raises:
+            ValueError: If the dataset can be refreshed in neither mode
+        """
+        current = self._jobs.get(definition.id)
+        if current is not None and not current.done:
+            return current
+
+        mode = mode or refresh_mode()
+        if mode == MODE_INPROCESS and definition.refresher is None:
+            mode = MODE_SUBPROCESS
+        if mode == MODE_SUBPROCESS and not command:
+            raise ValueError(f"Dataset {definition.id} cannot be refreshed automatically")
+
+        job = RefreshJob(dataset_id=definition.id, label=definition.label, mode=mode, command=command)
+        self._jobs[definition.id] = job
+        job._task = asyncio.get_running_loop().create_task(self._execute(job, definition))
+        return job
+
+    async def run(
+        self,
+        definition: DatasetDefinition,
+        command: list[str] | None = None,
+        *,
+        mode: str | None = None,
+    ) -> RefreshJob:
+        """Submit a refresh and wait for it to finish."""
+        return await self.submit(definition, command, mode=mode).wait()
+
+    def cancel(self, dataset_id: str) -> bool:
+        """Cancel the queued or running job of a dataset.
+
+        Returns:
+            True if there was an unfinished job to cancel
+        """
+        job = self._jobs.get(dataset_id)
+        if job is None or job.done:
+            return False
+        job._cancel.set()
+        if job._process is not None and job._process.returncode is None:
+            job._process.terminate()
+        return True
+
+    async def _execute(self, job: RefreshJob, definition: DatasetDefinition) -> None:
+        async with self._semaphore():
+            if job.cancel_requested:
+                self._finish(job, "cancelled")
+                return
+            job.status = "running"
+            job.started_at = datetime.now(UTC)
+            try:
+                if job.mode == MODE_SUBPROCESS:
+                    await self._run_subprocess(job)
+                else:
+                    await self._run_inprocess(job, definition)
+            except Exception as exc:  # Refresher bugs must not leave the job running forever
+                logger.exception(f"Dataset refresh {job.dataset_id} crashed")
+                job.error = str(exc)
+                self._finish(job, "failed", return_code=1)
+
+    async def _run_inprocess(self, job: RefreshJob, definition: DatasetDefinition) -> None:
+        if definition.refresher is None:
+            raise RuntimeError(f"Dataset {job.dataset_id} has no in-process refresher")
+        start = time.perf_counter()
+        job.report(f"Refreshing {job.label} in-process")
+        try:
+            await asyncio.to_thread(definition.refresher, definition, job)
+        except RefreshCancelled:
+            job.report("[cancelled]")
+            self._finish(job, "cancelled", return_code=1)
+            return
+        except Exception as exc:
+            detail = getattr(exc, "detail", None) or str(exc) or type(exc).__name__
+            job.error = str(detail)
+            job.report(f"[failed] {detail}")
+            self._finish(job, "failed", return_code=1)
+            return
+        job.report(f"[completed in {time.perf_counter() - start:.1f}s]")
+        self._finish(job, "succeeded", return_code=0)
+
+    async def _run_subprocess(self, job: RefreshJob) -> None:
+        if not job.command:
+            raise RuntimeError(f"Dataset {job.dataset_id} has no refresh command")
+        job.report(f"$ {job.command_display}")
+        proc = await asyncio.create_subprocess_exec(
+            *job.command,
+            cwd=str(project_root()),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+        job._process = proc
+        rc = 1
+        try:
+            if proc.stdout is None:
+                raise RuntimeError("task runner missing stdout pipe")
+            while True:
+                chunk = await proc.stdout.readline()
+                if not chunk:
+                    break
+                job.report(chunk.decode(errors="ignore").rstrip("\n"))
+        finally:
+            rc = await proc.wait()
+            job._process = None
+            job.report(f"[exit {rc}]")
+        if job.cancel_requested:
+            self._finish(job, "cancelled", return_code=rc)
+        else:
+            self._finish(job, "succeeded" if rc == 0 else "failed", return_code=rc)
+
+    @staticmethod
+    def _finish(job: RefreshJob, status: str, *, return_code: int | None = None) -> None:
+        job.status = status
+        job.return_code = return_code
+        job.completed_at = datetime.now(UTC)
+
+
+@lru_cache(maxsize=1)
+def get_refresh_executor() -> DatasetRefreshExecutor:
+    """Return the process-wide dataset refresh executor."""
+    return DatasetRefreshExecutor()
+
+
+__all__ = [
+    "MODE_INPROCESS",
+    "MODE_SUBPROCESS",
+    "DatasetRefreshExecutor",
+    "RefreshCancelled",
+    "RefreshJob",
+    "get_refresh_executor",
+    "refresh_mode",
+]
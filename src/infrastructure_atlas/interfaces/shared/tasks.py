@@ -10,15 +10,21 @@ from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from infrastructure_atlas.application.services import create_foreman_service, create_vcenter_service
 from infrastructure_atlas.db import get_sessionmaker
 from infrastructure_atlas.env import project_root
+from infrastructure_atlas.infrastructure.cache_metadata import load_cache_status
+
+if TYPE_CHECKING:
+    from infrastructure_atlas.interfaces.shared.refresh import RefreshJob
 
 # Type aliases
 CommandBuilder = Callable[["DatasetDefinition", "DatasetMetadata"], list[str] | None]
 MetadataBuilder = Callable[["DatasetDefinition"], "DatasetMetadata"]
+# In-process refresh; runs in a worker thread and reports progress on the job
+Refresher = Callable[["DatasetDefinition", "RefreshJob"], None]
 
 # Constants
 TASK_OUTPUT_LINE_LIMIT = 500
@@ -41,6 +47,7 @@ class DatasetDefinition:
     context: dict[str, Any] = field(default_factory=dict)
     command_builder: CommandBuilder | None = None
     metadata_builder: MetadataBuilder | None = None
+    refresher: Refresher | None = None
 
 
 @dataclass(slots=True)
@@ -111,11 +118,35 @@ def _make_vcenter_command_builder(config_id: str) -> CommandBuilder:
     return _builder
 
 
-def _build_commvault_metadata(defn: DatasetDefinition) -> DatasetMetadata:
-    """Build metadata for Commvault dataset, reading generated_at from JSON."""
+def _make_vcenter_refresher(config_id: str) -> Refresher:
+    """Create an in-process refresher for a vCenter inventory."""
+
+    def _refresh(_: DatasetDefinition, job: RefreshJob) -> None:
+        job.raise_if_cancelled()
+        with SessionLocal() as session:
+            service = create_vcenter_service(session)
+            _, vms, meta = service.refresh_inventory(config_id)
+        job.report(f"Cached {len(vms)} VMs (generated at {meta.get('generated_at')})")
+
+    return _refresh
+
+
+def _load_commvault_summary(path: Path) -> dict[str, Any] | None:
+    """Fully load a Commvault cache file; only used to backfill a missing sidecar."""
     import json
-    from datetime import datetime
 
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception:
+        return None
+    if not isinstance(data, dict):
+        return None
+    return {"generated_at": data.get("generated_at"), "total_cached": data.get("total_cached")}
+
+
+def _build_commvault_metadata(defn: DatasetDefinition) -> DatasetMetadata:
+    """Build metadata for Commvault dataset, reading generated_at from the cache sidecar."""
     base = _data_dir()
     files: list[DatasetFileRecord] = []
     last_updated: datetime | None = None
@@ -128,16 +159,14 @@ def _build_commvault_metadata(defn: DatasetDefinition) -> DatasetMetadata:
         path = base / pattern_norm
         files.append(_dataset_file_record(base, path))
 
-    # Read generated_at from the backups JSON (primary cache file)
+    # Read generated_at from the backups cache (primary cache file) metadata
     backups_path = base / "commvault_backups.json"
-    if backups_path.exists():
+    summary = load_cache_status(backups_path, lambda: _load_commvault_summary(backups_path))
+    generated_at_str = (summary or {}).get("generated_at")
+    if isinstance(generated_at_str, str) and generated_at_str:
         try:
-            with backups_path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-                generated_at_str = data.get("generated_at")
-                if generated_at_str:
-                    last_updated = datetime.fromisoformat(generated_at_str.replace("Z", "+00:00"))
-        except Exception:
+            last_updated = datetime.fromisoformat(generated_at_str.replace("Z", "+00:00"))
+        except ValueError:
             pass
 
     # Fallback to file modification time if no generated_at
@@ -154,6 +183,31 @@ def _build_commvault_command(defn: DatasetDefinition, meta: DatasetMetadata) ->
     return _command_with_uv(["commvault", "refresh"])
 
 
+def _refresh_commvault(_: DatasetDefinition, job: RefreshJob) -> None:
+    """Refresh all Commvault caches in-process, with the ``atlas commvault refresh`` defaults."""
+    from infrastructure_atlas.interfaces.api.routes import commvault as commvault_routes
+
+    steps: tuple[tuple[str, Callable[[], dict[str, Any]]], ...] = (
+        ("backups", lambda: commvault_routes._refresh_commvault_backups_sync(limit=5000, since_hours=168)),
+        ("plans", commvault_routes._refresh_commvault_plans_sync),
+        ("storage", commvault_routes._refresh_commvault_storage_sync),
+    )
+    failed: list[str] = []
+    for name, refresh in steps:
+        job.raise_if_cancelled()
+        job.report(f"Refreshing {name} cache...")
+        try:
+            payload = refresh()
+        except Exception as exc:
+            # Routes raise HTTPException; surface its detail rather than the status code
+            job.report(f"✗ {name.capitalize()} refresh failed: {getattr(exc, 'detail', None) or exc}")
+            failed.append(name)
+            continue
+        job.report(f"✓ {name.capitalize()}: {payload.get('total_cached', 0)} records cached")
+    if failed:
+        raise RuntimeError(f"Commvault refresh failed for: {', '.join(failed)}")
+
+
 def _collect_task_dataset_definitions() -> list[DatasetDefinition]:
     """Collect all dataset task definitions."""
     definitions: list[DatasetDefinition] = [
@@ -164,6 +218,7 @@ def _collect_task_dataset_definitions() -> list[DatasetDefinition]:
             description="Cached Commvault data (backups, plans, and storage pools).",
             command_builder=_build_commvault_command,
             metadata_builder=_build_commvault_metadata,
+            refresher=_refresh_commvault,
         ),
     ]
     definitions.extend(_discover_vcenter_task_definitions())
@@ -195,6 +250,7 @@ def _discover_vcenter_task_definitions() -> list[DatasetDefinition]:
                     "config_name": config.name,
                 },
                 command_builder=_make_vcenter_command_builder(config.id),
+                refresher=_make_vcenter_refresher(config.id),
             )
         )
         known_configs[config.id] = config.name
@@ -218,6 +274,7 @@ def _discover_vcenter_task_definitions() -> list[DatasetDefinition]:
                         "orphan": True,
                     },
                     command_builder=_make_vcenter_command_builder(config_id),
+                    refresher=_make_vcenter_refresher(config_id),
                 )
             )
     return definitions
@@ -232,6 +289,19 @@ def _make_foreman_command_builder(config_id: str) -> CommandBuilder:
     return _builder
 
 
+def _make_foreman_refresher(config_id: str) -> Refresher:
+    """Create an in-process refresher for a Foreman hosts inventory."""
+
+    def _refresh(_: DatasetDefinition, job: RefreshJob) -> None:
+        job.raise_if_cancelled()
+        with SessionLocal() as session:
+            service = create_foreman_service(session)
+            _, hosts, meta = service.refresh_inventory(config_id)
+        job.report(f"Cached {len(hosts)} hosts (generated at {meta.get('generated_at')})")
+
+    return _refresh
+
+
 def _discover_foreman_task_definitions() -> list[DatasetDefinition]:
     """Discover Foreman dataset tasks from database and filesystem."""
     definitions: list[DatasetDefinition] = []
@@ -256,6 +326,7 @@ def _discover_foreman_task_definitions() -> list[DatasetDefinition]:
                     "config_name": config.name,
                 },
                 command_builder=_make_foreman_command_builder(config.id),
+                refresher=_make_foreman_refresher(config.id),
             )
         )
         known_configs[config.id] = config.name
@@ -279,6 +350,7 @@ def _discover_foreman_task_definitions() -> list[DatasetDefinition]:
                         "orphan": True,
                     },
                     command_builder=_make_foreman_command_builder(config_id),
+                    refresher=_make_foreman_refresher(config_id),
                 )
             )
     return definitions
@@ -348,7 +420,12 @@ def _build_vcenter_metadata_mongodb(defn: DatasetDefinition) -> DatasetMetadata:
                 definition=defn,
                 files=files,
                 last_updated=last_updated,
-                extras={"vm_count": vm_count, "source": "mongodb"},
+                extras={
+                    "vm_count": vm_count,
+                    "source": "mongodb",
+                    "size_bytes": meta.get("size_bytes"),
+                    "sha256": meta.get("sha256"),
+                },
             )
     except Exception:
         pass
@@ -16,6 +16,7 @@ from infrastructure_atlas.infrastructure.external.netbox_client import (
     NetboxClient,
     NetboxClientConfig,
 )
+from infrastructure_atlas.infrastructure.host_identity import get_host_identity_index
 from infrastructure_atlas.infrastructure.logging import get_logger
 from infrastructure_atlas.skills.base import BaseSkill
 
@@ -218,9 +219,12 @@ class NetBoxSkill(BaseSkill):
             client = self._get_client()
             all_devices = client.list_devices()
 
-            # Filter by pattern (case-insensitive)
+            # Exact hostname/IP/serial hits first, then regex matches on the name
+            matches = [ref.record for ref in get_host_identity_index().lookup(pattern, source="netbox", kind="device")]
+            seen = {d.id for d in matches}
             regex = re.compile(pattern, re.IGNORECASE)
-            matches = [d for d in all_devices if regex.search(d.name)][:limit]
+            matches.extend(d for d in all_devices if d.id not in seen and regex.search(d.name))
+            matches = matches[:limit]
 
             return {
                 "success": True,
@@ -260,9 +264,12 @@ class NetBoxSkill(BaseSkill):
             client = self._get_client()
             all_vms = client.list_vms()
 
-            # Filter by pattern (case-insensitive)
+            # Exact hostname/IP hits first, then regex matches on the name
+            matches = [ref.record for ref in get_host_identity_index().lookup(pattern, source="netbox", kind="vm")]
+            seen = {v.id for v in matches}
             regex = re.compile(pattern, re.IGNORECASE)
-            matches = [v for v in all_vms if regex.search(v.name)][:limit]
+            matches.extend(v for v in all_vms if v.id not in seen and regex.search(v.name))
+            matches = matches[:limit]
 
             return {
                 "success": True,
@@ -409,12 +416,12 @@ class NetBoxSkill(BaseSkill):
         """
         try:
             client = self._get_client()
-            all_devices = client.list_devices()
+            client.list_devices()  # loads the cache and with it the identity index
 
             # Find exact match (case-insensitive)
-            for device in all_devices:
-                if device.name.lower() == name.lower():
-                    return self._get_device(device.id)
+            for ref in get_host_identity_index().lookup(name, source="netbox", kind="device"):
+                if ref.name.lower() == name.lower():
+                    return self._get_device(ref.record_id)
 
             return {"success": False, "error": f"Device '{name}' not found"}
         except Exception as e:
@@ -432,12 +439,12 @@ class NetBoxSkill(BaseSkill):
         """
         try:
             client = self._get_client()
-            all_vms = client.list_vms()
+            client.list_vms()  # loads the cache and with it the identity index
 
             # Find exact match (case-insensitive)
-            for vm in all_vms:
-                if vm.name.lower() == name.lower():
-                    return self._get_vm(vm.id)
+            for ref in get_host_identity_index().lookup(name, source="netbox", kind="vm"):
+                if ref.name.lower() == name.lower():
+                    return self._get_vm(ref.record_id)
 
             return {"success": False, "error": f"VM '{name}' not found"}
         except Exception as e:
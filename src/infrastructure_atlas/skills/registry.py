@@ -74,6 +74,16 @@ class SkillsRegistry:
         self._config: dict[str, Any] = {}
         self._lock = RLock()
         self._initialized = False
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever the set of skills or their actions may have changed.
+
+        Consumers that cache derived data (LangChain tools, prepared agents)
+        compare it to decide when to rebuild.
+        """
+        return self._version
 
     def load_config(self, config_path: str | Path | None = None) -> None:
         """Load skill configurations from YAML file.
@@ -114,6 +124,7 @@ class SkillsRegistry:
                 logger.warning(f"Skill '{skill.name}' already registered, replacing")
 
             self._skills[skill.name] = skill
+            self._version += 1
 
             logger.info(
                 f"Registered skill: {skill.name}",
@@ -209,6 +220,7 @@ class SkillsRegistry:
                     logger.error(f"Failed to initialize skill: {name}: {e!s}")
 
             self._initialized = True
+            self._version += 1
 
         return results
 
@@ -223,6 +235,7 @@ class SkillsRegistry:
                     logger.error(f"Error cleaning up skill {name}: {e!s}")
 
             self._initialized = False
+            self._version += 1
 
     def health_check_all(self) -> dict[str, dict[str, Any]]:
         """Run health checks on all skills.
@@ -8,16 +8,34 @@ Provides virtualization actions:
 
 from __future__ import annotations
 
-import re
 from typing import Any
 
-from infrastructure_atlas.application.services.vcenter import VCenterService
-from infrastructure_atlas.db import get_sessionmaker
+from infrastructure_atlas.application.services.vcenter import VCenterService, create_vcenter_service
 from infrastructure_atlas.infrastructure.logging import get_logger
 from infrastructure_atlas.skills.base import BaseSkill
 
 logger = get_logger(__name__)
 
+# VM attributes loaded for lookups; MongoDB projects only these fields
+SUMMARY_FIELDS = ("power_state", "guest_os", "cpu_count", "memory_mib", "ip_addresses", "datacenter", "cluster")
+DETAIL_FIELDS = (
+    *SUMMARY_FIELDS,
+    "tools_status",
+    "hardware_version",
+    "is_template",
+    "instance_uuid",
+    "bios_uuid",
+    "mac_addresses",
+    "host",
+    "resource_pool",
+    "folder",
+    "vcenter_url",
+    "tags",
+    "custom_attributes",
+    "disks",
+    "snapshots",
+)
+
 
 class VCenterSkill(BaseSkill):
     """Skill for interacting with vCenter virtualization platform.
@@ -39,9 +57,7 @@ class VCenterSkill(BaseSkill):
     def _get_service(self) -> VCenterService:
         """Get or create vCenter service lazily."""
         if self._service is None:
-            Sessionmaker = get_sessionmaker()
-            session = Sessionmaker()
-            self._service = VCenterService(session)
+            self._service = create_vcenter_service()
         return self._service
 
     def initialize(self) -> None:
@@ -102,23 +118,18 @@ class VCenterSkill(BaseSkill):
         """
         try:
             service = self._get_service()
-            configs = service.list_configs()
-
-            if config_id:
-                configs = [c for c in configs if c.id == config_id]
-
-            for config in configs:
-                try:
-                    _, vms, _ = service.get_inventory(config.id)
-                    for vm in vms:
-                        if vm.name.lower() == vm_name.lower():
-                            return {
-                                "success": True,
-                                "vm": self._vm_to_dict(vm, config.name),
-                            }
-                except Exception as e:
-                    logger.warning(f"Error getting inventory from {config.name}: {e}")
-                    continue
+            matches = service.search_vms(
+                config_ids=[config_id] if config_id else None,
+                name=vm_name,
+                limit=1,
+                fields=DETAIL_FIELDS,
+            )
+            if matches:
+                config, vm = matches[0]
+                return {
+                    "success": True,
+                    "vm": self._vm_to_dict(vm, config.name),
+                }
 
             return {"success": False, "error": f"VM '{vm_name}' not found"}
         except Exception as e:
@@ -143,27 +154,15 @@ class VCenterSkill(BaseSkill):
         """
         try:
             service = self._get_service()
-            configs = service.list_configs()
-
-            if config_id:
-                configs = [c for c in configs if c.id == config_id]
-
-            matches = []
-            regex = re.compile(pattern, re.IGNORECASE)
-
-            for config in configs:
-                try:
-                    _, vms, _ = service.get_inventory(config.id)
-                    for vm in vms:
-                        if regex.search(vm.name):
-                            matches.append(self._vm_summary(vm, config.name))
-                            if len(matches) >= limit:
-                                break
-                except Exception as e:
-                    logger.warning(f"Error searching inventory from {config.name}: {e}")
-                    continue
-                if len(matches) >= limit:
-                    break
+            matches = [
+                self._vm_summary(vm, config.name)
+                for config, vm in service.search_vms(
+                    config_ids=[config_id] if config_id else None,
+                    name_pattern=pattern,
+                    limit=limit,
+                    fields=SUMMARY_FIELDS,
+                )
+            ]
 
             return {
                 "success": True,
@@ -254,23 +253,18 @@ class VCenterSkill(BaseSkill):
         """
         try:
             service = self._get_service()
-            configs = service.list_configs()
-
-            if config_id:
-                configs = [c for c in configs if c.id == config_id]
-
-            for config in configs:
-                try:
-                    _, vms, _ = service.get_inventory(config.id)
-                    for vm in vms:
-                        if vm.ip_addresses and ip_address in vm.ip_addresses:
-                            return {
-                                "success": True,
-                                "vm": self._vm_to_dict(vm, config.name),
-                            }
-                except Exception as e:
-                    logger.warning(f"Error searching inventory from {config.name}: {e}")
-                    continue
+            matches = service.search_vms(
+                config_ids=[config_id] if config_id else None,
+                ip_address=ip_address,
+                limit=1,
+                fields=DETAIL_FIELDS,
+            )
+            if matches:
+                config, vm = matches[0]
+                return {
+                    "success": True,
+                    "vm": self._vm_to_dict(vm, config.name),
+                }
 
             return {"success": False, "error": f"VM with IP '{ip_address}' not found"}
         except Exception as e:
@@ -292,17 +286,23 @@ class VCenterSkill(BaseSkill):
             Power state information
         """
         try:
-            result = self._get_vm(vm_name, config_id)
-            if not result.get("success"):
-                return result
-
-            vm = result.get("vm", {})
+            service = self._get_service()
+            matches = service.search_vms(
+                config_ids=[config_id] if config_id else None,
+                name=vm_name,
+                limit=1,
+                fields=("power_state", "tools_status"),
+            )
+            if not matches:
+                return {"success": False, "error": f"VM '{vm_name}' not found"}
+
+            config, vm = matches[0]
             return {
                 "success": True,
-                "vm_name": vm.get("name"),
-                "power_state": vm.get("power_state"),
-                "vcenter": vm.get("vcenter"),
-                "tools_status": vm.get("tools_status"),
+                "vm_name": vm.name,
+                "power_state": vm.power_state,
+                "vcenter": config.name,
+                "tools_status": vm.tools_status,
             }
         except Exception as e:
             logger.error(f"Failed to get power state for '{vm_name}': {e}")
@@ -330,7 +330,7 @@ class VCenterSkill(BaseSkill):
             "resource_pool": vm.resource_pool,
             "folder": vm.folder,
             "vcenter": vcenter_name,
-            "vm_link": vm.vm_link,
+            "vm_link": vm.vcenter_url,
             "tags": list(vm.tags) if vm.tags else [],
             "custom_attributes": dict(vm.custom_attributes) if vm.custom_attributes else {},
             "disks": [